@@ -40,6 +40,7 @@ from opusagent.models.audiocodes_api import (
     UserStreamStoppedResponse,
 )
 from opusagent.models.openai_api import ResponseAudioDeltaEvent
+from opusagent.utils import event_codec
 
 logger = configure_logging("audiocodes_bridge")
 
@@ -775,27 +776,34 @@ class AudioCodesBridge(BaseRealtimeBridge):
             Exception: Logs errors but doesn't raise to prevent audio pipeline disruption
         """
         try:
-            # Validate that we have the required fields before parsing
-            required_fields = [
-                "response_id",
-                "item_id",
-                "output_index",
-                "content_index",
-                "delta",
-            ]
-            missing_fields = [
-                field for field in required_fields if field not in response_dict
-            ]
-
-            if missing_fields:
-                logger.warning(
-                    f"Incomplete audio delta event - missing fields: {missing_fields}"
-                )
-                logger.debug(f"Received data: {response_dict}")
-                return
+            if self.fast_event_path:
+                # Field checks only; no model, no base64 decode
+                delta = event_codec.read_audio_delta(response_dict)
+                if delta is None:
+                    logger.warning("Incomplete audio delta event, skipping")
+                    return
+            else:
+                # Validate that we have the required fields before parsing
+                required_fields = [
+                    "response_id",
+                    "item_id",
+                    "output_index",
+                    "content_index",
+                    "delta",
+                ]
+                missing_fields = [
+                    field for field in required_fields if field not in response_dict
+                ]
+
+                if missing_fields:
+                    logger.warning(
+                        f"Incomplete audio delta event - missing fields: {missing_fields}"
+                    )
+                    logger.debug(f"Received data: {response_dict}")
+                    return
 
-            # Parse audio delta event
-            audio_delta = ResponseAudioDeltaEvent(**response_dict)
+                # Parse audio delta event
+                delta = ResponseAudioDeltaEvent(**response_dict).delta
 
             # Check if connections are still active
             if self._closed or not self.conversation_id:
@@ -813,7 +821,7 @@ class AudioCodesBridge(BaseRealtimeBridge):
 
             # Record bot audio if recorder is available
             if self.call_recorder:
-                await self.call_recorder.record_bot_audio(audio_delta.delta)
+                await self.call_recorder.record_bot_audio(delta)
 
             # Start a new audio stream if needed
             if not self.audio_handler.active_stream_id:
@@ -840,27 +848,32 @@ class AudioCodesBridge(BaseRealtimeBridge):
                     return
 
             # Validate audio delta before sending chunk
-            if not audio_delta.delta or audio_delta.delta.strip() == "":
+            if not delta or delta.strip() == "":
                 logger.warning("Empty audio delta received, skipping audio chunk")
                 return
 
-            # Validate base64 encoding
-            try:
-                base64.b64decode(audio_delta.delta)
-            except Exception as e:
-                logger.error(f"Invalid base64 audio delta: {e}")
-                return
-
             # Send audio chunk to platform client (no resampling needed - AudioCodes supports 24kHz)
-            stream_chunk = PlayStreamChunkMessage(
-                type=TelephonyEventType.PLAY_STREAM_CHUNK,
-                conversationId=self.conversation_id,
-                streamId=self.audio_handler.active_stream_id,
-                audioChunk=audio_delta.delta,  # Send original 24kHz audio directly
-                participant="caller",
-            )
+            if self.fast_event_path:
+                chunk_message = event_codec.play_stream_chunk(
+                    self.conversation_id, self.audio_handler.active_stream_id, delta
+                )
+            else:
+                # Validate base64 encoding
+                try:
+                    base64.b64decode(delta)
+                except Exception as e:
+                    logger.error(f"Invalid base64 audio delta: {e}")
+                    return
+
+                chunk_message = PlayStreamChunkMessage(
+                    type=TelephonyEventType.PLAY_STREAM_CHUNK,
+                    conversationId=self.conversation_id,
+                    streamId=self.audio_handler.active_stream_id,
+                    audioChunk=delta,  # Send original 24kHz audio directly
+                    participant="caller",
+                ).model_dump()
             try:
-                await self.platform_websocket.send_json(stream_chunk.model_dump())
+                await self.platform_websocket.send_json(chunk_message)
             except Exception as e:
                 logger.error(f"Failed to send audio chunk: {e}")
                 return
@@ -5,15 +5,16 @@ WebSocket connection and the OpenAI Realtime API, enabling real-time audio commu
 with AI agents. It handles bidirectional audio streaming, session management, and event processing.
 """
 
-import json
 import time
 import uuid
+import weakref
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Union
 
 from websockets.client import WebSocketClientProtocol
 
-from opusagent.config.logging_config import configure_logging
+from opusagent.config import recording_config, server_config
+from opusagent.config.logging_config import LazyJson, configure_logging
 from opusagent.handlers.audio_stream_handler import AudioStreamHandler
 from opusagent.handlers.event_router import EventRouter
 from opusagent.handlers.function_handler import FunctionHandler
@@ -24,10 +25,11 @@ from opusagent.models.openai_api import SessionConfig
 from opusagent.models.session_state import SessionState
 from opusagent.services.session_manager_service import SessionManagerService
 from opusagent.session_storage import SessionStorage
-from opusagent.session_storage.memory_storage import MemorySessionStorage
+from opusagent.session_storage.factory import get_session_storage
+from opusagent.utils import event_codec
 from opusagent.utils.audio_quality_monitor import QualityThresholds
 from opusagent.utils.call_recorder import CallRecorder
-from opusagent.voiceprint import OpusAgentVoiceRecognizer
+from opusagent.voiceprint import StreamingCallerIdentifier, get_voice_recognizer
 
 # Configure logging
 logger = configure_logging("base_bridge")
@@ -59,8 +61,19 @@ class BaseRealtimeBridge(ABC):
         session_config (SessionConfig): Predefined session configuration for the OpenAI Realtime API
         use_local_realtime (bool): Whether to use local realtime client instead of OpenAI API
         local_realtime_client (Optional[Any]): Local realtime client instance when use_local_realtime is True
+        caller_identifier (Optional[StreamingCallerIdentifier]): Identifies the caller from the
+            first seconds of inbound audio when VOICE_STREAMING_IDENTIFICATION is enabled
+        identified_caller (Optional[Dict[str, Any]]): Caller identified by voice, if any
     """
 
+    # Bridges of this process that have not been closed yet
+    _open_bridges: "weakref.WeakSet[BaseRealtimeBridge]" = weakref.WeakSet()
+
+    @classmethod
+    def active_calls(cls) -> int:
+        """Number of calls currently bridged by this process."""
+        return len(cls._open_bridges)
+
     def __init__(
         self,
         platform_websocket,
@@ -90,6 +103,7 @@ class BaseRealtimeBridge(ABC):
         self.local_realtime_config = local_realtime_config or {}
         self.bridge_type = bridge_type
         self._closed = False
+        BaseRealtimeBridge._open_bridges.add(self)
         self.conversation_id: Optional[str] = None
         self.media_format: Optional[str] = None
         self.speech_detected = False
@@ -98,6 +112,9 @@ class BaseRealtimeBridge(ABC):
         self.audio_chunks_sent = 0
         self.total_audio_bytes_sent = 0
 
+        # Audio events skip pydantic validation (see utils/event_codec.py)
+        self.fast_event_path = server_config().fast_event_path
+
         # Transcript buffers for logging full transcripts
         self.input_transcript_buffer = []  # User → AI
         self.output_transcript_buffer = []  # AI → User
@@ -109,9 +126,8 @@ class BaseRealtimeBridge(ABC):
         self.session_state: Optional[SessionState] = None
         self.session_manager_service: Optional[SessionManagerService] = None
 
-        # Initialize session manager service with memory storage
-        session_storage = MemorySessionStorage()
-        self.session_manager_service = SessionManagerService(session_storage)
+        # Session manager over the worker's shared storage (SESSION_STORAGE_TYPE)
+        self.session_manager_service = SessionManagerService(get_session_storage())
 
         # Initialize function handler
         self.function_handler = FunctionHandler(
@@ -182,8 +198,25 @@ class BaseRealtimeBridge(ABC):
         logger.info(f"Bridge initialized with {connection_type}")
         logger.info(f"VAD handling {'enabled' if self.vad_enabled else 'disabled'}")
 
-        # Initialize voice recognizer
-        self.voice_recognizer = OpusAgentVoiceRecognizer()
+        # Every call shares the process-wide recognizer and its voiceprint index
+        self.voice_recognizer = get_voice_recognizer()
+
+        # Identify the caller while the call is still in its first seconds,
+        # so the context is loaded before the first agent response
+        self.identified_caller: Optional[Dict[str, Any]] = None
+        self.caller_identifier: Optional[StreamingCallerIdentifier] = None
+        voice_config = self.voice_recognizer.config
+        if voice_config.enabled and voice_config.streaming_identification:
+            self.caller_identifier = StreamingCallerIdentifier(
+                self.voice_recognizer,
+                sample_rate=self.audio_handler.internal_sample_rate,
+                on_identified=self.load_caller_context,
+                window_seconds=voice_config.streaming_window_seconds,
+                hop_seconds=voice_config.streaming_hop_seconds,
+                max_seconds=voice_config.streaming_max_seconds,
+                required_agreement=voice_config.streaming_required_agreement,
+            )
+            self.audio_handler.caller_identifier = self.caller_identifier
 
     def _initialize_local_realtime_client(self):
         #! Shouldn't this be handled in client? Yes, needs to work like websocket
@@ -248,6 +281,7 @@ class BaseRealtimeBridge(ABC):
         """
         if not self._closed:
             self._closed = True
+            BaseRealtimeBridge._open_bridges.discard(self)
 
             # Stop and finalize call recording
             if self.call_recorder:
@@ -304,6 +338,11 @@ class BaseRealtimeBridge(ABC):
 
             # Close realtime handler
             await self.realtime_handler.close()
+            logger.debug(
+                "Event dispatch stats for %s: %s",
+                self.conversation_id,
+                LazyJson(self.event_router.get_stats()),
+            )
 
             try:
                 if self.platform_websocket and not self._is_websocket_closed():
@@ -430,10 +469,15 @@ class BaseRealtimeBridge(ABC):
 
         # Initialize call recorder
         if self.conversation_id:
+            recording_settings = recording_config()
             self.call_recorder = CallRecorder(
                 conversation_id=self.conversation_id,
                 session_id=self.conversation_id,
                 base_output_dir="call_recordings",
+                streaming=recording_settings.streaming_writer,
+                writer_queue_size=recording_settings.writer_queue_size,
+                recording_format=recording_settings.format,
+                compression_level=recording_settings.compression_level,
             )
             await self.call_recorder.start_recording()
             logger.info(
@@ -594,7 +638,7 @@ class BaseRealtimeBridge(ABC):
                 if self._closed:
                     break
 
-                data = json.loads(message)
+                data = event_codec.loads(message)
                 await self.event_router.handle_platform_event(data)
 
         except Exception as e:
@@ -662,17 +706,55 @@ class BaseRealtimeBridge(ABC):
 
         if match:
             caller_id, similarity, metadata = match
-            await self.load_caller_context(caller_id)
+            await self.load_caller_context(caller_id, similarity, metadata)
             return f"Welcome back, {metadata.get('name', 'caller')}!"
         else:
             return "Hello! I don't recognize your voice. Would you like me to remember you for future calls?"
 
-    async def load_caller_context(self, caller_id):
-        # TODO: Implement caller context loading when SessionManagerService supports it
+    async def load_caller_context(
+        self,
+        caller_id: str,
+        similarity: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """Attach a caller identified by voice to the conversation.
+
+        Called by the streaming caller identifier as soon as the caller is
+        recognized. The caller's metadata is added to the Realtime
+        conversation so the next response can use it. The identification is
+        also kept on the bridge and recorded in the session metadata so it
+        survives a resume.
+
+        Args:
+            caller_id (str): Identifier of the enrolled caller
+            similarity (Optional[float]): Similarity of the match
+            metadata (Optional[Dict[str, Any]]): Metadata stored at enrollment
+        """
+        self.identified_caller = {
+            "caller_id": caller_id,
+            "similarity": similarity,
+            "metadata": metadata or {},
+        }
         logger.info(
-            f"Voice fingerprinting: caller {caller_id} identified, but context loading not yet implemented"
+            f"Voice fingerprinting: caller {caller_id} identified for conversation {self.conversation_id}"
         )
-        pass
+
+        if not self._closed and self.session_manager:
+            try:
+                await self.session_manager.send_caller_context(caller_id, metadata)
+            except Exception as e:
+                logger.error(f"Error sending caller context for {caller_id}: {e}")
+
+        if self.session_state and self.session_manager_service:
+            session_metadata = dict(self.session_state.metadata)
+            session_metadata["voiceprint"] = self.identified_caller
+            self.session_state.metadata = session_metadata
+            try:
+                await self.session_manager_service.update_session(
+                    self.session_state.conversation_id, metadata=session_metadata
+                )
+            except Exception as e:
+                logger.error(f"Error storing identified caller {caller_id}: {e}")
 
     def get_local_realtime_client(self):
         """Get the local realtime client instance if available.
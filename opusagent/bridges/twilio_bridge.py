@@ -6,14 +6,14 @@ Twilio-specific event types, message formats, and responses.
 
 import asyncio
 import base64
-import json
 import time
 from typing import Any, Dict, Optional
 
 from opusagent.bridges.base_bridge import BaseRealtimeBridge
 from opusagent.config.logging_config import configure_logging
-from opusagent.models.openai_api import InputAudioBufferAppendEvent, SessionConfig
+from opusagent.models.openai_api import SessionConfig
 from opusagent.models.twilio_api import (
+    ClearMessage,
     ConnectedMessage,
     DTMFMessage,
     MarkMessage,
@@ -26,12 +26,20 @@ from opusagent.models.twilio_api import (
 )
 
 # Import the proper audio utilities
+from opusagent.utils import event_codec, g711
+from opusagent.utils.audio_buffer import encode_input_audio_append
 from opusagent.utils.audio_utils import AudioUtils
+from opusagent.utils.paced_sender import PacedAudioSender
+from opusagent.utils.resampler import StreamingResampler
 
 logger = configure_logging("twilio_bridge")
 
 VOICE = "alloy"  # example voice, override as needed
 
+# Longest wait for queued bot audio (e.g. a goodbye) to play out before a
+# graceful hang-up closes the stream
+EGRESS_DRAIN_TIMEOUT = 10.0
+
 
 class TwilioBridge(BaseRealtimeBridge):
     """Twilio Media Streams implementation of the real-time bridge."""
@@ -57,6 +65,16 @@ class TwilioBridge(BaseRealtimeBridge):
         self.audio_buffer = []  # small buffer before relaying to OpenAI
         self.mark_counter = 0
 
+        # Stateful 24kHz -> 8kHz resampler for outbound audio; keeps filter
+        # history across OpenAI deltas so chunk boundaries stay click-free.
+        self._outbound_resampler = StreamingResampler(24000, 8000)
+
+        # Outbound μ-law is queued and released in 20ms frames by a single
+        # sender task, so audio deltas never block receive_from_realtime.
+        self._egress = PacedAudioSender(
+            self._send_media_frame, frame_size=160, silence_byte=g711.ULAW_SILENCE
+        )
+
         # Participant tracking for multi-party calls (future-proofing)
         self.current_participant: str = (
             "caller"  # Default participant for single-party calls
@@ -260,25 +278,32 @@ class TwilioBridge(BaseRealtimeBridge):
             data (dict): Media message data containing audio
         """
         try:
-            media_msg = MediaMessage(**data)
-            audio_payload = media_msg.media.payload
+            if self.fast_event_path:
+                audio_payload, track = event_codec.read_twilio_media(data)
+            else:
+                media_msg = MediaMessage(**data)
+                audio_payload = media_msg.media.payload
+                track = media_msg.media.track
 
             # Extract participant information if available (for multi-party calls)
-            track = media_msg.media.track
             if track and track != "inbound":
                 self.current_participant = track
                 logger.debug(f"Audio from participant: {track}")
 
             # Enhanced audio processing logging
             chunk_size = len(audio_payload)
-            logger.debug(f"Received audio chunk: {chunk_size} bytes, track: {track}")
+            logger.debug(
+                "Received audio chunk: %d bytes, track: %s",
+                chunk_size,
+                track,
+                extra={"event_type": "media"},
+            )
 
             mulaw_bytes = base64.b64decode(audio_payload)
             self.audio_buffer.append(mulaw_bytes)
             if len(self.audio_buffer) >= 2:  # ~40ms
                 combined = b"".join(self.audio_buffer)
                 pcm16 = self._convert_mulaw_to_pcm16(combined)
-                b64_pcm = base64.b64encode(pcm16).decode()
 
                 # Log audio processing metrics
                 total_bytes = len(combined)
@@ -295,9 +320,7 @@ class TwilioBridge(BaseRealtimeBridge):
 
                 try:
                     await self.realtime_websocket.send(
-                        InputAudioBufferAppendEvent(
-                            type="input_audio_buffer.append", audio=b64_pcm
-                        ).model_dump_json()
+                        encode_input_audio_append(pcm16)
                     )
                     self.audio_buffer.clear()
 
@@ -314,6 +337,10 @@ class TwilioBridge(BaseRealtimeBridge):
                 except Exception as e:
                     logger.error(f"Failed to send realtime message: {e}")
                     # Don't raise the exception to prevent cascading failures
+
+                # Record caller audio (the Twilio path bypasses AudioStreamHandler)
+                if self.call_recorder:
+                    await self.call_recorder.record_caller_audio_g711(combined)
         except Exception as e:
             logger.error(f"Error handling Twilio media: {e}")
             # Log additional context for debugging
@@ -390,6 +417,9 @@ class TwilioBridge(BaseRealtimeBridge):
             doesn't support VAD events natively, this method primarily logs
             the events for debugging and monitoring.
         """
+        # The caller is talking over the bot: drop the rest of the response
+        await self.clear_outbound_audio()
+
         if not self.vad_enabled:
             logger.warning("VAD disabled - ignoring speech started event")
             return
@@ -818,6 +848,8 @@ class TwilioBridge(BaseRealtimeBridge):
                 "vad_enabled": self.vad_enabled,
                 "bridge_type": self.bridge_type,
             },
+            "egress": self._egress.get_stats(),
+            "events": self.event_router.get_stats(),
         }
 
         # Add session state information if available
@@ -844,6 +876,13 @@ class TwilioBridge(BaseRealtimeBridge):
         logger.info(f"  Audio: {stats['audio']}")
         logger.info(f"  Connection: {stats['connection']}")
         logger.info(f"  Features: {stats['features']}")
+        if "egress" in stats:
+            logger.info(f"  Egress: {stats['egress']}")
+        if "events" in stats:
+            logger.info(
+                f"  Events: {stats['events']['dispatched']} dispatched, "
+                f"{stats['events']['errors']} handler errors"
+            )
 
     async def handle_graceful_shutdown(self, reason: str = "Graceful shutdown"):
         """Handle graceful shutdown of the bridge.
@@ -859,7 +898,8 @@ class TwilioBridge(BaseRealtimeBridge):
         # Log final statistics
         await self.log_bridge_statistics()
 
-        # Perform normal close operations
+        # Let queued bot audio finish, then perform normal close operations
+        await self._drain_egress()
         await self.close()
 
         logger.info("Graceful shutdown completed")
@@ -898,37 +938,22 @@ class TwilioBridge(BaseRealtimeBridge):
     # Helper conversions
     # ------------------------------------------------------------------
     def _convert_mulaw_to_pcm16(self, mulaw_bytes: bytes) -> bytes:
-        """Convert μ-law to PCM16 using audioop or proper fallback."""
-        try:
-            import audioop
-
-            return audioop.ulaw2lin(mulaw_bytes, 2)
-        except Exception as e:
-            logger.warning(f"audioop.ulaw2lin failed, using AudioUtils fallback: {e}")
-            # Use proper μ-law conversion from AudioUtils
-            return AudioUtils.ulaw_to_pcm16(mulaw_bytes)
+        """Convert μ-law to PCM16 using the shared G.711 lookup tables."""
+        return g711.ulaw_to_pcm16(mulaw_bytes)
 
     def _convert_pcm16_to_mulaw(self, pcm16_data: bytes) -> bytes:
-        """Convert PCM16 to μ-law using audioop or proper fallback."""
-        try:
-            import audioop
-
-            return audioop.lin2ulaw(pcm16_data, 2)
-        except Exception as e:
-            logger.warning(f"audioop.lin2ulaw failed, using AudioUtils fallback: {e}")
-            # Use proper μ-law conversion from AudioUtils
-            return AudioUtils.pcm16_to_ulaw(pcm16_data)
+        """Convert PCM16 to μ-law using the shared G.711 lookup tables."""
+        return g711.pcm16_to_ulaw(pcm16_data)
 
     async def send_audio_to_twilio(self, pcm16_data: bytes):
-        """Send audio to Twilio with improved quality and error handling.
-
-        Key improvements:
-        - High-quality resampling using librosa with proper anti-aliasing
-        - Correct μ-law conversion using lookup tables
-        - Audio level monitoring and quality validation
-        - Proper μ-law silence padding (0x80 instead of 0x00)
-        - Better timing control for consistent 20ms intervals
-        - Comprehensive error handling
+        """Queue bot audio for paced delivery to Twilio.
+
+        The audio is resampled to 8kHz, μ-law encoded and handed to the
+        per-call egress queue, which releases it in 20ms frames from its own
+        task. This method returns as soon as the audio is queued.
+
+        Args:
+            pcm16_data (bytes): 24kHz PCM16 audio from OpenAI
         """
         if not self.stream_sid:
             logger.warning("Cannot send audio to Twilio: stream_sid not set")
@@ -955,53 +980,77 @@ class TwilioBridge(BaseRealtimeBridge):
 
         # Resample from 24kHz to 8kHz if needed
         # OpenAI sends 24kHz PCM16, but Twilio expects 8kHz μ-law
-        resampled_pcm16 = self._resample_audio(pcm16_data, 24000, 8000)
+        resampled_pcm16 = self._outbound_resampler.process(pcm16_data)
         logger.debug(
             f"Resampled from 24kHz to 8kHz: {len(pcm16_data)} -> {len(resampled_pcm16)} bytes"
         )
 
-        # Convert to μ-law
+        # Convert to μ-law and queue for paced sending
         mulaw = self._convert_pcm16_to_mulaw(resampled_pcm16)
-        logger.debug(f"Converted to {len(mulaw)} bytes of μ-law audio")
+        self._egress.enqueue(mulaw)
+        logger.debug(
+            f"Queued {len(mulaw)} bytes of μ-law audio "
+            f"({self._egress.queue_depth} frames pending)"
+        )
 
-        # Send audio in 20ms chunks (160 bytes at 8kHz)
-        chunk_size = 160  # 20ms at 8kHz
-        chunks_sent = 0
-        start_time = time.time()
+    async def _send_media_frame(self, frame: bytes) -> None:
+        """Send one 20ms μ-law frame to Twilio (called by the egress task)."""
+        await self.send_platform_json(
+            OutgoingMediaMessage(
+                event=TwilioEventType.MEDIA,
+                streamSid=self.stream_sid,
+                media=OutgoingMediaPayload(payload=base64.b64encode(frame).decode()),
+            ).model_dump()
+        )
 
-        for i in range(0, len(mulaw), chunk_size):
-            chunk = mulaw[i : i + chunk_size]
-            if len(chunk) < chunk_size:
-                # Pad with silence instead of zeros for better audio quality
-                chunk += b"\x80" * (
-                    chunk_size - len(chunk)
-                )  # μ-law silence is 0x80, not 0x00
+    async def clear_outbound_audio(self) -> int:
+        """Drop queued bot audio and tell Twilio to discard what it buffered.
 
-            payload_b64 = base64.b64encode(chunk).decode()
+        Used for barge-in: the remainder of an interrupted response is
+        discarded locally at once, and a ``clear`` message flushes Twilio's
+        own playback buffer.
 
-            try:
-                await self.send_platform_json(
-                    OutgoingMediaMessage(
-                        event=TwilioEventType.MEDIA,
-                        streamSid=self.stream_sid,
-                        media=OutgoingMediaPayload(payload=payload_b64),
-                    ).model_dump()
-                )
-                chunks_sent += 1
+        Returns:
+            int: Number of locally queued frames dropped
+        """
+        dropped = self._egress.clear()
+        self._outbound_resampler.reset()
+        if self.stream_sid:
+            await self.send_platform_json(
+                ClearMessage(
+                    event=TwilioEventType.CLEAR, streamSid=self.stream_sid
+                ).model_dump()
+            )
+        if dropped:
+            logger.info(f"Cleared {dropped} queued outbound audio frames")
+        return dropped
 
-                # Better timing control - maintain consistent 20ms intervals
-                expected_time = start_time + (chunks_sent * 0.02)
-                current_time = time.time()
-                sleep_time = max(0, expected_time - current_time)
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
+    async def hang_up(self, reason: str = "Call completed"):
+        """Let queued bot audio play out, then hang up the call.
 
-            except Exception as e:
-                logger.error(f"Error sending audio chunk {chunks_sent}: {e}")
-                break
+        Args:
+            reason: The reason for hanging up the call
+        """
+        if not self._closed:
+            await self._drain_egress()
+        await super().hang_up(reason)
+
+    async def close(self):
+        """Stop the egress task, then close the bridge.
 
-        total_time = time.time() - start_time
-        logger.debug(f"Sent {chunks_sent} audio chunks to Twilio in {total_time:.2f}s")
+        Anything still queued is dropped, which is what errors and the
+        caller's ``stop`` need; graceful paths drain the queue first.
+        """
+        await self._egress.close()
+        await super().close()
+
+    async def _drain_egress(self) -> None:
+        """Wait up to EGRESS_DRAIN_TIMEOUT for queued bot audio to be sent."""
+        if not await self._egress.drain(timeout=EGRESS_DRAIN_TIMEOUT):
+            logger.warning(
+                f"Outbound audio did not drain within {EGRESS_DRAIN_TIMEOUT}s; "
+                f"dropping {self._egress.queue_depth} frames"
+            )
 
     def _resample_audio(
         self, audio_bytes: bytes, from_rate: int, to_rate: int
@@ -1062,7 +1111,7 @@ class TwilioBridge(BaseRealtimeBridge):
                 if self._closed:
                     break
 
-                data = json.loads(message)
+                data = event_codec.loads(message)
                 event_str = data.get("event")
 
                 if event_str:
@@ -1147,24 +1196,23 @@ class TwilioBridge(BaseRealtimeBridge):
                 logger.debug("Skipping audio delta - platform websocket is unavailable")
                 return
 
-            # Record bot audio if recorder is available
-            if self.call_recorder:
-                await self.call_recorder.record_bot_audio(audio_delta.delta)
-
             # Validate audio delta before sending
             if not audio_delta.delta or audio_delta.delta.strip() == "":
                 logger.warning("Empty audio delta received, skipping audio chunk")
                 return
 
-            # Validate base64 encoding
+            # Decode once; the recorder and the Twilio encoder share the PCM
             try:
-                base64.b64decode(audio_delta.delta)
+                pcm16 = base64.b64decode(audio_delta.delta)
             except Exception as e:
                 logger.error(f"Invalid base64 audio delta: {e}")
                 return
 
+            # Record bot audio if recorder is available
+            if self.call_recorder:
+                await self.call_recorder.record_bot_audio_bytes(pcm16)
+
             # Send audio to Twilio using our Twilio-specific method
-            pcm16 = base64.b64decode(audio_delta.delta)
             await self.send_audio_to_twilio(pcm16)
 
         except Exception as e:
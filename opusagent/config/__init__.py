@@ -76,6 +76,7 @@ from .settings import (
     tui_config,
     quality_config,
     mock_config,
+    recording_config,
     
     # Static data loading
     load_scenarios,
@@ -111,6 +112,7 @@ from .models import (
     TUIConfig,
     StaticDataConfig,
     SecurityConfig,
+    RecordingConfig,
     Environment,
     LogLevel,
 )
@@ -137,6 +139,7 @@ __all__ = [
     "tui_config", 
     "quality_config",
     "mock_config",
+    "recording_config",
     
     # Static data
     "load_scenarios",
@@ -170,6 +173,7 @@ __all__ = [
     "TUIConfig",
     "StaticDataConfig",
     "SecurityConfig",
+    "RecordingConfig",
     "Environment",
     "LogLevel",
     
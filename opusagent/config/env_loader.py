@@ -24,6 +24,7 @@ from .models import (
     MockConfig,
     OpenAIConfig,
     QualityMonitoringConfig,
+    RecordingConfig,
     SecurityConfig,
     ServerConfig,
     StaticDataConfig,
@@ -129,6 +130,14 @@ def load_server_config() -> ServerConfig:
         ws_ping_interval=safe_convert(os.getenv("WS_PING_INTERVAL"), int, 5),
         ws_ping_timeout=safe_convert(os.getenv("WS_PING_TIMEOUT"), int, 10),
         ws_max_size=safe_convert(os.getenv("WS_MAX_SIZE"), int, 16 * 1024 * 1024),
+        fast_event_path=safe_convert(os.getenv("FAST_EVENT_PATH"), bool, True),
+        preload=safe_convert(os.getenv("PRELOAD"), List[str], []),
+        session_storage=os.getenv("SESSION_STORAGE_TYPE", "memory").lower(),
+        redis_url=os.getenv("REDIS_URL", "redis://localhost:6379"),
+        worker_stats_dir=os.getenv("WORKER_STATS_DIR") or None,
+        worker_stats_interval=safe_convert(
+            os.getenv("WORKER_STATS_INTERVAL"), float, 2.0
+        ),
     )
 
 
@@ -220,6 +229,10 @@ def load_vad_config() -> VADConfig:
         sample_rate=safe_convert(
             os.getenv("VAD_SAMPLE_RATE"), int, DEFAULT_VAD_SAMPLE_RATE
         ),
+        shared_inference=safe_convert(
+            os.getenv("VAD_SHARED_INFERENCE"), bool, True
+        ),
+        onnx_model_path=safe_string_or_none(os.getenv("VAD_ONNX_MODEL_PATH")),
     )
 
 
@@ -273,6 +286,22 @@ def load_transcription_config() -> TranscriptionConfig:
         ),
         whisper_model_dir=safe_string_or_none(os.getenv("WHISPER_MODEL_DIR")),
         whisper_temperature=safe_convert(os.getenv("WHISPER_TEMPERATURE"), float, 0.0),
+        whisper_batching=safe_convert(os.getenv("WHISPER_BATCHING"), bool, True),
+        whisper_max_batch_size=safe_convert(
+            os.getenv("WHISPER_MAX_BATCH_SIZE"), int, 8
+        ),
+        whisper_batch_window_ms=safe_convert(
+            os.getenv("WHISPER_BATCH_WINDOW_MS"), float, 20.0
+        ),
+        shared_models=safe_convert(
+            os.getenv("TRANSCRIPTION_SHARED_MODELS"), bool, True
+        ),
+        model_idle_timeout=safe_convert(
+            os.getenv("TRANSCRIPTION_MODEL_IDLE_TIMEOUT"), float, 300.0
+        ),
+        model_memory_budget_mb=safe_convert(
+            os.getenv("TRANSCRIPTION_MODEL_MEMORY_BUDGET_MB"), float, 0.0
+        ),
     )
 
 
@@ -295,6 +324,10 @@ def load_websocket_config() -> WebSocketConfig:
         ping_interval=safe_convert(os.getenv("WEBSOCKET_PING_INTERVAL"), int, 20),
         ping_timeout=safe_convert(os.getenv("WEBSOCKET_PING_TIMEOUT"), int, 30),
         close_timeout=safe_convert(os.getenv("WEBSOCKET_CLOSE_TIMEOUT"), int, 10),
+        warm_pool_size=safe_convert(os.getenv("WEBSOCKET_WARM_POOL_SIZE"), int, 0),
+        pool_wait_timeout=safe_convert(
+            os.getenv("WEBSOCKET_POOL_WAIT_TIMEOUT"), float, 10.0
+        ),
     )
 
 
@@ -329,6 +362,13 @@ def load_quality_config() -> QualityMonitoringConfig:
         summary_interval_seconds=safe_convert(
             os.getenv("QUALITY_SUMMARY_INTERVAL"), int, 60
         ),
+        analysis_interval=safe_convert(
+            os.getenv("QUALITY_ANALYSIS_INTERVAL"), int, 5
+        ),
+        analysis_window=safe_convert(os.getenv("QUALITY_ANALYSIS_WINDOW"), int, 1024),
+        batched_analysis=safe_convert(
+            os.getenv("QUALITY_BATCHED_ANALYSIS"), bool, False
+        ),
     )
 
 
@@ -390,6 +430,13 @@ def load_logging_config() -> LoggingConfig:
         backup_count=safe_convert(os.getenv("LOG_BACKUP_COUNT"), int, 5),
         console_output=safe_convert(os.getenv("LOG_CONSOLE_OUTPUT"), bool, True),
         file_output=safe_convert(os.getenv("LOG_FILE_OUTPUT"), bool, True),
+        queued=safe_convert(os.getenv("LOG_QUEUED"), bool, True),
+        event_rate_limit=safe_convert(
+            os.getenv("LOG_EVENT_RATE_LIMIT"), float, 20.0
+        ),
+        audio_sample_every=safe_convert(
+            os.getenv("LOG_AUDIO_SAMPLE_EVERY"), int, 50
+        ),
     )
 
 
@@ -494,6 +541,24 @@ def load_security_config() -> SecurityConfig:
     )
 
 
+def load_recording_config() -> RecordingConfig:
+    """Load call recording configuration from environment variables."""
+    _check_env_loaded()
+
+    return RecordingConfig(
+        streaming_writer=safe_convert(
+            os.getenv("RECORDING_STREAMING_WRITER"), bool, False
+        ),
+        writer_queue_size=safe_convert(
+            os.getenv("RECORDING_WRITER_QUEUE_SIZE"), int, 500
+        ),
+        format=os.getenv("RECORDING_FORMAT", "wav").lower(),
+        compression_level=safe_convert(
+            os.getenv("RECORDING_COMPRESSION_LEVEL"), float, None
+        ),
+    )
+
+
 def load_application_config() -> ApplicationConfig:
     """Load complete application configuration from environment variables."""
     _check_env_loaded()
@@ -512,6 +577,7 @@ def load_application_config() -> ApplicationConfig:
         tui=load_tui_config(),
         static_data=load_static_data_config(),
         security=load_security_config(),
+        recording=load_recording_config(),
     )
 
     # Validate configuration and raise exceptions for critical errors
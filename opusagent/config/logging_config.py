@@ -4,13 +4,37 @@ Configure logging for the application.
 This module provides a consistent logging configuration across the entire
 application, ensuring log messages are formatted correctly and directed
 to the appropriate outputs (console, file, etc.).
+
+By default records are not written on the calling thread: each logger gets
+a QueueHandler that puts records on an in-memory queue, and a QueueListener
+thread writes them to the console and the rotating log file. Console and
+file I/O therefore never block the event loop. Set LOG_QUEUED=false to
+write synchronously instead. Threads do not survive fork(), so a forked
+worker process restarts the writer threads it inherits.
+
+Per-event logs on hot paths pass the event type as ``extra={"event_type":
+...}``. EventSamplingFilter keeps at most LOG_EVENT_RATE_LIMIT records per
+event type per second and only one in LOG_AUDIO_SAMPLE_EVERY records for
+audio events; the next record that gets through reports how many were
+suppressed. Warnings and errors are never dropped.
+
+Large payloads should be logged at DEBUG with LazyJson, so nothing is
+serialized unless DEBUG is enabled:
+
+    logger.debug("Response event details: %s", LazyJson(data, indent=2))
 """
 
+import atexit
+import json
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
 
 from opusagent.config.constants import LOGGER_NAME
 
@@ -24,58 +48,243 @@ LOG_FILE = LOG_DIR / "opusagent.log"
 MAX_LOG_SIZE = 10 * 1024 * 1024  # 10 MB
 BACKUP_COUNT = 5
 
+# Write records on a background thread
+LOG_QUEUED = os.getenv("LOG_QUEUED", "true").lower() in ("true", "1", "yes", "on")
 
-def configure_logging(name: str = LOGGER_NAME, file_path: str = "logs/", log_filename: str = "opusagent.log"):
-    """
-    Configure the application logger with console and file handlers.
-    
-    Returns:
-        logging.Logger: The configured logger instance
+# Hot-path sampling (0 disables the rate limit, 1 logs every audio event)
+LOG_EVENT_RATE_LIMIT = float(os.getenv("LOG_EVENT_RATE_LIMIT", "20"))
+LOG_AUDIO_SAMPLE_EVERY = int(os.getenv("LOG_AUDIO_SAMPLE_EVERY", "50"))
+
+# Event types that arrive for every audio chunk
+AUDIO_EVENT_TYPES = frozenset(
+    {
+        "userStream.chunk",
+        "playStream.chunk",
+        "input_audio_buffer.append",
+        "response.audio.delta",
+        "response.audio_transcript.delta",
+        "response.output_audio.delta",
+        "response.output_audio_transcript.delta",
+    }
+)
+
+
+class LazyJson:
+    """Serialize an object to JSON only when the log record is formatted."""
+
+    __slots__ = ("obj", "indent")
+
+    def __init__(self, obj: Any, indent: Optional[int] = None):
+        self.obj = obj
+        self.indent = indent
+
+    def __str__(self) -> str:
+        try:
+            return json.dumps(self.obj, indent=self.indent, default=str)
+        except (TypeError, ValueError):
+            return repr(self.obj)
+
+
+class EventSamplingFilter(logging.Filter):
+    """Rate-limit and sample records tagged with an ``event_type``.
+
+    Records without an event type, and records at WARNING or above, always
+    pass.
+
+    Attributes:
+        rate_limit (float): Records per event type per second; 0 for no limit
+        audio_sample_every (int): Keep one in this many audio event records
+        audio_event_types (FrozenSet[str]): Event types that are sampled
     """
-    global LOG_FILE
-    LOG_FILE = Path(file_path) / log_filename
 
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, LOG_LEVEL))
-    
-    # Remove existing handlers if any
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
-    
-    # Create formatter
-    formatter = logging.Formatter(LOG_FORMAT)
-    
-    # Create console handler
+    def __init__(
+        self,
+        rate_limit: float = LOG_EVENT_RATE_LIMIT,
+        audio_sample_every: int = LOG_AUDIO_SAMPLE_EVERY,
+        audio_event_types: Iterable[str] = AUDIO_EVENT_TYPES,
+    ):
+        """
+        Initialize the filter.
+
+        Args:
+            rate_limit (float): Records per event type per second; 0 for no limit
+            audio_sample_every (int): Keep one in this many audio event records
+            audio_event_types (Iterable[str]): Event types that are sampled
+        """
+        super().__init__()
+        self.rate_limit = rate_limit
+        self.audio_sample_every = max(1, audio_sample_every)
+        self.audio_event_types: FrozenSet[str] = frozenset(audio_event_types)
+        self._lock = threading.Lock()
+        self._seen: Dict[str, int] = {}
+        self._windows: Dict[str, List[float]] = {}
+        self._suppressed: Dict[str, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        event_type = getattr(record, "event_type", None)
+        if event_type is None or record.levelno >= logging.WARNING:
+            return True
+
+        with self._lock:
+            if event_type in self.audio_event_types and self.audio_sample_every > 1:
+                seen = self._seen.get(event_type, 0)
+                self._seen[event_type] = seen + 1
+                if seen % self.audio_sample_every:
+                    self._suppress(event_type)
+                    return False
+
+            if self.rate_limit > 0:
+                now = time.monotonic()
+                window = self._windows.get(event_type)
+                if window is None or now - window[0] >= 1.0:
+                    window = self._windows[event_type] = [now, 0]
+                if window[1] >= self.rate_limit:
+                    self._suppress(event_type)
+                    return False
+                window[1] += 1
+
+            suppressed = self._suppressed.pop(event_type, 0)
+
+        if suppressed:
+            record.msg = f"{record.msg} ({suppressed} similar suppressed)"
+        return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """Records suppressed per event type since the last one let through."""
+        with self._lock:
+            return dict(self._suppressed)
+
+    def _suppress(self, event_type: str) -> None:
+        self._suppressed[event_type] = self._suppressed.get(event_type, 0) + 1
+
+
+# Shared by every configured logger
+event_filter = EventSamplingFilter()
+
+# One queue and writer thread per log file
+_queue_handlers: Dict[Path, QueueHandler] = {}
+_listeners: Dict[Path, QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
+def _create_console_handler(formatter: logging.Formatter) -> logging.Handler:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     # Set encoding to utf-8 if possible (Python 3.7+)
     if hasattr(console_handler.stream, 'reconfigure'):
         try:
             console_handler.stream.reconfigure(encoding='utf-8')  # type: ignore
-        except Exception as e:
-            logger.warning(f"Could not reconfigure console stream encoding: {e}")
-    logger.addHandler(console_handler)
-    
-    # Create file handler if log directory exists or can be created
+        except Exception:
+            pass
+    return console_handler
+
+
+def _create_file_handler(log_file: Path, formatter: logging.Formatter) -> Optional[logging.Handler]:
     try:
         # Create logs directory if it doesn't exist
-        LOG_DIR.mkdir(exist_ok=True)
-        
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+
         # Create rotating file handler
         file_handler = RotatingFileHandler(
-            LOG_FILE,
+            log_file,
             maxBytes=MAX_LOG_SIZE,
             backupCount=BACKUP_COUNT,
             encoding='utf-8'
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        return file_handler
     except Exception as e:
-        logger.warning(f"Could not set up file logging: {e}")
-    
+        sys.stderr.write(f"Could not set up file logging: {e}\n")
+        return None
+
+
+def _get_queue_handler(log_file: Path, formatter: logging.Formatter) -> QueueHandler:
+    """Return the queue handler feeding the writer thread for a log file."""
+    with _listeners_lock:
+        handler = _queue_handlers.get(log_file)
+        if handler is not None:
+            return handler
+
+        handlers = [_create_console_handler(formatter)]
+        file_handler = _create_file_handler(log_file, formatter)
+        if file_handler is not None:
+            handlers.append(file_handler)
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        handler = QueueHandler(log_queue)  # type: ignore[arg-type]
+        _queue_handlers[log_file] = handler
+        _listeners[log_file] = listener
+        return handler
+
+
+def get_listener(log_file: Optional[Path] = None) -> Optional[QueueListener]:
+    """Return the writer for a log file (the last configured one by default)."""
+    return _listeners.get(log_file or LOG_FILE)
+
+
+def shutdown_logging() -> None:
+    """Write out queued records and stop the writer threads."""
+    with _listeners_lock:
+        listeners = list(_listeners.values())
+        _listeners.clear()
+        _queue_handlers.clear()
+    for listener in listeners:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def _restart_listeners_after_fork() -> None:
+    """Restart the writer threads in a forked child, which inherits none."""
+    global _listeners_lock
+    # The parent may have held the lock while forking
+    _listeners_lock = threading.Lock()
+    for listener in _listeners.values():
+        listener._thread = None
+        listener.start()
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listeners_after_fork)
+
+
+def configure_logging(name: str = LOGGER_NAME, file_path: str = "logs/", log_filename: str = "opusagent.log"):
+    """
+    Configure the application logger with console and file output.
+
+    Returns:
+        logging.Logger: The configured logger instance
+    """
+    global LOG_FILE
+    LOG_FILE = Path(file_path) / log_filename
+
+    # Create logger
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, LOG_LEVEL))
+
+    # Remove existing handlers if any
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+
+    # Create formatter
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    if LOG_QUEUED:
+        logger.addHandler(_get_queue_handler(LOG_FILE, formatter))
+    else:
+        logger.addHandler(_create_console_handler(formatter))
+        file_handler = _create_file_handler(LOG_FILE, formatter)
+        if file_handler is not None:
+            logger.addHandler(file_handler)
+
+    if event_filter not in logger.filters:
+        logger.addFilter(event_filter)
+
     # Prevent log propagation to root logger
     logger.propagate = False
-    
+
     logger.info("Logging configured")
     return logger
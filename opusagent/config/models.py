@@ -67,6 +67,23 @@ class ServerConfig:
     ws_ping_timeout: int = 10
     ws_max_size: int = 16 * 1024 * 1024  # 16MB
 
+    # Skip pydantic validation for audio deltas and media frames
+    fast_event_path: bool = True
+
+    # Subsystems loaded at startup instead of on first use
+    # (vad, voiceprint, mock, transcription)
+    preload: List[str] = field(default_factory=list)
+
+    # Session storage shared by the bridges of a worker (memory, redis or
+    # tiered); multiple workers need redis or tiered to share sessions
+    session_storage: str = "memory"
+    redis_url: str = "redis://localhost:6379"
+
+    # Directory where each worker publishes its statistics for /stats and
+    # /health; set by run_opus_server.py when it starts several workers
+    worker_stats_dir: Optional[str] = None
+    worker_stats_interval: float = 2.0
+
 
 @dataclass
 class OpenAIConfig:
@@ -123,6 +140,8 @@ class VADConfig:
     confidence_history_size: int = 5
     force_stop_timeout_ms: int = 2000
     sample_rate: int = DEFAULT_SAMPLE_RATE
+    shared_inference: bool = True  # One model + batched inference thread per process
+    onnx_model_path: Optional[str] = None  # silero_onnx backend; None = bundled model
 
 
 @dataclass
@@ -151,6 +170,14 @@ class TranscriptionConfig:
     # Whisper specific
     whisper_model_dir: Optional[str] = None
     whisper_temperature: float = 0.0
+    whisper_batching: bool = True  # Decode windows from all sessions in batches
+    whisper_max_batch_size: int = 8
+    whisper_batch_window_ms: float = 20.0  # Wait for more windows after the first
+
+    # Process-wide model registry
+    shared_models: bool = True  # Share loaded models between transcribers
+    model_idle_timeout: float = 300.0  # Seconds an unused model stays loaded
+    model_memory_budget_mb: float = 0.0  # Evict idle models above this (0 = no limit)
 
 
 @dataclass
@@ -165,6 +192,8 @@ class WebSocketConfig:
     ping_interval: int = 20
     ping_timeout: int = 30
     close_timeout: int = 10
+    warm_pool_size: int = 0  # Pre-opened connections kept ready (0 = disabled)
+    pool_wait_timeout: float = 10.0  # Max wait for a free connection when saturated
 
 
 @dataclass
@@ -185,6 +214,9 @@ class QualityMonitoringConfig:
     enable_realtime_logging: bool = True
     enable_summary_reports: bool = True
     summary_interval_seconds: int = 60
+    analysis_interval: int = 5  # Chunks per spectral analysis; levels are tracked on every chunk
+    analysis_window: int = 1024  # Samples in the sliding analysis window (0 = latest chunk)
+    batched_analysis: bool = False  # Analyse all calls together in one background pass
 
 
 @dataclass
@@ -211,6 +243,9 @@ class LoggingConfig:
     backup_count: int = 5
     console_output: bool = True
     file_output: bool = True
+    queued: bool = True  # Write records on a background thread
+    event_rate_limit: float = 20.0  # Records per event type per second (0 = no limit)
+    audio_sample_every: int = 50  # Keep one in N audio event records
 
 
 @dataclass
@@ -273,6 +308,16 @@ class TUIConfig:
     show_latency: bool = True
 
 
+@dataclass
+class RecordingConfig:
+    """Call recording configuration."""
+
+    streaming_writer: bool = False  # Write audio from a background thread, no in-memory buffers
+    writer_queue_size: int = 500  # Chunks queued for the writer before new audio is dropped
+    format: str = "wav"  # Stereo recording format: wav, flac or opus
+    compression_level: Optional[float] = None  # 0.0-1.0 encoder effort/quality, None for default
+
+
 @dataclass
 class StaticDataConfig:
     """Static data file configuration."""
@@ -314,6 +359,7 @@ class ApplicationConfig:
     tui: TUIConfig = field(default_factory=TUIConfig)
     static_data: StaticDataConfig = field(default_factory=StaticDataConfig)
     security: SecurityConfig = field(default_factory=SecurityConfig)
+    recording: RecordingConfig = field(default_factory=RecordingConfig)
 
     def validate(self) -> List[str]:
         """Validate configuration and return list of errors."""
@@ -344,6 +390,14 @@ class ApplicationConfig:
         ):
             errors.append("Transcription confidence threshold must be between 0 and 1")
 
+        # Validate recording config
+        if self.recording.format not in ("wav", "flac", "opus"):
+            errors.append("Recording format must be one of: wav, flac, opus")
+        if self.recording.compression_level is not None and not (
+            0 <= self.recording.compression_level <= 1
+        ):
+            errors.append("Recording compression level must be between 0 and 1")
+
         return errors
 
     def is_development(self) -> bool:
@@ -276,6 +276,11 @@ def mock_config():
     return get_config().mock
 
 
+def recording_config():
+    """Get call recording configuration."""
+    return get_config().recording
+
+
 def is_mock_mode() -> bool:
     """Check if running in mock mode."""
     return get_config().mock.enabled
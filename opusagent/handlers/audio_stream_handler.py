@@ -4,13 +4,16 @@ This module provides functionality for handling bidirectional audio streaming,
 including audio format validation, chunk processing, and stream management.
 """
 
+import asyncio
 import base64
 import logging
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import WebSocket
 
+from opusagent.config import quality_config, server_config
+from opusagent.config import vad_config as vad_settings
 from opusagent.config.constants import (
     DEFAULT_INTERNAL_SAMPLE_RATE,
     DEFAULT_MIN_AUDIO_BYTES,
@@ -25,13 +28,18 @@ from opusagent.models.audiocodes_api import (
     UserStreamSpeechStoppedResponse,
 )
 from opusagent.models.openai_api import (
-    InputAudioBufferAppendEvent,
     InputAudioBufferCommitEvent,
     ResponseAudioDeltaEvent,
 )
-from opusagent.utils.audio_quality_monitor import AudioQualityMonitor, QualityThresholds
-from opusagent.utils.audio_utils import AudioUtils
+from opusagent.utils.audio_buffer import AudioBufferPool, encode_input_audio_append
+from opusagent.utils.audio_quality_monitor import (
+    AudioQualityMonitor,
+    QualityThresholds,
+    get_quality_analysis_service,
+)
+from opusagent.utils import event_codec
 from opusagent.utils.call_recorder import CallRecorder
+from opusagent.utils.resampler import StreamingResampler
 from opusagent.utils.websocket_utils import WebSocketUtils
 from opusagent.vad.audio_processor import to_float32_mono
 from opusagent.vad.vad_config import load_vad_config
@@ -58,6 +66,8 @@ class AudioStreamHandler:
         media_format (Optional[str]): Audio format being used for the session
         active_stream_id (Optional[str]): Identifier for the current audio stream being played
         call_recorder (Optional[CallRecorder]): Call recorder for logging audio
+        caller_identifier (Optional[StreamingCallerIdentifier]): Identifies the
+            caller from the first seconds of inbound audio, when set
         audio_chunks_sent (int): Number of audio chunks sent to the OpenAI Realtime API
         total_audio_bytes_sent (int): Total number of bytes sent to the OpenAI Realtime API
         _closed (bool): Flag indicating whether the handler is closed
@@ -87,6 +97,7 @@ class AudioStreamHandler:
         self.platform_websocket = platform_websocket
         self.realtime_websocket = realtime_websocket
         self.call_recorder = call_recorder
+        self.caller_identifier = None
         self.enable_quality_monitoring = enable_quality_monitoring
         self.quality_monitor = None
         self.conversation_id = None
@@ -98,40 +109,82 @@ class AudioStreamHandler:
         self.bridge_type = bridge_type
         self.internal_sample_rate = internal_sample_rate
 
-        # Quality monitoring
+        # Audio deltas skip pydantic validation and base64 checks
+        self.fast_event_path = server_config().fast_event_path
+
+        # Per-stream resamplers keep filter state across chunks, avoiding
+        # boundary clicks and per-chunk filter design.
+        self._resamplers: Dict[Tuple[int, int], StreamingResampler] = {}
+
+        # Inbound chunks are decoded once and shared by every stage; padded
+        # frames are built in recycled buffers.
+        self._buffer_pool = AudioBufferPool()
+
+        # Quality monitoring. SNR/THD run on a decimated cadence over a
+        # sliding window, optionally batched across calls off the event loop.
         if self.enable_quality_monitoring:
+            quality_settings = quality_config()
             self.quality_monitor = AudioQualityMonitor(
                 sample_rate=self.internal_sample_rate,  # Use internal sample rate
                 chunk_size=1024,
                 thresholds=quality_thresholds or QualityThresholds(),
                 history_size=100,
+                analysis_interval=quality_settings.analysis_interval,
+                window_size=quality_settings.analysis_window or None,
+                batch_service=(
+                    get_quality_analysis_service()
+                    if quality_settings.batched_analysis
+                    else None
+                ),
             )
 
             # Set up quality alert callback
             self.quality_monitor.on_quality_alert = self._on_quality_alert
             logger.info("Audio quality monitoring enabled")
 
-        # VAD integration
+        # VAD integration. The VAD runs at the internal sample rate (24kHz
+        # audio is resampled to 16kHz inside the VAD); with shared inference
+        # enabled the model is loaded once per process and batched off-loop.
+        # The VAD (and torch) is created off the event loop when the stream
+        # is initialized, not when the handler is built.
         vad_config = load_vad_config()
-        self.vad = VADFactory.create_vad(vad_config)
+        vad_config["sample_rate"] = self.internal_sample_rate
+        vad_config["shared"] = vad_settings().shared_inference
+        self._vad_config = vad_config
+        self._vad: Optional[Any] = None
         self.vad_enabled = vad_config.get("backend", "silero") is not None
         self._speech_active = False  # Track speech state for VAD events
-        if self.vad_enabled and self.vad:
-            self.vad.sample_rate = self.internal_sample_rate
-            # Updated VAD chunk sizes to support 24kHz
-            if self.internal_sample_rate == 24000:
-                self.vad.chunk_size = 768  # 32ms at 24kHz
-            elif self.internal_sample_rate == 16000:
-                self.vad.chunk_size = 512  # 32ms at 16kHz
-            elif self.internal_sample_rate == 8000:
-                self.vad.chunk_size = 256  # 32ms at 8kHz
-            else:
-                logger.warning(
-                    f"Unsupported internal sample rate for VAD: {self.internal_sample_rate}"
-                )
-            logger.debug(
-                f"Set VAD to {self.internal_sample_rate}Hz, chunk_size {self.vad.chunk_size}"
-            )
+
+    @property
+    def vad(self) -> Optional[Any]:
+        """The VAD instance, or None until _ensure_vad() has created it."""
+        return self._vad
+
+    @vad.setter
+    def vad(self, value: Optional[Any]) -> None:
+        self._vad = value
+
+    def _create_vad(self) -> Any:
+        """Create the VAD; loads torch and the Silero model, so keep it off the loop."""
+        vad = VADFactory.create_vad(self._vad_config)
+        logger.debug(
+            f"Set VAD to {self.internal_sample_rate}Hz, chunk_size {vad.chunk_size}"
+        )
+        return vad
+
+    async def _ensure_vad(self) -> Optional[Any]:
+        """Create the VAD off the event loop if enabled and not created yet.
+
+        A VAD that fails to load disables VAD for the stream instead of
+        being retried on every chunk.
+        """
+        if self.vad_enabled and self._vad is None:
+            try:
+                self._vad = await asyncio.to_thread(self._create_vad)
+            except Exception as e:
+                logger.error(f"Failed to create VAD, continuing without it: {e}")
+                self.vad_enabled = False
+        return self._vad
 
     async def initialize_stream(self, conversation_id: str, media_format: str) -> None:
         """Initialize a new audio stream.
@@ -144,6 +197,11 @@ class AudioStreamHandler:
         self.media_format = media_format
         self.audio_chunks_sent = 0
         self.total_audio_bytes_sent = 0
+        for resampler in self._resamplers.values():
+            resampler.reset()
+        if self.caller_identifier is not None:
+            self.caller_identifier.reset()
+        await self._ensure_vad()
         logger.info(f"Audio stream initialized for conversation: {conversation_id}")
 
     async def handle_incoming_audio(self, data: Dict[str, Any]) -> None:
@@ -161,11 +219,11 @@ class AudioStreamHandler:
             )
             return
 
-        audio_chunk_b64 = data["audioChunk"]
+        pooled_buffer = None
 
         try:
-            # Decode base64 to get raw audio bytes
-            audio_bytes = base64.b64decode(audio_chunk_b64)
+            # Decode base64 once; every stage below reads the same buffer
+            audio_bytes = base64.b64decode(data["audioChunk"])
             original_size = len(audio_bytes)
 
             # Determine original sample rate
@@ -177,13 +235,17 @@ class AudioStreamHandler:
 
             # Resample directly to internal rate (24kHz) if necessary
             if original_rate != self.internal_sample_rate:
-                audio_bytes = AudioUtils.resample_audio(
-                    audio_bytes, original_rate, self.internal_sample_rate
-                )
+                audio_bytes = self._get_resampler(
+                    original_rate, self.internal_sample_rate
+                ).process(audio_bytes)
                 logger.debug(
                     f"Resampled from {original_rate}Hz to {self.internal_sample_rate}Hz"
                 )
 
+            # Early caller identification; embedding happens off the event loop
+            if self.caller_identifier is not None:
+                self.caller_identifier.feed(audio_bytes)
+
             # Calculate min chunk size for internal rate
             min_chunk_size = int(0.1 * self.internal_sample_rate * 2)  # 100ms
 
@@ -193,19 +255,18 @@ class AudioStreamHandler:
                     f"Audio chunk too small: {len(audio_bytes)} bytes. "
                     f"Padding with silence to {min_chunk_size} bytes for 100ms at {self.internal_sample_rate}Hz."
                 )
-                padding_needed = min_chunk_size - len(audio_bytes)
-                audio_bytes += b"\x00" * padding_needed
-                audio_chunk_b64 = base64.b64encode(audio_bytes).decode("utf-8")
+                pooled_buffer = self._buffer_pool.pad(audio_bytes, min_chunk_size)
+                audio_bytes = pooled_buffer
 
-            # VAD processing (local)
-            if self.vad_enabled and self.vad:
+            # VAD processing (local); created here if initialize_stream() did not
+            if self.vad_enabled and await self._ensure_vad():
                 # Convert to float32 mono for VAD
                 try:
                     audio_arr = to_float32_mono(audio_bytes, sample_width=2, channels=1)
                     logger.debug(
                         f"[VAD] Processing audio chunk: {len(audio_arr)} samples"
                     )
-                    vad_result = self.vad.process_audio(audio_arr)
+                    vad_result = await self.vad.process_audio_async(audio_arr)
                     is_speech = vad_result.get("is_speech", False)
                     speech_prob = vad_result.get("speech_prob", 0.0)
                     logger.debug(
@@ -251,36 +312,34 @@ class AudioStreamHandler:
             # Analyze audio quality if monitoring is enabled
             if self.enable_quality_monitoring and self.quality_monitor:
                 try:
-                    quality_metrics = self.quality_monitor.analyze_audio_chunk(
+                    quality_metrics = self.quality_monitor.process_audio_chunk(
                         audio_bytes
                     )
-                    logger.debug(
-                        f"Audio quality - SNR: {quality_metrics.snr_db:.1f}dB, "
-                        f"THD: {quality_metrics.thd_percent:.2f}%, "
-                        f"Clipping: {quality_metrics.clipping_percent:.2f}%, "
-                        f"Score: {quality_metrics.quality_score:.1f} ({quality_metrics.quality_level.value})"
-                    )
+                    if quality_metrics is not None:
+                        logger.debug(
+                            f"Audio quality - SNR: {quality_metrics.snr_db:.1f}dB, "
+                            f"THD: {quality_metrics.thd_percent:.2f}%, "
+                            f"Clipping: {quality_metrics.clipping_percent:.2f}%, "
+                            f"Score: {quality_metrics.quality_score:.1f} ({quality_metrics.quality_level.value})"
+                        )
                 except Exception as e:
                     logger.warning(f"Error analyzing audio quality: {e}")
 
             # Record caller audio if recorder is available (use resampled audio)
             if self.call_recorder:
-                resampled_audio_b64 = base64.b64encode(audio_bytes).decode("utf-8")
-                await self.call_recorder.record_caller_audio(resampled_audio_b64)
+                await self.call_recorder.record_caller_audio_bytes(audio_bytes)
 
             # Ensure audio is at OpenAI's required 24kHz sample rate
             if self.internal_sample_rate != DEFAULT_OPENAI_SAMPLE_RATE:
-                openai_audio = AudioUtils.resample_audio(
-                    audio_bytes, self.internal_sample_rate, DEFAULT_OPENAI_SAMPLE_RATE
-                )
+                openai_audio = self._get_resampler(
+                    self.internal_sample_rate, DEFAULT_OPENAI_SAMPLE_RATE
+                ).process(audio_bytes)
                 logger.debug(
                     f"Resampled from {self.internal_sample_rate}Hz to {DEFAULT_OPENAI_SAMPLE_RATE}Hz for OpenAI"
                 )
             else:
                 openai_audio = audio_bytes
 
-            audio_chunk_b64 = base64.b64encode(openai_audio).decode("utf-8")
-
             # Update total bytes with actual sent bytes
             self.total_audio_bytes_sent += len(openai_audio)
 
@@ -291,22 +350,19 @@ class AudioStreamHandler:
                 f"(~{duration_ms:.1f}ms), {len(openai_audio)} bytes to OpenAI. Total sent: {self.total_audio_bytes_sent} bytes"
             )
 
-            # Send to OpenAI
-            audio_append = InputAudioBufferAppendEvent(
-                type="input_audio_buffer.append", audio=audio_chunk_b64
-            )
-            logger.debug(
-                f"Sending audio to realtime-websocket (size: {len(audio_chunk_b64)} bytes base64)"
-            )
+            # Send to OpenAI: base64 and JSON framing happen once, here
             if WebSocketUtils.is_websocket_closed(self.realtime_websocket):
                 logger.warning(
                     "Attempted to send audio to realtime-websocket after close; message not sent."
                 )
                 return
-            await self.realtime_websocket.send(audio_append.model_dump_json())
+            await self.realtime_websocket.send(encode_input_audio_append(openai_audio))
 
         except Exception as e:
             logger.error(f"Error processing audio chunk: {e}")
+        finally:
+            if pooled_buffer is not None:
+                self._buffer_pool.release(pooled_buffer)
 
     async def handle_outgoing_audio(self, response_dict: Dict[str, Any]) -> None:
         """Handle outgoing audio chunk from OpenAI Realtime API.
@@ -318,27 +374,18 @@ class AudioStreamHandler:
             response_dict (Dict[str, Any]): Response data containing audio delta
         """
         try:
-            # Validate that we have the required fields before parsing
-            required_fields = [
-                "response_id",
-                "item_id",
-                "output_index",
-                "content_index",
-                "delta",
-            ]
-            missing_fields = [
-                field for field in required_fields if field not in response_dict
-            ]
-
-            if missing_fields:
-                logger.warning(
-                    f"Incomplete audio delta event - missing fields: {missing_fields}"
-                )
-                logger.debug(f"Received data: {response_dict}")
-                return
-
-            # Parse audio delta event
-            audio_delta = ResponseAudioDeltaEvent(**response_dict)
+            if self.fast_event_path:
+                delta = event_codec.read_audio_delta(response_dict)
+                if delta is None:
+                    logger.warning("Incomplete audio delta event, skipping")
+                    return
+                if not delta.strip():
+                    logger.warning("Empty audio delta received, skipping audio chunk")
+                    return
+            else:
+                delta = self._validate_audio_delta(response_dict)
+                if delta is None:
+                    return
 
             # Check if connections are still active
             if self._closed or not self.conversation_id:
@@ -381,33 +428,37 @@ class AudioStreamHandler:
                     return
 
             try:
-                # Record bot audio if recorder is available
-                if self.call_recorder:
-                    await self.call_recorder.record_bot_audio(audio_delta.delta)
-
-                # Validate audio delta before sending
-                if not audio_delta.delta or audio_delta.delta.strip() == "":
-                    logger.warning("Empty audio delta received, skipping audio chunk")
-                    return
-
-                # Validate base64 encoding
-                try:
-                    base64.b64decode(audio_delta.delta)
-                except Exception as e:
-                    logger.error(f"Invalid base64 audio delta: {e}")
-                    return
+                # Decode only when the audio is needed: for the recorder, or
+                # to validate the base64 on the slow path
+                if self.call_recorder or not self.fast_event_path:
+                    try:
+                        audio_bytes = base64.b64decode(delta)
+                    except Exception as e:
+                        logger.error(f"Invalid base64 audio delta: {e}")
+                        return
+
+                    # Record bot audio if recorder is available
+                    if self.call_recorder:
+                        await self.call_recorder.record_bot_audio_bytes(audio_bytes)
 
                 # Send audio chunk to platform client
-                stream_chunk = PlayStreamChunkMessage(
-                    type=TelephonyEventType.PLAY_STREAM_CHUNK,
-                    conversationId=self.conversation_id,
-                    streamId=self.active_stream_id,
-                    audioChunk=audio_delta.delta,
-                    participant="caller",
-                )
-                await self.platform_websocket.send_json(stream_chunk.model_dump())
+                if self.fast_event_path:
+                    chunk_message = event_codec.play_stream_chunk(
+                        self.conversation_id, self.active_stream_id, delta
+                    )
+                else:
+                    chunk_message = PlayStreamChunkMessage(
+                        type=TelephonyEventType.PLAY_STREAM_CHUNK,
+                        conversationId=self.conversation_id,
+                        streamId=self.active_stream_id,
+                        audioChunk=delta,
+                        participant="caller",
+                    ).model_dump()
+                await self.platform_websocket.send_json(chunk_message)
                 logger.debug(
-                    f"Sent audio chunk to client (size: {len(audio_delta.delta)} bytes)"
+                    "Sent audio chunk to client (size: %d bytes)",
+                    len(delta),
+                    extra={"event_type": "playStream.chunk"},
                 )
             except Exception as e:
                 logger.error(f"Error sending audio chunk: {e}")
@@ -421,6 +472,39 @@ class AudioStreamHandler:
             # Log the problematic data for debugging
             logger.debug(f"Problematic response_dict: {response_dict}")
 
+    def _validate_audio_delta(self, response_dict: Dict[str, Any]) -> Optional[str]:
+        """Validate an audio delta with the pydantic model.
+
+        Args:
+            response_dict (Dict[str, Any]): Response data containing audio delta
+
+        Returns:
+            Optional[str]: The base64 delta, or None if the event is incomplete or empty
+        """
+        required_fields = [
+            "response_id",
+            "item_id",
+            "output_index",
+            "content_index",
+            "delta",
+        ]
+        missing_fields = [
+            field for field in required_fields if field not in response_dict
+        ]
+
+        if missing_fields:
+            logger.warning(
+                f"Incomplete audio delta event - missing fields: {missing_fields}"
+            )
+            logger.debug(f"Received data: {response_dict}")
+            return None
+
+        audio_delta = ResponseAudioDeltaEvent(**response_dict)
+        if not audio_delta.delta or audio_delta.delta.strip() == "":
+            logger.warning("Empty audio delta received, skipping audio chunk")
+            return None
+        return audio_delta.delta
+
     async def commit_audio_buffer(self) -> None:
         """Commit the audio buffer to OpenAI Realtime API.
 
@@ -502,8 +586,26 @@ class AudioStreamHandler:
             quality_summary = self.quality_monitor.get_quality_summary()
             stats["quality_monitoring"] = quality_summary
 
+        stats["buffer_pool"] = self._buffer_pool.get_stats()
         return stats
 
+    def _get_resampler(self, from_rate: int, to_rate: int) -> StreamingResampler:
+        """Get the stateful resampler for a rate pair, creating it on first use.
+
+        Args:
+            from_rate (int): Source sample rate
+            to_rate (int): Target sample rate
+
+        Returns:
+            StreamingResampler: Resampler dedicated to this stream and rate pair
+        """
+        key = (from_rate, to_rate)
+        resampler = self._resamplers.get(key)
+        if resampler is None:
+            resampler = StreamingResampler(from_rate, to_rate)
+            self._resamplers[key] = resampler
+        return resampler
+
     def _on_quality_alert(self, alert) -> None:
         """Handle quality alerts from the quality monitor.
 
@@ -549,4 +651,8 @@ class AudioStreamHandler:
         if not self._closed:
             self._closed = True
             await self.stop_stream()
+            if self._vad:
+                self._vad.cleanup()
+            if self.caller_identifier is not None:
+                await self.caller_identifier.close()
             logger.info("Audio stream handler closed")
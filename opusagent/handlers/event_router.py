@@ -2,19 +2,108 @@
 
 This module provides a centralized event routing system for handling events
 from both telephony and OpenAI Realtime API sources.
+
+Handlers are compiled into dispatch tables when they are registered: each
+raw type string maps straight to an awaitable callable, with sync handlers
+wrapped once and log events routed to handle_log_event. Dispatching a
+message is then a single dict lookup. The router counts dispatches, errors
+and handler latency per event type; get_stats() reports them.
 """
 
 import asyncio
+import bisect
 import json
 import logging
-from typing import Any, Callable, Dict, Optional
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional
 
-from opusagent.config.logging_config import configure_logging
+from opusagent.config.logging_config import LazyJson, configure_logging
 from opusagent.models.audiocodes_api import TelephonyEventType
 from opusagent.models.openai_api import LogEventType, ServerEventType
 
 logger = configure_logging("event_router")
 
+# Upper bounds of the dispatch latency histogram buckets, in microseconds
+DISPATCH_BUCKETS_US = (10, 50, 100, 500, 1000, 5000, 10000, 50000, 100000)
+
+# Realtime events whose payload is logged at DEBUG
+_DETAIL_EVENTS = {
+    "response.created": None,
+    "response.done": None,
+    "response.output_item.added": "item",
+    "response.content_part.added": "part",
+}
+_AUDIO_DELTA_EVENTS = frozenset({"response.audio.delta", "response.audio_transcript.delta"})
+_FUNCTION_CALL_EVENTS = frozenset(
+    {"response.function_call_arguments.delta", "response.function_call_arguments.done"}
+)
+
+Dispatch = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+def _event_key(event_type: Any) -> str:
+    """Raw type string for an event type enum or string."""
+    return getattr(event_type, "value", event_type)
+
+
+def _as_coroutine(handler: Callable) -> Dispatch:
+    """Wrap a sync handler once so every table entry can be awaited."""
+    if asyncio.iscoroutinefunction(handler):
+        return handler
+
+    async def call_sync(data: Dict[str, Any]) -> Any:
+        return handler(data)
+
+    return call_sync
+
+
+class _DispatchStats:
+    """Dispatch count, errors and latency for one event type."""
+
+    __slots__ = ("count", "errors", "counts", "total_us", "max_us")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.counts = [0] * (len(DISPATCH_BUCKETS_US) + 1)
+        self.total_us = 0.0
+        self.max_us = 0.0
+
+    def record(self, seconds: float) -> None:
+        latency_us = seconds * 1e6
+        self.count += 1
+        self.counts[bisect.bisect_left(DISPATCH_BUCKETS_US, latency_us)] += 1
+        self.total_us += latency_us
+        if latency_us > self.max_us:
+            self.max_us = latency_us
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of dispatches."""
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(DISPATCH_BUCKETS_US, self.counts):
+            seen += count
+            if count and seen >= target:
+                return min(float(bound), self.max_us)
+        return self.max_us
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {
+            str(bound): count for bound, count in zip(DISPATCH_BUCKETS_US, self.counts)
+        }
+        buckets["inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_us": self.total_us / self.count if self.count else 0.0,
+            "p50_us": self.percentile(0.50),
+            "p99_us": self.percentile(0.99),
+            "max_us": self.max_us,
+            "buckets_us": buckets,
+        }
+
+
 class EventRouter:
     """Router class for handling events from telephony and realtime sources.
     
@@ -39,6 +128,17 @@ class EventRouter:
             LogEventType.INPUT_AUDIO_BUFFER_SPEECH_STOPPED,
             LogEventType.INPUT_AUDIO_BUFFER_SPEECH_STARTED,
         ]
+
+        # Compiled dispatch tables keyed by raw type string
+        self._platform_table: Dict[str, Dispatch] = {}
+        self._realtime_table: Dict[str, Dispatch] = {
+            _event_key(event_type): self.handle_log_event
+            for event_type in self.log_event_types
+        }
+        self._known_platform_types = frozenset(
+            event_type.value for event_type in TelephonyEventType
+        )
+        self._stats: Dict[str, _DispatchStats] = defaultdict(_DispatchStats)
     
     def register_platform_handler(self, event_type: TelephonyEventType, handler: Callable) -> None:
         """Register a handler for a telephony event type.
@@ -48,6 +148,7 @@ class EventRouter:
             handler: The handler function to call for this event type
         """
         self.telephony_handlers[event_type] = handler
+        self._platform_table[_event_key(event_type)] = _as_coroutine(handler)
         logger.debug(f"Registered telephony handler for event type: {event_type}")
     
     def register_realtime_handler(self, event_type: str, handler: Callable) -> None:
@@ -58,6 +159,10 @@ class EventRouter:
             handler: The handler function to call for this event type
         """
         self.realtime_handlers[event_type] = handler
+        key = _event_key(event_type)
+        # Log events always go to handle_log_event
+        if self._realtime_table.get(key) != self.handle_log_event:
+            self._realtime_table[key] = _as_coroutine(handler)
         logger.debug(f"Registered realtime handler for event type: {event_type}")
     
     def _get_platform_event_type(self, msg_type_str: str) -> Optional[TelephonyEventType]:
@@ -80,32 +185,29 @@ class EventRouter:
         Args:
             data: The event data containing the message type and other information
         """
-        msg_type_str = data["type"]
-        msg_type = self._get_platform_event_type(msg_type_str)
-        
-        if msg_type:
-            # Log message type and audio chunk size if present
-            if "audioChunk" in data:
-                logger.info(
-                    f"Received platform message: {msg_type_str} with audio chunk size: {len(data['audioChunk'])} bytes"
-                )
-            else:
-                logger.info(f"Received platform message: {msg_type_str}")
-                
-            # Dispatch to the appropriate handler
-            handler = self.telephony_handlers.get(msg_type)
-            if handler:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler(data)
-                    else:
-                        handler(data)
-                except Exception as e:
-                    logger.error(f"Error in platform event handler for {msg_type}: {e}")
+        msg_type_str = _event_key(data["type"])
+        handler = self._platform_table.get(msg_type_str)
+
+        if handler is None:
+            if msg_type_str in self._known_platform_types:
+                logger.warning(f"No handler for platform message type: {msg_type_str}")
             else:
-                logger.warning(f"No handler for platform message type: {msg_type}")
+                logger.warning(f"Unknown platform message type: {msg_type_str}")
+            return
+
+        # Log message type and audio chunk size if present (sampled per type)
+        extra = {"event_type": msg_type_str}
+        if "audioChunk" in data:
+            logger.debug(
+                "Received platform message: %s with audio chunk size: %d bytes",
+                msg_type_str,
+                len(data["audioChunk"]),
+                extra=extra,
+            )
         else:
-            logger.warning(f"Unknown platform message type: {msg_type_str}")
+            logger.info("Received platform message: %s", msg_type_str, extra=extra)
+
+        await self._dispatch(handler, msg_type_str, data, "platform event")
     
     async def handle_realtime_event(self, data: Dict[str, Any]) -> None:
         """Handle a realtime event.
@@ -113,44 +215,69 @@ class EventRouter:
         Args:
             data: The event data containing the event type and other information
         """
-        event_type = data["type"]
-        logger.info(f"Received OpenAI message type: {event_type}")
-        
-        # Add detailed logging for important events
-        if event_type in ["response.created", "response.done"]:
-            logger.info(f"Response event details: {json.dumps(data, indent=2)}")
-        elif event_type == "response.output_item.added":
-            logger.info(f"Output item added: {json.dumps(data.get('item', {}), indent=2)}")
-        elif event_type == "response.content_part.added":
-            logger.info(f"Content part added: {json.dumps(data.get('part', {}), indent=2)}")
-        elif event_type in ["response.audio.delta", "response.audio_transcript.delta"]:
-            logger.info(f"Audio event: {event_type} - delta size: {len(data.get('delta', ''))}")
-        
-        # Handle log events first
-        if event_type in [event.value for event in self.log_event_types]:
-            await self.handle_log_event(data)
-            return
-        
-        # Dispatch to the appropriate handler
-        handler = self.realtime_handlers.get(event_type)
-        if handler:
-            try:
-                # Special logging for function call events
-                if event_type in [
-                    "response.function_call_arguments.delta",
-                    "response.function_call_arguments.done",
-                ]:
-                    logger.info(f"🎯 Routing {event_type} to handler")
-                
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(data)
-                else:
-                    handler(data)
-            except Exception as e:
-                logger.error(f"Error in event handler for {event_type}: {e}")
-        else:
+        event_type = _event_key(data["type"])
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_realtime_details(event_type, data)
+
+        handler = self._realtime_table.get(event_type)
+        if handler is None:
             logger.warning(f"Unknown OpenAI event type: {event_type}")
-            logger.info(f"Unknown event data: {json.dumps(data, indent=2)}")
+            logger.debug("Unknown event data: %s", LazyJson(data, indent=2))
+            return
+
+        await self._dispatch(handler, event_type, data, "event")
+
+    async def _dispatch(
+        self, handler: Dispatch, event_type: str, data: Dict[str, Any], kind: str
+    ) -> None:
+        """Run a handler, recording its latency and swallowing its errors."""
+        stats = self._stats[event_type]
+        start = time.perf_counter()
+        try:
+            await handler(data)
+        except Exception as e:
+            stats.errors += 1
+            logger.error(f"Error in {kind} handler for {event_type}: {e}")
+        stats.record(time.perf_counter() - start)
+
+    def _log_realtime_details(self, event_type: str, data: Dict[str, Any]) -> None:
+        """Debug logging for a realtime event; payloads are serialized lazily."""
+        extra = {"event_type": event_type}
+        logger.debug("Received OpenAI message type: %s", event_type, extra=extra)
+        if event_type in _DETAIL_EVENTS:
+            field = _DETAIL_EVENTS[event_type]
+            payload = data if field is None else data.get(field, {})
+            logger.debug("%s details: %s", event_type, LazyJson(payload, indent=2), extra=extra)
+        elif event_type in _AUDIO_DELTA_EVENTS:
+            logger.debug(
+                "Audio event: %s - delta size: %d",
+                event_type,
+                len(data.get("delta", "")),
+                extra=extra,
+            )
+        elif event_type in _FUNCTION_CALL_EVENTS:
+            logger.debug("🎯 Routing %s to handler", event_type, extra=extra)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get dispatch statistics.
+
+        Returns:
+            Dict[str, Any]: Total dispatches and errors, and per event type
+                counts, errors and handler latency percentiles and buckets
+                (keyed by upper bound in microseconds)
+        """
+        return {
+            "dispatched": sum(s.count for s in self._stats.values()),
+            "errors": sum(s.errors for s in self._stats.values()),
+            "events": {
+                event_type: stats.to_dict()
+                for event_type, stats in self._stats.items()
+            },
+        }
+
+    def reset_stats(self) -> None:
+        """Clear dispatch statistics."""
+        self._stats.clear()
     
     async def handle_log_event(self, data: Dict[str, Any]) -> None:
         """Handle a log event.
@@ -85,7 +85,7 @@ import logging
 import uuid
 from typing import Any, Callable, Dict, List, Optional
 
-from opusagent.config.logging_config import configure_logging
+from opusagent.config.logging_config import LazyJson, configure_logging
 from opusagent.handlers.error_handler import ErrorContext, ErrorSeverity, handle_error
 
 logger = configure_logging("function_handler")
@@ -180,7 +180,7 @@ class FunctionHandler:
         Args:
             response_dict: The function call event data from OpenAI
         """
-        logger.info(f"Function call event received: {response_dict}")
+        logger.debug("Function call event received: %s", response_dict)
 
         try:
             # Arguments are a JSON string
@@ -200,7 +200,8 @@ class FunctionHandler:
                 logger.error(f"No function name found in arguments: {arguments_str}")
                 return
 
-            logger.info(f"Dispatching function: {function_name} with args: {args}")
+            logger.info("Dispatching function: %s", function_name)
+            logger.debug("Function %s args: %s", function_name, args)
 
             # Run function out-of-band
             asyncio.create_task(
@@ -255,7 +256,11 @@ class FunctionHandler:
         self.active_function_calls[call_id]["arguments_buffer"] += delta
 
         logger.debug(
-            f"Function call arguments delta for {call_id}: '{delta}' (total: {len(self.active_function_calls[call_id]['arguments_buffer'])} chars)"
+            "Function call arguments delta for %s: '%s' (total: %d chars)",
+            call_id,
+            delta,
+            len(self.active_function_calls[call_id]["arguments_buffer"]),
+            extra={"event_type": "response.function_call_arguments.delta"},
         )
 
     async def handle_function_call_arguments_done(
@@ -270,21 +275,21 @@ class FunctionHandler:
         Args:
             response_dict: The function call arguments done event data
         """
-        logger.info(f"🔧 FUNCTION CALL ARGUMENTS DONE HANDLER CALLED")
-        logger.info(f"🔧 Full response_dict: {response_dict}")
-
         call_id = response_dict.get("call_id")
         final_arguments = response_dict.get("arguments", "")
         item_id = response_dict.get("item_id")
         output_index = response_dict.get("output_index", 0)
         response_id = response_dict.get("response_id")
 
-        logger.info(f"🔧 Extracted values:")
-        logger.info(f"   call_id: {call_id}")
-        logger.info(f"   final_arguments: {final_arguments}")
-        logger.info(f"   item_id: {item_id}")
-        logger.info(f"   output_index: {output_index}")
-        logger.info(f"   response_id: {response_id}")
+        logger.debug(
+            "🔧 Function call arguments done: call_id=%s item_id=%s "
+            "output_index=%s response_id=%s arguments=%s",
+            call_id,
+            item_id,
+            output_index,
+            response_id,
+            final_arguments,
+        )
 
         if not call_id:
             logger.warning(
@@ -292,17 +297,12 @@ class FunctionHandler:
             )
             return
 
-        logger.info(
-            f"🔧 Active function calls: {list(self.active_function_calls.keys())}"
-        )
-
         # Use the final arguments from the done event, or fall back to accumulated buffer
         if final_arguments:
             arguments_str = final_arguments
-            logger.info(f"🔧 Using final_arguments from done event: {arguments_str}")
         elif call_id in self.active_function_calls:
             arguments_str = self.active_function_calls[call_id]["arguments_buffer"]
-            logger.info(f"🔧 Using accumulated buffer: {arguments_str}")
+            logger.debug("🔧 Using accumulated buffer for %s", call_id)
         else:
             logger.error(f"🚨 Function call done for unknown call_id: {call_id}")
             logger.error(
@@ -310,20 +310,14 @@ class FunctionHandler:
             )
             return
 
-        logger.info(
-            f"🔧 Function call arguments complete for {call_id}: {arguments_str}"
-        )
-
         try:
             # Parse the JSON arguments
             args = json.loads(arguments_str) if arguments_str else {}
-            logger.info(f"🔧 Parsed arguments: {args}")
 
             # Get the function name from the captured function call state
             function_name = None
             if call_id in self.active_function_calls:
                 function_name = self.active_function_calls[call_id].get("function_name")
-                logger.info(f"🔧 Found function_name in active calls: {function_name}")
             else:
                 logger.error(f"🚨 call_id {call_id} not found in active_function_calls")
 
@@ -338,7 +332,7 @@ class FunctionHandler:
                     del self.active_function_calls[call_id]
                 return
 
-            logger.info(f"🚀 Executing function: {function_name} with args: {args}")
+            logger.info("🚀 Executing function: %s (call_id=%s)", function_name, call_id)
 
             # Execute the function
             asyncio.create_task(
@@ -346,7 +340,6 @@ class FunctionHandler:
                     function_name, args, call_id, item_id, output_index, response_id
                 )
             )
-            logger.info(f"🚀 Function execution task created for {function_name}")
 
         except json.JSONDecodeError as e:
             logger.error(f"🚨 Failed to parse function arguments JSON: {e}")
@@ -359,7 +352,7 @@ class FunctionHandler:
         finally:
             # Clean up the active function call
             if call_id in self.active_function_calls:
-                logger.info(f"🔧 Cleaning up active function call for {call_id}")
+                logger.debug("🔧 Cleaning up active function call for %s", call_id)
                 del self.active_function_calls[call_id]
 
     async def _execute_and_respond_to_function(
@@ -382,36 +375,36 @@ class FunctionHandler:
             output_index: Output index
             response_id: Response identifier
         """
-        logger.info(f"🔥 _execute_and_respond_to_function called:")
-        logger.info(f"   function_name: {function_name}")
-        logger.info(f"   arguments: {arguments}")
-        logger.info(f"   call_id: {call_id}")
-        logger.info(f"   item_id: {item_id}")
-        logger.info(f"   output_index: {output_index}")
-        logger.info(f"   response_id: {response_id}")
+        logger.debug(
+            "🔥 Executing %s: call_id=%s item_id=%s output_index=%s "
+            "response_id=%s arguments=%s",
+            function_name,
+            call_id,
+            item_id,
+            output_index,
+            response_id,
+            arguments,
+        )
 
         # Execute the function
         try:
-            logger.info(f"🔥 Looking up function '{function_name}' in registry...")
-            logger.info(
-                f"🔥 Available functions: {list(self.function_registry.keys())}"
-            )
-
             func = self.function_registry.get(function_name)
             if not func:
-                logger.error(f"🚨 Function '{function_name}' not implemented.")
+                logger.error(
+                    f"🚨 Function '{function_name}' not implemented. "
+                    f"Available functions: {list(self.function_registry.keys())}"
+                )
                 raise NotImplementedError(
                     f"Function '{function_name}' not implemented."
                 )
 
-            logger.info(f"🔥 Found function '{function_name}', executing...")
-
             result = (
                 await func(arguments)
                 if asyncio.iscoroutinefunction(func)
                 else func(arguments)
             )
-            logger.info(f"✅ Function {function_name} executed successfully: {result}")
+            logger.info("✅ Function %s executed successfully", function_name)
+            logger.debug("Function %s result: %s", function_name, result)
 
             # Log function call to call recorder if available
             if self.call_recorder:
@@ -469,14 +462,13 @@ class FunctionHandler:
                 "output": json.dumps(result),
             },
         }
-        logger.info(f"📤 Sending function result for {function_name}: {result}")
-        logger.info(
-            f"📤 Function result event: {json.dumps(function_result_event, indent=2)}"
+        logger.debug(
+            "📤 Function result event: %s", LazyJson(function_result_event, indent=2)
         )
 
         try:
             await self.realtime_websocket.send(json.dumps(function_result_event))
-            logger.info(f"✅ Function result sent successfully to OpenAI")
+            logger.info("📤 Function result for %s sent to OpenAI", function_name)
 
             # Check if this function indicates the call should end
             should_hang_up = self._should_trigger_hang_up(function_name, result)
@@ -488,7 +480,7 @@ class FunctionHandler:
             else:
                 # After sending function result, trigger response generation
                 # This ensures the AI continues the conversation
-                logger.info(
+                logger.debug(
                     "🚀 Triggering response generation after function execution..."
                 )
                 response_create = {
@@ -502,7 +494,7 @@ class FunctionHandler:
                     },
                 }
                 await self.realtime_websocket.send(json.dumps(response_create))
-                logger.info("✅ Response generation triggered successfully")
+                logger.debug("✅ Response generation triggered successfully")
 
         except Exception as e:
             await handle_error(
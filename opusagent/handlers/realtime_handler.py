@@ -4,7 +4,6 @@ This module provides functionality to handle real-time communication with the Op
 including response state management, audio streaming, transcripts, and function calls.
 """
 
-import json
 from typing import Any, Dict, Optional
 
 import websockets
@@ -16,6 +15,7 @@ from opusagent.handlers.function_handler import FunctionHandler
 from opusagent.models.openai_api import ResponseDoneEvent, ServerEventType
 from opusagent.handlers.session_manager import SessionManager
 from opusagent.handlers.transcript_manager import TranscriptManager
+from opusagent.utils import event_codec
 
 # Configure logging
 logger = configure_logging("realtime_handler")
@@ -368,7 +368,7 @@ class RealtimeHandler:
                 if self._closed:
                     break
 
-                response_dict = json.loads(openai_message)
+                response_dict = event_codec.loads(openai_message)
                 await self.event_router.handle_realtime_event(response_dict)
 
         except websockets.exceptions.ConnectionClosed as e:
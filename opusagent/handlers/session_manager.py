@@ -6,11 +6,11 @@ including session initialization, configuration, and conversation management.
 
 import asyncio
 import json
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from opusagent.config.logging_config import configure_logging
 from opusagent.models.openai_api import SessionConfig, SessionUpdateEvent
-from opusagent.voiceprint import OpusAgentVoiceRecognizer
+from opusagent.voiceprint import get_voice_recognizer
 
 # Configure logging
 logger = configure_logging("session_manager")
@@ -50,14 +50,24 @@ class SessionManager:
         self.session_config = session_config
         self.session_initialized = False
         self.conversation_id: Optional[str] = None
-        self.voice_recognizer = OpusAgentVoiceRecognizer()
+        self.voice_recognizer = get_voice_recognizer()
 
     async def initialize_session(self):
         """Initialize the OpenAI Realtime API session with configuration.
 
         This method sets up the initial session configuration for the OpenAI Realtime API,
-        using the predefined session config passed to the constructor.
+        using the predefined session config passed to the constructor. Connections
+        from the WebSocket manager's warm pool already carry the default
+        configuration, in which case the update is not sent again.
         """
+        if (
+            getattr(self.realtime_websocket, "preconfigured_session", None)
+            == self.session_config
+        ):
+            logger.info("Session already configured on warm connection")
+            self.session_initialized = True
+            return
+
         session_update = SessionUpdateEvent(
             type="session.update", session=self.session_config
         )
@@ -121,6 +131,39 @@ class SessionManager:
             logger.error(f"Traceback: {traceback.format_exc()}")
             raise
 
+    async def send_caller_context(
+        self, caller_id: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Tell the model which caller it is talking to.
+
+        Adds a system message with the caller's enrollment metadata to the
+        conversation, so every response created after it can use them.
+
+        Args:
+            caller_id (str): Identifier of the caller recognized by voice
+            metadata (Optional[Dict[str, Any]]): Metadata stored at enrollment
+        """
+        details = json.dumps(metadata or {}, default=str)
+        caller_context = {
+            "type": "conversation.item.create",
+            "item": {
+                "type": "message",
+                "role": "system",
+                "content": [
+                    {
+                        "type": "input_text",
+                        "text": (
+                            f"The caller was recognized by voice as returning caller "
+                            f"{caller_id}. Caller details: {details}. Use them to "
+                            f"personalize the conversation."
+                        ),
+                    }
+                ],
+            },
+        }
+        await self.realtime_websocket.send(json.dumps(caller_context))
+        logger.info(f"Sent caller context for {caller_id}")
+
     async def create_response(self):
         #! Is this needed?
         """Create a new response request to OpenAI Realtime API.
@@ -3,6 +3,13 @@ WebSocket Manager for OpenAI Realtime API connections.
 
 This module provides centralized management of WebSocket connections to the OpenAI Realtime API,
 including connection pooling, health monitoring, reconnection logic, and graceful cleanup.
+
+Connection setup (DNS, TLS and the WebSocket handshake) can be taken off the
+call path with a warm pool: ``start_warm_pool`` keeps a number of connections
+open with ``session.update`` already sent for the default session
+configuration, and refills the pool in the background as calls check
+connections out. When every connection slot is in use, callers wait in a FIFO
+queue for a slot to free up instead of evicting a live connection.
 """
 
 import asyncio
@@ -10,8 +17,9 @@ import logging
 import os
 import time
 import uuid
+from collections import deque
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Deque, Dict, List, Optional, Set
 
 import websockets
 from websockets.exceptions import ConnectionClosed
@@ -20,6 +28,7 @@ from websockets.typing import Subprotocol
 from opusagent.config import get_config, websocket_config, mock_config, openai_config
 from opusagent.config.env_loader import load_env_file
 from opusagent.config.models import WebSocketConfig
+from opusagent.models.openai_api import SessionConfig, SessionUpdateEvent
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +93,7 @@ class RealtimeConnection:
         self.is_healthy = True
         self.session_count = 0
         self.max_sessions = config.websocket.max_sessions_per_connection
+        self.preconfigured_session: Optional[SessionConfig] = None
 
     @property
     def age_seconds(self) -> float:
@@ -100,6 +110,21 @@ class RealtimeConnection:
         self.last_used = time.time()
         self.session_count += 1
 
+    def set_preconfigured_session(self, session_config: Optional[SessionConfig]):
+        """Record the session configuration already applied on this connection.
+
+        The configuration is also attached to the websocket itself so that
+        ``SessionManager`` can skip sending an identical ``session.update``.
+
+        Args:
+            session_config: Applied configuration, or None to clear it
+        """
+        self.preconfigured_session = session_config
+        try:
+            setattr(self.websocket, "preconfigured_session", session_config)
+        except AttributeError:
+            pass
+
     @property
     def can_accept_session(self) -> bool:
         """Check if this connection can accept another session."""
@@ -138,6 +163,8 @@ class WebSocketManager:
 
     Features:
     - Connection pooling and reuse
+    - Warm pool of pre-configured connections, refilled in the background
+    - Bounded wait queue when all connection slots are in use
     - Health monitoring and automatic cleanup
     - Reconnection logic
     - Graceful shutdown
@@ -159,6 +186,8 @@ class WebSocketManager:
         self.max_connection_age = config.websocket.max_connection_age
         self.max_idle_time = config.websocket.max_idle_time
         self.health_check_interval = config.websocket.health_check_interval
+        self.warm_pool_size = config.websocket.warm_pool_size
+        self.pool_wait_timeout = config.websocket.pool_wait_timeout
 
         # Mock configuration from centralized config
         self.use_mock = use_mock if use_mock is not None else config.mock.enabled
@@ -169,6 +198,22 @@ class WebSocketManager:
         self._health_check_task: Optional[asyncio.Task] = None
         self._shutdown = False
 
+        # Warm pool state: idle connections with the default session applied
+        self._warm_connections: Deque[RealtimeConnection] = deque()
+        self._warm_session_config: Optional[SessionConfig] = None
+        self._refill_task: Optional[asyncio.Task] = None
+        # Callers waiting for a free connection slot, oldest first
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        # Pool statistics
+        self.pool_hits = 0
+        self.pool_misses = 0
+        self.pool_waits = 0
+        self.pool_wait_timeouts = 0
+        self.warm_connections_created = 0
+        self.warm_failures = 0
+        self._acquire_latencies_ms: Deque[float] = deque(maxlen=1000)
+
         # Connection parameters from centralized config
         if not self.use_mock:
             self._url: Optional[str] = config.openai.get_websocket_url()
@@ -209,6 +254,7 @@ class WebSocketManager:
         while not self._shutdown:
             try:
                 await self._cleanup_unhealthy_connections()
+                self._schedule_refill()
                 await asyncio.sleep(self.health_check_interval)
             except asyncio.CancelledError:
                 break
@@ -250,7 +296,10 @@ class WebSocketManager:
         """Remove and close a connection."""
         if connection_id in self._connections:
             conn = self._connections.pop(connection_id)
+            if conn in self._warm_connections:
+                self._warm_connections.remove(conn)
             await conn.close()
+            self._wake_waiter()
 
     async def _create_connection(self) -> RealtimeConnection:
         """Create a new WebSocket connection to OpenAI or mock server."""
@@ -316,41 +365,205 @@ class WebSocketManager:
         """
         Get an available WebSocket connection.
 
+        Warm connections are handed out first. Otherwise an existing connection
+        is reused or a new one is created. When every connection slot is taken,
+        the caller waits up to ``pool_wait_timeout`` seconds for one to free up.
+
         Returns:
             RealtimeConnection: A healthy connection ready for use
 
         Raises:
-            Exception: If unable to get or create a connection
+            asyncio.TimeoutError: If no connection became available in time
+            Exception: If unable to create a connection
         """
         # Ensure health monitoring is started if not already
         if not self._health_check_task:
             self._start_health_monitoring()
 
-        # Try to find an existing healthy connection
-        for conn in self._connections.values():
+        start_time = time.perf_counter()
+        connection = self._checkout_warm_connection()
+        if connection is not None:
+            self.pool_hits += 1
+            logger.debug(f"Using warm connection {connection.connection_id}")
+        else:
+            if self._warm_session_config is not None:
+                self.pool_misses += 1
+            connection = await self._acquire_connection()
+
+        connection.mark_used()
+        self._acquire_latencies_ms.append((time.perf_counter() - start_time) * 1000)
+        self._schedule_refill()
+        return connection
+
+    async def _acquire_connection(self) -> RealtimeConnection:
+        """Reuse or create a connection, waiting for a free slot if saturated."""
+        deadline = time.monotonic() + self.pool_wait_timeout
+        waited = False
+
+        while True:
+            # Try to find an existing healthy connection
+            for conn in self._connections.values():
+                if conn.can_accept_session and conn not in self._warm_connections:
+                    logger.debug(f"Reusing connection {conn.connection_id}")
+                    # Later sessions may have changed the applied configuration
+                    conn.set_preconfigured_session(None)
+                    return conn
+
+            # Create a new connection if we haven't hit the limit
+            self._prune_closed_connections()
+            if len(self._connections) < self.max_connections:
+                return await self._create_connection()
+
+            # A warm connection may have been added while we waited
+            connection = self._checkout_warm_connection()
+            if connection is not None:
+                return connection
+
+            if self._shutdown:
+                raise RuntimeError("WebSocket manager is shut down")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.pool_wait_timeouts += 1
+                logger.warning(
+                    f"No WebSocket connection available after waiting "
+                    f"{self.pool_wait_timeout:.1f}s ({len(self._connections)} in use)"
+                )
+                raise asyncio.TimeoutError(
+                    "Timed out waiting for an available WebSocket connection"
+                )
+
+            if not waited:
+                waited = True
+                self.pool_waits += 1
+                logger.info(
+                    f"Connection pool saturated, waiting for a free slot "
+                    f"({len(self._waiters)} already waiting)"
+                )
+
+            # Bridges close their sockets without telling the manager, so
+            # re-check for closed connections periodically as well
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, min(remaining, 0.25))
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def _checkout_warm_connection(self) -> Optional[RealtimeConnection]:
+        """Take the oldest usable connection out of the warm pool."""
+        while self._warm_connections:
+            conn = self._warm_connections.popleft()
             if conn.can_accept_session:
-                conn.mark_used()
-                logger.debug(f"Reusing connection {conn.connection_id}")
                 return conn
+            logger.debug(f"Discarding stale warm connection {conn.connection_id}")
+        return None
+
+    def _prune_closed_connections(self):
+        """Drop closed or unhealthy connections so their slots can be reused."""
+        for conn_id in [
+            conn_id
+            for conn_id, conn in self._connections.items()
+            if not conn.is_healthy
+            or getattr(conn.websocket, "closed", False)
+            or getattr(conn.websocket, "close_code", None) is not None
+        ]:
+            conn = self._connections.pop(conn_id)
+            if conn in self._warm_connections:
+                self._warm_connections.remove(conn)
+            conn.is_healthy = False
+
+    def _wake_waiter(self):
+        """Wake the longest-waiting caller, if any."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def start_warm_pool(
+        self, session_config: SessionConfig, wait: bool = False
+    ) -> None:
+        """
+        Start keeping ``warm_pool_size`` connections ready for incoming calls.
 
-        # Create a new connection if we haven't hit the limit
-        if len(self._connections) < self.max_connections:
-            connection = await self._create_connection()
-            connection.mark_used()
-            return connection
+        Each warm connection is opened and sent ``session.update`` for
+        ``session_config`` before any call needs it.
 
-        # If we're at the limit, find the least used connection
-        # and close it to make room for a new one
-        if self._connections:
-            oldest_conn_id = min(
-                self._connections.keys(), key=lambda k: self._connections[k].last_used
-            )
-            await self._remove_connection(oldest_conn_id)
-            logger.info(f"Removed oldest connection to make room for new one")
+        Args:
+            session_config: Default session configuration to pre-apply
+            wait: Whether to wait for the initial fill to finish
+        """
+        if self.warm_pool_size <= 0:
+            logger.debug("Warm pool disabled (warm_pool_size=0)")
+            return
 
-        # Create a new connection
+        self._warm_session_config = session_config
+        if not self._health_check_task:
+            self._start_health_monitoring()
+        logger.info(f"Starting warm pool with {self.warm_pool_size} connections")
+
+        self._schedule_refill()
+        if wait and self._refill_task is not None:
+            await asyncio.shield(self._refill_task)
+
+    def _schedule_refill(self):
+        """Start a background refill of the warm pool if it is below target."""
+        if (
+            self._warm_session_config is None
+            or self._shutdown
+            or len(self._warm_connections) >= self.warm_pool_size
+            or (self._refill_task is not None and not self._refill_task.done())
+        ):
+            return
+        try:
+            self._refill_task = asyncio.get_running_loop().create_task(
+                self._refill_warm_pool()
+            )
+        except RuntimeError:
+            logger.debug("No event loop running, warm pool refill deferred")
+
+    async def _refill_warm_pool(self):
+        """Open and configure connections until the warm pool is full."""
+        while (
+            not self._shutdown
+            and self._warm_session_config is not None
+            and len(self._warm_connections) < self.warm_pool_size
+            and len(self._connections) < self.max_connections
+            # Free slots go to waiting callers before the warm pool
+            and not self._waiters
+        ):
+            try:
+                connection = await self._create_warm_connection(
+                    self._warm_session_config
+                )
+            except Exception as e:
+                # Retry on the next health check rather than spinning here
+                self.warm_failures += 1
+                logger.warning(f"Failed to warm WebSocket connection: {e}")
+                return
+            self._warm_connections.append(connection)
+            self._wake_waiter()
+
+    async def _create_warm_connection(
+        self, session_config: SessionConfig
+    ) -> RealtimeConnection:
+        """Open a connection and apply ``session_config`` to it."""
         connection = await self._create_connection()
-        connection.mark_used()
+        try:
+            session_update = SessionUpdateEvent(
+                type="session.update", session=session_config
+            )
+            await connection.websocket.send(session_update.model_dump_json())
+        except Exception:
+            await self._remove_connection(connection.connection_id)
+            raise
+        connection.set_preconfigured_session(session_config)
+        self.warm_connections_created += 1
+        logger.debug(f"Warmed connection {connection.connection_id}")
         return connection
 
     @asynccontextmanager
@@ -389,6 +602,7 @@ class WebSocketManager:
             await asyncio.gather(*close_tasks, return_exceptions=True)
 
         self._connections.clear()
+        self._warm_connections.clear()
         self._active_sessions.clear()
 
     async def shutdown(self):
@@ -404,9 +618,21 @@ class WebSocketManager:
             except asyncio.CancelledError:
                 pass
 
+        # Stop refilling the warm pool
+        if self._refill_task and not self._refill_task.done():
+            self._refill_task.cancel()
+            try:
+                await self._refill_task
+            except asyncio.CancelledError:
+                pass
+
         # Close all connections
         await self.close_all_connections()
 
+        # Release anyone still waiting so they see the shutdown
+        while self._waiters:
+            self._wake_waiter()
+
     def get_stats(self) -> Dict:
         """Get connection statistics."""
         healthy_connections = sum(
@@ -421,6 +647,36 @@ class WebSocketManager:
             "total_sessions_handled": total_sessions,
             "max_connections": self.max_connections,
             "use_mock": self.use_mock,
+            "pool": self.get_pool_stats(),
+        }
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get warm pool, wait queue and acquire latency statistics."""
+        latencies = sorted(self._acquire_latencies_ms)
+        requests = self.pool_hits + self.pool_misses
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+
+        return {
+            "warm_pool_size": self.warm_pool_size,
+            "warm_connections": len(self._warm_connections),
+            "hits": self.pool_hits,
+            "misses": self.pool_misses,
+            "hit_rate": self.pool_hits / requests if requests else 0.0,
+            "waits": self.pool_waits,
+            "wait_timeouts": self.pool_wait_timeouts,
+            "waiting": len(self._waiters),
+            "warm_connections_created": self.warm_connections_created,
+            "warm_failures": self.warm_failures,
+            "acquire_latency_ms": {
+                "avg": sum(latencies) / len(latencies) if latencies else 0.0,
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "max": latencies[-1] if latencies else 0.0,
+            },
         }
 
 
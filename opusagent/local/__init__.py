@@ -3,41 +3,42 @@ Mock modules for testing and development.
 
 This package provides mock implementations of various components for testing
 and development purposes.
+
+The client classes below pull in scipy, sounddevice and pyaudio, so they are
+imported on first access rather than with the package: the server imports
+``opusagent.local.realtime`` and ``opusagent.local.transcription``, which do
+not need them. A client whose dependencies are missing is None, and its
+``*_AVAILABLE`` flag is False.
 """
 
-# Import the modular audiocodes client
-try:
-    from .audiocodes import LocalAudioCodesClient
-    AUDIOCODES_AVAILABLE = True
-except ImportError:
-    AUDIOCODES_AVAILABLE = False
-    LocalAudioCodesClient = None
-
-try:
-    from .mock_twilio_client import MockTwilioClient
-    TWILIO_AVAILABLE = True
-except ImportError:
-    TWILIO_AVAILABLE = False
-    MockTwilioClient = None
-
-try:
-    from .local_vad_client import LocalVADClient
-    VAD_AVAILABLE = True
-except ImportError:
-    VAD_AVAILABLE = False
-    LocalVADClient = None
-
-# Export available components
-__all__ = []
-
-if AUDIOCODES_AVAILABLE:
-    __all__.append("LocalAudioCodesClient")
-
-if TWILIO_AVAILABLE:
-    __all__.append("MockTwilioClient")
-
-if VAD_AVAILABLE:
-    __all__.append("LocalVADClient")
-
-# Version info
+import importlib
+from typing import Any
+
+# Lazily imported clients: name -> (module, availability flag)
+_CLIENTS = {
+    "LocalAudioCodesClient": (".audiocodes", "AUDIOCODES_AVAILABLE"),
+    "MockTwilioClient": (".mock_twilio_client", "TWILIO_AVAILABLE"),
+    "LocalVADClient": (".local_vad_client", "VAD_AVAILABLE"),
+}
+_FLAGS = {flag: name for name, (_, flag) in _CLIENTS.items()}
+
+__all__ = list(_CLIENTS)
+
 __version__ = "1.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    if name in _FLAGS:
+        return __getattr__(_FLAGS[name]) is not None
+    if name not in _CLIENTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, flag = _CLIENTS[name]
+    try:
+        client = getattr(importlib.import_module(module_name, __name__), name)
+    except (ImportError, OSError):
+        # OSError: sounddevice without the PortAudio library
+        client = None
+    globals()[name] = client
+    globals()[flag] = client is not None
+    return client
@@ -24,6 +24,8 @@ import sounddevice as sd
 import websockets
 from scipy import signal
 
+from opusagent.utils import g711
+
 
 class MockTwilioClient:
     """
@@ -421,23 +423,11 @@ class MockTwilioClient:
 
     def _convert_pcm16_to_mulaw(self, pcm16_data: bytes) -> bytes:
         """Convert PCM16 audio to mulaw format."""
-        try:
-            import audioop
-            return audioop.lin2ulaw(pcm16_data, 2)
-        except ImportError:
-            self.logger.warning("[MOCK TWILIO] audioop not available, using simple conversion")
-            # Simple approximation - take every other byte
-            return pcm16_data[::2]
+        return g711.pcm16_to_ulaw(pcm16_data)
 
     def _convert_mulaw_to_pcm16(self, mulaw_data: bytes) -> bytes:
         """Convert mulaw audio to PCM16 format."""
-        try:
-            import audioop
-            return audioop.ulaw2lin(mulaw_data, 2)
-        except ImportError:
-            self.logger.warning("[MOCK TWILIO] audioop not available, using simple conversion")
-            # Simple approximation - repeat each byte twice
-            return b"".join([bytes([b, b]) for b in mulaw_data])
+        return g711.ulaw_to_pcm16(mulaw_data)
 
     async def multi_turn_conversation(
         self, 
@@ -772,7 +762,7 @@ class MockTwilioClient:
                         for i in range(0, len(mulaw_data), target_chunk_size):
                             chunk = mulaw_data[i:i + target_chunk_size]
                             if len(chunk) < target_chunk_size:
-                                chunk += b"\x80" * (target_chunk_size - len(chunk))
+                                chunk += bytes([g711.ULAW_SILENCE]) * (target_chunk_size - len(chunk))
                             
                             encoded_chunk = base64.b64encode(chunk).decode("utf-8")
                             await self.send_media_chunk(encoded_chunk)
@@ -780,7 +770,7 @@ class MockTwilioClient:
                     else:
                         # Pad to target size
                         if len(mulaw_data) < target_chunk_size:
-                            mulaw_data += b"\x80" * (target_chunk_size - len(mulaw_data))
+                            mulaw_data += bytes([g711.ULAW_SILENCE]) * (target_chunk_size - len(mulaw_data))
                         
                         encoded_chunk = base64.b64encode(mulaw_data).decode("utf-8")
                         await self.send_media_chunk(encoded_chunk)
@@ -1206,7 +1196,7 @@ class MockTwilioClient:
                     for i in range(0, len(mulaw_data), target_chunk_size):
                         chunk = mulaw_data[i:i + target_chunk_size]
                         if len(chunk) < target_chunk_size:
-                            chunk += b"\x80" * (target_chunk_size - len(chunk))
+                            chunk += bytes([g711.ULAW_SILENCE]) * (target_chunk_size - len(chunk))
                         
                         encoded_chunk = base64.b64encode(chunk).decode("utf-8")
                         await self.send_media_chunk(encoded_chunk)
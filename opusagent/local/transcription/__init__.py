@@ -30,6 +30,8 @@ Features:
     - Error handling and recovery
     - Session management
     - Audio format conversion and resampling
+    - Models loaded once per process and shared between transcribers
+    - Whisper windows from all sessions decoded together in batches
 
 For detailed documentation, see DESIGN.md in this directory.
 """
@@ -38,6 +40,8 @@ from .models import TranscriptionResult, TranscriptionConfig
 from .factory import TranscriptionFactory
 from .config import load_transcription_config
 from .base import BaseTranscriber
+from .model_registry import ModelRegistry, get_model_registry
+from .scheduler import WhisperBatchScheduler, get_whisper_scheduler
 
 __all__ = [
     "TranscriptionResult",
@@ -45,4 +49,8 @@ __all__ = [
     "TranscriptionFactory",
     "load_transcription_config",
     "BaseTranscriber",
+    "ModelRegistry",
+    "get_model_registry",
+    "WhisperBatchScheduler",
+    "get_whisper_scheduler",
 ] 
\ No newline at end of file
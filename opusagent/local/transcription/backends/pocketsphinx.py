@@ -5,6 +5,11 @@ This module provides:
 - PocketSphinxTranscriber: A lightweight, offline transcription backend using PocketSphinx, optimized for real-time and resource-constrained environments.
 - Implements audio resampling, preprocessing, and chunked streaming for best performance.
 
+Decoders hold utterance state, so they are leased exclusively from the
+process-wide model registry: a session reuses a decoder released by an
+earlier one with the same configuration instead of loading the acoustic
+model, language model and dictionary again.
+
 Usage:
     from opusagent.mock.transcription.backends.pocketsphinx import PocketSphinxTranscriber
     transcriber = PocketSphinxTranscriber(config)
@@ -15,6 +20,7 @@ import numpy as np
 from typing import Optional, Dict, Any
 
 from ..base import BaseTranscriber
+from ..model_registry import ModelLease, get_model_registry, path_size_bytes
 from ..models import TranscriptionConfig, TranscriptionResult
 
 class PocketSphinxTranscriber(BaseTranscriber):
@@ -23,6 +29,7 @@ class PocketSphinxTranscriber(BaseTranscriber):
     def __init__(self, config: TranscriptionConfig):
         super().__init__(config)
         self._decoder = None
+        self._lease: Optional[ModelLease] = None
         self._accumulated_text = ""
         if self.config.sample_rate != 16000:
             self.logger.warning(
@@ -61,14 +68,32 @@ class PocketSphinxTranscriber(BaseTranscriber):
                 config_dict["lm"] = self.config.pocketsphinx_lm
             if self.config.pocketsphinx_dict:
                 config_dict["dict"] = self.config.pocketsphinx_dict
-            ps_config = pocketsphinx.Decoder.default_config()
-            for key, value in config_dict.items():
-                try:
-                    ps_config.set_string(key, str(value))
-                except Exception as e:
-                    self.logger.debug(f"Skipping config option {key}: {e}")
-                    continue
-            self._decoder = pocketsphinx.Decoder(ps_config)
+
+            def load_decoder():
+                ps_config = pocketsphinx.Decoder.default_config()
+                for key, value in config_dict.items():
+                    try:
+                        ps_config.set_string(key, str(value))
+                    except Exception as e:
+                        self.logger.debug(f"Skipping config option {key}: {e}")
+                        continue
+                return pocketsphinx.Decoder(ps_config)
+
+            if self.config.shared_models:
+                model_files = (
+                    self.config.pocketsphinx_hmm,
+                    self.config.pocketsphinx_lm,
+                    self.config.pocketsphinx_dict,
+                )
+                self._lease = get_model_registry().acquire(
+                    ("pocketsphinx", repr(sorted(config_dict.items())), "cpu"),
+                    load_decoder,
+                    exclusive=True,
+                    sizer=lambda _: path_size_bytes(model_files),
+                )
+                self._decoder = self._lease.model
+            else:
+                self._decoder = load_decoder()
             self._initialized = True
             self.logger.info("PocketSphinx transcriber initialized successfully")
             return True
@@ -190,6 +215,9 @@ class PocketSphinxTranscriber(BaseTranscriber):
                 self._decoder.end_utt()
             except:
                 pass
+        if self._lease is not None:
+            self._lease.release()
+            self._lease = None
         self._decoder = None
         self._initialized = False
         self.logger.debug("PocketSphinx transcriber cleaned up")
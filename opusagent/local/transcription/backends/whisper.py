@@ -5,26 +5,47 @@ This module provides:
 - WhisperTranscriber: A high-accuracy transcription backend using OpenAI Whisper, supporting multiple model sizes and advanced features.
 - Implements async processing, segment timing, and confidence scoring for detailed transcription results.
 
+Models are loaded through the process-wide model registry, so every
+transcriber with the same model and device shares one copy of the weights;
+each transcriber keeps its own audio buffer and accumulated text. Pending
+audio is kept in a ring buffer, and windows are decoded by the process-wide
+WhisperBatchScheduler together with the windows of other sessions.
+
 Usage:
     from opusagent.mock.transcription.backends.whisper import WhisperTranscriber
     transcriber = WhisperTranscriber(config)
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, Optional
 
 import numpy as np
 
 from ..base import BaseTranscriber
+from ..model_registry import ModelLease, get_model_registry
 from ..models import TranscriptionConfig, TranscriptionResult
+from ..ring_buffer import AudioRingBuffer
+from ..scheduler import WhisperBatchScheduler, get_whisper_scheduler
+
+
+def _model_size_bytes(model: Any) -> int:
+    """Memory taken by a Whisper model's parameters."""
+    return sum(p.numel() * p.element_size() for p in model.parameters())
 
 
 class WhisperTranscriber(BaseTranscriber):
     """Whisper-based transcription for high accuracy."""
 
     def __init__(self, config: TranscriptionConfig):
+        self._ring = AudioRingBuffer(
+            int(config.sample_rate * config.chunk_duration * 4)
+        )
         super().__init__(config)
         self._model = None
+        self._whisper: Any = None
+        self._lease: Optional[ModelLease] = None
+        self._scheduler: Optional[WhisperBatchScheduler] = None
         self._temp_dir = None
         self._accumulated_text = ""
         self._last_segment_end = 0.0
@@ -47,17 +68,34 @@ class WhisperTranscriber(BaseTranscriber):
             import tempfile
             from pathlib import Path
 
+            model_source = model_name
             if self.config.whisper_model_dir:
                 model_path = Path(self.config.whisper_model_dir) / f"{model_name}.pt"
                 if model_path.exists():
-                    self._model = whisper.load_model(str(model_path), device=self.config.device)  # type: ignore
+                    model_source = str(model_path)
                 else:
                     self.logger.warning(
                         f"Custom model not found at {model_path}, using default"
                     )
-                    self._model = whisper.load_model(model_name, device=self.config.device)  # type: ignore
+            device = self.config.device
+
+            def load_model():
+                return whisper.load_model(model_source, device=device)  # type: ignore
+
+            if self.config.shared_models:
+                # Loading takes seconds; keep it off the event loop
+                self._lease = await asyncio.to_thread(
+                    get_model_registry().acquire,
+                    ("whisper", model_source, device),
+                    load_model,
+                    sizer=_model_size_bytes,
+                )
+                self._model = self._lease.model
             else:
-                self._model = whisper.load_model(model_name, device=self.config.device)  # type: ignore
+                self._model = load_model()
+            self._whisper = whisper
+            if self.config.whisper_batching:
+                self._scheduler = get_whisper_scheduler()
             self._temp_dir = tempfile.mkdtemp(prefix="whisper_transcription_")
             self._initialized = True
             self.logger.info(
@@ -83,21 +121,15 @@ class WhisperTranscriber(BaseTranscriber):
             audio_array = self._convert_audio_for_processing(audio_data)
             if len(audio_array) == 0:
                 return TranscriptionResult(text="", error="Invalid audio data")
-            self._audio_buffer.extend(audio_array)
+            self._ring.extend(audio_array)
             chunk_samples = int(
                 self.config.sample_rate * self.config.chunk_duration * 2
             )
-            if len(self._audio_buffer) >= chunk_samples:
-                chunk_data = np.array(self._audio_buffer[:chunk_samples])
+            if len(self._ring) >= chunk_samples:
+                chunk_data = self._ring.peek(chunk_samples)
                 overlap_samples = int(chunk_samples * 0.1)
-                self._audio_buffer = self._audio_buffer[
-                    chunk_samples - overlap_samples :
-                ]
-                import asyncio
-
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None, self._transcribe_with_whisper, chunk_data
-                )
+                self._ring.consume(chunk_samples - overlap_samples)
+                result = await self._decode_window(chunk_data)
                 processing_time = max(
                     time.time() - start_time, 0.001
                 )  # Ensure minimum time
@@ -116,17 +148,54 @@ class WhisperTranscriber(BaseTranscriber):
                 text="", error=str(e), processing_time=processing_time
             )
 
+    @property
+    def _audio_buffer(self) -> AudioRingBuffer:
+        """Pending audio; assigning a sequence of samples replaces it."""
+        return self._ring
+
+    @_audio_buffer.setter
+    def _audio_buffer(self, samples) -> None:
+        self._ring.clear()
+        self._ring.extend(samples)
+
+    def _language(self) -> Optional[str]:
+        return self.config.language if self.config.language != "en" else None
+
+    async def _decode_window(self, audio_data: np.ndarray) -> TranscriptionResult:
+        """Decode a window through the batch scheduler, or alone when batching is off."""
+        if self._scheduler is None:
+            return await asyncio.get_event_loop().run_in_executor(
+                None, self._transcribe_with_whisper, audio_data
+            )
+        try:
+            decoded = await self._scheduler.transcribe(
+                self._whisper,
+                self._model,
+                audio_data,
+                language=self._language(),
+                temperature=self.config.whisper_temperature,
+            )
+        except Exception as e:
+            self.logger.error(f"Whisper transcription error: {e}")
+            return TranscriptionResult(text="", error=str(e))
+        segments = [
+            {
+                "text": decoded.text,
+                "avg_logprob": decoded.avg_logprob,
+                "no_speech_prob": decoded.no_speech_prob,
+            }
+        ]
+        return self._build_result(decoded.text, segments)
+
     def _transcribe_with_whisper(self, audio_data: np.ndarray) -> TranscriptionResult:
         try:
+            # Whisper pads the log-mel spectrogram to 30 seconds itself
             target_length = self.config.sample_rate * 30
             if len(audio_data) > target_length:
                 audio_data = audio_data[:target_length]
-            elif len(audio_data) < target_length:
-                padding = target_length - len(audio_data)
-                audio_data = np.pad(audio_data, (0, padding), mode="constant")
             result = self._model.transcribe(  # type: ignore
                 audio_data,
-                language=self.config.language if self.config.language != "en" else None,
+                language=self._language(),
                 temperature=self.config.whisper_temperature,
                 word_timestamps=True,
                 verbose=False,
@@ -136,47 +205,50 @@ class WhisperTranscriber(BaseTranscriber):
                 text = text.strip()
             else:
                 text = ""
-            segments = result.get("segments", [])
-            delta_text = ""
-            if text and text != self._accumulated_text:
-                if text.startswith(self._accumulated_text):
-                    delta_text = text[len(self._accumulated_text) :].strip()
-                else:
-                    # Handle case where Whisper gives completely different result
-                    # Check if the new text contains repetitions or duplications
-                    if self._accumulated_text and self._accumulated_text in text:
-                        # Find the last occurrence of accumulated text and take everything after it
-                        last_pos = text.rfind(self._accumulated_text)
-                        if last_pos != -1:
-                            delta_text = text[
-                                last_pos + len(self._accumulated_text) :
-                            ].strip()
-                        else:
-                            delta_text = text.strip()
-                    else:
-                        delta_text = text.strip()
-
-                # Update accumulated text only if we have meaningful delta
-                if delta_text:
-                    self._accumulated_text = text
-            confidence = 0.0
-            if segments and isinstance(segments, list):
-                valid_segments = [s for s in segments if isinstance(s, dict)]
-                if valid_segments:
-                    confidence = sum(
-                        s.get("avg_logprob", 0.0) for s in valid_segments
-                    ) / len(valid_segments)
-                    confidence = max(0.0, min(1.0, (confidence + 1.0) / 2.0))
-            return TranscriptionResult(
-                text=delta_text,
-                confidence=confidence,
-                is_final=False,
-                segments=segments if isinstance(segments, list) else None,
-            )
+            return self._build_result(text, result.get("segments", []))
         except Exception as e:
             self.logger.error(f"Whisper transcription error: {e}")
             return TranscriptionResult(text="", error=str(e))
 
+    def _build_result(self, text: str, segments: Any) -> TranscriptionResult:
+        """Turn a window's full text into a delta against the accumulated text."""
+        delta_text = ""
+        if text and text != self._accumulated_text:
+            if text.startswith(self._accumulated_text):
+                delta_text = text[len(self._accumulated_text) :].strip()
+            else:
+                # Handle case where Whisper gives completely different result
+                # Check if the new text contains repetitions or duplications
+                if self._accumulated_text and self._accumulated_text in text:
+                    # Find the last occurrence of accumulated text and take everything after it
+                    last_pos = text.rfind(self._accumulated_text)
+                    if last_pos != -1:
+                        delta_text = text[
+                            last_pos + len(self._accumulated_text) :
+                        ].strip()
+                    else:
+                        delta_text = text.strip()
+                else:
+                    delta_text = text.strip()
+
+            # Update accumulated text only if we have meaningful delta
+            if delta_text:
+                self._accumulated_text = text
+        confidence = 0.0
+        if segments and isinstance(segments, list):
+            valid_segments = [s for s in segments if isinstance(s, dict)]
+            if valid_segments:
+                confidence = sum(
+                    s.get("avg_logprob", 0.0) for s in valid_segments
+                ) / len(valid_segments)
+                confidence = max(0.0, min(1.0, (confidence + 1.0) / 2.0))
+        return TranscriptionResult(
+            text=delta_text,
+            confidence=confidence,
+            is_final=False,
+            segments=segments if isinstance(segments, list) else None,
+        )
+
     async def finalize(self) -> TranscriptionResult:
         if not self._initialized or not self._model:
             return TranscriptionResult(text="", error="Transcriber not initialized")
@@ -185,13 +257,8 @@ class WhisperTranscriber(BaseTranscriber):
         start_time = time.time()
         try:
             final_text = self._accumulated_text
-            if self._audio_buffer:
-                remaining_audio = np.array(self._audio_buffer)
-                import asyncio
-
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None, self._transcribe_with_whisper, remaining_audio
-                )
+            if self._ring:
+                result = await self._decode_window(self._ring.to_array())
                 if result.text:
                     # Only use the delta text from remaining audio, not the full result
                     # This prevents repetition of already transcribed content
@@ -238,7 +305,12 @@ class WhisperTranscriber(BaseTranscriber):
                 shutil.rmtree(self._temp_dir)
             except Exception as e:
                 self.logger.warning(f"Failed to clean up temp directory: {e}")
+        if self._lease is not None:
+            self._lease.release()
+            self._lease = None
         self._model = None
+        self._whisper = None
+        self._scheduler = None
         self._initialized = False
         self.logger.debug("Whisper transcriber cleaned up")
 
@@ -45,4 +45,6 @@ def load_transcription_config() -> TranscriptionConfig:
         pocketsphinx_input_sample_rate=config.pocketsphinx_input_sample_rate,
         whisper_model_dir=config.whisper_model_dir,
         whisper_temperature=config.whisper_temperature,
+        whisper_batching=config.whisper_batching,
+        shared_models=config.shared_models,
     ) 
\ No newline at end of file
@@ -0,0 +1,374 @@
+"""
+Process-wide registry of transcription models.
+
+Every transcriber used to load its own model: each local realtime session
+built a WhisperTranscriber that called whisper.load_model, so every session
+paid for hundreds of MB of weights and several seconds of loading.
+
+ModelRegistry keeps loaded models keyed by (backend, model, device) and hands
+out reference-counted leases:
+
+- Shared models (Whisper) are loaded once, lazily on first use, and used by
+  every transcriber at the same time. Decode state (audio buffer, accumulated
+  text) stays in each transcriber.
+- Exclusive models (PocketSphinx decoders, which hold utterance state) are
+  leased to one transcriber at a time. A released decoder goes back to the
+  pool and is reused by the next session instead of being reloaded.
+
+Models nobody holds are evicted once idle for idle_timeout seconds, by a
+background sweep that runs while any model is loaded, and, when a memory
+budget is set, least recently used idle models are evicted as soon as the
+loaded models exceed it. Models in use are never evicted, so
+the budget can be exceeded while they are all busy.
+
+Usage:
+    from opusagent.local.transcription.model_registry import get_model_registry
+
+    lease = get_model_registry().acquire(
+        ("whisper", "base", "cpu"), lambda: whisper.load_model("base")
+    )
+    model = lease.model
+    ...
+    lease.release()
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (backend, model name or path, device)
+ModelKey = Tuple[str, str, str]
+
+# Bounds on how often idle models are swept, in seconds
+MIN_SWEEP_INTERVAL = 1.0
+MAX_SWEEP_INTERVAL = 60.0
+
+
+@dataclass
+class _LoadedModel:
+    key: ModelKey
+    model: Any
+    size_bytes: int
+    exclusive: bool
+    refs: int = 0
+    idle_since: float = field(default_factory=time.monotonic)
+
+
+class ModelLease:
+    """A transcriber's hold on a model from the registry.
+
+    Release it when the transcriber is cleaned up; releasing twice is a
+    no-op.
+
+    Attributes:
+        key (ModelKey): Registry key of the model
+    """
+
+    def __init__(self, registry: "ModelRegistry", loaded: _LoadedModel):
+        self._registry = registry
+        self._loaded: Optional[_LoadedModel] = loaded
+        self.key = loaded.key
+        self._model = loaded.model
+
+    @property
+    def model(self) -> Any:
+        """The leased model."""
+        return self._model
+
+    @property
+    def released(self) -> bool:
+        """Whether the lease was released."""
+        return self._loaded is None
+
+    def release(self) -> None:
+        """Give the model back to the registry."""
+        loaded, self._loaded = self._loaded, None
+        if loaded is not None:
+            self._registry._release(loaded)
+
+
+class ModelRegistry:
+    """Reference-counted, lazily loaded transcription models.
+
+    Attributes:
+        idle_timeout (Optional[float]): Seconds an unused model is kept; None
+            keeps it until evicted by the memory budget or clear()
+        memory_budget_bytes (Optional[int]): Memory the loaded models may use
+            before idle ones are evicted; None for no limit
+        loads (int): Models loaded
+        hits (int): Acquisitions served by an already loaded model
+        evictions (int): Models evicted
+    """
+
+    def __init__(
+        self,
+        idle_timeout: Optional[float] = 300.0,
+        memory_budget_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            idle_timeout (Optional[float]): Seconds an unused model is kept
+            memory_budget_bytes (Optional[int]): Memory budget for loaded models
+        """
+        self.idle_timeout = idle_timeout
+        self.memory_budget_bytes = memory_budget_bytes
+        self._models: Dict[ModelKey, List[_LoadedModel]] = {}
+        self._load_locks: Dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._sweeper: Optional[threading.Thread] = None
+
+        # Statistics
+        self.loads = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def acquire(
+        self,
+        key: ModelKey,
+        loader: Callable[[], Any],
+        exclusive: bool = False,
+        sizer: Optional[Callable[[Any], int]] = None,
+    ) -> ModelLease:
+        """
+        Lease a model, loading it if no suitable one is loaded.
+
+        Blocks while the model loads, so call it from a worker thread on the
+        event loop. Concurrent acquisitions of a shared model wait for a
+        single load.
+
+        Args:
+            key (ModelKey): (backend, model name or path, device)
+            loader (Callable[[], Any]): Loads the model
+            exclusive (bool): Lease the model to one holder at a time
+            sizer (Optional[Callable[[Any], int]]): Estimates a loaded model's
+                memory in bytes, for the memory budget
+
+        Returns:
+            ModelLease: Lease on the model
+
+        Raises:
+            Exception: Whatever the loader raises
+        """
+        with self._lock:
+            self._evict_idle_locked(time.monotonic())
+            loaded = self._take_locked(key, exclusive)
+            if loaded is not None:
+                return ModelLease(self, loaded)
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        if exclusive:
+            return ModelLease(self, self._load(key, loader, exclusive, sizer))
+
+        with load_lock:
+            # Another holder may have loaded it while this one waited
+            with self._lock:
+                loaded = self._take_locked(key, exclusive)
+            if loaded is None:
+                loaded = self._load(key, loader, exclusive, sizer)
+        return ModelLease(self, loaded)
+
+    def evict_idle(self) -> int:
+        """
+        Evict models that have been unused for longer than idle_timeout.
+
+        Acquiring and releasing models does this, and so does a background
+        sweep every half idle_timeout (between 1 and 60 seconds) while any
+        model is loaded, so idle models are freed without further calls.
+
+        Returns:
+            int: Number of models evicted
+        """
+        with self._lock:
+            return self._evict_idle_locked(time.monotonic())
+
+    def clear(self) -> None:
+        """Forget every loaded model. Outstanding leases keep their model."""
+        with self._lock:
+            self._models.clear()
+            self._load_locks.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dict[str, Any]: Loaded and in-use model counts, memory and counters
+        """
+        with self._lock:
+            models = [m for entries in self._models.values() for m in entries]
+            return {
+                "models_loaded": len(models),
+                "models_in_use": sum(1 for m in models if m.refs > 0),
+                "leases": sum(m.refs for m in models),
+                "memory_bytes": sum(m.size_bytes for m in models),
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "loads": self.loads,
+                "hits": self.hits,
+                "evictions": self.evictions,
+            }
+
+    def _load(
+        self,
+        key: ModelKey,
+        loader: Callable[[], Any],
+        exclusive: bool,
+        sizer: Optional[Callable[[Any], int]],
+    ) -> _LoadedModel:
+        """Load a model outside the registry lock and register it as held."""
+        start = time.perf_counter()
+        model = loader()
+        size_bytes = 0
+        if sizer is not None:
+            try:
+                size_bytes = int(sizer(model))
+            except Exception as e:
+                logger.debug(f"Could not estimate size of {key}: {e}")
+        loaded = _LoadedModel(key, model, size_bytes, exclusive, refs=1)
+
+        with self._lock:
+            self._models.setdefault(key, []).append(loaded)
+            self.loads += 1
+            self._enforce_budget_locked()
+            self._start_sweeper_locked()
+        logger.info(
+            f"Loaded {key[0]} model {key[1]} on {key[2]} in "
+            f"{time.perf_counter() - start:.2f}s ({size_bytes / 1e6:.0f} MB)"
+        )
+        return loaded
+
+    def _take_locked(self, key: ModelKey, exclusive: bool) -> Optional[_LoadedModel]:
+        """Return a loaded model for the key with one more holder, if any."""
+        for loaded in self._models.get(key, ()):
+            if not exclusive or loaded.refs == 0:
+                loaded.refs += 1
+                self.hits += 1
+                return loaded
+        return None
+
+    def _release(self, loaded: _LoadedModel) -> None:
+        """Drop one holder of a model."""
+        with self._lock:
+            loaded.refs -= 1
+            if loaded.refs > 0:
+                return
+            loaded.idle_since = time.monotonic()
+            self._evict_idle_locked(loaded.idle_since)
+            self._enforce_budget_locked()
+
+    def _evict_idle_locked(self, now: float) -> int:
+        """Evict models unused for longer than idle_timeout."""
+        if self.idle_timeout is None:
+            return 0
+        expired = [
+            loaded
+            for entries in self._models.values()
+            for loaded in entries
+            if loaded.refs == 0 and now - loaded.idle_since >= self.idle_timeout
+        ]
+        for loaded in expired:
+            self._remove_locked(loaded, "idle")
+        return len(expired)
+
+    def _start_sweeper_locked(self) -> None:
+        """Start the idle sweep if models can expire and it is not running."""
+        if self.idle_timeout is None:
+            return
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        self._sweeper = threading.Thread(
+            target=self._sweep, name="model-registry-sweep", daemon=True
+        )
+        self._sweeper.start()
+
+    def _sweep(self) -> None:
+        """Evict idle models periodically; stops once no model is loaded."""
+        interval = min(
+            max(self.idle_timeout / 2, MIN_SWEEP_INTERVAL), MAX_SWEEP_INTERVAL
+        )
+        while True:
+            time.sleep(interval)
+            with self._lock:
+                self._evict_idle_locked(time.monotonic())
+                if not self._models:
+                    self._sweeper = None
+                    return
+
+    def _enforce_budget_locked(self) -> None:
+        """Evict least recently used idle models until within the budget."""
+        if self.memory_budget_bytes is None:
+            return
+        models = [m for entries in self._models.values() for m in entries]
+        total = sum(m.size_bytes for m in models)
+        if total <= self.memory_budget_bytes:
+            return
+        idle = sorted((m for m in models if m.refs == 0), key=lambda m: m.idle_since)
+        for loaded in idle:
+            if total <= self.memory_budget_bytes:
+                break
+            total -= loaded.size_bytes
+            self._remove_locked(loaded, "over memory budget")
+        if total > self.memory_budget_bytes:
+            logger.warning(
+                f"Transcription models in use take {total / 1e6:.0f} MB, "
+                f"over the {self.memory_budget_bytes / 1e6:.0f} MB budget"
+            )
+
+    def _remove_locked(self, loaded: _LoadedModel, reason: str) -> None:
+        entries = self._models.get(loaded.key, [])
+        if loaded in entries:
+            entries.remove(loaded)
+        if not entries:
+            self._models.pop(loaded.key, None)
+        self.evictions += 1
+        logger.info(f"Evicted {loaded.key[0]} model {loaded.key[1]} ({reason})")
+
+
+def path_size_bytes(paths: Iterable[Optional[str]]) -> int:
+    """Total size of the given files and directories, for sizing models."""
+    total = 0
+    for path in paths:
+        if not path or not os.path.exists(path):
+            continue
+        if os.path.isfile(path):
+            total += os.path.getsize(path)
+            continue
+        for directory, _, files in os.walk(path):
+            total += sum(os.path.getsize(os.path.join(directory, f)) for f in files)
+    return total
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry, creating it on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            from opusagent.config import transcription_config
+
+            settings = transcription_config()
+            _registry = ModelRegistry(
+                idle_timeout=settings.model_idle_timeout,
+                memory_budget_bytes=(
+                    int(settings.model_memory_budget_mb * 1024 * 1024) or None
+                ),
+            )
+        return _registry
+
+
+def reset_model_registry() -> None:
+    """Drop the process-wide registry and its models (mainly for tests)."""
+    global _registry
+    with _registry_lock:
+        if _registry is not None:
+            _registry.clear()
+        _registry = None
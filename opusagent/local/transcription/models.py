@@ -60,6 +60,11 @@ class TranscriptionConfig(BaseModel):
     # Whisper specific
     whisper_model_dir: Optional[str] = None
     whisper_temperature: float = Field(default=0.0, ge=0.0, le=1.0)
+    # Decode windows through the process-wide batch scheduler
+    whisper_batching: bool = True
+
+    # Load models through the process-wide model registry
+    shared_models: bool = True
 
     @field_validator("backend")
     def validate_backend(cls, v: str, info: ValidationInfo) -> str:
@@ -0,0 +1,121 @@
+"""
+Growable ring buffer of audio samples for streaming transcription.
+
+Transcribers used to keep pending audio in a Python list of numpy floats:
+every chunk was appended element by element, every window copied the list
+into a new array, and consuming a window re-sliced the whole list. The ring
+buffer keeps the samples in one float32 array, so appending, reading a
+window and dropping consumed audio only copy the samples involved.
+
+Usage:
+    from opusagent.local.transcription.ring_buffer import AudioRingBuffer
+
+    buffer = AudioRingBuffer(capacity=32000)
+    buffer.extend(samples)
+    if len(buffer) >= window:
+        audio = buffer.peek(window)
+        buffer.consume(window - overlap)
+"""
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """FIFO of float32 samples backed by a circular array.
+
+    The array doubles in size when an append would overflow it, so the
+    buffer never drops audio.
+
+    Attributes:
+        capacity (int): Samples the buffer holds before growing
+    """
+
+    def __init__(self, capacity: int = 16000):
+        """
+        Initialize the buffer.
+
+        Args:
+            capacity (int): Initial capacity in samples
+        """
+        self._data = np.zeros(max(1, capacity), dtype=np.float32)
+        self._start = 0
+        self._length = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def extend(self, samples) -> None:
+        """
+        Append samples to the end of the buffer.
+
+        Args:
+            samples: 1-D array-like of samples
+        """
+        samples = np.asarray(samples, dtype=np.float32).ravel()
+        count = len(samples)
+        if count == 0:
+            return
+        if self._length + count > len(self._data):
+            self._grow(self._length + count)
+
+        end = (self._start + self._length) % len(self._data)
+        first = min(count, len(self._data) - end)
+        self._data[end : end + first] = samples[:first]
+        self._data[: count - first] = samples[first:]
+        self._length += count
+
+    def peek(self, count: int) -> np.ndarray:
+        """
+        Copy the oldest samples without removing them.
+
+        Args:
+            count (int): Samples to read; capped at the buffer length
+
+        Returns:
+            np.ndarray: Contiguous float32 copy of the samples
+        """
+        count = min(count, self._length)
+        first = min(count, len(self._data) - self._start)
+        if first == count:
+            return self._data[self._start : self._start + count].copy()
+        return np.concatenate(
+            (self._data[self._start :], self._data[: count - first])
+        )
+
+    def consume(self, count: int) -> None:
+        """
+        Drop the oldest samples.
+
+        Args:
+            count (int): Samples to drop; capped at the buffer length
+        """
+        count = min(max(count, 0), self._length)
+        self._start = (self._start + count) % len(self._data)
+        self._length -= count
+        if self._length == 0:
+            self._start = 0
+
+    def to_array(self) -> np.ndarray:
+        """Copy every buffered sample into a contiguous array."""
+        return self.peek(self._length)
+
+    def clear(self) -> None:
+        """Drop every sample."""
+        self._start = 0
+        self._length = 0
+
+    def _grow(self, required: int) -> None:
+        capacity = len(self._data)
+        while capacity < required:
+            capacity *= 2
+        data = np.zeros(capacity, dtype=np.float32)
+        data[: self._length] = self.to_array()
+        self._data = data
+        self._start = 0
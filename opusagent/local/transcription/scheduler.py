@@ -0,0 +1,255 @@
+"""
+Process-wide batched Whisper decoding.
+
+Each WhisperTranscriber used to send its windows to the default executor
+with one model.transcribe() call per window. With several sessions on a
+worker, the windows competed for the default executor's threads and each
+one ran its own 30-second encoder pass.
+
+WhisperBatchScheduler runs decoding on one dedicated thread. Windows
+submitted by every transcriber within a short batching window are
+collected and decoded together: log-mel spectrograms are computed per
+window and stacked, then the model encodes and decodes the whole batch in
+one whisper.decode() call. The encoder's input is fixed at 30 seconds, so
+stacking windows costs little more than decoding one.
+
+The scheduler reports its queue depth and real-time factor (decode time
+divided by the duration of the audio decoded) through get_stats().
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from opusagent.utils.batch_worker import BatchWorker
+
+logger = logging.getLogger(__name__)
+
+# Whisper works on 16kHz audio in 30-second windows
+WHISPER_SAMPLE_RATE = 16000
+WHISPER_WINDOW_SAMPLES = 30 * WHISPER_SAMPLE_RATE
+
+
+@dataclass
+class WindowTranscription:
+    """Decoding result for one window.
+
+    Attributes:
+        text: Transcribed text
+        avg_logprob: Average log probability of the decoded tokens
+        no_speech_prob: Probability that the window holds no speech
+    """
+
+    text: str
+    avg_logprob: float
+    no_speech_prob: float
+
+
+@dataclass
+class _WindowRequest:
+    whisper: Any
+    model: Any
+    audio: np.ndarray
+    language: Optional[str]
+    temperature: float
+    submitted: float = field(default_factory=time.perf_counter)
+    future: concurrent.futures.Future = field(default_factory=concurrent.futures.Future)
+
+
+class WhisperBatchScheduler(BatchWorker[_WindowRequest]):
+    """Batches Whisper windows from every session onto one decoding thread.
+
+    Attributes:
+        max_batch_size: Maximum number of windows decoded together
+        batch_window_ms: Time to wait for more windows after the first one
+    """
+
+    thread_name = "whisper-batch"
+
+    def __init__(self, max_batch_size: int = 8, batch_window_ms: float = 20.0):
+        """
+        Initialize the scheduler. The thread starts on the first window.
+
+        Args:
+            max_batch_size: Maximum number of windows decoded together
+            batch_window_ms: Time to wait for more windows after the first one
+        """
+        super().__init__(max_batch_size, batch_window_ms)
+
+        # Statistics
+        self.batches_run = 0
+        self.windows_decoded = 0
+        self.max_batch_seen = 0
+        self.total_audio_seconds = 0.0
+        self.total_decode_seconds = 0.0
+        self.total_wait_seconds = 0.0
+        self.last_real_time_factor = 0.0
+
+    async def transcribe(
+        self,
+        whisper: Any,
+        model: Any,
+        audio: np.ndarray,
+        language: Optional[str] = None,
+        temperature: float = 0.0,
+    ) -> WindowTranscription:
+        """
+        Decode one window of audio.
+
+        Args:
+            whisper: The whisper module the model was loaded with
+            model: Loaded Whisper model
+            audio: Float32 audio at 16kHz; only the first 30 seconds are used
+            language: Language code, or None to detect it
+            temperature: Sampling temperature
+
+        Returns:
+            WindowTranscription: Text and confidence for the window
+
+        Raises:
+            Exception: If decoding the batch failed
+        """
+        future = self._submit(_WindowRequest(whisper, model, audio, language, temperature))
+        return await asyncio.wrap_future(future, loop=asyncio.get_running_loop())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dict[str, Any]: Queue depth, batch sizes, real-time factor and latency
+        """
+        return {
+            "running": self.running,
+            "queue_depth": self.queue_depth,
+            "batches_run": self.batches_run,
+            "windows_decoded": self.windows_decoded,
+            "max_batch_seen": self.max_batch_seen,
+            "avg_batch_size": (
+                self.windows_decoded / self.batches_run if self.batches_run else 0.0
+            ),
+            "audio_seconds": self.total_audio_seconds,
+            "decode_seconds": self.total_decode_seconds,
+            "real_time_factor": (
+                self.total_decode_seconds / self.total_audio_seconds
+                if self.total_audio_seconds
+                else 0.0
+            ),
+            "last_real_time_factor": self.last_real_time_factor,
+            "avg_wait_ms": (
+                self.total_wait_seconds / self.windows_decoded * 1000
+                if self.windows_decoded
+                else 0.0
+            ),
+        }
+
+    def _process_batch(self, batch: List[_WindowRequest]) -> None:
+        """Decode a batch, one whisper.decode() per model and options."""
+        # Windows can only share a decode with the same model and options
+        groups: Dict[tuple, List[_WindowRequest]] = defaultdict(list)
+        for request in batch:
+            key = (id(request.model), request.language, request.temperature)
+            groups[key].append(request)
+        for group in groups.values():
+            try:
+                self._decode(group)
+            except Exception as e:
+                # A failed group does not fail the other groups' windows
+                logger.exception(f"Whisper batch failed: {e}")
+                for request in group:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+
+    def _decode(self, group: List[_WindowRequest]) -> None:
+        """Decode windows sharing a model and options in one pass."""
+        start = time.perf_counter()
+        try:
+            import torch
+
+            whisper = group[0].whisper
+            model = group[0].model
+            padded = np.zeros(WHISPER_WINDOW_SAMPLES, dtype=np.float32)
+            mels = []
+            for request in group:
+                audio = request.audio[:WHISPER_WINDOW_SAMPLES]
+                padded[: len(audio)] = audio
+                padded[len(audio) :] = 0.0
+                # Per window: log-mel normalization depends on the window's peak
+                mels.append(
+                    whisper.log_mel_spectrogram(
+                        padded, model.dims.n_mels, device=model.device
+                    )
+                )
+            options = whisper.DecodingOptions(
+                language=group[0].language,
+                temperature=group[0].temperature,
+                without_timestamps=True,
+                fp16=getattr(model.device, "type", "cpu") == "cuda",
+            )
+            results = whisper.decode(model, torch.stack(mels), options)
+            if len(results) != len(group):
+                raise RuntimeError(
+                    f"Whisper returned {len(results)} results for {len(group)} windows"
+                )
+        except Exception as e:
+            logger.error(f"Whisper batch decode failed: {e}")
+            for request in group:
+                request.future.set_exception(e)
+            return
+
+        elapsed = time.perf_counter() - start
+        audio_seconds = (
+            sum(min(len(r.audio), WHISPER_WINDOW_SAMPLES) for r in group)
+            / WHISPER_SAMPLE_RATE
+        )
+        self.batches_run += 1
+        self.windows_decoded += len(group)
+        self.max_batch_seen = max(self.max_batch_seen, len(group))
+        self.total_audio_seconds += audio_seconds
+        self.total_decode_seconds += elapsed
+        self.total_wait_seconds += sum(start - r.submitted for r in group)
+        self.last_real_time_factor = elapsed / audio_seconds if audio_seconds else 0.0
+
+        for request, result in zip(group, results):
+            request.future.set_result(
+                WindowTranscription(
+                    text=result.text.strip(),
+                    avg_logprob=float(result.avg_logprob),
+                    no_speech_prob=float(result.no_speech_prob),
+                )
+            )
+
+
+_scheduler: Optional[WhisperBatchScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_whisper_scheduler() -> WhisperBatchScheduler:
+    """Return the process-wide Whisper batch scheduler."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            from opusagent.config import transcription_config
+
+            settings = transcription_config()
+            _scheduler = WhisperBatchScheduler(
+                max_batch_size=settings.whisper_max_batch_size,
+                batch_window_ms=settings.whisper_batch_window_ms,
+            )
+        return _scheduler
+
+
+def reset_whisper_scheduler() -> None:
+    """Stop and drop the process-wide scheduler (mainly for tests)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is not None:
+            _scheduler.shutdown()
+        _scheduler = None
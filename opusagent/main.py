@@ -8,20 +8,26 @@ real-time voice interactions between users and AI voice agents.
 
 The server handles incoming WebSocket connections, routes messages to appropriate
 handlers, and maintains conversation state throughout the call session.
+
+Optional subsystems (the local realtime mock, the Twilio SDK, voiceprint
+recognition, VAD and transcription models) are imported on first use so the
+server starts quickly; set PRELOAD to load some of them at startup instead
+(see opusagent/services/preload.py).
 """
 
 import asyncio
 import os
 from pathlib import Path
+from typing import Optional
 
 import websockets
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
-from twilio.twiml.voice_response import VoiceResponse
 
 from opusagent.agents.banking_agent import session_config
 from opusagent.bridges.audiocodes_bridge import AudioCodesBridge
+from opusagent.bridges.base_bridge import BaseRealtimeBridge
 from opusagent.bridges.call_agent_bridge import CallAgentBridge
 from opusagent.bridges.dual_agent_bridge import DualAgentBridge
 from opusagent.bridges.twilio_bridge import TwilioBridge
@@ -43,8 +49,9 @@ from opusagent.config.logging_config import configure_logging
 from opusagent.config.models import WebSocketConfig
 from opusagent.handlers.session_manager import SessionManager
 from opusagent.handlers.websocket_manager import WebSocketManager, get_websocket_manager
-from opusagent.local.realtime import create_mock_websocket_connection
-from opusagent.voiceprint import OpusAgentVoiceRecognizer
+from opusagent.services.preload import preload_subsystems
+from opusagent.services.worker_stats import WorkerStatsPublisher
+from opusagent.session_storage.factory import close_session_storage
 
 # Load environment variables before accessing configuration
 load_env_file()
@@ -104,9 +111,55 @@ app.add_middleware(
 )
 
 
+async def create_mock_connection():
+    """Create a mock Realtime API connection backed by the local realtime client.
+
+    The local realtime package is imported here, on the first call that
+    needs it, rather than at server start.
+    """
+    from opusagent.local.realtime import create_mock_websocket_connection
+
+    return await create_mock_websocket_connection(
+        session_config=session_config,
+        local_realtime_config=LOCAL_REALTIME_CONFIG,
+        setup_smart_responses=LOCAL_REALTIME_CONFIG.get("setup_smart_responses", True),
+        enable_vad=VAD_ENABLED,
+        enable_transcription=LOCAL_REALTIME_CONFIG.get("enable_transcription", False),
+    )
+
+
+# Publishes this worker's statistics when the server runs several workers
+stats_publisher: Optional[WorkerStatsPublisher] = None
+
+
+def get_worker_stats() -> dict:
+    """Statistics of this worker process: its connection pool and calls."""
+    stats = get_websocket_manager().get_stats()
+    stats["active_calls"] = BaseRealtimeBridge.active_calls()
+    return stats
+
+
 @app.on_event("startup")
 async def startup_event():
-    app.state.voice_recognizer = OpusAgentVoiceRecognizer()
+    global stats_publisher
+
+    # Share statistics with the other workers for /stats and /health
+    if config.server.worker_stats_dir:
+        stats_publisher = WorkerStatsPublisher(
+            config.server.worker_stats_dir,
+            get_worker_stats,
+            interval=config.server.worker_stats_interval,
+        )
+        await stats_publisher.start()
+        logger.info(f"Worker {os.getpid()} publishing statistics")
+
+    # Optional warm-up of lazily loaded subsystems (PRELOAD)
+    if config.server.preload:
+        await preload_subsystems(config.server.preload)
+
+    # Pre-open Realtime API connections so calls skip the connect handshake
+    if not USE_LOCAL_REALTIME:
+        await get_websocket_manager().start_warm_pool(session_config)
 
 
 @app.websocket("/ws/telephony")
@@ -130,17 +183,7 @@ async def websocket_endpoint(websocket: WebSocket):
             logger.info("Using mock WebSocket connection with local realtime client")
 
             # Create mock WebSocket connection that wraps LocalRealtimeClient
-            mock_connection = await create_mock_websocket_connection(
-                session_config=session_config,
-                local_realtime_config=LOCAL_REALTIME_CONFIG,
-                setup_smart_responses=LOCAL_REALTIME_CONFIG.get(
-                    "setup_smart_responses", True
-                ),
-                enable_vad=VAD_ENABLED,
-                enable_transcription=LOCAL_REALTIME_CONFIG.get(
-                    "enable_transcription", False
-                ),
-            )
+            mock_connection = await create_mock_connection()
 
             # Create AudioCodes bridge with mock connection
             bridge = AudioCodesBridge(
@@ -213,17 +256,7 @@ async def handle_caller_call(caller_websocket: WebSocket):
             )
 
             # Create mock WebSocket connection that wraps LocalRealtimeClient
-            mock_connection = await create_mock_websocket_connection(
-                session_config=session_config,
-                local_realtime_config=LOCAL_REALTIME_CONFIG,
-                setup_smart_responses=LOCAL_REALTIME_CONFIG.get(
-                    "setup_smart_responses", True
-                ),
-                enable_vad=VAD_ENABLED,
-                enable_transcription=LOCAL_REALTIME_CONFIG.get(
-                    "enable_transcription", False
-                ),
-            )
+            mock_connection = await create_mock_connection()
 
             # Instantiate our caller side bridge with mock connection
             bridge = CallAgentBridge(
@@ -315,17 +348,7 @@ async def handle_twilio_call(twilio_websocket: WebSocket):
             )
 
             # Create mock WebSocket connection that wraps LocalRealtimeClient
-            mock_connection = await create_mock_websocket_connection(
-                session_config=session_config,
-                local_realtime_config=LOCAL_REALTIME_CONFIG,
-                setup_smart_responses=LOCAL_REALTIME_CONFIG.get(
-                    "setup_smart_responses", True
-                ),
-                enable_vad=VAD_ENABLED,
-                enable_transcription=LOCAL_REALTIME_CONFIG.get(
-                    "enable_transcription", False
-                ),
-            )
+            mock_connection = await create_mock_connection()
 
             # Create Twilio bridge with mock connection
             bridge = TwilioBridge(
@@ -465,6 +488,8 @@ async def twilio_voice(request: Request):
     instructions to connect the call to our WebSocket endpoint for real-time AI interaction.
     """
     logger.info(f"------ Incoming Twilio voice call ------")
+    from twilio.twiml.voice_response import VoiceResponse
+
     # Create a TwiML response
     response = VoiceResponse()
     connect = response.connect()
@@ -553,10 +578,15 @@ async def root():
 async def get_stats():
     """Get WebSocket connection statistics and health information.
 
+    With several workers the statistics of all workers are added up; see
+    opusagent/services/worker_stats.py.
+
     Returns:
         dict: Current connection pool statistics
     """
-    return get_websocket_manager().get_stats()
+    if stats_publisher is not None:
+        return stats_publisher.cluster_stats()
+    return get_worker_stats()
 
 
 @app.get("/health")
@@ -566,22 +596,26 @@ async def health_check():
     Returns:
         dict: Health status information
     """
-    stats = get_websocket_manager().get_stats()
+    stats = await get_stats()
     is_healthy = stats["healthy_connections"] > 0
 
-    return {
+    health = {
         "status": "healthy" if is_healthy else "degraded",
         "websocket_manager": {
             "healthy_connections": stats["healthy_connections"],
             "total_connections": stats["total_connections"],
             "max_connections": stats["max_connections"],
         },
+        "active_calls": stats["active_calls"],
         "message": (
             "Service is operational"
             if is_healthy
             else "WebSocket connection issues detected"
         ),
     }
+    if "workers" in stats:
+        health["workers"] = stats["workers"]
+    return health
 
 
 @app.get("/config")
@@ -630,6 +664,8 @@ async def get_app_config():
             "ping_interval": config.websocket.ping_interval,
             "ping_timeout": config.websocket.ping_timeout,
             "close_timeout": config.websocket.close_timeout,
+            "warm_pool_size": config.websocket.warm_pool_size,
+            "pool_wait_timeout": config.websocket.pool_wait_timeout,
             "openai_model": config.openai.model,
             "websocket_url": config.openai.get_websocket_url(),
         },
@@ -681,7 +717,10 @@ async def shutdown_event():
     """Clean up resources on application shutdown."""
     logger.info("Application shutting down, cleaning up WebSocket connections...")
     try:
+        if stats_publisher is not None:
+            await stats_publisher.stop()
         await get_websocket_manager().shutdown()
+        await close_session_storage()
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
         # Continue with shutdown even if there's an error
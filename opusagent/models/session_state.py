@@ -209,6 +209,38 @@ class SessionState:
             "metadata": self.metadata,
         }
     
+    @classmethod
+    def serialize_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Serialize individual field values the same way to_dict() does.
+        
+        Used to persist a partial update without serializing the whole
+        session. Names that are not SessionState fields are skipped.
+        
+        Args:
+            values: Field names mapped to their new values
+            
+        Returns:
+            Dict[str, Any]: The known fields in storage-friendly form
+            
+        Example:
+            ```python
+            SessionState.serialize_fields({"status": SessionStatus.PAUSED})
+            # {"status": "paused"}
+            ```
+        """
+        serialized = {}
+        for name, value in values.items():
+            if name not in cls.__dataclass_fields__:
+                continue
+            if isinstance(value, Enum):
+                value = value.value
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            elif name == "audio_buffer":
+                value = [chunk.hex() for chunk in value]
+            serialized[name] = value
+        return serialized
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SessionState":
         """Create SessionState instance from dictionary data.
@@ -4,6 +4,13 @@ This package provides service layer implementations for managing
 application state, sessions, and other cross-cutting concerns.
 """
 
+from .preload import preload_subsystems
 from .session_manager_service import SessionManagerService
+from .worker_stats import WorkerStatsPublisher, aggregate_worker_stats
 
-__all__ = ["SessionManagerService"] 
\ No newline at end of file
+__all__ = [
+    "SessionManagerService",
+    "WorkerStatsPublisher",
+    "aggregate_worker_stats",
+    "preload_subsystems",
+] 
\ No newline at end of file
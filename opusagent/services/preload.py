@@ -0,0 +1,110 @@
+"""Optional warm-up of lazily loaded subsystems.
+
+The server imports the voiceprint encoder, VAD model, local realtime mock
+and transcription backends on first use, so a new worker accepts
+connections quickly. The first call then pays the load (torch, model
+weights). Deployments that prefer to pay it before taking traffic list the
+subsystems in ``PRELOAD`` (comma separated); the startup hook loads them on
+worker threads so the event loop stays responsive.
+
+Subsystems:
+- ``vad``: the VAD backend and, with shared inference, its model
+- ``voiceprint``: resemblyzer and the process-wide voice encoder
+- ``mock``: the local realtime client used with USE_LOCAL_REALTIME
+- ``transcription``: the configured transcription backend and its model
+
+Example:
+    ```python
+    timings = await preload_subsystems(["vad", "voiceprint"])
+    # {"vad": 1.84, "voiceprint": 2.31}
+    ```
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+def _preload_vad() -> None:
+    from opusagent.config import vad_config
+    from opusagent.config.constants import DEFAULT_INTERNAL_SAMPLE_RATE
+    from opusagent.vad.vad_config import load_vad_config
+    from opusagent.vad.vad_factory import VADFactory
+
+    # Same configuration as AudioStreamHandler; shared backends keep the
+    # model loaded after this instance is cleaned up
+    config = load_vad_config()
+    config["sample_rate"] = DEFAULT_INTERNAL_SAMPLE_RATE
+    config["shared"] = vad_config().shared_inference
+    VADFactory.create_vad(config).cleanup()
+
+
+def _preload_voiceprint() -> None:
+    from opusagent.voiceprint import get_voice_encoder
+
+    get_voice_encoder()
+
+
+def _preload_mock() -> None:
+    import opusagent.local.realtime  # noqa: F401
+
+
+def _preload_transcription() -> None:
+    from opusagent.local.transcription import (
+        TranscriptionFactory,
+        load_transcription_config,
+    )
+
+    async def load() -> None:
+        # Shared models stay in the model registry after cleanup
+        transcriber = TranscriptionFactory.create_transcriber(
+            load_transcription_config()
+        )
+        if await transcriber.initialize():
+            await transcriber.cleanup()
+
+    asyncio.run(load())
+
+
+PRELOADERS: Dict[str, Callable[[], None]] = {
+    "vad": _preload_vad,
+    "voiceprint": _preload_voiceprint,
+    "mock": _preload_mock,
+    "transcription": _preload_transcription,
+}
+
+
+async def preload_subsystems(names: Iterable[str]) -> Dict[str, float]:
+    """Load subsystems ahead of the first call.
+
+    Each subsystem is loaded on a worker thread, one after the other.
+    Failures are logged and do not stop the server; the subsystem is then
+    loaded on first use as usual.
+
+    Args:
+        names: Subsystem names (see PRELOADERS)
+
+    Returns:
+        Seconds taken per subsystem that loaded successfully
+    """
+    timings: Dict[str, float] = {}
+    for name in (name.strip().lower() for name in names):
+        preloader = PRELOADERS.get(name)
+        if preloader is None:
+            logger.warning(
+                f"Unknown preload subsystem '{name}'; "
+                f"expected one of {', '.join(PRELOADERS)}"
+            )
+            continue
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(preloader)
+        except Exception as e:
+            logger.warning(f"Preloading {name} failed: {e}")
+            continue
+        timings[name] = time.perf_counter() - start
+        logger.info(f"Preloaded {name} in {timings[name]:.2f}s")
+    return timings
@@ -8,7 +8,8 @@ backends to maintain session state persistence across the application.
 The SessionManagerService handles the complete lifecycle of sessions:
 - Session creation and initialization
 - Session retrieval and validation
-- Session updates and state management
+- Session updates and state management, written as deltas so that
+  per-turn updates do not rewrite the whole conversation history
 - Session resumption with expiration checks
 - Session termination and cleanup
 - Session statistics and monitoring
@@ -240,9 +241,10 @@ class SessionManagerService:
     async def update_session(self, conversation_id: str, **updates) -> bool:
         """Update session state with the provided changes.
         
-        Retrieves the current session state, applies the specified updates,
-        and stores the updated state back to the storage backend. Only
-        attributes that exist on the SessionState object will be updated.
+        Serializes only the updated fields and patches them into the stored
+        session, so the cost of an update does not grow with the
+        conversation history. Only attributes that are SessionState fields
+        will be updated. The last activity timestamp is always refreshed.
         
         Args:
             conversation_id: Unique conversation identifier to update
@@ -282,18 +284,69 @@ class SessionManagerService:
         if not conversation_id or not isinstance(conversation_id, str):
             raise ValueError("conversation_id must be a non-empty string")
         
-        session_state = await self.get_session(conversation_id, update_activity=False)
-        if not session_state:
-            return False
+        updates["last_activity"] = datetime.now()
+        fields = SessionState.serialize_fields(updates)
+        return await self.storage.patch_session(conversation_id, fields)
+    
+    async def append_conversation_item(self, conversation_id: str, item: Dict[str, Any]) -> bool:
+        """Append a conversation item to a stored session.
         
-        # Apply updates
-        for key, value in updates.items():
-            if hasattr(session_state, key):
-                setattr(session_state, key, value)
+        Only the new item is written; the history already in storage is not
+        read or rewritten. Advances current_turn and the last activity
+        timestamp, like SessionState.add_conversation_item.
         
-        session_state.update_activity()
-        await self.storage.store_session(conversation_id, session_state.to_dict())
-        return True
+        Args:
+            conversation_id: Unique conversation identifier to update
+            item: Conversation item (message, response, etc.) to append
+        
+        Returns:
+            bool: True if the item was appended, False if session not found
+            
+        Raises:
+            ValueError: If conversation_id is empty or invalid
+        
+        Example:
+            ```python
+            await service.append_conversation_item(
+                "call_123", {"role": "user", "content": "Hello"}
+            )
+            ```
+        """
+        return await self._append(conversation_id, "conversation_history", item)
+    
+    async def append_function_call(self, conversation_id: str, function_call: Dict[str, Any]) -> bool:
+        """Append a function call record to a stored session.
+        
+        Only the new record is written, like append_conversation_item.
+        
+        Args:
+            conversation_id: Unique conversation identifier to update
+            function_call: Function call data (name, arguments, result, etc.)
+        
+        Returns:
+            bool: True if the call was appended, False if session not found
+            
+        Raises:
+            ValueError: If conversation_id is empty or invalid
+        
+        Example:
+            ```python
+            await service.append_function_call(
+                "call_123",
+                {"name": "get_balance", "arguments": {"account_id": "12345"}}
+            )
+            ```
+        """
+        return await self._append(conversation_id, "function_calls", function_call)
+    
+    async def _append(self, conversation_id: str, field: str, item: Dict[str, Any]) -> bool:
+        if not conversation_id or not isinstance(conversation_id, str):
+            raise ValueError("conversation_id must be a non-empty string")
+        
+        fields = SessionState.serialize_fields({"last_activity": datetime.now()})
+        return await self.storage.append_session_items(
+            conversation_id, field, [item], fields=fields
+        )
     
     async def resume_session(self, conversation_id: str, max_age_seconds: int = 3600) -> Optional[SessionState]:
         """Resume an existing session with expiration validation.
@@ -346,6 +399,7 @@ class SessionManagerService:
         # Update resume count and status
         session_state.increment_resume_count()
         
+        # Storing the reassembled state also compacts the stored deltas
         await self.storage.store_session(conversation_id, session_state.to_dict())
         logger.info(f"Resumed session: {conversation_id} (resume #{session_state.resumed_count})")
         return session_state
@@ -393,7 +447,15 @@ class SessionManagerService:
         session_state.metadata["end_reason"] = reason
         session_state.update_activity()
         
-        await self.storage.store_session(conversation_id, session_state.to_dict())
+        # Patch rather than store, so items appended meanwhile are kept
+        fields = SessionState.serialize_fields(
+            {
+                "status": session_state.status,
+                "metadata": session_state.metadata,
+                "last_activity": session_state.last_activity,
+            }
+        )
+        await self.storage.patch_session(conversation_id, fields)
         logger.info(f"Ended session: {conversation_id} - {reason}")
         return True
     
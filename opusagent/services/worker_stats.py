@@ -0,0 +1,232 @@
+"""Statistics shared between server worker processes.
+
+With several uvicorn workers each process has its own WebSocketManager and
+its own calls, and a request to ``/stats`` or ``/health`` reaches whichever
+worker accepted it. Each worker therefore writes a snapshot of its
+statistics to ``WORKER_STATS_DIR`` every ``WORKER_STATS_INTERVAL`` seconds
+(one JSON file per process, replaced atomically), and the endpoints add up
+the snapshots of all live workers. Snapshots older than a few intervals
+belong to workers that died and are ignored.
+
+run_opus_server.py creates the directory when it starts more than one
+worker; with a single worker nothing is published and the endpoints report
+the process's own statistics as before.
+
+Example:
+    ```python
+    publisher = WorkerStatsPublisher("/tmp/opusagent-workers", snapshot)
+    await publisher.start()
+    stats = aggregate_worker_stats(read_worker_stats("/tmp/opusagent-workers"))
+    ```
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Connection counters that add up across workers
+SUMMED_FIELDS = (
+    "total_connections",
+    "healthy_connections",
+    "active_sessions",
+    "total_sessions_handled",
+    "max_connections",
+    "active_calls",
+)
+
+# Warm pool counters that add up across workers
+SUMMED_POOL_FIELDS = (
+    "warm_pool_size",
+    "warm_connections",
+    "hits",
+    "misses",
+    "waits",
+    "wait_timeouts",
+    "waiting",
+    "warm_connections_created",
+    "warm_failures",
+)
+
+
+def _snapshot_path(directory: Path, pid: int) -> Path:
+    return directory / f"worker-{pid}.json"
+
+
+class WorkerStatsPublisher:
+    """Periodically write this worker's statistics to a shared directory.
+
+    Attributes:
+        directory (Path): Directory shared by the workers
+        interval (float): Seconds between snapshots
+        pid (int): Process ID identifying this worker
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        snapshot: Callable[[], Dict[str, Any]],
+        interval: float = 2.0,
+    ):
+        """
+        Initialize the publisher.
+
+        Args:
+            directory: Directory shared by the workers; created if missing
+            snapshot: Returns this worker's current statistics
+            interval: Seconds between snapshots
+
+        Raises:
+            ValueError: If interval is not positive
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.snapshot = snapshot
+        self.interval = interval
+        self.pid = os.getpid()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def path(self) -> Path:
+        return _snapshot_path(self.directory, self.pid)
+
+    @property
+    def max_age(self) -> float:
+        """Age after which a snapshot is treated as a dead worker's."""
+        return max(3 * self.interval, 5.0)
+
+    def publish(self) -> Dict[str, Any]:
+        """Write a snapshot now and return it."""
+        stats = dict(self.snapshot())
+        stats["pid"] = self.pid
+        stats["updated_at"] = time.time()
+        # Readers never see a partially written file
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(stats, default=str))
+        os.replace(tmp_path, self.path)
+        return stats
+
+    async def start(self) -> None:
+        """Publish a first snapshot and keep publishing in the background."""
+        self.publish()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._publish_loop())
+
+    async def stop(self) -> None:
+        """Stop publishing and remove this worker's snapshot."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.path.unlink(missing_ok=True)
+
+    async def _publish_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.publish()
+            except Exception as e:
+                logger.warning(f"Could not publish worker statistics: {e}")
+
+    def cluster_stats(self) -> Dict[str, Any]:
+        """Aggregate the snapshots of all live workers, this one up to date."""
+        snapshots = [
+            stats
+            for stats in read_worker_stats(self.directory, self.max_age)
+            if stats.get("pid") != self.pid
+        ]
+        snapshots.append(self.publish())
+        return aggregate_worker_stats(snapshots)
+
+
+def read_worker_stats(
+    directory: Union[str, Path], max_age: float = 10.0
+) -> List[Dict[str, Any]]:
+    """
+    Read the snapshots of the workers that published recently.
+
+    Args:
+        directory: Directory shared by the workers
+        max_age: Seconds after which a snapshot is ignored
+
+    Returns:
+        Snapshots ordered by worker PID
+    """
+    now = time.time()
+    snapshots = []
+    for path in Path(directory).glob("worker-*.json"):
+        try:
+            stats = json.loads(path.read_text())
+        except (OSError, ValueError):
+            # Removed by a stopping worker, or not a snapshot
+            continue
+        if now - stats.get("updated_at", 0) <= max_age:
+            snapshots.append(stats)
+    return sorted(snapshots, key=lambda stats: stats.get("pid", 0))
+
+
+def aggregate_worker_stats(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine worker snapshots into statistics for the whole server.
+
+    Counters are summed. The pool hit rate is recomputed from the summed
+    hits and misses, the average acquire latency is weighted by each
+    worker's acquires, and p50, p95 and max latencies are the highest
+    reported by any worker.
+
+    Args:
+        snapshots: WebSocketManager.get_stats() snapshots with the worker's
+            ``pid`` and ``active_calls``
+
+    Returns:
+        Statistics shaped like WebSocketManager.get_stats(), plus
+        ``workers`` and a ``per_worker`` summary
+    """
+    stats: Dict[str, Any] = {
+        field: sum(s.get(field, 0) for s in snapshots) for field in SUMMED_FIELDS
+    }
+    stats["use_mock"] = any(s.get("use_mock") for s in snapshots)
+
+    pools = [s.get("pool", {}) for s in snapshots]
+    pool: Dict[str, Any] = {
+        field: sum(p.get(field, 0) for p in pools) for field in SUMMED_POOL_FIELDS
+    }
+    requests = pool["hits"] + pool["misses"]
+    pool["hit_rate"] = pool["hits"] / requests if requests else 0.0
+
+    latencies = [p.get("acquire_latency_ms", {}) for p in pools]
+    weights = [p.get("hits", 0) + p.get("misses", 0) for p in pools]
+    pool["acquire_latency_ms"] = {
+        "avg": (
+            sum(l.get("avg", 0.0) * w for l, w in zip(latencies, weights)) / requests
+            if requests
+            else 0.0
+        ),
+        "p50": max((l.get("p50", 0.0) for l in latencies), default=0.0),
+        "p95": max((l.get("p95", 0.0) for l in latencies), default=0.0),
+        "max": max((l.get("max", 0.0) for l in latencies), default=0.0),
+    }
+    stats["pool"] = pool
+
+    stats["workers"] = len(snapshots)
+    stats["per_worker"] = [
+        {
+            "pid": s.get("pid"),
+            "active_calls": s.get("active_calls", 0),
+            "active_sessions": s.get("active_sessions", 0),
+            "healthy_connections": s.get("healthy_connections", 0),
+            "updated_at": s.get("updated_at"),
+        }
+        for s in snapshots
+    ]
+    return stats
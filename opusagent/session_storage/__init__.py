@@ -9,6 +9,9 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+# List fields of a session that grow during a call and can be appended to
+APPENDABLE_FIELDS = ("conversation_history", "function_calls")
+
 
 class SessionStorage(ABC):
     """Abstract interface for session state storage.
@@ -90,6 +93,62 @@ class SessionStorage(ABC):
         """
         pass
     
+    async def patch_session(self, conversation_id: str, fields: Dict[str, Any]) -> bool:
+        """Overwrite individual top-level fields of a stored session.
+        
+        The default implementation reads the whole session and stores it
+        again. Backends override it to write only the changed fields.
+        
+        Args:
+            conversation_id: Unique identifier for the conversation
+            fields: Serialized field values, as produced by SessionState.to_dict()
+            
+        Returns:
+            True if the session exists and was updated, False otherwise
+        """
+        session_data = await self.retrieve_session(conversation_id, update_activity=False)
+        if session_data is None:
+            return False
+        session_data.update(fields)
+        return await self.store_session(conversation_id, session_data)
+    
+    async def append_session_items(
+        self,
+        conversation_id: str,
+        field: str,
+        items: List[Dict[str, Any]],
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Append items to a list field of a stored session.
+        
+        Appending to conversation_history also advances current_turn by one
+        per item, as SessionState.add_conversation_item does. The default
+        implementation reads the whole session and stores it again. Backends
+        override it to write only the new items.
+        
+        Args:
+            conversation_id: Unique identifier for the conversation
+            field: One of APPENDABLE_FIELDS
+            items: Items to append, in order
+            fields: Optional serialized fields to overwrite in the same update
+            
+        Returns:
+            True if the session exists and was updated, False otherwise
+            
+        Raises:
+            ValueError: If field cannot be appended to
+        """
+        _check_appendable(field)
+        session_data = await self.retrieve_session(conversation_id, update_activity=False)
+        if session_data is None:
+            return False
+        session_data[field] = list(session_data.get(field, [])) + list(items)
+        if field == "conversation_history":
+            session_data["current_turn"] = session_data.get("current_turn", 0) + len(items)
+        if fields:
+            session_data.update(fields)
+        return await self.store_session(conversation_id, session_data)
+    
     async def start_cleanup_task(self):
         """Start background cleanup task (optional)."""
         pass
@@ -99,8 +158,26 @@ class SessionStorage(ABC):
         pass
 
 
+def _check_appendable(field: str) -> None:
+    if field not in APPENDABLE_FIELDS:
+        raise ValueError(
+            f"Cannot append to session field '{field}'; "
+            f"appendable fields are {', '.join(APPENDABLE_FIELDS)}"
+        )
+
+
 # Import implementations after defining the base class
+from .codec import SessionCodec, get_session_codec
 from .memory_storage import MemorySessionStorage
 from .redis_storage import RedisSessionStorage
+from .tiered_storage import TieredSessionStorage
 
-__all__ = ["SessionStorage", "MemorySessionStorage", "RedisSessionStorage"] 
\ No newline at end of file
+__all__ = [
+    "APPENDABLE_FIELDS",
+    "SessionCodec",
+    "SessionStorage",
+    "MemorySessionStorage",
+    "RedisSessionStorage",
+    "TieredSessionStorage",
+    "get_session_codec",
+] 
\ No newline at end of file
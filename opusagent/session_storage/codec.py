@@ -0,0 +1,273 @@
+"""Serialization codecs for stored session state.
+
+Session backends that keep sessions outside the process (Redis) serialize
+every snapshot and every delta. ``SessionCodec`` makes that step pluggable:
+the payload can be JSON, orjson or msgpack, and payloads above a size
+threshold can be compressed with zlib or zstd, which pays off for long
+conversation histories.
+
+Encoded values carry a small header so any reader can decode them whatever
+codec it is configured with:
+
+    b"\\xc1S"   magic (0xC1 never starts UTF-8 text and is unused by msgpack)
+    1 byte     format version
+    1 byte     serializer id (0 json, 1 orjson, 2 msgpack)
+    1 byte     compression id (0 none, 1 zlib, 2 zstd)
+    ...        payload
+
+Uncompressed JSON is written without a header, exactly as sessions were
+stored before codecs existed. Values without the magic are decoded as JSON,
+so entries written by older versions keep loading.
+
+orjson, msgpack and zstandard are optional dependencies. They are imported
+when a codec that needs them is created or a value that needs them is read.
+
+Example:
+    ```python
+    codec = get_session_codec("msgpack+zstd")
+    data = codec.encode(session.to_dict())
+    session_dict = codec.decode(data)
+    ```
+"""
+
+import importlib
+import json
+import zlib
+from typing import Any, Dict, Optional, Union
+
+# Header of encoded values; plain JSON never starts with it
+MAGIC = b"\xc1S"
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 3
+
+SERIALIZERS = ("json", "orjson", "msgpack")
+COMPRESSIONS = ("none", "zlib", "zstd")
+
+# Import name and pip package of each optional dependency
+_OPTIONAL_MODULES = {
+    "orjson": ("orjson", "orjson"),
+    "msgpack": ("msgpack", "msgpack"),
+    "zstd": ("zstandard", "zstandard"),
+}
+
+_DEFAULT_LEVELS = {"zlib": 6, "zstd": 3}
+
+
+def _import_optional(name: str) -> Any:
+    module_name, package = _OPTIONAL_MODULES[name]
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        raise RuntimeError(
+            f"The {name} session codec requires {package}. "
+            f"Install with: pip install {package}"
+        ) from e
+
+
+def _dumps(serializer: str, value: Any) -> bytes:
+    if serializer == "json":
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+    if serializer == "orjson":
+        return _import_optional("orjson").dumps(value)
+    return _import_optional("msgpack").packb(value, use_bin_type=True)
+
+
+def _loads(serializer: str, payload: bytes) -> Any:
+    if serializer == "json":
+        return json.loads(payload)
+    if serializer == "orjson":
+        return _import_optional("orjson").loads(payload)
+    return _import_optional("msgpack").unpackb(
+        payload, raw=False, strict_map_key=False
+    )
+
+
+def _decompress(compression: str, payload: bytes) -> bytes:
+    if compression == "zlib":
+        return zlib.decompress(payload)
+    return _import_optional("zstd").ZstdDecompressor().decompress(payload)
+
+
+class SessionCodec:
+    """Encodes session values to bytes and decodes them back.
+
+    Attributes:
+        serializer: Payload format, one of SERIALIZERS
+        compression: Compression applied above the threshold, or None
+        compression_threshold: Smallest serialized size, in bytes, that is
+            compressed
+        compression_level: Compression level
+        binary: Whether encoded values may not be valid UTF-8 text
+    """
+
+    def __init__(
+        self,
+        serializer: str = "json",
+        compression: Optional[str] = None,
+        compression_threshold: int = 1024,
+        compression_level: Optional[int] = None,
+    ):
+        """
+        Initialize the codec.
+
+        Args:
+            serializer: "json", "orjson" or "msgpack"
+            compression: "zlib", "zstd", or None (or "none") to never compress
+            compression_threshold: Serialized size in bytes from which values
+                are compressed. Small values, such as single conversation
+                items, are stored uncompressed.
+            compression_level: Compression level, None for the default
+
+        Raises:
+            ValueError: If the serializer or compression is unknown, or the
+                threshold is negative
+            RuntimeError: If an optional dependency is not installed
+        """
+        serializer = serializer.lower()
+        compression = (compression or "none").lower()
+        if serializer not in SERIALIZERS:
+            raise ValueError(
+                f"Unknown session serializer '{serializer}'; "
+                f"choose from {', '.join(SERIALIZERS)}"
+            )
+        if compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unknown session compression '{compression}'; "
+                f"choose from {', '.join(COMPRESSIONS)}"
+            )
+        if compression_threshold < 0:
+            raise ValueError("compression_threshold must not be negative")
+
+        self.serializer = serializer
+        self.compression = None if compression == "none" else compression
+        self.compression_threshold = compression_threshold
+        self.compression_level = (
+            compression_level
+            if compression_level is not None
+            else _DEFAULT_LEVELS.get(compression)
+        )
+        self.binary = serializer != "json" or self.compression is not None
+
+        # Fail on missing dependencies now rather than on the first write
+        if serializer in _OPTIONAL_MODULES:
+            _import_optional(serializer)
+        self._compressor = None
+        if self.compression == "zstd":
+            self._compressor = _import_optional("zstd").ZstdCompressor(
+                level=self.compression_level
+            )
+
+        # Statistics
+        self.values_encoded = 0
+        self.values_compressed = 0
+        self.serialized_bytes = 0
+        self.stored_bytes = 0
+
+    @property
+    def name(self) -> str:
+        """Codec spec, e.g. "msgpack+zstd", as accepted by get_session_codec."""
+        if self.compression:
+            return f"{self.serializer}+{self.compression}"
+        return self.serializer
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Serialize a value and compress it if it is large enough.
+
+        Args:
+            value: JSON-compatible value
+
+        Returns:
+            Encoded bytes; plain JSON when neither a binary serializer nor
+            compression was used
+        """
+        payload = _dumps(self.serializer, value)
+        self.values_encoded += 1
+        self.serialized_bytes += len(payload)
+
+        compression_id = 0
+        if self.compression and len(payload) >= self.compression_threshold:
+            if self._compressor is not None:
+                payload = self._compressor.compress(payload)
+            else:
+                payload = zlib.compress(payload, self.compression_level)
+            compression_id = COMPRESSIONS.index(self.compression)
+            self.values_compressed += 1
+
+        if self.serializer == "json" and not compression_id:
+            self.stored_bytes += len(payload)
+            return payload
+        header = MAGIC + bytes(
+            (FORMAT_VERSION, SERIALIZERS.index(self.serializer), compression_id)
+        )
+        self.stored_bytes += HEADER_SIZE + len(payload)
+        return header + payload
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a value written by any codec, or legacy JSON.
+
+        Args:
+            data: Encoded bytes, or JSON text
+
+        Returns:
+            The decoded value
+
+        Raises:
+            ValueError: If the header is from a newer format version or
+                names an unknown serializer or compression
+            RuntimeError: If decoding needs an optional dependency that is
+                not installed
+        """
+        if isinstance(data, str) or not data.startswith(MAGIC):
+            return json.loads(data)
+
+        version, serializer_id, compression_id = data[len(MAGIC) : HEADER_SIZE]
+        if version > FORMAT_VERSION:
+            raise ValueError(f"Unsupported session codec version {version}")
+        if serializer_id >= len(SERIALIZERS) or compression_id >= len(COMPRESSIONS):
+            raise ValueError("Corrupt session codec header")
+
+        payload = data[HEADER_SIZE:]
+        if compression_id:
+            payload = _decompress(COMPRESSIONS[compression_id], payload)
+        return _loads(SERIALIZERS[serializer_id], payload)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get encoding statistics."""
+        return {
+            "codec": self.name,
+            "values_encoded": self.values_encoded,
+            "values_compressed": self.values_compressed,
+            "serialized_bytes": self.serialized_bytes,
+            "stored_bytes": self.stored_bytes,
+            "compression_ratio": (
+                self.serialized_bytes / self.stored_bytes if self.stored_bytes else 1.0
+            ),
+        }
+
+
+def get_session_codec(
+    codec: Union[str, SessionCodec, None] = None, **kwargs: Any
+) -> SessionCodec:
+    """
+    Build a codec from a spec such as "json", "orjson" or "msgpack+zstd".
+
+    Args:
+        codec: Codec spec, an existing codec (returned as is), or None for
+            plain JSON
+        **kwargs: Further SessionCodec arguments, such as compression_threshold
+
+    Returns:
+        The codec
+
+    Raises:
+        ValueError: If the spec is not recognized
+        RuntimeError: If an optional dependency is not installed
+    """
+    if isinstance(codec, SessionCodec):
+        return codec
+    if not codec:
+        return SessionCodec(**kwargs)
+    serializer, _, compression = codec.partition("+")
+    return SessionCodec(serializer, compression or None, **kwargs)
@@ -0,0 +1,96 @@
+"""Process-wide session storage selected by configuration.
+
+Bridges share one storage per worker process instead of creating their own,
+so a session written by one call can be resumed by the next. The backend is
+chosen with SESSION_STORAGE_TYPE:
+
+- ``memory``: MemorySessionStorage, private to the worker process
+- ``redis``: RedisSessionStorage at REDIS_URL, shared by all workers
+- ``tiered``: a local memory cache in front of Redis (TieredSessionStorage)
+
+With several server workers a call may reconnect to a different worker, so
+sessions only resume reliably with ``redis`` or ``tiered``.
+"""
+
+import threading
+from typing import Optional
+
+from opusagent.config import server_config
+from opusagent.config.logging_config import configure_logging
+
+from . import SessionStorage
+
+logger = configure_logging("session_storage_factory")
+
+SESSION_STORAGE_BACKENDS = ("memory", "redis", "tiered")
+
+_session_storage: Optional[SessionStorage] = None
+_session_storage_lock = threading.Lock()
+
+
+def create_session_storage(
+    backend: str = "memory", redis_url: str = "redis://localhost:6379"
+) -> SessionStorage:
+    """
+    Create a session storage backend.
+
+    Args:
+        backend: One of SESSION_STORAGE_BACKENDS
+        redis_url: Redis URL for the redis and tiered backends
+
+    Returns:
+        The storage
+
+    Raises:
+        ValueError: If the backend is not recognized
+    """
+    if backend == "memory":
+        from .memory_storage import MemorySessionStorage
+
+        return MemorySessionStorage()
+    if backend not in SESSION_STORAGE_BACKENDS:
+        raise ValueError(
+            f"Unknown session storage '{backend}'; "
+            f"expected one of {', '.join(SESSION_STORAGE_BACKENDS)}"
+        )
+
+    # redis is only imported when a Redis backend is configured
+    from .redis_storage import RedisSessionStorage
+
+    remote = RedisSessionStorage(redis_url=redis_url)
+    if backend == "redis":
+        return remote
+
+    from .tiered_storage import TieredSessionStorage
+
+    return TieredSessionStorage(remote)
+
+
+def get_session_storage() -> SessionStorage:
+    """Return the process-wide session storage, creating it on first use."""
+    global _session_storage
+    with _session_storage_lock:
+        if _session_storage is None:
+            config = server_config()
+            _session_storage = create_session_storage(
+                config.session_storage, config.redis_url
+            )
+            logger.info(f"Session storage: {config.session_storage}")
+        return _session_storage
+
+
+async def close_session_storage() -> None:
+    """Flush and close the process-wide session storage, if it was created."""
+    global _session_storage
+    with _session_storage_lock:
+        storage, _session_storage = _session_storage, None
+    close = getattr(storage, "close", None)
+    if close is not None:
+        await close()
+
+
+def reset_session_storage() -> None:
+    """Drop the process-wide session storage (for tests)."""
+    global _session_storage
+    with _session_storage_lock:
+        _session_storage = None
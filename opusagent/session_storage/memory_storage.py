@@ -15,7 +15,10 @@ Key Features:
 - Configurable session limits and cleanup intervals
 - Thread-safe operations using asyncio locks
 - Background cleanup task for maintenance
-- Memory management with oldest session eviction
+- Memory management with least recently used session eviction
+- O(1) amortized store, retrieve, touch, eviction and expiry through an
+  LRU-ordered activity index with timer-wheel slots
+- Per-operation latency histograms
 
 Example:
     ```python
@@ -41,15 +44,169 @@ Example:
 """
 
 import asyncio
+import bisect
+import functools
+import heapq
 import time
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict, defaultdict
+from typing import Dict, Any, Iterator, MutableMapping, Optional, List, Set
 from datetime import datetime
 
-from . import SessionStorage
+from . import APPENDABLE_FIELDS, SessionStorage, _check_appendable
 from opusagent.config.logging_config import configure_logging
 
 logger = configure_logging("memory_session_storage")
 
+# Upper bounds of the latency histogram buckets, in microseconds
+LATENCY_BUCKETS_US = (
+    1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 50000
+)
+
+
+def _detach(session_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow-copy a session so appends in storage are not seen by callers."""
+    detached = dict(session_data)
+    for field in APPENDABLE_FIELDS:
+        if field in detached:
+            detached[field] = list(detached[field])
+    return detached
+
+
+class _ActivityIndex(MutableMapping):
+    """Last activity time per session, with O(1) eviction and expiry.
+    
+    Iteration is least recently touched first, so the eviction candidate
+    is always the first key. Sessions are also hashed into timer-wheel
+    slots of ``resolution`` seconds by activity time. Expiry pops whole
+    slots older than the cutoff from a heap of slot numbers and checks
+    individually only the sessions in the slot the cutoff falls in, so it
+    costs time in the number of expired sessions, not the number stored.
+    """
+    
+    def __init__(self, resolution: float = 1.0):
+        self._resolution = resolution
+        self._times: "OrderedDict[str, float]" = OrderedDict()
+        self._slots: Dict[int, Set[str]] = {}
+        # Slot numbers; may hold slots that have since emptied
+        self._slot_heap: List[int] = []
+    
+    def _slot(self, timestamp: float) -> int:
+        return int(timestamp // self._resolution)
+    
+    def _unslot(self, key: str, timestamp: float) -> None:
+        slot = self._slot(timestamp)
+        members = self._slots.get(slot)
+        if members is not None:
+            members.discard(key)
+            if not members:
+                del self._slots[slot]
+    
+    def __getitem__(self, key: str) -> float:
+        return self._times[key]
+    
+    def __setitem__(self, key: str, timestamp: float) -> None:
+        previous = self._times.get(key)
+        if previous is not None:
+            self._unslot(key, previous)
+            self._times.move_to_end(key)
+        self._times[key] = timestamp
+        
+        slot = self._slot(timestamp)
+        members = self._slots.get(slot)
+        if members is None:
+            members = self._slots[slot] = set()
+            heapq.heappush(self._slot_heap, slot)
+            # Drop emptied slots once they outnumber the live ones
+            if len(self._slot_heap) > 2 * len(self._slots) + 64:
+                self._slot_heap = list(self._slots)
+                heapq.heapify(self._slot_heap)
+        members.add(key)
+    
+    def __delitem__(self, key: str) -> None:
+        self._unslot(key, self._times.pop(key))
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._times)
+    
+    def __len__(self) -> int:
+        return len(self._times)
+    
+    def least_recent(self) -> Optional[str]:
+        """The session touched longest ago, or None if empty."""
+        return next(iter(self._times), None)
+    
+    def pop_expired(self, cutoff: float) -> List[str]:
+        """Remove and return the sessions last active before ``cutoff``."""
+        expired: List[str] = []
+        cutoff_slot = self._slot(cutoff)
+        while self._slot_heap and self._slot_heap[0] < cutoff_slot:
+            members = self._slots.pop(heapq.heappop(self._slot_heap), ())
+            for key in members:
+                del self._times[key]
+            expired.extend(members)
+        
+        boundary = [
+            key for key in self._slots.get(cutoff_slot, ()) if self._times[key] < cutoff
+        ]
+        for key in boundary:
+            del self[key]
+        expired.extend(boundary)
+        return expired
+
+
+class _LatencyHistogram:
+    """Operation latencies counted in fixed buckets; recording is O(1)."""
+    
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_US) + 1)
+        self.total_us = 0.0
+        self.max_us = 0.0
+    
+    def record(self, seconds: float) -> None:
+        latency_us = seconds * 1e6
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_US, latency_us)] += 1
+        self.total_us += latency_us
+        self.max_us = max(self.max_us, latency_us)
+    
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of calls."""
+        target = fraction * sum(self.counts)
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_US, self.counts):
+            seen += count
+            if count and seen >= target:
+                return min(float(bound), self.max_us)
+        return self.max_us
+    
+    def to_dict(self) -> Dict[str, Any]:
+        calls = sum(self.counts)
+        buckets = {
+            str(bound): count for bound, count in zip(LATENCY_BUCKETS_US, self.counts)
+        }
+        buckets["inf"] = self.counts[-1]
+        return {
+            "calls": calls,
+            "avg_us": self.total_us / calls if calls else 0.0,
+            "p50_us": self.percentile(0.50),
+            "p99_us": self.percentile(0.99),
+            "max_us": self.max_us,
+            "buckets_us": buckets,
+        }
+
+
+def _timed(method):
+    """Record the latency of a storage operation, lock wait included."""
+    
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self._latency[method.__name__].record(time.perf_counter() - start)
+    
+    return wrapper
+
 
 class MemorySessionStorage(SessionStorage):
     """In-memory session storage implementation.
@@ -68,12 +225,15 @@ class MemorySessionStorage(SessionStorage):
     - Configurable session limits and cleanup intervals
     - Thread-safe operations using asyncio locks
     - Background cleanup task for maintenance
-    - Memory management with oldest session eviction
+    - Memory management with least recently used session eviction
     - Automatic timestamp management
+    - O(1) amortized operations, including eviction and expiry
+    - Per-operation latency histograms
     
     Attributes:
         _sessions: Dictionary storing session data by conversation ID
-        _session_timestamps: Dictionary storing last activity timestamps
+        _session_timestamps: Last activity timestamps, least recently used
+            first and indexed by time for expiry
         _max_sessions: Maximum number of sessions allowed in storage
         _cleanup_interval: Interval in seconds between cleanup runs
         _cleanup_task: Background task for automatic cleanup
@@ -138,12 +298,17 @@ class MemorySessionStorage(SessionStorage):
             raise ValueError("cleanup_interval must be positive")
         
         self._sessions: Dict[str, Dict[str, Any]] = {}
-        self._session_timestamps: Dict[str, float] = {}
+        self._session_timestamps = _ActivityIndex()
         self._max_sessions = max_sessions
         self._cleanup_interval = cleanup_interval
         self._cleanup_task: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
         
+        # Statistics
+        self._latency: Dict[str, _LatencyHistogram] = defaultdict(_LatencyHistogram)
+        self._evictions = 0
+        self._expirations = 0
+        
         logger.info(f"Memory session storage initialized: max_sessions={max_sessions}, cleanup_interval={cleanup_interval}s")
     
     async def start_cleanup_task(self) -> None:
@@ -222,12 +387,14 @@ class MemorySessionStorage(SessionStorage):
             except Exception as e:
                 logger.error(f"Error in cleanup loop: {e}")
     
+    @_timed
     async def store_session(self, conversation_id: str, session_data: Dict[str, Any]) -> bool:
         """Store session state in memory.
         
         Stores the session data in memory with automatic timestamp
-        management. If the storage is at capacity, the oldest session
-        will be automatically evicted to make room for the new session.
+        management. If the storage is at capacity, the least recently
+        used session will be automatically evicted to make room for the
+        new session.
         
         Args:
             conversation_id: Unique identifier for the conversation session.
@@ -271,10 +438,13 @@ class MemorySessionStorage(SessionStorage):
                     session_data["last_activity"] = datetime.now().isoformat()
                 
                 # Check if we need to make room
-                if len(self._sessions) >= self._max_sessions:
+                if (
+                    conversation_id not in self._sessions
+                    and len(self._sessions) >= self._max_sessions
+                ):
                     await self._evict_oldest_session()
                 
-                self._sessions[conversation_id] = session_data
+                self._sessions[conversation_id] = _detach(session_data)
                 self._session_timestamps[conversation_id] = time.time()
                 
                 logger.debug(f"Stored session: {conversation_id}")
@@ -284,12 +454,14 @@ class MemorySessionStorage(SessionStorage):
                 logger.error(f"Error storing session {conversation_id}: {e}")
                 return False
     
+    @_timed
     async def retrieve_session(self, conversation_id: str, update_activity: bool = True) -> Optional[Dict[str, Any]]:
         """Retrieve session state from memory.
         
         Retrieves session data from memory and optionally updates the
-        last activity timestamp. This method is thread-safe and provides
-        O(1) access time for session retrieval.
+        last activity timestamp. This method is thread-safe. The returned
+        dictionary is a copy, so later appends to the stored conversation
+        history and function calls do not show up in it.
         
         Args:
             conversation_id: Unique conversation identifier to retrieve.
@@ -328,13 +500,14 @@ class MemorySessionStorage(SessionStorage):
                         session_data["last_activity"] = datetime.now().isoformat()
                         self._session_timestamps[conversation_id] = time.time()
                     logger.debug(f"Retrieved session: {conversation_id}")
-                    return session_data
+                    return _detach(session_data)
                 return None
                 
             except Exception as e:
                 logger.error(f"Error retrieving session {conversation_id}: {e}")
                 return None
     
+    @_timed
     async def delete_session(self, conversation_id: str) -> bool:
         """Delete session state from memory.
         
@@ -379,6 +552,7 @@ class MemorySessionStorage(SessionStorage):
                 logger.error(f"Error deleting session {conversation_id}: {e}")
                 return False
     
+    @_timed
     async def list_active_sessions(self) -> List[str]:
         """List all active session IDs in memory.
         
@@ -403,13 +577,16 @@ class MemorySessionStorage(SessionStorage):
         async with self._lock:
             return list(self._sessions.keys())
     
+    @_timed
     async def cleanup_expired_sessions(self, max_age_seconds: int = 3600) -> int:
         """Clean up expired sessions from memory.
         
         Removes sessions that have exceeded the specified maximum age
         since their last activity. This method is called automatically
         by the background cleanup task, but can also be called manually
-        for immediate cleanup.
+        for immediate cleanup. Expired sessions are found through the
+        activity index's timer-wheel slots, so the cost depends on the
+        number of expired sessions rather than the number stored.
         
         Args:
             max_age_seconds: Maximum age in seconds before session is
@@ -436,23 +613,19 @@ class MemorySessionStorage(SessionStorage):
             raise ValueError("max_age_seconds must be positive")
         
         async with self._lock:
-            current_time = time.time()
-            expired_sessions = []
-            
-            for conv_id, timestamp in self._session_timestamps.items():
-                if current_time - timestamp > max_age_seconds:
-                    expired_sessions.append(conv_id)
-            
-            # Remove expired sessions
+            expired_sessions = self._session_timestamps.pop_expired(
+                time.time() - max_age_seconds
+            )
             for conv_id in expired_sessions:
                 del self._sessions[conv_id]
-                del self._session_timestamps[conv_id]
+            self._expirations += len(expired_sessions)
             
             if expired_sessions:
                 logger.info(f"Cleaned up {len(expired_sessions)} expired sessions")
             
             return len(expired_sessions)
     
+    @_timed
     async def update_session_activity(self, conversation_id: str) -> bool:
         """Update session last activity timestamp.
         
@@ -494,15 +667,85 @@ class MemorySessionStorage(SessionStorage):
                 logger.error(f"Error updating session activity {conversation_id}: {e}")
                 return False
     
+    @_timed
+    async def patch_session(self, conversation_id: str, fields: Dict[str, Any]) -> bool:
+        """Overwrite individual fields of a session in place.
+        
+        Only the given fields are touched, so the cost does not depend on
+        the size of the conversation history.
+        
+        Args:
+            conversation_id: Unique conversation identifier to update.
+            fields: Serialized field values to overwrite.
+                
+        Returns:
+            bool: True if the session was updated, False if not found
+            
+        Raises:
+            ValueError: If conversation_id is empty or invalid
+        """
+        if not conversation_id or not isinstance(conversation_id, str):
+            raise ValueError("conversation_id must be a non-empty string")
+        
+        async with self._lock:
+            session_data = self._sessions.get(conversation_id)
+            if session_data is None:
+                return False
+            session_data.update(_detach(fields))
+            self._session_timestamps[conversation_id] = time.time()
+            return True
+    
+    @_timed
+    async def append_session_items(
+        self,
+        conversation_id: str,
+        field: str,
+        items: List[Dict[str, Any]],
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Append items to a list field of a session in place.
+        
+        Appending to conversation_history also advances current_turn by one
+        per item.
+        
+        Args:
+            conversation_id: Unique conversation identifier to update.
+            field: "conversation_history" or "function_calls".
+            items: Items to append, in order.
+            fields: Optional serialized fields to overwrite in the same update.
+                
+        Returns:
+            bool: True if the session was updated, False if not found
+            
+        Raises:
+            ValueError: If conversation_id is invalid or field cannot be appended to
+        """
+        if not conversation_id or not isinstance(conversation_id, str):
+            raise ValueError("conversation_id must be a non-empty string")
+        _check_appendable(field)
+        
+        async with self._lock:
+            session_data = self._sessions.get(conversation_id)
+            if session_data is None:
+                return False
+            session_data.setdefault(field, []).extend(items)
+            if field == "conversation_history":
+                session_data["current_turn"] = session_data.get("current_turn", 0) + len(items)
+            if fields:
+                session_data.update(fields)
+            self._session_timestamps[conversation_id] = time.time()
+            return True
+    
     async def _evict_oldest_session(self) -> None:
-        """Evict the oldest session to make room for new ones.
+        """Evict the least recently used session to make room for new ones.
         
-        Removes the session with the oldest last activity timestamp
-        to maintain the maximum session limit. This method is called
+        Removes the session that was stored or touched longest ago to
+        maintain the maximum session limit. This method is called
         automatically when the storage reaches capacity.
         
-        The eviction is based on the last activity timestamp, ensuring
-        that the least recently used session is removed first.
+        The activity index keeps sessions in order of use, so the
+        candidate is found in O(1) rather than by scanning every
+        timestamp.
         
         Example:
             ```python
@@ -510,24 +753,22 @@ class MemorySessionStorage(SessionStorage):
             # No need to call it manually
             ```
         """
-        if not self._session_timestamps:
+        oldest_conv_id = self._session_timestamps.least_recent()
+        if oldest_conv_id is None:
             return
         
-        oldest_conv_id = min(
-            self._session_timestamps.keys(),
-            key=lambda k: self._session_timestamps[k]
-        )
-        
         del self._sessions[oldest_conv_id]
         del self._session_timestamps[oldest_conv_id]
+        self._evictions += 1
         logger.debug(f"Evicted oldest session: {oldest_conv_id}")
     
     def get_stats(self) -> Dict[str, Any]:
         """Get storage statistics and health information.
         
         Returns comprehensive statistics about the memory storage,
-        including session counts, configuration, and task status.
-        This is useful for monitoring and debugging.
+        including session counts, configuration, task status, evictions
+        and per-operation latency histograms. This is useful for
+        monitoring and debugging.
         
         Returns:
             Dict[str, Any]: Dictionary containing storage statistics with keys:
@@ -535,6 +776,11 @@ class MemorySessionStorage(SessionStorage):
                 - max_sessions: Maximum number of sessions allowed
                 - cleanup_interval: Interval between cleanup runs in seconds
                 - cleanup_task_running: Whether background cleanup is active
+                - evictions: Sessions evicted to stay under max_sessions
+                - expirations: Sessions removed by cleanup
+                - latency: Per operation, the number of calls, average, p50,
+                  p99 and maximum latency in microseconds, and call counts
+                  per histogram bucket (keyed by upper bound in microseconds)
                 
         Example:
             ```python
@@ -548,5 +794,11 @@ class MemorySessionStorage(SessionStorage):
             "total_sessions": len(self._sessions),
             "max_sessions": self._max_sessions,
             "cleanup_interval": self._cleanup_interval,
-            "cleanup_task_running": self._cleanup_task is not None and not self._cleanup_task.done()
+            "cleanup_task_running": self._cleanup_task is not None and not self._cleanup_task.done(),
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "latency": {
+                operation: histogram.to_dict()
+                for operation, histogram in self._latency.items()
+            },
         } 
\ No newline at end of file
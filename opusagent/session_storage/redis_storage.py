@@ -15,7 +15,33 @@ Key Features:
 - Error handling and connection recovery
 - Background cleanup tasks for maintenance
 - Scalable across multiple server instances
-- JSON serialization for complex session data
+- JSON serialization for complex session data, or msgpack/orjson with
+  optional compression through a SessionCodec
+- Delta writes: field patches and appended conversation items do not
+  rewrite the whole session
+- Sorted-set activity index, so listing and expiry are range queries
+  instead of KEYS scans
+- One round trip per operation through MULTI pipelines
+- Invalidation messages on a pub/sub channel when a session is replaced or
+  deleted, so workers caching sessions locally can drop stale copies
+
+Key layout:
+    {prefix}{id}                        Encoded snapshot of the session
+    {prefix}{id}:meta                   JSON tracking metadata
+    {prefix}{id}:fields                 Hash of fields patched since the snapshot
+    {prefix}{id}:conversation_history   List of items appended since the snapshot
+    {prefix}{id}:function_calls         List of calls appended since the snapshot
+    {prefix}__activity__                Sorted set of conversation IDs scored by
+                                        last activity time
+    {prefix}__invalidate__              Pub/sub channel announcing replaced and
+                                        deleted sessions
+
+Snapshots, patched field values and appended items are encoded with the
+storage's codec; metadata is always JSON. Values written by any codec, and
+plain JSON written before codecs existed, can be read whatever the codec.
+
+The snapshot is rewritten only by store_session(), which also drops the
+deltas it supersedes. retrieve_session() reassembles snapshot and deltas.
 
 Example:
     ```python
@@ -45,15 +71,53 @@ Example:
 import asyncio
 import json
 import time
+import uuid
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Union
 
 import redis.asyncio as redis
-from . import SessionStorage
+from . import APPENDABLE_FIELDS, SessionStorage, _check_appendable
+from .codec import SessionCodec, get_session_codec
 from opusagent.config.logging_config import configure_logging
 
 logger = configure_logging("redis_session_storage")
 
+# Hash field counting conversation items appended since current_turn was set
+_TURN_DELTA_FIELD = "_turn_delta"
+# Name of the activity index under the session prefix
+_ACTIVITY_INDEX = "__activity__"
+# Name of the invalidation channel under the session prefix
+_INVALIDATION_CHANNEL = "__invalidate__"
+
+
+def _decode(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _apply_deltas(
+    session_dict: Dict[str, Any],
+    fields: Dict[Any, Any],
+    appended: Dict[str, List[Any]],
+    decode: Callable[[Any], Any],
+) -> Dict[str, Any]:
+    """Merge patched fields and appended items into a snapshot."""
+    turn_delta = 0
+    for name, value in fields.items():
+        name = _decode(name)
+        if name == _TURN_DELTA_FIELD:
+            turn_delta = int(value)
+        else:
+            session_dict[name] = decode(value)
+    for field, items in appended.items():
+        if items:
+            session_dict[field] = list(session_dict.get(field, [])) + [
+                decode(item) for item in items
+            ]
+    if turn_delta:
+        session_dict["current_turn"] = session_dict.get("current_turn", 0) + turn_delta
+    return session_dict
+
 
 class RedisSessionStorage(SessionStorage):
     """Redis-based session storage implementation.
@@ -74,13 +138,21 @@ class RedisSessionStorage(SessionStorage):
     - Error handling and connection recovery
     - Background cleanup tasks for maintenance
     - Scalable across multiple server instances
-    - JSON serialization for complex session data
+    - JSON serialization for complex session data, or a binary codec
+    - Sorted-set activity index for listing and expiry
+    - Round trip and cleanup statistics
     
     Attributes:
         redis_url: Redis connection URL
         session_prefix: Prefix for session keys in Redis
         default_ttl: Default TTL in seconds for sessions
         max_connections: Maximum number of Redis connections in pool
+        cleanup_batch_size: Sessions removed per round trip during cleanup
+        codec: Serialization codec of session values
+        activity_index_key: Sorted set of conversation IDs by last activity
+        invalidation_channel: Pub/sub channel announcing replaced and
+            deleted sessions
+        instance_id: Identifies this instance's own invalidation messages
         redis_kwargs: Additional Redis connection parameters
         redis_pool: Redis connection pool
         redis_client: Redis client instance
@@ -116,6 +188,8 @@ class RedisSessionStorage(SessionStorage):
         session_prefix: str = "session:",
         default_ttl: int = 3600,  # 1 hour default TTL
         max_connections: int = 10,
+        cleanup_batch_size: int = 500,
+        codec: Union[str, SessionCodec, None] = None,
         **kwargs
     ):
         """Initialize Redis session storage.
@@ -140,6 +214,12 @@ class RedisSessionStorage(SessionStorage):
                 connection pool. Higher values support more concurrent
                 operations but use more memory.
                 Defaults to 10 connections.
+            cleanup_batch_size: Number of expired sessions read from the
+                activity index and deleted per round trip during cleanup.
+                Defaults to 500.
+            codec: Serialization of session values: a SessionCodec or a
+                spec such as "msgpack" or "orjson+zstd". Defaults to plain
+                JSON. Binary codecs need decode_responses to be off.
             **kwargs: Additional Redis connection parameters passed to
                 redis.ConnectionPool.from_url(). Common options include:
                 - decode_responses: Whether to decode responses to strings
@@ -149,7 +229,11 @@ class RedisSessionStorage(SessionStorage):
                 
         Raises:
             ValueError: If redis_url is empty or invalid
-            ValueError: If default_ttl or max_connections are not positive
+            ValueError: If default_ttl, max_connections or cleanup_batch_size
+                are not positive
+            ValueError: If the codec is unknown, or binary while
+                decode_responses is on
+            RuntimeError: If the codec needs a package that is not installed
             
         Example:
             ```python
@@ -173,30 +257,53 @@ class RedisSessionStorage(SessionStorage):
             raise ValueError("default_ttl must be positive")
         if max_connections <= 0:
             raise ValueError("max_connections must be positive")
+        if cleanup_batch_size <= 0:
+            raise ValueError("cleanup_batch_size must be positive")
+        codec = get_session_codec(codec)
+        if codec.binary and kwargs.get("decode_responses"):
+            raise ValueError(
+                f"The {codec.name} session codec cannot be used with decode_responses"
+            )
         
         self.redis_url = redis_url
         self.session_prefix = session_prefix
         self.default_ttl = default_ttl
         self.max_connections = max_connections
+        self.cleanup_batch_size = cleanup_batch_size
+        self.codec = codec
+        self.activity_index_key = f"{session_prefix}{_ACTIVITY_INDEX}"
+        self.invalidation_channel = f"{session_prefix}{_INVALIDATION_CHANNEL}"
+        self.instance_id = uuid.uuid4().hex
         self.redis_kwargs = kwargs
         
         # Initialize Redis connection pool
         self.redis_pool: Optional[redis.ConnectionPool] = None
         self.redis_client: Optional[redis.Redis] = None
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._invalidation_task: Optional[asyncio.Task] = None
         self._initialized = False
         
+        # Statistics
+        self._operation_calls: Dict[str, int] = defaultdict(int)
+        self._operation_round_trips: Dict[str, int] = defaultdict(int)
+        self._cleanup_runs = 0
+        self._cleanup_removed = 0
+        self._last_cleanup_removed = 0
+        self._last_cleanup_seconds = 0.0
+        self._invalidations_received = 0
+        
         logger.info(f"Redis session storage initialized with URL: {redis_url}")
     
     async def _ensure_connection(self) -> bool:
         """Ensure Redis connection is established and healthy.
         
-        Checks if the Redis connection is available and working. If not,
-        attempts to establish a new connection. This method is called
-        before each Redis operation to ensure connectivity.
+        Establishes the connection on first use. This method is called
+        before each Redis operation to ensure connectivity. Once connected
+        it returns at once, without a round trip; operations that fail mark
+        the connection as lost, and the next call reconnects.
         
-        The method handles connection recovery and will attempt to
-        reconnect if the current connection is lost or unhealthy.
+        On the first connection, the activity index is rebuilt from the
+        session metadata if it does not exist yet.
         
         Returns:
             bool: True if connection is available and healthy, False otherwise
@@ -218,13 +325,7 @@ class RedisSessionStorage(SessionStorage):
             ```
         """
         if self._initialized and self.redis_client:
-            try:
-                # Test connection
-                await self.redis_client.ping()
-                return True
-            except Exception as e:
-                logger.warning(f"Redis connection test failed: {e}")
-                self._initialized = False
+            return True
         
         try:
             # Create connection pool if not exists
@@ -243,6 +344,13 @@ class RedisSessionStorage(SessionStorage):
             self._initialized = True
             
             logger.info("Redis connection established successfully")
+            
+            # Index sessions stored before the activity index existed
+            try:
+                if not await self.redis_client.exists(self.activity_index_key):
+                    await self.rebuild_activity_index()
+            except Exception as e:
+                logger.warning(f"Failed to rebuild Redis activity index: {e}")
             return True
             
         except Exception as e:
@@ -293,19 +401,77 @@ class RedisSessionStorage(SessionStorage):
         """
         return f"{self.session_prefix}{conversation_id}:meta"
     
+    def _get_session_fields_key(self, conversation_id: str) -> str:
+        """Get Redis key for the hash of fields patched since the snapshot."""
+        return f"{self.session_prefix}{conversation_id}:fields"
+    
+    def _get_session_list_key(self, conversation_id: str, field: str) -> str:
+        """Get Redis key for the list of items appended to a list field."""
+        return f"{self.session_prefix}{conversation_id}:{field}"
+    
+    def _get_delta_keys(self, conversation_id: str) -> List[str]:
+        """Get all Redis keys holding deltas for a session."""
+        return [self._get_session_fields_key(conversation_id)] + [
+            self._get_session_list_key(conversation_id, field)
+            for field in APPENDABLE_FIELDS
+        ]
+    
+    def _get_all_keys(self, conversation_id: str) -> List[str]:
+        """Get every Redis key of a session."""
+        return [
+            self._get_session_key(conversation_id),
+            self._get_session_meta_key(conversation_id),
+        ] + self._get_delta_keys(conversation_id)
+    
+    def _build_metadata(self, conversation_id: str, now: float) -> Dict[str, Any]:
+        """Build the tracking metadata written with each snapshot.
+        
+        last_activity is the time of the snapshot; later activity is
+        tracked in the activity index.
+        """
+        return {
+            "conversation_id": conversation_id,
+            "created_at": now,
+            "last_activity": now,
+            "ttl": self.default_ttl
+        }
+    
+    def _queue_touch(self, pipe: Any, conversation_id: str, now: float) -> None:
+        """Queue the commands that record activity and extend the TTLs."""
+        # XX: never re-add a session that has been deleted
+        pipe.zadd(self.activity_index_key, {conversation_id: now}, xx=True)
+        for key in self._get_all_keys(conversation_id):
+            pipe.expire(key, self.default_ttl)
+    
+    def _queue_invalidation(self, pipe: Any, conversation_id: str) -> None:
+        """Queue a message telling other instances to drop cached copies."""
+        pipe.publish(
+            self.invalidation_channel,
+            json.dumps({"origin": self.instance_id, "conversation_id": conversation_id}),
+        )
+    
+    def _track(self, operation: str, round_trips: int = 1) -> None:
+        """Record the Redis round trips made by one operation."""
+        self._operation_calls[operation] += 1
+        self._operation_round_trips[operation] += round_trips
+    
     async def store_session(self, conversation_id: str, session_data: Dict[str, Any]) -> bool:
         """Store session state in Redis.
         
         Stores the session data in Redis with automatic TTL management.
-        The session is stored as a JSON string with the configured
-        expiration time. Metadata is also stored separately for tracking.
+        The session is encoded with the storage's codec (JSON by default)
+        and stored with the configured expiration time. Metadata is also stored separately for tracking,
+        and the session is added to the activity index. An invalidation
+        message tells other instances that the session was replaced, e.g.
+        on resume by another worker. All writes go out in one MULTI
+        transaction.
         
         Args:
             conversation_id: Unique identifier for the conversation.
                 Must be a non-empty string.
             session_data: Session state data to store. Should be a
                 dictionary containing all session information.
-                The data will be serialized to JSON for storage.
+                The data will be encoded with the codec for storage.
                 
         Returns:
             bool: True if storage was successful, False otherwise
@@ -314,7 +480,7 @@ class RedisSessionStorage(SessionStorage):
             ValueError: If conversation_id is empty or invalid
             TypeError: If session_data is not a dictionary
             ConnectionError: If unable to connect to Redis
-            JSONEncodeError: If session_data cannot be serialized to JSON
+            TypeError: If session_data cannot be serialized by the codec
             
         Example:
             ```python
@@ -344,42 +510,40 @@ class RedisSessionStorage(SessionStorage):
             if not self.redis_client:
                 return False
                 
-            session_key = self._get_session_key(conversation_id)
-            meta_key = self._get_session_meta_key(conversation_id)
-            
-            # Store session data
-            await self.redis_client.set(
-                session_key,
-                json.dumps(session_data),
+            now = time.time()
+            pipe = self.redis_client.pipeline(transaction=True)
+            # The snapshot supersedes earlier deltas
+            pipe.delete(*self._get_delta_keys(conversation_id))
+            pipe.set(
+                self._get_session_key(conversation_id),
+                self.codec.encode(session_data),
                 ex=self.default_ttl
             )
-            
-            # Store metadata for tracking
-            metadata = {
-                "conversation_id": conversation_id,
-                "created_at": time.time(),
-                "last_activity": time.time(),
-                "ttl": self.default_ttl
-            }
-            await self.redis_client.set(
-                meta_key,
-                json.dumps(metadata),
+            pipe.set(
+                self._get_session_meta_key(conversation_id),
+                json.dumps(self._build_metadata(conversation_id, now)),
                 ex=self.default_ttl
             )
+            pipe.zadd(self.activity_index_key, {conversation_id: now})
+            self._queue_invalidation(pipe, conversation_id)
+            await pipe.execute()
+            self._track("store_session")
             
             logger.debug(f"Stored session in Redis: {conversation_id}")
             return True
             
         except Exception as e:
             logger.error(f"Error storing session in Redis: {e}")
+            self._initialized = False
             return False
     
     async def retrieve_session(self, conversation_id: str, update_activity: bool = True) -> Optional[Dict[str, Any]]:
         """Retrieve session state from Redis.
         
         Retrieves session data from Redis and optionally updates the
-        last activity timestamp. The session data is deserialized from
-        JSON back to a Python dictionary.
+        last activity timestamp. The snapshot, its deltas and the activity
+        update are read and written in one MULTI transaction, and the
+        result is decoded back to a Python dictionary.
         
         Args:
             conversation_id: Unique identifier for the conversation.
@@ -395,7 +559,7 @@ class RedisSessionStorage(SessionStorage):
         Raises:
             ValueError: If conversation_id is empty or invalid
             ConnectionError: If unable to connect to Redis
-            JSONDecodeError: If stored session data is invalid JSON
+            JSONDecodeError: If stored legacy session data is invalid JSON
             
         Example:
             ```python
@@ -418,31 +582,157 @@ class RedisSessionStorage(SessionStorage):
             if not self.redis_client:
                 return None
                 
-            session_key = self._get_session_key(conversation_id)
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.get(self._get_session_key(conversation_id))
+            pipe.hgetall(self._get_session_fields_key(conversation_id))
+            for field in APPENDABLE_FIELDS:
+                pipe.lrange(self._get_session_list_key(conversation_id, field), 0, -1)
+            # Update last activity only if requested
+            if update_activity:
+                self._queue_touch(pipe, conversation_id, time.time())
+            results = await pipe.execute()
+            self._track("retrieve_session")
             
-            # Retrieve session data
-            session_data = await self.redis_client.get(session_key)
+            session_data, fields = results[0], results[1]
             if not session_data:
                 return None
-            
-            # Parse JSON data
-            session_dict = json.loads(session_data)
-            
-            # Update last activity only if requested
-            if update_activity:
-                await self.update_session_activity(conversation_id)
+            appended = dict(zip(APPENDABLE_FIELDS, results[2:]))
+            session_dict = _apply_deltas(
+                self.codec.decode(session_data), fields, appended, self.codec.decode
+            )
             
             logger.debug(f"Retrieved session from Redis: {conversation_id}")
             return session_dict
             
         except Exception as e:
             logger.error(f"Error retrieving session from Redis: {e}")
+            self._initialized = False
             return None
     
+    async def patch_session(self, conversation_id: str, fields: Dict[str, Any]) -> bool:
+        """Overwrite individual fields of a session without rewriting it.
+        
+        The fields are written to the session's delta hash in one MULTI
+        transaction that also records activity, so the cost does not depend
+        on the size of the conversation history.
+        
+        Args:
+            conversation_id: Unique identifier for the conversation.
+            fields: Serialized field values to overwrite.
+                
+        Returns:
+            bool: True if the session was updated, False if not found or on error
+            
+        Raises:
+            ValueError: If conversation_id is empty or invalid
+        """
+        return await self._write_deltas(
+            "patch_session", conversation_id, fields=fields
+        )
+    
+    async def append_session_items(
+        self,
+        conversation_id: str,
+        field: str,
+        items: List[Dict[str, Any]],
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Append items to a list field of a session without rewriting it.
+        
+        The items are pushed onto the field's delta list with RPUSH.
+        Appending to conversation_history also advances current_turn by one
+        per item through a counter in the delta hash.
+        
+        Args:
+            conversation_id: Unique identifier for the conversation.
+            field: "conversation_history" or "function_calls".
+            items: Items to append, in order.
+            fields: Optional serialized fields to overwrite in the same update.
+                
+        Returns:
+            bool: True if the session was updated, False if not found or on error
+            
+        Raises:
+            ValueError: If conversation_id is invalid or field cannot be appended to
+        """
+        _check_appendable(field)
+        return await self._write_deltas(
+            "append_session_items",
+            conversation_id,
+            fields=fields,
+            field=field,
+            items=items,
+        )
+    
+    async def _write_deltas(
+        self,
+        operation: str,
+        conversation_id: str,
+        fields: Optional[Dict[str, Any]] = None,
+        field: Optional[str] = None,
+        items: Optional[List[Dict[str, Any]]] = None,
+    ) -> bool:
+        """Write field patches and appended items in one transaction."""
+        if not conversation_id or not isinstance(conversation_id, str):
+            raise ValueError("conversation_id must be a non-empty string")
+        
+        if not await self._ensure_connection():
+            return False
+        
+        try:
+            if not self.redis_client:
+                return False
+            
+            fields_key = self._get_session_fields_key(conversation_id)
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.exists(self._get_session_key(conversation_id))
+            
+            if fields:
+                pipe.hset(
+                    fields_key,
+                    mapping={
+                        name: self.codec.encode(value) for name, value in fields.items()
+                    },
+                )
+                # A replaced list field drops the items appended to the old one
+                for name in APPENDABLE_FIELDS:
+                    if name in fields:
+                        pipe.delete(self._get_session_list_key(conversation_id, name))
+            
+            if field and items:
+                pipe.rpush(
+                    self._get_session_list_key(conversation_id, field),
+                    *[self.codec.encode(item) for item in items],
+                )
+                if field == "conversation_history":
+                    pipe.hincrby(fields_key, _TURN_DELTA_FIELD, len(items))
+            
+            if fields and "current_turn" in fields:
+                pipe.hdel(fields_key, _TURN_DELTA_FIELD)
+            
+            self._queue_touch(pipe, conversation_id, time.time())
+            exists = (await pipe.execute())[0]
+            
+            if not exists:
+                # The session is gone; drop the deltas just written for it
+                await self.redis_client.delete(*self._get_delta_keys(conversation_id))
+                self._track(operation, 2)
+                return False
+            self._track(operation)
+            logger.debug(f"Wrote session deltas to Redis: {conversation_id}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error writing session deltas to Redis: {e}")
+            self._initialized = False
+            return False
+    
     async def delete_session(self, conversation_id: str) -> bool:
         """Delete session state from Redis.
         
-        Removes both the session data and metadata from Redis. This
+        Removes the session data, metadata and deltas from Redis, drops
+        the session from the activity index and publishes an invalidation
+        message, in one MULTI transaction. This
         operation is immediate and cannot be undone. The session will
         no longer be available for retrieval.
         
@@ -477,29 +767,27 @@ class RedisSessionStorage(SessionStorage):
             if not self.redis_client:
                 return False
                 
-            session_key = self._get_session_key(conversation_id)
-            meta_key = self._get_session_meta_key(conversation_id)
-            
-            # Delete both session data and metadata
-            await self.redis_client.delete(session_key, meta_key)
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.delete(*self._get_all_keys(conversation_id))
+            pipe.zrem(self.activity_index_key, conversation_id)
+            self._queue_invalidation(pipe, conversation_id)
+            await pipe.execute()
+            self._track("delete_session")
             
             logger.debug(f"Deleted session from Redis: {conversation_id}")
             return True
             
         except Exception as e:
             logger.error(f"Error deleting session from Redis: {e}")
+            self._initialized = False
             return False
     
     async def list_active_sessions(self) -> List[str]:
         """List all active session IDs from Redis.
         
         Retrieves all conversation IDs for sessions currently stored
-        in Redis. This method uses Redis KEYS pattern matching to
-        find all session keys with the configured prefix.
-        
-        Note: This operation can be slow on large Redis databases
-        as it uses the KEYS command. For production use with many
-        sessions, consider using SCAN instead.
+        in Redis with a single range query on the activity index: every
+        session active within the TTL is still alive.
         
         Returns:
             List[str]: List of conversation IDs for active sessions
@@ -526,31 +814,29 @@ class RedisSessionStorage(SessionStorage):
             if not self.redis_client:
                 return []
                 
-            # Get all session keys with the prefix
-            pattern = f"{self.session_prefix}*"
-            keys = await self.redis_client.keys(pattern)
-            
-            # Extract conversation IDs from keys
-            conversation_ids = []
-            for key in keys:
-                key_str = key.decode('utf-8') if isinstance(key, bytes) else key
-                if not key_str.endswith(':meta'):  # Skip metadata keys
-                    conversation_id = key_str[len(self.session_prefix):]
-                    conversation_ids.append(conversation_id)
+            members = await self.redis_client.zrangebyscore(
+                self.activity_index_key, time.time() - self.default_ttl, "+inf"
+            )
+            self._track("list_active_sessions")
+            conversation_ids = [_decode(member) for member in members]
             
             logger.debug(f"Found {len(conversation_ids)} active sessions in Redis")
             return conversation_ids
             
         except Exception as e:
             logger.error(f"Error listing active sessions from Redis: {e}")
+            self._initialized = False
             return []
     
     async def cleanup_expired_sessions(self, max_age_seconds: int = 3600) -> int:
         """Clean up expired sessions from Redis.
         
         Removes sessions that have exceeded the specified maximum age
-        since their last activity. This method checks session metadata
-        to determine which sessions should be cleaned up.
+        since their last activity. Expired sessions are read from the
+        activity index with a range query, cleanup_batch_size at a time,
+        and each batch is deleted with one pipelined DEL and ZREM.
+        Sessions whose keys already expired through their TTL are dropped
+        from the index the same way.
         
         Args:
             max_age_seconds: Maximum age in seconds before session is
@@ -584,55 +870,64 @@ class RedisSessionStorage(SessionStorage):
             if not self.redis_client:
                 return 0
                 
-            # Get all session metadata
-            pattern = f"{self.session_prefix}*:meta"
-            meta_keys = await self.redis_client.keys(pattern)
-            
-            current_time = time.time()
+            started = time.perf_counter()
+            cutoff = time.time() - max_age_seconds
             cleaned_count = 0
+            round_trips = 0
             
-            for meta_key in meta_keys:
-                try:
-                    # Get metadata
-                    meta_data = await self.redis_client.get(meta_key)
-                    if not meta_data:
-                        continue
-                    
-                    metadata = json.loads(meta_data)
-                    last_activity = metadata.get("last_activity", 0)
-                    
-                    # Check if session is expired
-                    if current_time - last_activity > max_age_seconds:
-                        conversation_id = metadata.get("conversation_id")
-                        if conversation_id:
-                            # Delete session
-                            await self.delete_session(conversation_id)
-                            cleaned_count += 1
-                            
-                except Exception as e:
-                    logger.warning(f"Error processing session metadata: {e}")
-                    continue
+            while True:
+                members = await self.redis_client.zrangebyscore(
+                    self.activity_index_key, "-inf", cutoff,
+                    start=0, num=self.cleanup_batch_size
+                )
+                round_trips += 1
+                if not members:
+                    break
+                
+                conversation_ids = [_decode(member) for member in members]
+                keys = [
+                    key
+                    for conversation_id in conversation_ids
+                    for key in self._get_all_keys(conversation_id)
+                ]
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.delete(*keys)
+                pipe.zrem(self.activity_index_key, *conversation_ids)
+                await pipe.execute()
+                round_trips += 1
+                cleaned_count += len(conversation_ids)
+                
+                if len(conversation_ids) < self.cleanup_batch_size:
+                    break
+            
+            self._track("cleanup_expired_sessions", round_trips)
+            self._cleanup_runs += 1
+            self._cleanup_removed += cleaned_count
+            self._last_cleanup_removed = cleaned_count
+            self._last_cleanup_seconds = time.perf_counter() - started
             
             logger.info(f"Cleaned up {cleaned_count} expired sessions from Redis")
             return cleaned_count
             
         except Exception as e:
             logger.error(f"Error cleaning up expired sessions from Redis: {e}")
+            self._initialized = False
             return 0
     
     async def update_session_activity(self, conversation_id: str) -> bool:
         """Update session last activity timestamp in Redis.
         
-        Updates the last activity timestamp for a session without
-        retrieving the full session data. This is useful for keeping
-        sessions alive during long-running operations.
+        Updates the session's score in the activity index and extends the
+        TTL of all its keys in one MULTI transaction, without retrieving
+        the session data. This is useful for keeping sessions alive during
+        long-running operations.
         
         Args:
             conversation_id: Unique identifier for the conversation.
                 Must be a non-empty string.
                 
         Returns:
-            bool: True if update was successful, False otherwise
+            bool: True if the session exists and was updated, False otherwise
             
         Raises:
             ValueError: If conversation_id is empty or invalid
@@ -656,31 +951,122 @@ class RedisSessionStorage(SessionStorage):
             if not self.redis_client:
                 return False
                 
-            meta_key = self._get_session_meta_key(conversation_id)
-            
-            # Get existing metadata
-            meta_data = await self.redis_client.get(meta_key)
-            if meta_data:
-                metadata = json.loads(meta_data)
-                metadata["last_activity"] = time.time()
-                
-                # Update metadata with new TTL
-                await self.redis_client.set(
-                    meta_key,
-                    json.dumps(metadata),
-                    ex=self.default_ttl
-                )
-                
-                # Also extend TTL for session data
-                session_key = self._get_session_key(conversation_id)
-                await self.redis_client.expire(session_key, self.default_ttl)
-            
-            return True
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.exists(self._get_session_key(conversation_id))
+            self._queue_touch(pipe, conversation_id, time.time())
+            exists = (await pipe.execute())[0]
+            self._track("update_session_activity")
+            return bool(exists)
             
         except Exception as e:
             logger.error(f"Error updating session activity in Redis: {e}")
+            self._initialized = False
             return False
     
+    async def rebuild_activity_index(self) -> int:
+        """Add sessions missing from the activity index.
+        
+        Walks the session metadata keys with SCAN and reads them in batches
+        with MGET, so Redis is never blocked the way KEYS would block it.
+        Sessions already in the index keep their score. Called on first
+        connection when the index does not exist, e.g. after upgrading from
+        a version without it.
+        
+        Returns:
+            int: Number of sessions added to the index
+        """
+        if not self.redis_client:
+            return 0
+        
+        added = 0
+        round_trips = 0
+        cursor = 0
+        pattern = f"{self.session_prefix}*:meta"
+        while True:
+            cursor, meta_keys = await self.redis_client.scan(
+                cursor, match=pattern, count=self.cleanup_batch_size
+            )
+            round_trips += 1
+            if meta_keys:
+                scores = {}
+                for meta_data in await self.redis_client.mget(meta_keys):
+                    if not meta_data:
+                        continue
+                    try:
+                        metadata = json.loads(meta_data)
+                        scores[metadata["conversation_id"]] = metadata.get("last_activity", 0)
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.warning(f"Error processing session metadata: {e}")
+                round_trips += 1
+                if scores:
+                    added += await self.redis_client.zadd(
+                        self.activity_index_key, scores, nx=True
+                    )
+                    round_trips += 1
+            if not cursor:
+                break
+        
+        self._track("rebuild_activity_index", round_trips)
+        if added:
+            logger.info(f"Added {added} sessions to the Redis activity index")
+        return added
+    
+    async def subscribe_invalidations(self, callback: Callable[[str], Any]) -> None:
+        """Call ``callback`` with the ID of each session replaced or deleted
+        by another instance.
+        
+        Starts a background task listening on the invalidation channel;
+        messages published by this instance are skipped. The task
+        reconnects after errors and stops on close().
+        
+        Args:
+            callback: Called with the conversation ID; may be a coroutine
+                function
+            
+        Raises:
+            RuntimeError: If already subscribed
+        """
+        if self._invalidation_task and not self._invalidation_task.done():
+            raise RuntimeError("Already subscribed to session invalidations")
+        
+        self._invalidation_task = asyncio.create_task(self._invalidation_loop(callback))
+        logger.info(f"Subscribed to session invalidations on {self.invalidation_channel}")
+    
+    async def _invalidation_loop(self, callback: Callable[[str], Any]) -> None:
+        """Listen on the invalidation channel until cancelled."""
+        while True:
+            pubsub = None
+            try:
+                if not await self._ensure_connection() or not self.redis_client:
+                    await asyncio.sleep(1)
+                    continue
+                pubsub = self.redis_client.pubsub()
+                await pubsub.subscribe(self.invalidation_channel)
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if not message or message.get("type") != "message":
+                        continue
+                    payload = json.loads(message["data"])
+                    if payload.get("origin") == self.instance_id:
+                        continue
+                    self._invalidations_received += 1
+                    result = callback(payload["conversation_id"])
+                    if asyncio.iscoroutine(result):
+                        await result
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in session invalidation listener: {e}")
+                await asyncio.sleep(1)  # Wait before reconnecting
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+    
     async def start_cleanup_task(self) -> None:
         """Start background cleanup task for expired sessions.
         
@@ -761,7 +1147,7 @@ class RedisSessionStorage(SessionStorage):
         """Close Redis connections and cleanup resources.
         
         Gracefully shuts down the Redis storage by stopping the cleanup
-        task and closing all Redis connections. This method should be
+        and invalidation tasks and closing all Redis connections. This method should be
         called when the storage is no longer needed to prevent resource
         leaks.
         
@@ -780,6 +1166,14 @@ class RedisSessionStorage(SessionStorage):
         """
         await self.stop_cleanup_task()
         
+        if self._invalidation_task:
+            self._invalidation_task.cancel()
+            try:
+                await self._invalidation_task
+            except asyncio.CancelledError:
+                pass
+            self._invalidation_task = None
+        
         if self.redis_client:
             await self.redis_client.close()
             self.redis_client = None
@@ -795,8 +1189,9 @@ class RedisSessionStorage(SessionStorage):
         """Get Redis storage statistics and configuration.
         
         Returns comprehensive statistics about the Redis storage,
-        including configuration, connection status, and task status.
-        This is useful for monitoring and debugging.
+        including configuration, connection status, task status, Redis
+        round trips per operation and cleanup timings. This is useful for
+        monitoring and debugging.
         
         Returns:
             Dict[str, Any]: Dictionary containing storage statistics with keys:
@@ -807,6 +1202,13 @@ class RedisSessionStorage(SessionStorage):
                 - max_connections: Maximum connections in the pool
                 - initialized: Whether Redis connection is established
                 - cleanup_task_running: Whether background cleanup is active
+                - operations: Per operation, the number of calls, the Redis
+                  round trips they made and the average per call
+                - cleanup: Runs, sessions removed and duration of the last run
+                - codec: Codec name, values encoded and compressed, and bytes
+                  before and after compression
+                - invalidations_received: Invalidation messages from other
+                  instances passed to the subscriber
                 
         Example:
             ```python
@@ -825,5 +1227,21 @@ class RedisSessionStorage(SessionStorage):
             "default_ttl": self.default_ttl,
             "max_connections": self.max_connections,
             "initialized": self._initialized,
-            "cleanup_task_running": self._cleanup_task is not None and not self._cleanup_task.done()
+            "cleanup_task_running": self._cleanup_task is not None and not self._cleanup_task.done(),
+            "operations": {
+                operation: {
+                    "calls": calls,
+                    "round_trips": self._operation_round_trips[operation],
+                    "round_trips_per_call": self._operation_round_trips[operation] / calls,
+                }
+                for operation, calls in self._operation_calls.items()
+            },
+            "cleanup": {
+                "runs": self._cleanup_runs,
+                "total_removed": self._cleanup_removed,
+                "last_removed": self._last_cleanup_removed,
+                "last_duration_ms": self._last_cleanup_seconds * 1000,
+            },
+            "codec": self.codec.get_stats(),
+            "invalidations_received": self._invalidations_received,
         } 
\ No newline at end of file
@@ -0,0 +1,572 @@
+"""Two-tier session storage: a local memory cache in front of a shared backend.
+
+Every session read through RedisSessionStorage costs a network round trip
+and a decode, even when the worker asking owns the call and wrote the
+session itself a moment ago. TieredSessionStorage keeps the sessions a
+worker uses in a local MemorySessionStorage (an LRU) and only goes to the
+remote tier, usually Redis, on a cache miss.
+
+Writes are applied to the local copy first. In write-behind mode (the
+default), patches, appends and activity updates are queued and sent to the
+remote tier every ``flush_interval`` seconds. Writes to the same session
+are coalesced: several patches become one, consecutive appends to a list
+are sent in one call, and activity updates are folded into the other
+writes. Snapshots (store_session, used on create and resume) and deletes
+always go to the remote tier at once. In write-through mode every write is
+sent before the call returns.
+
+When another worker replaces or deletes a session, RedisSessionStorage
+publishes an invalidation message. The tiered storage subscribes to these
+and drops its cached copy and any queued writes for the session, so a call
+taken over by another worker for resume is not overwritten with stale data.
+
+Write-behind trades durability for latency: writes queued in the last
+``flush_interval`` are lost if the worker dies. A session missing from the
+cache is read from the remote tier only after its own queued writes have
+been flushed, so a worker always reads its own writes.
+
+Example:
+    ```python
+    storage = TieredSessionStorage(
+        RedisSessionStorage(redis_url="redis://localhost:6379"),
+        local_max_sessions=500,
+        flush_interval=0.05,
+    )
+    service = SessionManagerService(storage)
+
+    session = await service.get_session("call_123")  # microseconds when cached
+
+    await storage.close()  # flushes queued writes
+    ```
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from . import SessionStorage, _check_appendable
+from .memory_storage import MemorySessionStorage
+from opusagent.config.logging_config import configure_logging
+
+logger = configure_logging("tiered_session_storage")
+
+
+class _PendingWrites:
+    """Coalesced writes to one session not yet sent to the remote tier."""
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        self.appended: Dict[str, List[Any]] = {}
+        # Whole session to store instead, when the writes are not deltas
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self.touched = False
+        self.operations = 0
+
+    def patch(self, fields: Dict[str, Any]) -> bool:
+        # A replaced list supersedes the items appended to the old one
+        for name in fields:
+            self.appended.pop(name, None)
+        self.fields.update(fields)
+        return True
+
+    def append(
+        self, field: str, items: List[Any], fields: Optional[Dict[str, Any]]
+    ) -> bool:
+        """Queue appended items; False if they cannot be sent as deltas."""
+        if field in self.fields:
+            # Appending to a replaced list is only expressible as a snapshot
+            return False
+        if field == "conversation_history" and "current_turn" in self.fields:
+            self.fields["current_turn"] += len(items)
+        self.appended.setdefault(field, []).extend(items)
+        if fields:
+            self.patch(fields)
+        return True
+
+    def touch(self) -> bool:
+        self.touched = True
+        return True
+
+
+class TieredSessionStorage(SessionStorage):
+    """Session storage with a local LRU cache in front of a remote backend.
+
+    Attributes:
+        remote: Shared storage holding the sessions of all workers
+        local: Local cache of recently used sessions
+        write_behind: Whether writes are queued and sent in batches
+        flush_interval: Seconds between write-behind flushes
+        max_pending_sessions: Sessions with queued writes that trigger an
+            immediate flush
+        max_concurrent_writes: Remote writes in flight during a flush
+    """
+
+    def __init__(
+        self,
+        remote: SessionStorage,
+        local: Optional[MemorySessionStorage] = None,
+        local_max_sessions: int = 1000,
+        write_behind: bool = True,
+        flush_interval: float = 0.05,
+        max_pending_sessions: int = 500,
+        max_concurrent_writes: int = 8,
+    ):
+        """Initialize tiered session storage.
+
+        Args:
+            remote: Shared session storage, e.g. RedisSessionStorage
+            local: Local cache; defaults to a MemorySessionStorage holding
+                ``local_max_sessions`` sessions
+            local_max_sessions: Size of the default local cache
+            write_behind: Queue writes and flush them in batches (True) or
+                send each write before returning (False)
+            flush_interval: Seconds between write-behind flushes
+            max_pending_sessions: Number of sessions with queued writes at
+                which a flush runs at once
+            max_concurrent_writes: Remote writes in flight during a flush;
+                keep it below the remote's connection pool size
+
+        Raises:
+            ValueError: If flush_interval, max_pending_sessions or
+                max_concurrent_writes are not positive
+        """
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        if max_pending_sessions <= 0:
+            raise ValueError("max_pending_sessions must be positive")
+        if max_concurrent_writes <= 0:
+            raise ValueError("max_concurrent_writes must be positive")
+
+        self.remote = remote
+        if local is None:
+            local = MemorySessionStorage(max_sessions=local_max_sessions)
+        self.local = local
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.max_pending_sessions = max_pending_sessions
+        self.max_concurrent_writes = max_concurrent_writes
+
+        self._pending: Dict[str, _PendingWrites] = {}
+        # Serializes remote writes so queued deltas never overtake snapshots
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._subscribed = False
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._operations_queued = 0
+        self._flushes = 0
+        self._remote_writes = 0
+        self._write_failures = 0
+        self._invalidations = 0
+        self._dropped_operations = 0
+
+        logger.info(
+            f"Tiered session storage initialized: write_behind={write_behind}, "
+            f"flush_interval={flush_interval}s"
+        )
+
+    async def _ensure_started(self) -> None:
+        """Start the flush task and the invalidation subscription."""
+        flush_stopped = self._flush_task is None or self._flush_task.done()
+        if self.write_behind and flush_stopped:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        if not self._subscribed:
+            self._subscribed = True
+            subscribe = getattr(self.remote, "subscribe_invalidations", None)
+            if subscribe is not None:
+                try:
+                    await subscribe(self.invalidate)
+                except Exception as e:
+                    logger.warning(f"Cannot subscribe to session invalidations: {e}")
+
+    async def store_session(
+        self, conversation_id: str, session_data: Dict[str, Any]
+    ) -> bool:
+        """Store a session in both tiers, writing the remote tier at once.
+
+        Queued writes for the session are dropped, since the snapshot
+        supersedes them.
+
+        Args:
+            conversation_id: Unique identifier for the conversation
+            session_data: Session state data to store
+
+        Returns:
+            bool: True if the remote tier stored the session
+        """
+        await self._ensure_started()
+        async with self._flush_lock:
+            self._pending.pop(conversation_id, None)
+            stored = await self.remote.store_session(conversation_id, session_data)
+            self._remote_writes += 1
+        if stored:
+            await self.local.store_session(conversation_id, session_data)
+        return stored
+
+    async def retrieve_session(
+        self, conversation_id: str, update_activity: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve a session from the cache, or the remote tier on a miss.
+
+        Args:
+            conversation_id: Unique identifier for the conversation
+            update_activity: Whether to update the last activity timestamp
+
+        Returns:
+            Optional[Dict[str, Any]]: Session state data if found, None otherwise
+        """
+        await self._ensure_started()
+        session_data = await self.local.retrieve_session(
+            conversation_id, update_activity
+        )
+        if session_data is not None:
+            self._hits += 1
+            if update_activity:
+                if self.write_behind:
+                    await self._queue(conversation_id, _PendingWrites.touch)
+                else:
+                    await self.remote.update_session_activity(conversation_id)
+                    self._remote_writes += 1
+            return session_data
+
+        self._misses += 1
+        # Read our own writes
+        await self._flush_session(conversation_id)
+        session_data = await self.remote.retrieve_session(
+            conversation_id, update_activity
+        )
+        if session_data is not None:
+            await self.local.store_session(conversation_id, session_data)
+        return session_data
+
+    async def patch_session(self, conversation_id: str, fields: Dict[str, Any]) -> bool:
+        """Overwrite fields in the cache and queue them for the remote tier.
+
+        Args:
+            conversation_id: Unique identifier for the conversation
+            fields: Serialized field values to overwrite
+
+        Returns:
+            bool: True if the session was updated, False if not found
+        """
+        await self._ensure_started()
+        cached = await self.local.patch_session(conversation_id, fields)
+        if cached and self.write_behind:
+            await self._queue(conversation_id, lambda pending: pending.patch(fields))
+            return True
+        return await self._write_through(
+            conversation_id,
+            cached,
+            lambda: self.remote.patch_session(conversation_id, fields),
+        )
+
+    async def append_session_items(
+        self,
+        conversation_id: str,
+        field: str,
+        items: List[Dict[str, Any]],
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Append items in the cache and queue them for the remote tier.
+
+        Args:
+            conversation_id: Unique identifier for the conversation
+            field: "conversation_history" or "function_calls"
+            items: Items to append, in order
+            fields: Optional serialized fields to overwrite in the same update
+
+        Returns:
+            bool: True if the session was updated, False if not found
+
+        Raises:
+            ValueError: If field cannot be appended to
+        """
+        _check_appendable(field)
+        await self._ensure_started()
+        cached = await self.local.append_session_items(
+            conversation_id, field, items, fields
+        )
+        if cached and self.write_behind:
+            await self._queue(
+                conversation_id, lambda pending: pending.append(field, items, fields)
+            )
+            return True
+        return await self._write_through(
+            conversation_id,
+            cached,
+            lambda: self.remote.append_session_items(
+                conversation_id, field, items, fields
+            ),
+        )
+
+    async def delete_session(self, conversation_id: str) -> bool:
+        """Delete a session from both tiers, dropping queued writes.
+
+        Args:
+            conversation_id: Unique identifier for the conversation
+
+        Returns:
+            bool: True if the session was deleted from either tier
+        """
+        await self._ensure_started()
+        async with self._flush_lock:
+            self._pending.pop(conversation_id, None)
+            deleted = await self.remote.delete_session(conversation_id)
+            self._remote_writes += 1
+        cached = await self.local.delete_session(conversation_id)
+        return deleted or cached
+
+    async def list_active_sessions(self) -> List[str]:
+        """List active sessions of the remote tier and the cache.
+
+        Returns:
+            List[str]: Conversation IDs of active sessions
+        """
+        conversation_ids = await self.remote.list_active_sessions()
+        seen = set(conversation_ids)
+        return conversation_ids + [
+            conversation_id
+            for conversation_id in await self.local.list_active_sessions()
+            if conversation_id not in seen
+        ]
+
+    async def cleanup_expired_sessions(self, max_age_seconds: int = 3600) -> int:
+        """Clean up expired sessions in both tiers.
+
+        Queued activity updates are flushed first so that sessions active
+        on this worker are not expired in the remote tier.
+
+        Args:
+            max_age_seconds: Maximum age in seconds before a session expires
+
+        Returns:
+            int: Number of sessions removed from the remote tier
+        """
+        await self.flush()
+        await self.local.cleanup_expired_sessions(max_age_seconds)
+        return await self.remote.cleanup_expired_sessions(max_age_seconds)
+
+    async def update_session_activity(self, conversation_id: str) -> bool:
+        """Update activity in the cache and queue it for the remote tier.
+
+        Args:
+            conversation_id: Unique identifier for the conversation
+
+        Returns:
+            bool: True if the session exists and was updated
+        """
+        await self._ensure_started()
+        cached = await self.local.update_session_activity(conversation_id)
+        if cached and self.write_behind:
+            await self._queue(conversation_id, _PendingWrites.touch)
+            return True
+        return await self._write_through(
+            conversation_id,
+            cached,
+            lambda: self.remote.update_session_activity(conversation_id),
+        )
+
+    async def invalidate(self, conversation_id: str) -> None:
+        """Drop the cached copy and queued writes of a session.
+
+        Called for sessions replaced or deleted by another worker.
+
+        Args:
+            conversation_id: Unique identifier for the conversation
+        """
+        pending = self._pending.pop(conversation_id, None)
+        if pending is not None:
+            self._dropped_operations += pending.operations
+            logger.warning(
+                f"Dropped {pending.operations} queued writes for session "
+                f"{conversation_id} changed by another worker"
+            )
+        await self.local.delete_session(conversation_id)
+        self._invalidations += 1
+
+    async def flush(self) -> int:
+        """Send all queued writes to the remote tier.
+
+        Returns:
+            int: Number of sessions written
+        """
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            semaphore = asyncio.Semaphore(self.max_concurrent_writes)
+
+            async def write(conversation_id: str, writes: _PendingWrites) -> None:
+                async with semaphore:
+                    await self._write_pending(conversation_id, writes)
+
+            await asyncio.gather(
+                *(write(session_id, writes) for session_id, writes in pending.items())
+            )
+            self._flushes += 1
+            return len(pending)
+
+    async def _flush_session(self, conversation_id: str) -> None:
+        """Send the queued writes of one session to the remote tier."""
+        if conversation_id not in self._pending:
+            return
+        async with self._flush_lock:
+            pending = self._pending.pop(conversation_id, None)
+            if pending is not None:
+                await self._write_pending(conversation_id, pending)
+
+    async def _queue(
+        self, conversation_id: str, apply: Callable[[_PendingWrites], bool]
+    ) -> None:
+        """Coalesce a write, already applied to the cache, into the queue."""
+        pending = self._pending.get(conversation_id)
+        if pending is None:
+            pending = self._pending[conversation_id] = _PendingWrites()
+        pending.operations += 1
+        self._operations_queued += 1
+        if pending.snapshot is not None or not apply(pending):
+            # Send the cached session as a whole instead
+            pending.snapshot = await self.local.retrieve_session(
+                conversation_id, update_activity=False
+            )
+        if len(self._pending) >= self.max_pending_sessions:
+            await self.flush()
+
+    async def _write_through(
+        self,
+        conversation_id: str,
+        cached: bool,
+        remote_write: Callable[[], Awaitable[bool]],
+    ) -> bool:
+        """Send a write to the remote tier after the session's queued writes."""
+        await self._flush_session(conversation_id)
+        updated = await remote_write()
+        self._remote_writes += 1
+        if cached and not updated:
+            # The remote copy is gone, so the cached one is stale
+            await self.local.delete_session(conversation_id)
+        return updated
+
+    async def _write_pending(
+        self, conversation_id: str, pending: _PendingWrites
+    ) -> None:
+        """Send one session's coalesced writes, one remote call per list field."""
+        try:
+            if pending.snapshot is not None:
+                ok = await self.remote.store_session(conversation_id, pending.snapshot)
+                self._remote_writes += 1
+            else:
+                ok = True
+                appended = [
+                    (field, items) for field, items in pending.appended.items() if items
+                ]
+                for i, (field, items) in enumerate(appended):
+                    # Patched fields go with the last append
+                    fields = pending.fields if i == len(appended) - 1 else None
+                    appended_ok = await self.remote.append_session_items(
+                        conversation_id, field, items, fields or None
+                    )
+                    ok = appended_ok and ok
+                    self._remote_writes += 1
+                if not appended and pending.fields:
+                    ok = await self.remote.patch_session(
+                        conversation_id, pending.fields
+                    )
+                    self._remote_writes += 1
+                elif not appended and pending.touched:
+                    ok = await self.remote.update_session_activity(conversation_id)
+                    self._remote_writes += 1
+
+            if not ok:
+                # The remote copy expired or was lost; rewrite it from the cache
+                snapshot = await self.local.retrieve_session(
+                    conversation_id, update_activity=False
+                )
+                if snapshot is not None:
+                    ok = await self.remote.store_session(conversation_id, snapshot)
+                    self._remote_writes += 1
+            if not ok:
+                self._write_failures += 1
+                logger.warning(
+                    f"Failed to write queued updates for session {conversation_id}"
+                )
+        except Exception as e:
+            self._write_failures += 1
+            logger.error(
+                f"Error writing queued updates for session {conversation_id}: {e}"
+            )
+
+    async def _flush_loop(self) -> None:
+        """Background loop flushing queued writes every flush_interval."""
+        while True:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                if self._pending:
+                    await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in write-behind flush loop: {e}")
+
+    async def start_cleanup_task(self) -> None:
+        """Start the cleanup tasks of both tiers."""
+        await self.local.start_cleanup_task()
+        await self.remote.start_cleanup_task()
+
+    async def stop_cleanup_task(self) -> None:
+        """Stop the cleanup tasks of both tiers."""
+        await self.local.stop_cleanup_task()
+        await self.remote.stop_cleanup_task()
+
+    async def close(self) -> None:
+        """Flush queued writes, stop background tasks and close the remote."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+        await self.stop_cleanup_task()
+        close = getattr(self.remote, "close", None)
+        if close is not None:
+            await close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache, write-behind and invalidation statistics.
+
+        Returns:
+            Dict[str, Any]: Statistics with keys:
+                - storage_type: Always "tiered"
+                - write_behind: Whether writes are queued
+                - hits, misses, hit_rate: Reads served by the local cache
+                - pending_sessions: Sessions with queued writes
+                - operations_queued: Writes queued since start
+                - flushes: Write-behind flushes run
+                - remote_writes: Write calls made to the remote tier
+                - write_failures: Queued writes the remote tier did not take
+                - invalidations: Sessions dropped because another worker
+                  changed them
+                - dropped_operations: Queued writes dropped by invalidations
+                - local, remote: Statistics of each tier
+        """
+        reads = self._hits + self._misses
+        get_remote_stats = getattr(self.remote, "get_stats", None)
+        return {
+            "storage_type": "tiered",
+            "write_behind": self.write_behind,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / reads if reads else 0.0,
+            "pending_sessions": len(self._pending),
+            "operations_queued": self._operations_queued,
+            "flushes": self._flushes,
+            "remote_writes": self._remote_writes,
+            "write_failures": self._write_failures,
+            "invalidations": self._invalidations,
+            "dropped_operations": self._dropped_operations,
+            "local": self.local.get_stats(),
+            "remote": get_remote_stats() if get_remote_stats else {},
+        }
@@ -5,8 +5,10 @@ This package contains common utilities that can be used across different
 parts of the codebase to avoid duplication.
 """
 
+from .audio_buffer import AudioBufferPool
 from .audio_utils import AudioUtils
+from .resampler import StreamingResampler
 from .websocket_utils import WebSocketUtils
 from .retry_utils import RetryUtils
 
-__all__ = ["AudioUtils", "WebSocketUtils", "RetryUtils"] 
\ No newline at end of file
+__all__ = ["AudioBufferPool", "AudioUtils", "StreamingResampler", "WebSocketUtils", "RetryUtils"] 
\ No newline at end of file
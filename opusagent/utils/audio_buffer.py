@@ -0,0 +1,136 @@
+"""
+Pooled audio buffers and egress framing for the live audio path.
+
+Every inbound audio chunk is decoded from base64 exactly once. The decoded
+PCM is handed as one buffer to VAD, the quality monitor, the call recorder
+and the outbound encoder, which all read it through the buffer protocol
+instead of re-encoding it to base64 between stages.
+
+``AudioBufferPool`` recycles the fixed-size ``bytearray`` frames the handler
+builds (e.g. silence-padded chunks) so steady-state audio processing does not
+allocate a new frame per chunk. Buffers taken from the pool are only valid
+until they are released; consumers that keep audio beyond the current chunk
+(such as the call recorder) must copy it.
+
+``encode_input_audio_append`` frames PCM for the OpenAI Realtime API with a
+prebuilt JSON template, producing the same wire format as
+``InputAudioBufferAppendEvent.model_dump_json()`` without building a pydantic
+model per frame. Base64 output never contains characters that need JSON
+escaping, so the payload can be spliced into the template directly.
+"""
+
+import base64
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Union
+
+BufferLike = Union[bytes, bytearray, memoryview]
+
+# Prebuilt framing for input_audio_buffer.append. Field order matches
+# InputAudioBufferAppendEvent.model_dump_json().
+_INPUT_AUDIO_APPEND_PREFIX = (
+    '{"type":"input_audio_buffer.append","event_id":null,"audio":"'
+)
+_INPUT_AUDIO_APPEND_SUFFIX = '"}'
+
+
+def encode_input_audio_append(audio: BufferLike) -> str:
+    """
+    Encode PCM audio as an ``input_audio_buffer.append`` JSON message.
+
+    Args:
+        audio: Raw PCM16 audio (any buffer-protocol object)
+
+    Returns:
+        JSON text ready to send on the Realtime websocket
+    """
+    return (
+        _INPUT_AUDIO_APPEND_PREFIX
+        + base64.b64encode(audio).decode("ascii")
+        + _INPUT_AUDIO_APPEND_SUFFIX
+    )
+
+
+class AudioBufferPool:
+    """Free-list of reusable ``bytearray`` frames keyed by size.
+
+    Audio frames on a call have a handful of fixed sizes, so buffers are
+    recycled per exact size rather than carved out of a larger arena.
+
+    Attributes:
+        max_buffers_per_size: Free buffers kept per size; extras are dropped
+    """
+
+    def __init__(self, max_buffers_per_size: int = 8):
+        """
+        Initialize the pool.
+
+        Args:
+            max_buffers_per_size: Free buffers kept per size
+        """
+        self.max_buffers_per_size = max_buffers_per_size
+        self._free: Dict[int, List[bytearray]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.allocations = 0
+        self.reuses = 0
+
+    def acquire(self, size: int) -> bytearray:
+        """
+        Take a buffer of exactly ``size`` bytes from the pool.
+
+        The contents are undefined; callers overwrite or zero what they use.
+
+        Args:
+            size: Buffer size in bytes
+
+        Returns:
+            A ``bytearray`` of length ``size``
+        """
+        with self._lock:
+            free = self._free.get(size)
+            if free:
+                self.reuses += 1
+                return free.pop()
+            self.allocations += 1
+        return bytearray(size)
+
+    def release(self, buffer: bytearray) -> None:
+        """
+        Return a buffer to the pool.
+
+        Args:
+            buffer: Buffer previously returned by acquire()
+        """
+        with self._lock:
+            free = self._free[len(buffer)]
+            if len(free) < self.max_buffers_per_size:
+                free.append(buffer)
+
+    def pad(self, audio: BufferLike, size: int) -> bytearray:
+        """
+        Copy ``audio`` into a pooled buffer, padding it with silence.
+
+        Args:
+            audio: Audio shorter than ``size`` bytes
+            size: Size of the padded frame in bytes
+
+        Returns:
+            Pooled buffer holding the padded frame; release it when done
+        """
+        buffer = self.acquire(size)
+        length = len(audio)
+        buffer[:length] = audio
+        buffer[length:] = bytes(size - length)
+        return buffer
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        with self._lock:
+            pooled = sum(len(free) for free in self._free.values())
+        return {
+            "allocations": self.allocations,
+            "reuses": self.reuses,
+            "pooled_buffers": pooled,
+        }
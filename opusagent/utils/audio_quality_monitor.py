@@ -6,17 +6,26 @@ This module provides real-time audio quality analysis including:
 - Clipping detection
 - Overall quality scoring
 - Real-time alerts and logging
+
+SNR and THD are read from one real FFT per analysis window. Streaming
+monitors analyse on a decimated cadence over a sliding window, and the
+spectral analysis of many calls can be batched into one NumPy pass.
 """
 
+import concurrent.futures
 import logging
+import math
+import threading
 import time
-from collections import deque
-from dataclasses import dataclass
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
+from opusagent.utils.batch_worker import BatchWorker
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,8 +75,295 @@ class QualityAlert:
     timestamp: float
 
 
+# Spectral analysis parameters
+_SIGNAL_BANDWIDTH_HZ = 50
+_HARMONICS = np.arange(2, 6)  # 2nd to 5th harmonic
+_CLIPPING_THRESHOLD = 0.95  # 95% of max amplitude
+_NOISE_FLOOR = 1e-8  # Noise power used when no noise bins remain
+
+
+class _SpectralWorkspace:
+    """Preallocated work buffers for analysing windows of a fixed shape."""
+
+    def __init__(self, rows: int, size: int):
+        half = size // 2
+        self.shape = (rows, size)
+        self.magnitude = np.empty((rows, half), dtype=np.float32)
+        self.power = np.empty((rows, half), dtype=np.float64)
+        self.cumulative = np.zeros((rows, half + 1), dtype=np.float64)
+
+
+def spectral_metrics(
+    windows: np.ndarray,
+    sample_rates: Union[int, np.ndarray],
+    workspace: Optional[_SpectralWorkspace] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute SNR and THD for each row of ``windows`` from one real FFT.
+
+    SNR compares the power within 50Hz of the strongest bin with the mean
+    power of the remaining bins. THD is the RMS of the 2nd to 5th harmonic
+    relative to that strongest bin. Both are read from the same spectrum.
+
+    Args:
+        windows: Normalized samples shaped (rows, samples) or (samples,)
+        sample_rates: Sample rate of every row, or one per row
+        workspace: Work buffers matching the window shape, reused if given
+
+    Returns:
+        Tuple of (snr_db, thd_percent) arrays with one value per row
+    """
+    windows = np.atleast_2d(windows)
+    rows, size = windows.shape
+    half = size // 2
+    snr_db = np.zeros(rows)
+    thd_percent = np.zeros(rows)
+    if half < 2:
+        return snr_db, thd_percent
+
+    if workspace is None or workspace.shape != windows.shape:
+        workspace = _SpectralWorkspace(rows, size)
+    magnitude = workspace.magnitude
+    power = workspace.power
+    cumulative = workspace.cumulative
+
+    np.abs(np.fft.rfft(windows, axis=1)[:, :half], out=magnitude)
+    np.square(magnitude, out=power, dtype=np.float64)
+    np.cumsum(power, axis=1, out=cumulative[:, 1:])
+
+    if rows == 1:
+        # Per-array overhead dominates for a single window; use scalars
+        snr_db[0], thd_percent[0] = _single_window_metrics(
+            magnitude[0], power[0], cumulative[0], int(np.ravel(sample_rates)[0]), size
+        )
+        return snr_db, thd_percent
+
+    row = np.arange(rows)
+    # Fundamental = strongest bin above DC
+    fundamental = np.argmax(magnitude[:, 1:], axis=1) + 1
+
+    # SNR: signal band around the fundamental vs. mean power of other bins
+    resolution = np.asarray(sample_rates, dtype=np.float64) / size  # Hz per bin
+    bandwidth = np.maximum(1, (_SIGNAL_BANDWIDTH_HZ / resolution).astype(np.int64))
+    start = np.maximum(fundamental - bandwidth, 0)
+    end = np.minimum(fundamental + bandwidth, half)
+    low = np.maximum(start, 1)
+
+    signal_power = cumulative[row, end] - cumulative[row, start]
+    noise_power = (cumulative[row, low] - cumulative[:, 1]) + (
+        cumulative[:, half] - cumulative[row, end]
+    )
+    noise_count = (low - 1) + (half - end)
+    np.divide(noise_power, noise_count, out=noise_power, where=noise_count > 0)
+    noise_power[noise_count == 0] = _NOISE_FLOOR
+
+    # 10*log10(signal/noise), 0 where undefined, floored at 0 dB
+    np.divide(signal_power, noise_power, out=signal_power, where=noise_power > 0)
+    np.log10(signal_power, out=snr_db, where=(noise_power > 0) & (signal_power > 0))
+    np.multiply(snr_db, 10, out=snr_db)
+    np.maximum(snr_db, 0.0, out=snr_db)
+
+    # THD: RMS of the harmonics below Nyquist relative to the fundamental
+    harmonic_idx = fundamental[:, None] * _HARMONICS
+    valid = harmonic_idx < half
+    harmonic_power = power[row[:, None], np.minimum(harmonic_idx, half - 1)]
+    harmonic_count = valid.sum(axis=1)
+    harmonic_rms = np.sqrt(
+        (harmonic_power * valid).sum(axis=1) / np.maximum(harmonic_count, 1)
+    )
+    fundamental_magnitude = magnitude[row, fundamental]
+    np.divide(
+        harmonic_rms,
+        fundamental_magnitude,
+        out=thd_percent,
+        where=(harmonic_count > 0) & (fundamental_magnitude > 0),
+    )
+    np.multiply(thd_percent, 100, out=thd_percent)
+    np.minimum(thd_percent, 100.0, out=thd_percent)
+
+    return snr_db, thd_percent
+
+
+def _single_window_metrics(
+    magnitude: np.ndarray,
+    power: np.ndarray,
+    cumulative: np.ndarray,
+    sample_rate: int,
+    size: int,
+) -> Tuple[float, float]:
+    """Scalar form of the spectral_metrics computation for one window."""
+    half = size // 2
+    fundamental = int(magnitude[1:].argmax()) + 1
+
+    bandwidth = max(1, int(_SIGNAL_BANDWIDTH_HZ / (sample_rate / size)))
+    start = max(fundamental - bandwidth, 0)
+    end = min(fundamental + bandwidth, half)
+    low = max(start, 1)
+
+    signal_power = float(cumulative[end] - cumulative[start])
+    noise_count = (low - 1) + (half - end)
+    if noise_count > 0:
+        noise_power = float(
+            (cumulative[low] - cumulative[1]) + (cumulative[half] - cumulative[end])
+        ) / noise_count
+    else:
+        noise_power = _NOISE_FLOOR
+    snr_db = 0.0
+    if noise_power > 0 and signal_power > 0:
+        snr_db = max(0.0, 10 * math.log10(signal_power / noise_power))
+
+    harmonics = [fundamental * h for h in _HARMONICS if fundamental * h < half]
+    fundamental_magnitude = float(magnitude[fundamental])
+    thd_percent = 0.0
+    if harmonics and fundamental_magnitude > 0:
+        harmonic_rms = math.sqrt(float(power[harmonics].mean()))
+        thd_percent = min(100.0, harmonic_rms / fundamental_magnitude * 100)
+
+    return snr_db, thd_percent
+
+
+class _LevelAccumulator:
+    """Running RMS, peak and clipping over the chunks since the last analysis."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.sum_squares = 0.0
+        self.peak = 0.0
+        self.clipped = 0
+        self.samples = 0
+
+    def update(self, samples: np.ndarray) -> None:
+        if not len(samples):
+            return
+        magnitude = np.abs(samples)
+        self.sum_squares += float(np.dot(samples, samples))
+        self.peak = max(self.peak, float(magnitude.max()))
+        self.clipped += int(np.count_nonzero(magnitude >= _CLIPPING_THRESHOLD))
+        self.samples += len(samples)
+
+    @property
+    def rms(self) -> float:
+        return (self.sum_squares / self.samples) ** 0.5 if self.samples else 0.0
+
+    @property
+    def clipping_percent(self) -> float:
+        return self.clipped / self.samples * 100 if self.samples else 0.0
+
+
+@dataclass
+class _AnalysisRequest:
+    window: np.ndarray
+    sample_rate: int
+    future: concurrent.futures.Future = field(default_factory=concurrent.futures.Future)
+
+
+class QualityAnalysisService(BatchWorker[_AnalysisRequest]):
+    """Batched spectral analysis shared by many monitors, off the event loop.
+
+    Monitors submit analysis windows; a worker thread stacks the windows
+    that arrive within ``batch_window_ms`` and analyses them with one FFT.
+
+    Attributes:
+        max_batch_size: Maximum number of windows merged into one pass
+        batch_window_ms: Time to wait for more windows after the first one
+    """
+
+    thread_name = "quality-analysis"
+
+    def __init__(self, max_batch_size: int = 256, batch_window_ms: float = 5.0):
+        """Initialize the service. The worker thread starts on first use.
+
+        Args:
+            max_batch_size: Maximum number of windows merged into one pass
+            batch_window_ms: Time to wait for more windows after the first one
+        """
+        super().__init__(max_batch_size, batch_window_ms)
+
+        # Statistics
+        self.batches_run = 0
+        self.windows_analyzed = 0
+        self.max_batch_seen = 0
+        self.total_analysis_time = 0.0
+
+    def submit(self, window: np.ndarray, sample_rate: int) -> concurrent.futures.Future:
+        """Queue a window for analysis.
+
+        Args:
+            window: Normalized samples; the caller must not modify it afterwards
+            sample_rate: Sample rate of the window
+
+        Returns:
+            Future resolving to a (snr_db, thd_percent) tuple
+        """
+        return self._submit(_AnalysisRequest(window, sample_rate))
+
+    def get_stats(self) -> Dict:
+        """Get batching statistics."""
+        return {
+            "running": self.running,
+            "batches_run": self.batches_run,
+            "windows_analyzed": self.windows_analyzed,
+            "avg_batch_size": self.windows_analyzed / max(self.batches_run, 1),
+            "max_batch_size": self.max_batch_seen,
+            "avg_analysis_ms": (
+                self.total_analysis_time / max(self.batches_run, 1) * 1000
+            ),
+            "queue_depth": self.queue_depth,
+        }
+
+    def _process_batch(self, batch: List[_AnalysisRequest]) -> None:
+        start = time.perf_counter()
+
+        # One FFT per window length
+        by_size: Dict[int, List[_AnalysisRequest]] = defaultdict(list)
+        for request in batch:
+            by_size[len(request.window)].append(request)
+
+        for requests in by_size.values():
+            try:
+                snr_db, thd_percent = spectral_metrics(
+                    np.stack([r.window for r in requests]),
+                    np.array([r.sample_rate for r in requests]),
+                )
+            except Exception as e:
+                logger.error(f"Batched quality analysis failed: {e}")
+                for request in requests:
+                    request.future.set_exception(e)
+                continue
+            for i, request in enumerate(requests):
+                request.future.set_result((float(snr_db[i]), float(thd_percent[i])))
+
+        self.batches_run += 1
+        self.windows_analyzed += len(batch)
+        self.max_batch_seen = max(self.max_batch_seen, len(batch))
+        self.total_analysis_time += time.perf_counter() - start
+
+
+_service: Optional[QualityAnalysisService] = None
+_service_lock = threading.Lock()
+
+
+def get_quality_analysis_service() -> QualityAnalysisService:
+    """Get the process-wide batched analysis service, creating it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = QualityAnalysisService()
+        return _service
+
+
 class AudioQualityMonitor:
-    """Real-time audio quality monitoring and analysis."""
+    """Real-time audio quality monitoring and analysis.
+
+    ``analyze_audio_chunk`` analyses every chunk it is given. For streaming
+    use, ``process_audio_chunk`` tracks RMS, peak and clipping on every
+    chunk but runs the spectral analysis only every ``analysis_interval``
+    chunks, over a sliding window of the most recent ``window_size``
+    samples. With a ``batch_service`` the spectral analysis of many calls
+    runs together off the event loop and results are applied on the next
+    chunk.
+    """
 
     def __init__(
         self,
@@ -75,6 +371,9 @@ class AudioQualityMonitor:
         chunk_size: int = 1024,
         thresholds: Optional[QualityThresholds] = None,
         history_size: int = 100,
+        analysis_interval: int = 1,
+        window_size: Optional[int] = None,
+        batch_service: Optional[QualityAnalysisService] = None,
     ):
         """Initialize the audio quality monitor.
 
@@ -83,11 +382,19 @@ class AudioQualityMonitor:
             chunk_size: Number of samples per chunk
             thresholds: Quality thresholds configuration
             history_size: Number of recent metrics to keep in history
+            analysis_interval: Chunks per spectral analysis in process_audio_chunk
+            window_size: Samples in the sliding analysis window, or None to
+                analyse the latest chunk
+            batch_service: Shared service for batched analysis, or None to
+                analyse inline
         """
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
         self.thresholds = thresholds or QualityThresholds()
         self.history_size = history_size
+        self.analysis_interval = max(1, analysis_interval)
+        self.window_size = window_size
+        self.batch_service = batch_service
 
         # Quality history
         self.quality_history: deque = deque(maxlen=history_size)
@@ -95,15 +402,31 @@ class AudioQualityMonitor:
 
         # Statistics
         self.total_chunks_analyzed = 0
+        self.chunks_processed = 0
         self.alerts_triggered = 0
         self.start_time = time.time()
 
+        # Streaming state: levels since the last analysis and the sliding
+        # window, kept as a ring buffer. Rotating a window does not change
+        # its magnitude spectrum, so the ring is analysed in place.
+        self._levels = _LevelAccumulator()
+        self._ring = np.zeros(window_size or 0, dtype=np.float32)
+        self._ring_pos = 0
+        self._ring_filled = 0
+        self._latest_chunk: Optional[np.ndarray] = None
+        self._workspace: Optional[_SpectralWorkspace] = None
+        # (future, rms, peak, clipping %) of a batched analysis in flight
+        self._pending: Optional[Tuple[concurrent.futures.Future, float, float, float]]
+        self._pending = None
+
         # Callbacks
         self.on_quality_alert: Optional[Callable[[QualityAlert], None]] = None
         self.on_metrics_update: Optional[Callable[[QualityMetrics], None]] = None
 
         logger.info(
-            f"AudioQualityMonitor initialized: sample_rate={sample_rate}, chunk_size={chunk_size}"
+            f"AudioQualityMonitor initialized: sample_rate={sample_rate}, "
+            f"chunk_size={chunk_size}, analysis_interval={self.analysis_interval}, "
+            f"window_size={window_size}, batched={batch_service is not None}"
         )
 
     def analyze_audio_chunk(self, audio_bytes: bytes) -> QualityMetrics:
@@ -116,82 +439,184 @@ class AudioQualityMonitor:
             QualityMetrics object with analysis results
         """
         try:
-            # Convert bytes to numpy array
-            audio_array = (
-                np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
-            )
+            audio_array = self._to_float(audio_bytes)
+            levels = _LevelAccumulator()
+            levels.update(audio_array)
+            return self._analyze(audio_array, levels)
+        except Exception as e:
+            logger.error(f"Error analyzing audio chunk: {e}")
+            return self._empty_metrics()
 
-            # Calculate basic metrics
-            rms_level = np.sqrt(np.mean(audio_array**2))
-            peak_level = np.max(np.abs(audio_array))
-
-            # Skip analysis if audio is too quiet
-            if rms_level < self.thresholds.min_audio_level:
-                return QualityMetrics(
-                    snr_db=0.0,
-                    thd_percent=0.0,
-                    clipping_percent=0.0,
-                    rms_level=float(rms_level),
-                    peak_level=float(peak_level),
-                    quality_score=0.0,
-                    quality_level=QualityLevel.UNACCEPTABLE,
-                    timestamp=time.time(),
+    def process_audio_chunk(self, audio_bytes: bytes) -> Optional[QualityMetrics]:
+        """Track a chunk of a stream, analysing it on the configured cadence.
+
+        Levels are updated for every chunk. Every ``analysis_interval``
+        chunks the spectral metrics are computed over the analysis window
+        and combined with the levels accumulated since the last analysis.
+
+        Args:
+            audio_bytes: Raw audio data as bytes (16-bit PCM)
+
+        Returns:
+            QualityMetrics when an analysis completed on this call, else None
+        """
+        try:
+            completed = self._collect_pending()
+
+            audio_array = self._to_float(audio_bytes)
+            self._levels.update(audio_array)
+            if self.window_size:
+                self._push_window(audio_array)
+            else:
+                self._latest_chunk = audio_array
+
+            self.chunks_processed += 1
+            if (self.chunks_processed - 1) % self.analysis_interval:
+                return completed
+
+            levels = self._levels
+            self._levels = _LevelAccumulator()
+            window = self._window()
+
+            if self.batch_service is not None:
+                if levels.rms < self.thresholds.min_audio_level:
+                    return completed
+                # The service keeps the window, so hand it a copy of the ring
+                future = self.batch_service.submit(window.copy(), self.sample_rate)
+                self._pending = (
+                    future,
+                    levels.rms,
+                    levels.peak,
+                    levels.clipping_percent,
                 )
+                return completed
 
-            # Calculate SNR
-            snr_db = self._calculate_snr(audio_array)
+            return self._analyze(window, levels)
 
-            # Calculate THD
-            thd_percent = self._calculate_thd(audio_array)
+        except Exception as e:
+            logger.error(f"Error processing audio chunk: {e}")
+            return None
+
+    @staticmethod
+    def _to_float(audio_bytes: bytes) -> np.ndarray:
+        return np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+
+    def _empty_metrics(
+        self, rms_level: float = 0.0, peak_level: float = 0.0
+    ) -> QualityMetrics:
+        return QualityMetrics(
+            snr_db=0.0,
+            thd_percent=0.0,
+            clipping_percent=0.0,
+            rms_level=float(rms_level),
+            peak_level=float(peak_level),
+            quality_score=0.0,
+            quality_level=QualityLevel.UNACCEPTABLE,
+            timestamp=time.time(),
+        )
 
-            # Calculate clipping percentage
-            clipping_percent = self._calculate_clipping(audio_array)
+    def _push_window(self, samples: np.ndarray) -> None:
+        """Append samples to the sliding-window ring buffer."""
+        size = len(self._ring)
+        count = len(samples)
+        if count >= size:
+            self._ring[:] = samples[-size:]
+            self._ring_pos = 0
+            self._ring_filled = size
+            return
+        end = self._ring_pos + count
+        if end <= size:
+            self._ring[self._ring_pos : end] = samples
+        else:
+            split = size - self._ring_pos
+            self._ring[self._ring_pos :] = samples[:split]
+            self._ring[: end - size] = samples[split:]
+        self._ring_pos = end % size
+        self._ring_filled = min(size, self._ring_filled + count)
+
+    def _window(self) -> np.ndarray:
+        """Current analysis window (unordered once the ring has wrapped)."""
+        if self.window_size:
+            return self._ring[: self._ring_filled]
+        return self._latest_chunk
+
+    def _analyze(self, window: np.ndarray, levels: _LevelAccumulator) -> QualityMetrics:
+        """Run the spectral analysis inline and record the result."""
+        rms_level = levels.rms
+
+        # Skip analysis if audio is too quiet
+        if rms_level < self.thresholds.min_audio_level:
+            return self._empty_metrics(rms_level, levels.peak)
+
+        if self._workspace is None or self._workspace.shape != (1, len(window)):
+            self._workspace = _SpectralWorkspace(1, len(window))
+        snr_db, thd_percent = spectral_metrics(
+            window, self.sample_rate, self._workspace
+        )
+        return self._record_metrics(
+            float(snr_db[0]),
+            float(thd_percent[0]),
+            levels.clipping_percent,
+            rms_level,
+            levels.peak,
+        )
 
-            # Calculate overall quality score
-            quality_score = self._calculate_quality_score(
-                snr_db, thd_percent, clipping_percent, rms_level
-            )
+    def _collect_pending(self) -> Optional[QualityMetrics]:
+        """Record the result of a finished batched analysis, if any."""
+        if self._pending is None or not self._pending[0].done():
+            return None
+        future, rms_level, peak_level, clipping_percent = self._pending
+        self._pending = None
+        try:
+            snr_db, thd_percent = future.result()
+        except Exception as e:
+            logger.error(f"Error in batched quality analysis: {e}")
+            return None
+        return self._record_metrics(
+            snr_db, thd_percent, clipping_percent, rms_level, peak_level
+        )
 
-            # Determine quality level
-            quality_level = self._determine_quality_level(quality_score)
-
-            # Create metrics object
-            metrics = QualityMetrics(
-                snr_db=float(snr_db),
-                thd_percent=float(thd_percent),
-                clipping_percent=float(clipping_percent),
-                rms_level=float(rms_level),
-                peak_level=float(peak_level),
-                quality_score=float(quality_score),
-                quality_level=quality_level,
-                timestamp=time.time(),
-            )
+    def _record_metrics(
+        self,
+        snr_db: float,
+        thd_percent: float,
+        clipping_percent: float,
+        rms_level: float,
+        peak_level: float,
+    ) -> QualityMetrics:
+        """Score metrics, store them in history and raise alerts."""
+        # Calculate overall quality score
+        quality_score = self._calculate_quality_score(
+            snr_db, thd_percent, clipping_percent, rms_level
+        )
 
-            # Store in history
-            self.quality_history.append(metrics)
-            self.total_chunks_analyzed += 1
+        # Determine quality level
+        quality_level = self._determine_quality_level(quality_score)
+
+        # Create metrics object
+        metrics = QualityMetrics(
+            snr_db=float(snr_db),
+            thd_percent=float(thd_percent),
+            clipping_percent=float(clipping_percent),
+            rms_level=float(rms_level),
+            peak_level=float(peak_level),
+            quality_score=float(quality_score),
+            quality_level=quality_level,
+            timestamp=time.time(),
+        )
 
-            # Check for quality alerts
-            self._check_quality_alerts(metrics)
+        # Store in history
+        self.quality_history.append(metrics)
+        self.total_chunks_analyzed += 1
 
-            # Trigger callback if set
-            if self.on_metrics_update:
-                self.on_metrics_update(metrics)
+        # Check for quality alerts
+        self._check_quality_alerts(metrics)
 
-            return metrics
+        # Trigger callback if set
+        if self.on_metrics_update:
+            self.on_metrics_update(metrics)
 
-        except Exception as e:
-            logger.error(f"Error analyzing audio chunk: {e}")
-            return QualityMetrics(
-                snr_db=0.0,
-                thd_percent=0.0,
-                clipping_percent=0.0,
-                rms_level=0.0,
-                peak_level=0.0,
-                quality_score=0.0,
-                quality_level=QualityLevel.UNACCEPTABLE,
-                timestamp=time.time(),
-            )
+        return metrics
 
     def _calculate_snr(self, audio_array: np.ndarray) -> float:
         """Calculate Signal-to-Noise Ratio in dB using spectral analysis.
@@ -203,43 +628,7 @@ class AudioQualityMonitor:
             SNR in dB
         """
         try:
-            # Calculate FFT
-            fft = np.fft.fft(audio_array)
-            magnitude = np.abs(fft)
-
-            # Find the fundamental frequency (strongest component)
-            fundamental_idx = np.argmax(magnitude[1 : len(magnitude) // 2]) + 1
-
-            if fundamental_idx == 0:
-                return 0.0
-
-            # Calculate signal power around fundamental frequency
-            signal_bandwidth = 50  # Hz
-            freq_resolution = self.sample_rate / len(audio_array)  # Hz per bin
-            bandwidth_bins = max(1, int(signal_bandwidth / freq_resolution))
-
-            start_bin = max(0, int(fundamental_idx - bandwidth_bins))
-            end_bin = min(len(magnitude) // 2, int(fundamental_idx + bandwidth_bins))
-
-            signal_power = np.sum(magnitude[start_bin:end_bin] ** 2)
-
-            # Calculate noise power from remaining frequency bins
-            noise_bins = np.concatenate(
-                [magnitude[1:start_bin], magnitude[end_bin : len(magnitude) // 2]]
-            )
-
-            if len(noise_bins) > 0:
-                noise_power = np.mean(noise_bins**2)
-            else:
-                # Fallback to fixed noise floor for very clean signals
-                noise_power = 1e-8
-
-            if noise_power > 0:
-                snr_db = 10 * np.log10(signal_power / noise_power)
-                return float(max(0.0, snr_db))
-            else:
-                return 0.0
-
+            return float(spectral_metrics(audio_array, self.sample_rate)[0][0])
         except Exception as e:
             logger.debug(f"Error calculating SNR: {e}")
             return 0.0
@@ -254,33 +643,7 @@ class AudioQualityMonitor:
             THD percentage
         """
         try:
-            # Simplified THD calculation using FFT
-            fft = np.fft.fft(audio_array)
-            magnitude = np.abs(fft)
-
-            # Find fundamental frequency (strongest component)
-            fundamental_idx = np.argmax(magnitude[1 : len(magnitude) // 2]) + 1
-
-            if fundamental_idx == 0:
-                return 0.0
-
-            fundamental_magnitude = magnitude[fundamental_idx]
-
-            # Calculate harmonics (2nd, 3rd, 4th, 5th)
-            harmonic_magnitudes = []
-            for i in range(2, 6):
-                harmonic_idx = fundamental_idx * i
-                if harmonic_idx < len(magnitude) // 2:
-                    harmonic_magnitudes.append(magnitude[harmonic_idx])
-
-            if not harmonic_magnitudes:
-                return 0.0
-
-            # Calculate THD
-            harmonic_rms = np.sqrt(np.mean(np.array(harmonic_magnitudes) ** 2))
-            thd_percent = (harmonic_rms / fundamental_magnitude) * 100
-
-            return min(100.0, thd_percent)
+            return float(spectral_metrics(audio_array, self.sample_rate)[1][0])
         except Exception as e:
             logger.debug(f"Error calculating THD: {e}")
             return 0.0
@@ -295,12 +658,9 @@ class AudioQualityMonitor:
             Clipping percentage
         """
         try:
-            # Count samples that are at or near maximum amplitude
-            clipping_threshold = 0.95  # 95% of max amplitude
-            clipped_samples = np.sum(np.abs(audio_array) >= clipping_threshold)
-            clipping_percent = (clipped_samples / len(audio_array)) * 100
-
-            return float(clipping_percent)
+            levels = _LevelAccumulator()
+            levels.update(audio_array)
+            return float(levels.clipping_percent)
         except Exception as e:
             logger.debug(f"Error calculating clipping: {e}")
             return 0.0
@@ -436,9 +796,11 @@ class AudioQualityMonitor:
         Returns:
             Dictionary with quality summary statistics
         """
+        self._collect_pending()
         if not self.quality_history:
             return {
                 "total_chunks": 0,
+                "chunks_processed": self.chunks_processed,
                 "average_quality_score": 0.0,
                 "average_snr_db": 0.0,
                 "average_thd_percent": 0.0,
@@ -462,6 +824,7 @@ class AudioQualityMonitor:
 
         return {
             "total_chunks": self.total_chunks_analyzed,
+            "chunks_processed": self.chunks_processed,
             "average_quality_score": avg_quality,
             "average_snr_db": avg_snr,
             "average_thd_percent": avg_thd,
@@ -498,6 +861,13 @@ class AudioQualityMonitor:
         self.quality_history.clear()
         self.alert_history.clear()
         self.total_chunks_analyzed = 0
+        self.chunks_processed = 0
         self.alerts_triggered = 0
         self.start_time = time.time()
+        self._levels.reset()
+        self._ring.fill(0.0)
+        self._ring_pos = 0
+        self._ring_filled = 0
+        self._latest_chunk = None
+        self._pending = None
         logger.info("AudioQualityMonitor reset")
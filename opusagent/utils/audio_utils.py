@@ -10,6 +10,8 @@ import logging
 import struct
 from typing import List, Optional, Tuple
 
+from opusagent.utils import g711
+
 logger = logging.getLogger(__name__)
 
 
@@ -190,12 +192,7 @@ class AudioUtils:
         Returns:
             bytes: PCM16 audio data
         """
-        try:
-            import audioop
-            return audioop.ulaw2lin(mulaw_bytes, 2)
-        except ImportError:
-            # Fallback implementation using lookup table
-            return AudioUtils._ulaw_to_pcm16_fallback(mulaw_bytes)
+        return g711.ulaw_to_pcm16(mulaw_bytes)
 
     @staticmethod
     def pcm16_to_ulaw(pcm16_data: bytes) -> bytes:
@@ -208,94 +205,33 @@ class AudioUtils:
         Returns:
             bytes: μ-law encoded audio data
         """
-        try:
-            import audioop
-            return audioop.lin2ulaw(pcm16_data, 2)
-        except ImportError:
-            # Fallback implementation using lookup table
-            return AudioUtils._pcm16_to_ulaw_fallback(pcm16_data)
+        return g711.pcm16_to_ulaw(pcm16_data)
 
     @staticmethod
-    def _ulaw_to_pcm16_fallback(mulaw_bytes: bytes) -> bytes:
-        """Fallback μ-law to PCM16 conversion using lookup table."""
-        # μ-law to linear conversion table
-        ulaw_table = [
-            -32124, -31100, -30076, -29052, -28028, -27004, -25980, -24956,
-            -23932, -22908, -21884, -20860, -19836, -18812, -17788, -16764,
-            -15996, -15484, -14972, -14460, -13948, -13436, -12924, -12412,
-            -11900, -11388, -10876, -10364, -9852, -9340, -8828, -8316,
-            -7932, -7676, -7420, -7164, -6908, -6652, -6396, -6140,
-            -5884, -5628, -5372, -5116, -4860, -4604, -4348, -4092,
-            -3900, -3772, -3644, -3516, -3388, -3260, -3132, -3004,
-            -2876, -2748, -2620, -2492, -2364, -2236, -2108, -1980,
-            -1884, -1820, -1756, -1692, -1628, -1564, -1500, -1436,
-            -1372, -1308, -1244, -1180, -1116, -1052, -988, -924,
-            -876, -844, -812, -780, -748, -716, -684, -652,
-            -620, -588, -556, -524, -492, -460, -428, -396,
-            -372, -356, -340, -324, -308, -292, -276, -260,
-            -244, -228, -212, -196, -180, -164, -148, -132,
-            -120, -112, -104, -96, -88, -80, -72, -64,
-            -56, -48, -40, -32, -24, -16, -8, 0,
-            32124, 31100, 30076, 29052, 28028, 27004, 25980, 24956,
-            23932, 22908, 21884, 20860, 19836, 18812, 17788, 16764,
-            15996, 15484, 14972, 14460, 13948, 13436, 12924, 12412,
-            11900, 11388, 10876, 10364, 9852, 9340, 8828, 8316,
-            7932, 7676, 7420, 7164, 6908, 6652, 6396, 6140,
-            5884, 5628, 5372, 5116, 4860, 4604, 4348, 4092,
-            3900, 3772, 3644, 3516, 3388, 3260, 3132, 3004,
-            2876, 2748, 2620, 2492, 2364, 2236, 2108, 1980,
-            1884, 1820, 1756, 1692, 1628, 1564, 1500, 1436,
-            1372, 1308, 1244, 1180, 1116, 1052, 988, 924,
-            876, 844, 812, 780, 748, 716, 684, 652,
-            620, 588, 556, 524, 492, 460, 428, 396,
-            372, 356, 340, 324, 308, 292, 276, 260,
-            244, 228, 212, 196, 180, 164, 148, 132,
-            120, 112, 104, 96, 88, 80, 72, 64,
-            56, 48, 40, 32, 24, 16, 8, 0
-        ]
-        
-        pcm16_data = bytearray()
-        for byte in mulaw_bytes:
-            pcm16_data.extend(struct.pack('<h', ulaw_table[byte]))
-        
-        return bytes(pcm16_data)
+    def alaw_to_pcm16(alaw_bytes: bytes) -> bytes:
+        """
+        Convert A-law encoded audio to PCM16.
+        
+        Args:
+            alaw_bytes (bytes): A-law encoded audio data
+        
+        Returns:
+            bytes: PCM16 audio data
+        """
+        return g711.alaw_to_pcm16(alaw_bytes)
 
     @staticmethod
-    def _pcm16_to_ulaw_fallback(pcm16_data: bytes) -> bytes:
-        """Fallback PCM16 to μ-law conversion using lookup table."""
-        # Simplified PCM16 to μ-law conversion
-        ulaw_data = bytearray()
-        
-        for i in range(0, len(pcm16_data), 2):
-            if i + 1 < len(pcm16_data):
-                # Convert 16-bit little-endian to signed integer
-                sample = struct.unpack('<h', pcm16_data[i:i+2])[0]
-                
-                # Simple μ-law encoding (simplified version)
-                if sample >= 0:
-                    ulaw_byte = 0x80  # Sign bit
-                else:
-                    ulaw_byte = 0x00
-                    sample = -sample
-                
-                # Quantize to 7-bit
-                if sample > 0:
-                    # Find the highest bit set
-                    bit_pos = 0
-                    temp = sample
-                    while temp > 1:
-                        temp >>= 1
-                        bit_pos += 1
-                    
-                    # Encode segment and quantization
-                    segment = max(0, min(7, bit_pos - 4))
-                    quantization = (sample >> (bit_pos - 4)) & 0x0F
-                    
-                    ulaw_byte |= (segment << 4) | quantization
-                
-                ulaw_data.append(ulaw_byte)
+    def pcm16_to_alaw(pcm16_data: bytes) -> bytes:
+        """
+        Convert PCM16 audio to A-law encoding.
         
-        return bytes(ulaw_data)
+        Args:
+            pcm16_data (bytes): PCM16 audio data
+        
+        Returns:
+            bytes: A-law encoded audio data
+        """
+        return g711.pcm16_to_alaw(pcm16_data)
 
     @staticmethod
     def visualize_audio_level(audio_data: bytes, max_bars: int = 10) -> str:
@@ -0,0 +1,147 @@
+"""
+Dedicated thread serving requests from many calls in batches.
+
+The torch and ONNX VAD batchers, the Whisper batch scheduler and the
+quality analysis service share the same loop: requests queued by many calls are
+collected for a short batching window, handled together on one thread, and
+answered through concurrent futures the calls await on the event loop.
+
+BatchWorker is that loop. Subclasses define the request type (any object
+with a ``future`` attribute) and ``_process_batch``, which sets every
+request's result or exception.
+
+A call that hangs up cancels the future it was awaiting. Cancelled requests
+are dropped when a batch is collected; the futures of the others are marked
+running, so they can no longer be cancelled and setting their results
+cannot fail. A batch that raises fails only its own unresolved requests,
+and the thread keeps serving the others.
+"""
+
+import concurrent.futures
+import logging
+import queue
+import threading
+import time
+from typing import Any, Generic, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+
+class BatchWorker(Generic[R]):
+    """Collects queued requests into batches and handles them on one thread.
+
+    Attributes:
+        thread_name: Name of the worker thread
+        max_batch_size: Maximum number of requests in one batch
+        batch_window_ms: Time to wait for more requests after the first one
+    """
+
+    thread_name = "batch-worker"
+
+    def __init__(self, max_batch_size: int, batch_window_ms: float):
+        """
+        Initialize the worker. The thread starts on the first request.
+
+        Args:
+            max_batch_size: Maximum number of requests in one batch
+            batch_window_ms: Time to wait for more requests after the first one
+        """
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_window_ms = batch_window_ms
+        self._requests: "queue.Queue[Optional[R]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting to be batched."""
+        return self._requests.qsize()
+
+    def start(self) -> None:
+        """Start the worker thread, after _prepare()."""
+        with self._lock:
+            if self.running:
+                return
+            self._prepare()
+            self._thread = threading.Thread(
+                target=self._run, name=self.thread_name, daemon=True
+            )
+            self._thread.start()
+            logger.info(
+                f"{self.thread_name} started (max batch {self.max_batch_size}, "
+                f"window {self.batch_window_ms}ms)"
+            )
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the worker thread. Requests already queued are still served."""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._requests.put(None)
+            thread.join(timeout)
+            self._thread = None
+            logger.info(f"{self.thread_name} stopped")
+
+    def _prepare(self) -> None:
+        """Load what the thread needs; called under the lock by start()."""
+
+    def _submit(self, request: R) -> concurrent.futures.Future:
+        """Queue a request, starting the thread if needed, and return its future."""
+        if not self.running:
+            self.start()
+        self._requests.put(request)
+        return request.future  # type: ignore[attr-defined]
+
+    def _process_batch(self, batch: List[R]) -> None:
+        """Handle a batch, setting the result or exception of every request."""
+        raise NotImplementedError
+
+    def _run(self) -> None:
+        window = self.batch_window_ms / 1000.0
+        stopping = False
+        while not stopping:
+            request = self._requests.get()
+            if request is None:
+                break
+
+            batch = [request]
+            deadline = time.monotonic() + window
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    request = (
+                        self._requests.get(timeout=remaining)
+                        if remaining > 0
+                        else self._requests.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+
+            batch = [r for r in batch if _claim(r)]
+            if not batch:
+                continue
+            try:
+                self._process_batch(batch)
+            except Exception as e:
+                logger.exception(f"{self.thread_name} batch failed: {e}")
+                for request in batch:
+                    future: concurrent.futures.Future = request.future  # type: ignore[attr-defined]
+                    if not future.done():
+                        future.set_exception(e)
+
+
+def _claim(request: Any) -> bool:
+    """Mark a request's future running; False if its caller cancelled it."""
+    return request.future.set_running_or_notify_cancel()
@@ -20,6 +20,15 @@ import numpy as np
 
 from opusagent.config.constants import DEFAULT_SAMPLE_RATE
 from opusagent.config.logging_config import configure_logging
+from opusagent.utils import g711
+from opusagent.utils.audio_buffer import BufferLike
+from opusagent.utils.recording_encoder import extract_channel, get_encoder_class
+from opusagent.utils.recording_writer import (
+    BOT_CHANNEL,
+    CALLER_CHANNEL,
+    StreamingRecordingWriter,
+)
+from opusagent.utils.resampler import StreamingResampler
 
 logger = configure_logging("call_recorder")
 
@@ -123,6 +132,14 @@ class CallRecorder:
     - Call metadata and statistics
     - File management and cleanup
     - Audio resampling for different sample rates (caller: 16kHz, bot: 24kHz)
+
+    In streaming mode, audio goes to a background writer thread that
+    interleaves the stereo file as the call progresses. Nothing is buffered
+    for a final mixdown, so memory does not grow with call length.
+
+    With a compressed recording format (flac or opus) the recorder always
+    streams and writes a single stereo file; mono caller and bot WAV files
+    are produced on demand by extract_channel().
     """
 
     def __init__(
@@ -131,6 +148,10 @@ class CallRecorder:
         session_id: Optional[str] = None,
         base_output_dir: str = "call_recordings",
         bot_sample_rate: int = 24000,  # Allow overriding the bot sample rate
+        streaming: bool = False,
+        writer_queue_size: int = 500,
+        recording_format: str = "wav",
+        compression_level: Optional[float] = None,
     ):
         """
         Initialize the call recorder.
@@ -140,6 +161,15 @@ class CallRecorder:
             session_id: Optional session identifier
             base_output_dir: Base directory for recordings
             bot_sample_rate: Sample rate for bot audio (default 24000 for OpenAI Realtime API)
+            streaming: Write audio from a background thread instead of
+                buffering it for a final stereo mixdown
+            writer_queue_size: Chunks queued for the streaming writer
+            recording_format: Stereo file format: wav, flac or opus
+            compression_level: Encoder compression level from 0.0 to 1.0,
+                or None for the codec default
+
+        Raises:
+            ValueError: If the recording format is not supported
         """
         self.conversation_id = conversation_id
         self.session_id = session_id or conversation_id
@@ -162,7 +192,12 @@ class CallRecorder:
         # File paths
         self.caller_audio_file = self.recording_dir / "caller_audio.wav"
         self.bot_audio_file = self.recording_dir / "bot_audio.wav"
-        self.stereo_audio_file = self.recording_dir / "stereo_recording.wav"
+        encoder_class = get_encoder_class(recording_format)
+        self.recording_format = encoder_class.format
+        self.compression_level = compression_level
+        self.stereo_audio_file = (
+            self.recording_dir / f"stereo_recording{encoder_class.extension}"
+        )
         self.transcript_file = self.recording_dir / "transcript.json"
         self.metadata_file = self.recording_dir / "call_metadata.json"
         self.session_log_file = self.recording_dir / "session_events.json"
@@ -172,6 +207,14 @@ class CallRecorder:
         self.bot_wav: Optional[wave.Wave_write] = None
         self.stereo_wav: Optional[wave.Wave_write] = None
 
+        # Background writer used instead of the WAV handles in streaming mode
+        self.streaming = streaming or self.recording_format != "wav"
+        self.writer_queue_size = writer_queue_size
+        self._writer: Optional[StreamingRecordingWriter] = None
+
+        # Resamplers for G.711 telephony audio, keyed by source rate
+        self._g711_resamplers: Dict[int, StreamingResampler] = {}
+
         # Audio buffers for stereo creation
         self.caller_audio_buffer: List[bytes] = []
         self.bot_audio_buffer: List[bytes] = []
@@ -321,6 +364,7 @@ class CallRecorder:
                     "caller_sample_rate": self.caller_sample_rate,
                     "bot_sample_rate": self.bot_sample_rate,
                     "target_sample_rate": self.target_sample_rate,
+                    "recording_format": self.recording_format,
                 },
             )
 
@@ -338,6 +382,23 @@ class CallRecorder:
             self.recording_dir.mkdir(parents=True, exist_ok=True)
             logger.debug(f"Recording directory ensured: {self.recording_dir}")
 
+            if self.streaming:
+                # Compressed recordings keep only the stereo stream
+                write_mono = self.recording_format == "wav"
+                self._writer = StreamingRecordingWriter(
+                    self.caller_audio_file if write_mono else None,
+                    self.bot_audio_file if write_mono else None,
+                    self.stereo_audio_file,
+                    sample_rate=self.target_sample_rate,
+                    sample_width=self.sample_width,
+                    max_queue_chunks=self.writer_queue_size,
+                    stereo_format=self.recording_format,
+                    compression_level=self.compression_level,
+                )
+                self._writer.start()
+                logger.info("Streaming recording writer started")
+                return
+
             # Caller audio (16kHz)
             try:
                 self.caller_wav = wave.open(str(self.caller_audio_file), "wb")
@@ -403,6 +464,29 @@ class CallRecorder:
 
         try:
             decoded_chunk = base64.b64decode(audio_chunk_b64)
+        except Exception as e:
+            logger.error(f"Error recording caller audio: {e}")
+            return False
+        return await self.record_caller_audio_bytes(decoded_chunk)
+
+    async def record_caller_audio_bytes(self, audio_chunk: BufferLike) -> bool:
+        """
+        Record already-decoded audio from the caller.
+
+        The chunk may be a pooled buffer owned by the caller; it is copied
+        before being kept.
+
+        Args:
+            audio_chunk: Raw PCM16 audio chunk (assumed 16kHz)
+
+        Returns:
+            True if recorded successfully, False otherwise
+        """
+        if not self.recording_active:
+            return False
+
+        try:
+            decoded_chunk = bytes(audio_chunk)
 
             # Caller audio is typically already 16kHz, so no resampling needed usually
             processed_chunk = decoded_chunk
@@ -411,20 +495,25 @@ class CallRecorder:
                     decoded_chunk, self.caller_sample_rate, self.target_sample_rate
                 )
 
-            # Write to caller-only file
-            if self.caller_wav:
-                self.caller_wav.writeframes(processed_chunk)
-
-            # Store in buffer for stereo creation
-            self.caller_audio_buffer.append(processed_chunk)
-
             # Update metadata (use processed chunk size for consistency)
             self.metadata.caller_audio_chunks += 1
             self.metadata.caller_audio_bytes += len(processed_chunk)
 
-            # Write to stereo file (left channel)
-            if self.stereo_wav:
-                await self._write_stereo_chunk(processed_chunk, AudioChannel.CALLER)
+            if self._writer is not None:
+                self._writer.write(CALLER_CHANNEL, processed_chunk)
+            else:
+                # Write to caller-only file
+                if self.caller_wav:
+                    self.caller_wav.writeframes(processed_chunk)
+
+                # Store in buffer for stereo creation
+                self.caller_audio_buffer.append(processed_chunk)
+
+                # Write to stereo file (left channel)
+                if self.stereo_wav:
+                    await self._write_stereo_chunk(
+                        processed_chunk, AudioChannel.CALLER
+                    )
 
             return True
 
@@ -432,6 +521,42 @@ class CallRecorder:
             logger.error(f"Error recording caller audio: {e}")
             return False
 
+    async def record_caller_audio_g711(
+        self, encoded_chunk: BufferLike, law: str = "ulaw", sample_rate: int = 8000
+    ) -> bool:
+        """
+        Record G.711 encoded audio from the caller (e.g. Twilio media frames).
+
+        Args:
+            encoded_chunk: μ-law or A-law code words, one byte per sample
+            law: "ulaw" or "alaw"
+            sample_rate: Sample rate of the encoded audio
+
+        Returns:
+            True if recorded successfully, False otherwise
+        """
+        if not self.recording_active:
+            return False
+
+        try:
+            if law == "ulaw":
+                pcm16 = g711.ulaw_to_pcm16(encoded_chunk)
+            elif law == "alaw":
+                pcm16 = g711.alaw_to_pcm16(encoded_chunk)
+            else:
+                raise ValueError(f"Unsupported G.711 law: {law}")
+
+            if sample_rate != self.caller_sample_rate:
+                resampler = self._g711_resamplers.get(sample_rate)
+                if resampler is None:
+                    resampler = StreamingResampler(sample_rate, self.caller_sample_rate)
+                    self._g711_resamplers[sample_rate] = resampler
+                pcm16 = resampler.process(pcm16)
+        except Exception as e:
+            logger.error(f"Error recording caller audio: {e}")
+            return False
+        return await self.record_caller_audio_bytes(pcm16)
+
     async def record_bot_audio(self, audio_chunk_b64: str) -> bool:
         """
         Record audio from the bot.
@@ -447,6 +572,26 @@ class CallRecorder:
 
         try:
             decoded_chunk = base64.b64decode(audio_chunk_b64)
+        except Exception as e:
+            logger.error(f"Error recording bot audio: {e}")
+            return False
+        return await self.record_bot_audio_bytes(decoded_chunk)
+
+    async def record_bot_audio_bytes(self, audio_chunk: BufferLike) -> bool:
+        """
+        Record already-decoded audio from the bot.
+
+        Args:
+            audio_chunk: Raw PCM16 audio chunk at bot_sample_rate
+
+        Returns:
+            True if recorded successfully, False otherwise
+        """
+        if not self.recording_active:
+            return False
+
+        try:
+            decoded_chunk = bytes(audio_chunk)
 
             # Validate chunk size (should be reasonable for audio data)
             if len(decoded_chunk) < 2:  # Need at least one 16-bit sample
@@ -473,20 +618,23 @@ class CallRecorder:
             resampled_samples = len(processed_chunk) // 2
             resampled_duration_ms = (resampled_samples / self.target_sample_rate) * 1000
 
-            # Write to bot-only file
-            if self.bot_wav:
-                self.bot_wav.writeframes(processed_chunk)
-
-            # Store in buffer for stereo creation
-            self.bot_audio_buffer.append(processed_chunk)
-
             # Update metadata (use processed chunk size for consistency)
             self.metadata.bot_audio_chunks += 1
             self.metadata.bot_audio_bytes += len(processed_chunk)
 
-            # Write to stereo file (right channel)
-            if self.stereo_wav:
-                await self._write_stereo_chunk(processed_chunk, AudioChannel.BOT)
+            if self._writer is not None:
+                self._writer.write(BOT_CHANNEL, processed_chunk)
+            else:
+                # Write to bot-only file
+                if self.bot_wav:
+                    self.bot_wav.writeframes(processed_chunk)
+
+                # Store in buffer for stereo creation
+                self.bot_audio_buffer.append(processed_chunk)
+
+                # Write to stereo file (right channel)
+                if self.stereo_wav:
+                    await self._write_stereo_chunk(processed_chunk, AudioChannel.BOT)
 
             # Log resampling info occasionally for debugging
             if self.metadata.bot_audio_chunks % 100 == 1:  # Log every 100th chunk
@@ -619,6 +767,14 @@ class CallRecorder:
             self.recording_active = False
             self.metadata.end_time = datetime.now(timezone.utc)
 
+            # Drain the streaming writer off the event loop
+            try:
+                if self._writer is not None:
+                    await asyncio.to_thread(self._writer.close)
+                    logger.debug("Streaming recording writer closed")
+            except Exception as e:
+                logger.error(f"Error closing streaming recording writer: {e}")
+
             # Close WAV files safely
             try:
                 if self.caller_wav:
@@ -671,14 +827,16 @@ class CallRecorder:
                 logger.error(error_msg)
                 save_errors.append(error_msg)
 
-            # Create final stereo recording (if needed)
-            try:
-                await self._create_final_stereo_recording()
-                logger.debug("Final stereo recording created successfully")
-            except Exception as e:
-                error_msg = f"Error creating final stereo recording: {e}"
-                logger.error(error_msg)
-                save_errors.append(error_msg)
+            # Create final stereo recording (not needed when streaming: the
+            # stereo file was interleaved as the call went)
+            if self._writer is None:
+                try:
+                    await self._create_final_stereo_recording()
+                    logger.debug("Final stereo recording created successfully")
+                except Exception as e:
+                    error_msg = f"Error creating final stereo recording: {e}"
+                    logger.error(error_msg)
+                    save_errors.append(error_msg)
 
             try:
                 await self._log_session_event(
@@ -877,7 +1035,7 @@ class CallRecorder:
 
     def get_recording_summary(self) -> Dict[str, Any]:
         """Get a summary of the recording session."""
-        return {
+        summary = {
             "conversation_id": self.conversation_id,
             "session_id": self.session_id,
             "recording_dir": str(self.recording_dir),
@@ -893,6 +1051,50 @@ class CallRecorder:
             },
             "stats": self.metadata.to_dict(),
         }
+        if self._writer is not None:
+            summary["writer"] = self._writer.get_stats()
+            summary["encoder"] = self._writer.encoder.get_stats()
+        return summary
+
+    async def extract_channel(
+        self, channel: AudioChannel, output_path: Optional[Path] = None
+    ) -> Optional[Path]:
+        """
+        Write one side of the finished stereo recording to a mono WAV file.
+
+        Args:
+            channel: AudioChannel.CALLER or AudioChannel.BOT
+            output_path: Destination file; defaults to caller_audio.wav or
+                bot_audio.wav in the recording directory
+
+        Returns:
+            The mono file path, or None if it could not be extracted
+        """
+        if self.recording_active:
+            logger.warning("Cannot extract a channel while recording is active")
+            return None
+        if channel not in (AudioChannel.CALLER, AudioChannel.BOT):
+            logger.error(f"Cannot extract channel: {channel}")
+            return None
+        if not self.stereo_audio_file.exists():
+            logger.error(f"Stereo recording not found: {self.stereo_audio_file}")
+            return None
+
+        if channel == AudioChannel.CALLER:
+            index, default_path = CALLER_CHANNEL, self.caller_audio_file
+        else:
+            index, default_path = BOT_CHANNEL, self.bot_audio_file
+
+        try:
+            return await asyncio.to_thread(
+                extract_channel,
+                self.stereo_audio_file,
+                index,
+                output_path or default_path,
+            )
+        except Exception as e:
+            logger.error(f"Error extracting {channel.value} channel: {e}")
+            return None
 
     async def cleanup(self):
         """Clean up resources and close any open files."""
@@ -901,6 +1103,8 @@ class CallRecorder:
                 await self.stop_recording()
 
             # Ensure all files are closed
+            if self._writer is not None:
+                await asyncio.to_thread(self._writer.close)
             for wav_file in [self.caller_wav, self.bot_wav, self.stereo_wav]:
                 if wav_file:
                     wav_file.close()
@@ -915,6 +1119,15 @@ class CallRecorder:
         try:
             logger.warning(f"Emergency cleanup for conversation {self.conversation_id}")
 
+            # Stop the streaming writer; queued audio is still written
+            if self._writer is not None:
+                try:
+                    await asyncio.to_thread(self._writer.close, 5.0)
+                except Exception as e:
+                    logger.error(
+                        f"Error closing recording writer during emergency cleanup: {e}"
+                    )
+
             # Force close all WAV files
             for wav_file in [self.caller_wav, self.bot_wav, self.stereo_wav]:
                 if wav_file:
@@ -958,6 +1171,8 @@ class CallRecorder:
                 "bot_wav": self.bot_wav is not None,
                 "stereo_wav": self.stereo_wav is not None,
             },
+            "streaming_writer": self._writer is not None and self._writer.running,
+            "recording_format": self.recording_format,
         }
 
     @classmethod
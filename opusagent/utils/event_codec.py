@@ -0,0 +1,126 @@
+"""
+Fast-path decoding and framing for high-frequency websocket events.
+
+Every Realtime API message was decoded with ``json.loads``, and every audio
+delta then went through a pydantic ``ResponseAudioDeltaEvent``, a base64
+decode to validate it and a ``PlayStreamChunkMessage`` whose validator
+decoded it again. Twilio media frames were validated as ``MediaMessage``.
+At 50 audio events per second per call in each direction this dominates the
+per-message cost.
+
+This module provides:
+
+- ``loads``: orjson when it is installed, the standard library otherwise.
+  It raises ``json.JSONDecodeError`` (orjson's error subclasses it) either
+  way.
+- Field readers for audio deltas and Twilio media frames that check only
+  what the audio path uses, and a ``playStream.chunk`` builder that produces
+  the same dict as ``PlayStreamChunkMessage.model_dump()``.
+
+Handlers use these for audio events when ``FAST_EVENT_PATH`` is enabled
+(the default). Control events are always validated with the pydantic
+models, and so are audio events when the fast path is disabled.
+"""
+
+import json
+from typing import Any, Dict, Optional, Tuple, Union
+
+from opusagent.models.audiocodes_api import TelephonyEventType
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is missing
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+# Fields the audio path reads from a response.audio.delta event
+AUDIO_DELTA_FIELDS = ("response_id", "item_id", "output_index", "content_index", "delta")
+
+
+def loads(message: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    Decode a JSON websocket message.
+
+    Args:
+        message: JSON text or UTF-8 bytes
+
+    Returns:
+        The decoded value
+
+    Raises:
+        json.JSONDecodeError: If the message is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+def read_audio_delta(response_dict: Dict[str, Any]) -> Optional[str]:
+    """
+    Return the base64 audio of a response.audio.delta event.
+
+    Only the presence of the event's fields and a string delta are checked;
+    the audio is not decoded. An empty delta is returned as is, so callers
+    decide where to skip it, as on their slow paths.
+
+    Args:
+        response_dict: Decoded audio delta event
+
+    Returns:
+        The base64 delta, or None if a field is missing or the delta is not a string
+    """
+    for field in AUDIO_DELTA_FIELDS:
+        if field not in response_dict:
+            return None
+    delta = response_dict["delta"]
+    if not isinstance(delta, str):
+        return None
+    return delta
+
+
+def read_twilio_media(data: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """
+    Return the payload and track of a Twilio media message.
+
+    Args:
+        data: Decoded Twilio ``media`` message
+
+    Returns:
+        Tuple of the base64 payload and the track (None if absent)
+
+    Raises:
+        ValueError: If the message has no string payload
+    """
+    media = data.get("media")
+    payload = media.get("payload") if isinstance(media, dict) else None
+    if not isinstance(payload, str):
+        raise ValueError("Twilio media message without a payload")
+    return payload, media.get("track")  # type: ignore[union-attr]
+
+
+def play_stream_chunk(
+    conversation_id: Optional[str],
+    stream_id: str,
+    audio_chunk: str,
+    participant: Optional[str] = "caller",
+) -> Dict[str, Any]:
+    """
+    Build a playStream.chunk message without a pydantic model.
+
+    Args:
+        conversation_id: Conversation identifier
+        stream_id: Active play stream identifier
+        audio_chunk: Base64 audio
+        participant: Participant the audio is played to
+
+    Returns:
+        The same dict as ``PlayStreamChunkMessage(...).model_dump()``
+    """
+    return {
+        "type": TelephonyEventType.PLAY_STREAM_CHUNK.value,
+        "conversationId": conversation_id,
+        "participant": participant,
+        "streamId": stream_id,
+        "audioChunk": audio_chunk,
+    }
@@ -0,0 +1,154 @@
+"""
+Lookup-table G.711 μ-law and A-law codec.
+
+Replaces ``audioop`` (removed in Python 3.13) on the telephony paths. Every
+possible code word is decoded once into a 256-entry table and every possible
+16-bit sample is encoded once into a 65536-entry table, so converting a chunk
+is a single NumPy gather with no per-sample Python work.
+
+The tables are generated from the ITU-T G.191 reference implementation
+(``ulaw_compress``/``ulaw_expand``/``alaw_compress``/``alaw_expand``) and are
+bit-exact with it. Decoding is identical to ``audioop``; μ-law encoding of a
+few negative samples at segment boundaries differs from ``audioop``, which
+negates with two's rather than one's complement before quantizing.
+"""
+
+import numpy as np
+
+from .audio_buffer import BufferLike
+
+# μ-law and A-law silence code words
+ULAW_SILENCE = 0xFF
+ALAW_SILENCE = 0xD5
+
+
+def _build_ulaw_decode_table() -> np.ndarray:
+    codes = np.arange(256, dtype=np.int32)
+    inverted = ~codes & 0xFF
+    exponent = (inverted >> 4) & 0x07
+    mantissa = inverted & 0x0F
+    step = 4 << (exponent + 1)
+    magnitude = (0x80 << exponent) + step * mantissa + step // 2 - 4 * 33
+    return np.where(codes < 0x80, -magnitude, magnitude).astype(np.int16)
+
+
+def _build_alaw_decode_table() -> np.ndarray:
+    codes = np.arange(256, dtype=np.int32)
+    toggled = (codes ^ 0x55) & 0x7F
+    exponent = toggled >> 4
+    mantissa = toggled & 0x0F
+    mantissa = np.where(exponent > 0, mantissa + 16, mantissa)
+    mantissa = (mantissa << 4) + 0x08
+    mantissa = np.where(exponent > 1, mantissa << np.maximum(exponent - 1, 0), mantissa)
+    return np.where(codes > 0x7F, mantissa, -mantissa).astype(np.int16)
+
+
+def _segment(magnitude: np.ndarray, first_shift: int) -> np.ndarray:
+    """Number of significant bits above ``first_shift``, plus one."""
+    segment = np.ones_like(magnitude)
+    remaining = magnitude >> first_shift
+    while remaining.any():
+        segment += remaining != 0
+        remaining >>= 1
+    return segment
+
+
+def _build_ulaw_encode_table() -> np.ndarray:
+    # Indexed by the int16 sample reinterpreted as uint16
+    samples = np.arange(65536, dtype=np.int32).astype(np.uint16).view(np.int16)
+    samples = samples.astype(np.int32)
+    magnitude = np.where(samples < 0, (~samples) >> 2, samples >> 2) + 33
+    magnitude = np.minimum(magnitude, 0x1FFF)
+    segment = _segment(magnitude, 6)
+    high = 8 - segment
+    low = 0x0F - ((magnitude >> segment) & 0x0F)
+    codes = (high << 4) | low
+    return np.where(samples >= 0, codes | 0x80, codes).astype(np.uint8)
+
+
+def _build_alaw_encode_table() -> np.ndarray:
+    samples = np.arange(65536, dtype=np.int32).astype(np.uint16).view(np.int16)
+    samples = samples.astype(np.int32)
+    magnitude = np.where(samples < 0, (~samples) >> 4, samples >> 4)
+    # Segments 1-7 keep the four bits below the leading one
+    exponent = np.where(magnitude > 15, _segment(magnitude, 5), 0)
+    codes = np.where(
+        magnitude > 15,
+        ((magnitude >> np.maximum(exponent - 1, 0)) - 16) + (exponent << 4),
+        magnitude,
+    )
+    codes = np.where(samples >= 0, codes | 0x80, codes)
+    return (codes ^ 0x55).astype(np.uint8)
+
+
+ULAW_DECODE_TABLE = _build_ulaw_decode_table()
+ALAW_DECODE_TABLE = _build_alaw_decode_table()
+ULAW_ENCODE_TABLE = _build_ulaw_encode_table()
+ALAW_ENCODE_TABLE = _build_alaw_encode_table()
+for _table in (ULAW_DECODE_TABLE, ALAW_DECODE_TABLE, ULAW_ENCODE_TABLE, ALAW_ENCODE_TABLE):
+    _table.flags.writeable = False
+del _table
+
+
+def _decode(table: np.ndarray, data: BufferLike) -> bytes:
+    codes = np.frombuffer(data, dtype=np.uint8)
+    return table[codes].astype("<i2", copy=False).tobytes()
+
+
+def _encode(table: np.ndarray, data: BufferLike) -> bytes:
+    # A trailing odd byte is not a whole sample and is dropped, like audioop
+    usable = len(data) & ~1
+    samples = np.frombuffer(data, dtype="<u2", count=usable // 2)
+    return table[samples].tobytes()
+
+
+def ulaw_to_pcm16(data: BufferLike) -> bytes:
+    """
+    Decode G.711 μ-law to 16-bit little-endian PCM.
+
+    Args:
+        data: μ-law code words, one byte per sample
+
+    Returns:
+        PCM16 audio, two bytes per sample
+    """
+    return _decode(ULAW_DECODE_TABLE, data)
+
+
+def pcm16_to_ulaw(data: BufferLike) -> bytes:
+    """
+    Encode 16-bit little-endian PCM to G.711 μ-law.
+
+    Args:
+        data: PCM16 audio
+
+    Returns:
+        μ-law code words, one byte per sample
+    """
+    return _encode(ULAW_ENCODE_TABLE, data)
+
+
+def alaw_to_pcm16(data: BufferLike) -> bytes:
+    """
+    Decode G.711 A-law to 16-bit little-endian PCM.
+
+    Args:
+        data: A-law code words, one byte per sample
+
+    Returns:
+        PCM16 audio, two bytes per sample
+    """
+    return _decode(ALAW_DECODE_TABLE, data)
+
+
+def pcm16_to_alaw(data: BufferLike) -> bytes:
+    """
+    Encode 16-bit little-endian PCM to G.711 A-law.
+
+    Args:
+        data: PCM16 audio
+
+    Returns:
+        A-law code words, one byte per sample
+    """
+    return _encode(ALAW_ENCODE_TABLE, data)
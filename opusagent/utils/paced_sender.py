@@ -0,0 +1,242 @@
+"""
+Paced, timer-driven egress for real-time telephony audio.
+
+Telephony platforms expect outbound audio at playback rate. Sleeping between
+frames inside the handler that received the audio blocks that handler (and
+everything queued behind it) for the whole utterance.
+
+``PacedAudioSender`` decouples the two: producers enqueue audio and return
+immediately, and one sender task per call releases fixed-size frames against
+a playout clock. Each wake-up sends every frame that is due, keeping a small
+lead over real time, so frames held up by an event-loop stall go out together
+on the next tick instead of accumulating delay. ``clear()`` drops everything
+queued, which is how an interrupted response is cut off instantly.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PacedAudioSender:
+    """Per-call frame queue drained by a single timer-driven sender task.
+
+    Attributes:
+        frame_size: Frame size in bytes
+        frame_duration: Playback duration of one frame in seconds
+        lead_frames: Frames sent ahead of real time to absorb network jitter
+        max_queue_frames: Queue bound; the oldest frames are dropped beyond it
+        silence_byte: Byte value used to pad the final partial frame
+    """
+
+    def __init__(
+        self,
+        send_frame: Callable[[bytes], Awaitable[None]],
+        frame_size: int = 160,
+        frame_duration: float = 0.02,
+        lead_frames: int = 3,
+        max_queue_frames: int = 3000,
+        silence_byte: int = 0xFF,
+    ):
+        """
+        Initialize the sender. The sender task starts on first enqueue.
+
+        Args:
+            send_frame: Coroutine function that transmits one frame
+            frame_size: Frame size in bytes (160 = 20ms of 8kHz G.711)
+            frame_duration: Playback duration of one frame in seconds
+            lead_frames: Frames sent ahead of real time
+            max_queue_frames: Maximum queued frames (3000 = 60s at 20ms)
+            silence_byte: Byte value used to pad the final partial frame
+        """
+        self._send_frame = send_frame
+        self.frame_size = frame_size
+        self.frame_duration = frame_duration
+        self.lead_frames = lead_frames
+        self.max_queue_frames = max_queue_frames
+        self.silence_byte = silence_byte
+
+        self._frames: Deque[bytes] = deque()
+        self._partial = bytearray()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        # Playout time of the next frame to send
+        self._clock: Optional[float] = None
+        self._last_enqueue = 0.0
+
+        # Statistics
+        self.frames_enqueued = 0
+        self.frames_sent = 0
+        self.frames_cleared = 0
+        self.frames_overflowed = 0
+        self.send_errors = 0
+        self.clears = 0
+        self.max_queue_depth = 0
+        self.catch_up_batches = 0
+        self.max_lag_ms = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of complete frames waiting to be sent."""
+        return len(self._frames)
+
+    def enqueue(self, data: bytes) -> None:
+        """
+        Queue audio for paced sending without waiting for it to play.
+
+        Bytes that do not fill a whole frame are held until more audio
+        arrives, or padded with silence once the queue runs dry.
+
+        Args:
+            data: Encoded audio in the platform's wire format
+        """
+        if self._closed or not data:
+            return
+
+        self._last_enqueue = time.monotonic()
+        self._partial += data
+        complete = len(self._partial) - len(self._partial) % self.frame_size
+        for offset in range(0, complete, self.frame_size):
+            self._frames.append(bytes(self._partial[offset : offset + self.frame_size]))
+        del self._partial[:complete]
+
+        added = complete // self.frame_size
+        self.frames_enqueued += added
+        overflow = len(self._frames) - self.max_queue_frames
+        if overflow > 0:
+            for _ in range(overflow):
+                self._frames.popleft()
+            self.frames_overflowed += overflow
+            logger.warning(f"Egress queue full, dropped {overflow} oldest frames")
+        self.max_queue_depth = max(self.max_queue_depth, len(self._frames))
+
+        self._ensure_task()
+        self._wakeup.set()
+
+    def clear(self) -> int:
+        """
+        Drop all queued audio immediately.
+
+        Returns:
+            Number of frames dropped
+        """
+        dropped = len(self._frames) + (1 if self._partial else 0)
+        self._frames.clear()
+        self._partial.clear()
+        self._clock = None
+        self.frames_cleared += dropped
+        self.clears += 1
+        return dropped
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued frame (including a padded partial) is sent.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._frames or self._partial:
+            if self._task is None or self._task.done():
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(self.frame_duration / 2)
+        return True
+
+    async def close(self) -> None:
+        """Stop the sender task and discard anything still queued."""
+        self._closed = True
+        self.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get egress and back-pressure statistics."""
+        return {
+            "queue_depth": len(self._frames),
+            "queued_ms": len(self._frames) * self.frame_duration * 1000,
+            "max_queue_depth": self.max_queue_depth,
+            "frames_enqueued": self.frames_enqueued,
+            "frames_sent": self.frames_sent,
+            "frames_cleared": self.frames_cleared,
+            "frames_overflowed": self.frames_overflowed,
+            "send_errors": self.send_errors,
+            "clears": self.clears,
+            "catch_up_batches": self.catch_up_batches,
+            "max_lag_ms": self.max_lag_ms,
+        }
+
+    # ------------------------------------------------------------------
+    # Sender task
+    # ------------------------------------------------------------------
+    def _ensure_task(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        lead = self.lead_frames * self.frame_duration
+        while not self._closed:
+            if not self._frames:
+                if not self._partial:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    # Audio after an idle gap starts a fresh playout clock
+                    now = time.monotonic()
+                    if self._clock is None or self._clock < now:
+                        self._clock = now
+                    continue
+
+                # Give the producer one frame time to complete the frame,
+                # then finish it with silence
+                waited = time.monotonic() - self._last_enqueue
+                if waited < self.frame_duration:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(
+                            self._wakeup.wait(), self.frame_duration - waited
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                padding = self.frame_size - len(self._partial)
+                self._partial += bytes([self.silence_byte]) * padding
+                self._frames.append(bytes(self._partial))
+                self._partial.clear()
+                self.frames_enqueued += 1
+
+            now = time.monotonic()
+            if self._clock is None:
+                self._clock = now
+            lag = now - self._clock
+            if lag > self.frame_duration:
+                # The loop stalled; everything already due goes out in one batch
+                self.catch_up_batches += 1
+                self.max_lag_ms = max(self.max_lag_ms, lag * 1000)
+
+            while self._frames and self._clock <= now + lead:
+                frame = self._frames.popleft()
+                try:
+                    await self._send_frame(frame)
+                    self.frames_sent += 1
+                except Exception as e:
+                    self.send_errors += 1
+                    logger.error(f"Error sending paced audio frame: {e}")
+                self._clock += self.frame_duration
+
+            delay = self._clock - lead - time.monotonic()
+            if delay > 0 and self._frames:
+                await asyncio.sleep(delay)
@@ -0,0 +1,328 @@
+"""
+Incremental encoders for call recordings.
+
+A recorder in streaming mode writes one stereo stream (left = caller,
+right = bot) through a ``RecordingEncoder``. WAV keeps the historical
+uncompressed output. FLAC is lossless and typically cuts speech to a third
+of the WAV size or less for very little CPU. Ogg-Opus is lossy and much
+smaller again, at a higher encode cost.
+
+FLAC and Opus are written through ``soundfile`` (libsndfile), which encodes
+each block as it is written, so nothing is buffered until the end of the
+call. Per-channel mono WAV files are produced on demand by
+``extract_channel``.
+"""
+
+import logging
+import os
+import time
+import wave
+from pathlib import Path
+from typing import Any, Dict, Optional, Type, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Sample rates the Opus codec accepts
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+
+class RecordingEncoder:
+    """Writes interleaved PCM16 frames to an output file incrementally.
+
+    Subclasses implement ``_open``, ``_encode`` and ``_close``. ``write``
+    measures the CPU time spent encoding on the calling thread.
+
+    Attributes:
+        format: Short format name used in configuration
+        extension: File extension including the dot
+    """
+
+    format = ""
+    extension = ""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        sample_rate: int,
+        channels: int = 2,
+        compression_level: Optional[float] = None,
+    ):
+        """
+        Initialize the encoder. The file is opened by open().
+
+        Args:
+            path: Output file path
+            sample_rate: Sample rate of the PCM16 frames
+            channels: Interleaved channels per frame
+            compression_level: Codec effort/quality from 0.0 to 1.0, or None
+                for the codec default
+        """
+        self.path = Path(path)
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.compression_level = compression_level
+
+        self.frames_written = 0
+        self.input_bytes = 0
+        self.encode_cpu_seconds = 0.0
+        self._output_bytes = 0
+        self._open_file = False
+
+    def open(self) -> None:
+        """Create the output file."""
+        self._open()
+        self._open_file = True
+
+    def write(self, frames: np.ndarray) -> None:
+        """
+        Encode a block of frames.
+
+        Args:
+            frames: int16 array shaped (frames, channels)
+        """
+        if not self._open_file or not len(frames):
+            return
+        start = time.thread_time()
+        self._encode(frames)
+        self.encode_cpu_seconds += time.thread_time() - start
+        self.frames_written += len(frames)
+        self.input_bytes += frames.nbytes
+
+    def close(self) -> None:
+        """Finish the stream and close the output file."""
+        if not self._open_file:
+            return
+        start = time.thread_time()
+        try:
+            self._close()
+        finally:
+            self.encode_cpu_seconds += time.thread_time() - start
+            self._open_file = False
+            self._output_bytes = self._file_size()
+
+    @property
+    def output_bytes(self) -> int:
+        """Bytes written to the output file so far."""
+        return self._file_size() if self._open_file else self._output_bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get size and CPU cost statistics."""
+        output_bytes = self.output_bytes
+        audio_seconds = self.frames_written / self.sample_rate
+        return {
+            "format": self.format,
+            "path": str(self.path),
+            "audio_seconds": audio_seconds,
+            "input_bytes": self.input_bytes,
+            "output_bytes": output_bytes,
+            "compression_ratio": (
+                self.input_bytes / output_bytes if output_bytes else 0.0
+            ),
+            "encode_cpu_ms": self.encode_cpu_seconds * 1000,
+            # CPU seconds spent per second of recorded audio
+            "encode_cpu_per_audio_second": (
+                self.encode_cpu_seconds / audio_seconds if audio_seconds else 0.0
+            ),
+        }
+
+    def _file_size(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def _open(self) -> None:
+        raise NotImplementedError
+
+    def _encode(self, frames: np.ndarray) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        raise NotImplementedError
+
+
+class WavEncoder(RecordingEncoder):
+    """Uncompressed 16-bit WAV."""
+
+    format = "wav"
+    extension = ".wav"
+
+    def _open(self) -> None:
+        self._wav = wave.open(str(self.path), "wb")
+        self._wav.setnchannels(self.channels)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(self.sample_rate)
+
+    def _encode(self, frames: np.ndarray) -> None:
+        self._wav.writeframes(frames.tobytes())
+
+    def _close(self) -> None:
+        self._wav.close()
+
+
+class SoundFileEncoder(RecordingEncoder):
+    """Compressed output through libsndfile."""
+
+    sf_format = ""
+    sf_subtype = ""
+
+    def _open(self) -> None:
+        try:
+            import soundfile
+        except ImportError as e:
+            raise RuntimeError(
+                f"{self.format} recordings require soundfile. "
+                "Install with: pip install soundfile"
+            ) from e
+
+        self._file = soundfile.SoundFile(
+            str(self.path),
+            mode="w",
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            format=self.sf_format,
+            subtype=self.sf_subtype,
+            compression_level=self.compression_level,
+        )
+
+    def _encode(self, frames: np.ndarray) -> None:
+        self._file.write(frames)
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class FlacEncoder(SoundFileEncoder):
+    """Lossless FLAC."""
+
+    format = "flac"
+    extension = ".flac"
+    sf_format = "FLAC"
+    sf_subtype = "PCM_16"
+
+
+class OpusEncoder(SoundFileEncoder):
+    """Opus in an Ogg container."""
+
+    format = "opus"
+    extension = ".opus"
+    sf_format = "OGG"
+    sf_subtype = "OPUS"
+
+    def __init__(self, path, sample_rate, channels=2, compression_level=None):
+        if sample_rate not in OPUS_SAMPLE_RATES:
+            raise ValueError(
+                f"Opus does not support {sample_rate}Hz; "
+                f"use one of {OPUS_SAMPLE_RATES}"
+            )
+        super().__init__(path, sample_rate, channels, compression_level)
+
+
+_ENCODERS: Dict[str, Type[RecordingEncoder]] = {
+    cls.format: cls for cls in (WavEncoder, FlacEncoder, OpusEncoder)
+}
+
+RECORDING_FORMATS = tuple(_ENCODERS)
+
+
+def get_encoder_class(recording_format: str) -> Type[RecordingEncoder]:
+    """
+    Look up the encoder for a format name.
+
+    Args:
+        recording_format: One of RECORDING_FORMATS
+
+    Returns:
+        The encoder class
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    try:
+        return _ENCODERS[recording_format.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported recording format: {recording_format}. "
+            f"Supported formats: {', '.join(RECORDING_FORMATS)}"
+        ) from None
+
+
+def create_recording_encoder(
+    recording_format: str,
+    path: Union[str, Path],
+    sample_rate: int,
+    channels: int = 2,
+    compression_level: Optional[float] = None,
+) -> RecordingEncoder:
+    """
+    Create an encoder for a format name.
+
+    Args:
+        recording_format: One of RECORDING_FORMATS
+        path: Output file path
+        sample_rate: Sample rate of the PCM16 frames
+        channels: Interleaved channels per frame
+        compression_level: Codec effort/quality from 0.0 to 1.0, or None
+
+    Returns:
+        An unopened encoder
+    """
+    encoder_class = get_encoder_class(recording_format)
+    return encoder_class(path, sample_rate, channels, compression_level)
+
+
+def extract_channel(
+    source_path: Union[str, Path],
+    channel: int,
+    output_path: Union[str, Path],
+    block_frames: int = 16000,
+) -> Path:
+    """
+    Write one channel of a stereo recording to a mono 16-bit WAV file.
+
+    The source is read block by block, so memory use does not depend on the
+    length of the recording.
+
+    Args:
+        source_path: Stereo WAV, FLAC or Ogg-Opus recording
+        channel: Channel index to extract (0 = caller, 1 = bot)
+        output_path: Mono WAV file to write
+        block_frames: Frames read per block
+
+    Returns:
+        The output path
+    """
+    source_path = Path(source_path)
+    output_path = Path(output_path)
+
+    if source_path.suffix.lower() == ".wav":
+        with wave.open(str(source_path), "rb") as src:
+            channels = src.getnchannels()
+            sample_rate = src.getframerate()
+            with wave.open(str(output_path), "wb") as out:
+                out.setnchannels(1)
+                out.setsampwidth(2)
+                out.setframerate(sample_rate)
+                while True:
+                    data = src.readframes(block_frames)
+                    if not data:
+                        break
+                    frames = np.frombuffer(data, dtype=np.int16)
+                    out.writeframes(frames[channel::channels].tobytes())
+        return output_path
+
+    import soundfile
+
+    info = soundfile.info(str(source_path))
+    with wave.open(str(output_path), "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(info.samplerate)
+        for block in soundfile.blocks(
+            str(source_path), blocksize=block_frames, dtype="int16", always_2d=True
+        ):
+            out.writeframes(np.ascontiguousarray(block[:, channel]).tobytes())
+    logger.debug(f"Extracted channel {channel} of {source_path} to {output_path}")
+    return output_path
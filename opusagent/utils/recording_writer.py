@@ -0,0 +1,327 @@
+"""
+Background disk writer for call recordings.
+
+Buffering a whole call in memory and mixing the stereo file down at the end
+makes recorder memory grow with call length. Writing WAV frames inside the
+audio handlers also puts disk I/O on the event loop.
+
+``StreamingRecordingWriter`` avoids both. Producers hand PCM16 chunks to a
+bounded queue and return at once. A single writer thread appends them to the
+caller and bot mono files and interleaves the stereo file as it goes.
+
+Both stereo channels share one timeline in samples since the start of the
+recording. A chunk is placed at its arrival time, or right after the previous
+chunk of its channel if that is later. Gaps between bursts become silence.
+Stereo frames are written as soon as both channels are known up to that point.
+A channel that has gone quiet counts as silent once the wall clock has moved
+past it by ``max_skew_seconds``. Memory therefore stays bounded by the skew
+between the two channels, not by the length of the call.
+
+The stereo stream goes through a ``RecordingEncoder``, so it can be written
+as WAV, FLAC or Ogg-Opus. The mono files are optional.
+"""
+
+import logging
+import queue
+import threading
+import time
+import wave
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+
+import numpy as np
+
+from opusagent.utils.recording_encoder import create_recording_encoder
+
+logger = logging.getLogger(__name__)
+
+# Stereo channel indices (left = caller, right = bot)
+CALLER_CHANNEL = 0
+BOT_CHANNEL = 1
+
+_STOP = object()
+
+
+class _ChannelTimeline:
+    """Samples of one channel not yet written to the stereo file."""
+
+    def __init__(self):
+        self._chunks: Deque[np.ndarray] = deque()
+        self.length = 0
+
+    def append(self, samples: np.ndarray) -> None:
+        if len(samples):
+            self._chunks.append(samples)
+            self.length += len(samples)
+
+    def append_silence(self, count: int) -> None:
+        self.append(np.zeros(count, dtype=np.int16))
+
+    def take(self, count: int) -> np.ndarray:
+        """Remove ``count`` samples, padding with silence past the end."""
+        out = np.zeros(count, dtype=np.int16)
+        filled = 0
+        while filled < count and self._chunks:
+            chunk = self._chunks[0]
+            used = min(len(chunk), count - filled)
+            out[filled : filled + used] = chunk[:used]
+            filled += used
+            if used == len(chunk):
+                self._chunks.popleft()
+            else:
+                self._chunks[0] = chunk[used:]
+        self.length = max(0, self.length - count)
+        return out
+
+
+class StreamingRecordingWriter:
+    """Writes the caller, bot and stereo recording files from a background thread.
+
+    Attributes:
+        encoder: Encoder of the stereo stream
+        sample_rate: Sample rate of all three files
+        max_queue_chunks: Queue bound; chunks beyond it are dropped
+        max_skew_seconds: How long a quiet channel may lag the clock before
+            it is treated as silent
+        max_pending_seconds: Upper bound on audio held for stereo alignment
+    """
+
+    def __init__(
+        self,
+        caller_path: Optional[Union[str, Path]],
+        bot_path: Optional[Union[str, Path]],
+        stereo_path: Union[str, Path],
+        sample_rate: int,
+        sample_width: int = 2,
+        max_queue_chunks: int = 500,
+        max_skew_seconds: float = 0.5,
+        max_pending_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        stereo_format: str = "wav",
+        compression_level: Optional[float] = None,
+    ):
+        """
+        Initialize the writer. Files are opened by start().
+
+        Args:
+            caller_path: Caller mono WAV path, or None to skip the file
+            bot_path: Bot mono WAV path, or None to skip the file
+            stereo_path: Stereo file path (left = caller, right = bot)
+            sample_rate: Sample rate of the PCM16 audio passed to write()
+            sample_width: Bytes per sample
+            max_queue_chunks: Maximum chunks waiting for the writer thread
+            max_skew_seconds: Lag after which a quiet channel counts as silent
+            max_pending_seconds: Maximum audio held back for stereo alignment
+            clock: Monotonic clock in seconds
+            stereo_format: Stereo encoder format (wav, flac or opus)
+            compression_level: Encoder compression level, None for default
+
+        Raises:
+            ValueError: If the stereo format or sample rate is not supported
+        """
+        self.caller_path = Path(caller_path) if caller_path else None
+        self.bot_path = Path(bot_path) if bot_path else None
+        self.stereo_path = Path(stereo_path)
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.max_queue_chunks = max_queue_chunks
+        self.max_skew_seconds = max_skew_seconds
+        self.max_pending_seconds = max_pending_seconds
+        self._clock = clock
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_chunks)
+        self._thread: Optional[threading.Thread] = None
+        self._start_time = 0.0
+        self._mono: List[Optional[wave.Wave_write]] = [None, None]
+        self.encoder = create_recording_encoder(
+            stereo_format, self.stereo_path, sample_rate, 2, compression_level
+        )
+        self._timelines = [_ChannelTimeline(), _ChannelTimeline()]
+        # Stereo frames written so far; timeline position of the pending audio
+        self._stereo_position = 0
+
+        # Statistics
+        self.chunks_queued = 0
+        self.chunks_written = 0
+        self.chunks_dropped = 0
+        self.max_queue_depth = 0
+        self.stereo_frames_written = 0
+        self.silence_samples_inserted = 0
+        self.max_pending_samples = 0
+        self.write_errors = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the writer thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Open the output files and start the writer thread."""
+        if self.running:
+            return
+        self._mono = [self._open(self.caller_path), self._open(self.bot_path)]
+        self.encoder.open()
+        self._start_time = self._clock()
+        self._thread = threading.Thread(
+            target=self._run, name="recording-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, channel: int, pcm16: bytes) -> bool:
+        """
+        Queue a chunk for writing without blocking.
+
+        Args:
+            channel: CALLER_CHANNEL or BOT_CHANNEL
+            pcm16: PCM16 audio at ``sample_rate``
+
+        Returns:
+            True if queued, False if the writer is stopped or the queue is full
+        """
+        if not self.running or not pcm16:
+            return False
+        try:
+            self._queue.put_nowait((channel, self._clock(), pcm16))
+        except queue.Full:
+            self.chunks_dropped += 1
+            if self.chunks_dropped == 1 or self.chunks_dropped % 100 == 0:
+                logger.warning(
+                    f"Recording writer queue full, dropped {self.chunks_dropped} chunks"
+                )
+            return False
+        self.chunks_queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Write everything still queued, finish the stereo file and close files.
+
+        Blocks until the writer thread exits; call it off the event loop.
+
+        Args:
+            timeout: Maximum time to wait for the writer thread
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.error("Recording writer did not drain its queue before close")
+            return
+        thread.join(timeout)
+        self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer and back-pressure statistics."""
+        return {
+            "running": self.running,
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": self.max_queue_depth,
+            "chunks_queued": self.chunks_queued,
+            "chunks_written": self.chunks_written,
+            "chunks_dropped": self.chunks_dropped,
+            "stereo_frames_written": self.stereo_frames_written,
+            "silence_samples_inserted": self.silence_samples_inserted,
+            "max_pending_ms": self.max_pending_samples / self.sample_rate * 1000,
+            "write_errors": self.write_errors,
+        }
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+    def _open(self, path: Optional[Path]) -> Optional[wave.Wave_write]:
+        if path is None:
+            return None
+        wav = wave.open(str(path), "wb")
+        wav.setnchannels(1)
+        wav.setsampwidth(self.sample_width)
+        wav.setframerate(self.sample_rate)
+        return wav
+
+    def _run(self) -> None:
+        # Wake up regularly so a quiet channel does not hold back stereo output
+        tick = min(0.1, self.max_skew_seconds / 2) or 0.1
+        while True:
+            try:
+                item = self._queue.get(timeout=tick)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                break
+            try:
+                if item is not None:
+                    self._write_chunk(*item)
+                self._flush_stereo(final=False)
+            except Exception as e:
+                self.write_errors += 1
+                logger.error(f"Error writing recording audio: {e}")
+
+        try:
+            self._flush_stereo(final=True)
+        except Exception as e:
+            self.write_errors += 1
+            logger.error(f"Error finishing stereo recording: {e}")
+        for wav in self._mono:
+            if wav is not None:
+                try:
+                    wav.close()
+                except Exception as e:
+                    logger.error(f"Error closing recording file: {e}")
+        self._mono = [None, None]
+        try:
+            self.encoder.close()
+        except Exception as e:
+            self.write_errors += 1
+            logger.error(f"Error finishing stereo recording: {e}")
+
+    def _position(self, timestamp: float) -> int:
+        return round((timestamp - self._start_time) * self.sample_rate)
+
+    def _write_chunk(self, channel: int, arrival: float, pcm16: bytes) -> None:
+        mono = self._mono[channel]
+        if mono is not None:
+            mono.writeframes(pcm16)
+
+        samples = np.frombuffer(pcm16, dtype=np.int16)
+        timeline = self._timelines[channel]
+        end = self._stereo_position + timeline.length
+        # The chunk ended on arrival unless its channel is already further on
+        start = max(end, self._position(arrival) - len(samples))
+        if start > end:
+            timeline.append_silence(start - end)
+            self.silence_samples_inserted += start - end
+        timeline.append(samples)
+        self.chunks_written += 1
+
+    def _flush_stereo(self, final: bool) -> None:
+        caller, bot = self._timelines
+        pending = max(caller.length, bot.length)
+        self.max_pending_samples = max(self.max_pending_samples, pending)
+
+        if final:
+            ready = pending
+        else:
+            # A channel is complete up to its buffered audio, or up to the
+            # clock (less the skew allowance) if it has gone quiet
+            quiet_until = (
+                self._position(self._clock())
+                - int(self.max_skew_seconds * self.sample_rate)
+                - self._stereo_position
+            )
+            ready = min(max(caller.length, quiet_until), max(bot.length, quiet_until))
+            # Never hold back more than max_pending_seconds of audio
+            limit = int(self.max_pending_seconds * self.sample_rate)
+            ready = max(ready, pending - limit)
+
+        if ready <= 0:
+            return
+
+        frames = np.empty((ready, 2), dtype=np.int16)
+        frames[:, CALLER_CHANNEL] = caller.take(ready)
+        frames[:, BOT_CHANNEL] = bot.take(ready)
+        self.encoder.write(frames)
+        self._stereo_position += ready
+        self.stereo_frames_written += ready
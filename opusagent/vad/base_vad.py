@@ -13,6 +13,14 @@ class BaseVAD(ABC):
         """Process audio data and return VAD result (e.g., speech probability, is_speech)."""
         pass
 
+    async def process_audio_async(self, audio_data) -> dict:
+        """Process audio data from async code.
+
+        Backends that can run inference off the event loop override this;
+        the default simply calls process_audio().
+        """
+        return self.process_audio(audio_data)
+
     @abstractmethod
     def reset(self):
         """Reset VAD state."""
@@ -0,0 +1,158 @@
+"""
+Batched Silero inference shared by the torch and ONNX backends.
+
+Both the torch ``VADInferenceService`` and the ONNX ``OnnxVADBatcher`` serve
+one model to many calls: requests queued by the calls are collected by a
+``BatchWorker`` and run as batched forward passes on its thread, with every
+stream's recurrent state gathered into the batch and scattered back.
+
+``VADBatchWorker`` holds what they have in common: queuing, the grouping of a
+batch into forward passes, result delivery and statistics. A stream's chunks
+must run in order, so a stream appears at most once per forward pass and its
+repeated requests go to a later round; within a round, streams are grouped by
+sample rate. Backends only load their model (``_prepare``) and implement one
+forward pass over a group of requests (``_forward``).
+
+This module does not import torch, so the ONNX backend can use it.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import numpy as np
+
+from opusagent.utils.batch_worker import BatchWorker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VADRequest:
+    stream: Any
+    chunks: np.ndarray
+    future: concurrent.futures.Future = field(default_factory=concurrent.futures.Future)
+
+
+def group_requests(batch: List[VADRequest]) -> List[List[List[VADRequest]]]:
+    """
+    Split a batch into rounds of forward passes.
+
+    Each round holds at most one request per stream, so a stream's requests
+    run in submission order; within a round, requests are grouped by the
+    sample rate of their stream.
+
+    Args:
+        batch: Requests in submission order
+
+    Returns:
+        For each round, the groups of requests sharing a forward pass
+    """
+    rounds: List[List[VADRequest]] = []
+    for request in batch:
+        for round_requests in rounds:
+            if all(r.stream is not request.stream for r in round_requests):
+                round_requests.append(request)
+                break
+        else:
+            rounds.append([request])
+
+    grouped = []
+    for round_requests in rounds:
+        by_rate: Dict[int, List[VADRequest]] = defaultdict(list)
+        for request in round_requests:
+            by_rate[request.stream.sample_rate].append(request)
+        grouped.append(list(by_rate.values()))
+    return grouped
+
+
+class VADBatchWorker(BatchWorker[VADRequest]):
+    """Runs VAD requests from many streams as batched forward passes.
+
+    Attributes:
+        max_batch_size: Maximum number of requests merged into one batch
+        batch_window_ms: Time to wait for more requests after the first one
+    """
+
+    def __init__(self, max_batch_size: int = 64, batch_window_ms: float = 2.0):
+        """
+        Initialize the worker. The thread starts on the first request.
+
+        Args:
+            max_batch_size: Maximum number of requests merged into one batch
+            batch_window_ms: Time to wait for more requests after the first one
+        """
+        super().__init__(max_batch_size, batch_window_ms)
+
+        # Statistics
+        self.batches_run = 0
+        self.requests_served = 0
+        self.chunks_processed = 0
+        self.total_inference_time = 0.0
+        self.max_batch_seen = 0
+
+    def submit(self, stream: Any, chunks: np.ndarray) -> concurrent.futures.Future:
+        """
+        Queue chunks of one stream for inference.
+
+        Args:
+            stream: Recurrent state of the stream the chunks belong to
+            chunks: Array of shape (num_chunks, chunk_size), float32
+
+        Returns:
+            Future resolving to an array of per-chunk speech probabilities
+        """
+        return self._submit(VADRequest(stream, np.asarray(chunks, dtype=np.float32)))
+
+    async def infer(self, stream: Any, chunks: np.ndarray) -> np.ndarray:
+        """Run inference without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(stream, chunks))
+
+    def infer_sync(self, stream: Any, chunks: np.ndarray) -> np.ndarray:
+        """Run inference and block until the result is available."""
+        return self.submit(stream, chunks).result()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get inference statistics."""
+        return {
+            "running": self.running,
+            "batches_run": self.batches_run,
+            "requests_served": self.requests_served,
+            "chunks_processed": self.chunks_processed,
+            "avg_batch_size": self.requests_served / max(self.batches_run, 1),
+            "max_batch_size": self.max_batch_seen,
+            "avg_inference_ms": (
+                self.total_inference_time / max(self.batches_run, 1) * 1000
+            ),
+            "queue_depth": self.queue_depth,
+        }
+
+    def _process_batch(self, batch: List[VADRequest]) -> None:
+        start = time.perf_counter()
+
+        for groups in group_requests(batch):
+            for requests in groups:
+                try:
+                    results = self._forward(requests[0].stream.sample_rate, requests)
+                except Exception as e:
+                    # A failed pass fails its own requests only
+                    logger.error(f"{self.thread_name} batch inference failed: {e}")
+                    for request in requests:
+                        request.future.set_exception(e)
+                    continue
+                for request, probs in zip(requests, results):
+                    request.future.set_result(probs)
+                    self.chunks_processed += len(probs)
+
+        self.batches_run += 1
+        self.requests_served += len(batch)
+        self.max_batch_seen = max(self.max_batch_seen, len(batch))
+        self.total_inference_time += time.perf_counter() - start
+
+    def _forward(self, sample_rate: int, requests: List[VADRequest]) -> List[np.ndarray]:
+        """Run the chunks of distinct streams at one sample rate, in step."""
+        raise NotImplementedError
@@ -0,0 +1,347 @@
+"""
+Silero VAD on ONNX Runtime, without torch.
+
+Importing torch dominates worker start-up time and resident memory, yet VAD
+only needs the Silero forward pass. This backend runs the ONNX export of the
+Silero model shipped with the ``silero-vad`` package through onnxruntime on
+CPU.
+
+``SileroOnnxModel`` takes a ``[batch, samples]`` array and keeps no state of
+its own: the recurrent state and left context of every stream live in an
+``OnnxVADStreamState`` that is gathered into the batch before the forward pass
+and scattered back after it. One model can therefore serve many calls in a
+single vectorized pass.
+
+``OnnxVADBatcher`` does this for concurrent calls: requests arriving within a
+short window are merged and run as one batch on a dedicated thread, like the
+torch ``VADInferenceService`` (see ``batching``). ``SileroOnnxVAD`` is the per-call ``BaseVAD`` front
+end, reusing the configuration, chunking and speech hysteresis of ``SileroVAD``.
+"""
+
+import importlib.util
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .batching import VADBatchWorker, VADRequest
+from .silero_vad import SileroVAD
+
+logger = logging.getLogger(__name__)
+
+# Recurrent state width of the Silero v5 model
+_STATE_SIZE = 128
+# Samples of left context the model expects in front of every chunk
+_CONTEXT_SIZES = {16000: 64, 8000: 32}
+_CHUNK_SIZES = {16000: 512, 8000: 256}
+
+
+def default_model_path() -> str:
+    """
+    Locate the ONNX model bundled with the silero-vad package.
+
+    The package is located without importing it, since its ``__init__``
+    imports torch.
+
+    Returns:
+        Path to ``silero_vad.onnx``
+
+    Raises:
+        RuntimeError: If the silero-vad package is not installed
+    """
+    spec = importlib.util.find_spec("silero_vad")
+    if spec is None or not spec.submodule_search_locations:
+        raise RuntimeError(
+            "silero-vad package not installed. Please install with: "
+            "pip install silero-vad, or set VAD_ONNX_MODEL_PATH"
+        )
+    return os.path.join(spec.submodule_search_locations[0], "data", "silero_vad.onnx")
+
+
+class OnnxVADStreamState:
+    """Per-stream recurrent state for the ONNX Silero model.
+
+    Attributes:
+        sample_rate: Sample rate of the stream (8000 or 16000)
+        state: Recurrent state of shape (2, 128)
+        context: Trailing samples of the previous chunk
+    """
+
+    def __init__(self, sample_rate: int):
+        if sample_rate not in _CONTEXT_SIZES:
+            raise ValueError(
+                f"Unsupported VAD sample rate: {sample_rate}. Must be 8000 or 16000 Hz"
+            )
+        self.sample_rate = sample_rate
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the recurrent state."""
+        self.state = np.zeros((2, _STATE_SIZE), dtype=np.float32)
+        self.context = np.zeros(_CONTEXT_SIZES[self.sample_rate], dtype=np.float32)
+
+
+class SileroOnnxModel:
+    """Stateless, batched Silero VAD forward pass on onnxruntime.
+
+    ``InferenceSession.run`` is thread-safe, so one instance can be shared by
+    every call in the process.
+
+    Attributes:
+        model_path: Path of the loaded ONNX model
+        session: The onnxruntime inference session
+    """
+
+    def __init__(self, model_path: Optional[str] = None, num_threads: int = 1):
+        """
+        Load the ONNX model.
+
+        Args:
+            model_path: Path to a Silero ONNX model; defaults to the one
+                bundled with the silero-vad package
+            num_threads: Intra-op threads used by onnxruntime
+
+        Raises:
+            RuntimeError: If onnxruntime or the model is not available
+        """
+        try:
+            import onnxruntime
+        except ImportError:
+            raise RuntimeError(
+                "onnxruntime package not installed. Please install with: "
+                "pip install onnxruntime"
+            )
+
+        self.model_path = model_path or default_model_path()
+        if not os.path.exists(self.model_path):
+            raise RuntimeError(f"Silero ONNX model not found: {self.model_path}")
+
+        options = onnxruntime.SessionOptions()
+        options.inter_op_num_threads = 1
+        options.intra_op_num_threads = num_threads
+        self.session = onnxruntime.InferenceSession(
+            self.model_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        logger.info(f"Loaded Silero ONNX model from {self.model_path}")
+
+    def create_stream(self, sample_rate: int) -> OnnxVADStreamState:
+        """Create recurrent state for a new audio stream."""
+        return OnnxVADStreamState(sample_rate)
+
+    def forward(
+        self, audio: np.ndarray, streams: Sequence[OnnxVADStreamState]
+    ) -> np.ndarray:
+        """
+        Run one chunk for each stream in a single batched pass.
+
+        Args:
+            audio: Array of shape (batch, chunk_size), float32
+            streams: One state per row of ``audio``, all at the same sample rate.
+                Each state is advanced in place.
+
+        Returns:
+            Array of shape (batch,) with the speech probability of each row
+
+        Raises:
+            ValueError: If the batch does not match the streams or sample rate
+        """
+        if len(streams) != audio.shape[0]:
+            raise ValueError(
+                f"Got {audio.shape[0]} audio rows for {len(streams)} streams"
+            )
+        sample_rate = streams[0].sample_rate
+        if any(stream.sample_rate != sample_rate for stream in streams):
+            raise ValueError("All streams in a batch must share one sample rate")
+        if audio.shape[1] != _CHUNK_SIZES[sample_rate]:
+            raise ValueError(
+                f"Chunk size must be {_CHUNK_SIZES[sample_rate]} at {sample_rate}Hz, "
+                f"got {audio.shape[1]}"
+            )
+
+        context_size = _CONTEXT_SIZES[sample_rate]
+        inputs = np.concatenate(
+            [np.stack([stream.context for stream in streams]), audio], axis=1
+        ).astype(np.float32, copy=False)
+        state = np.stack([stream.state for stream in streams], axis=1)
+
+        output, new_state = self.session.run(
+            None,
+            {
+                "input": inputs,
+                "state": state,
+                "sr": np.array(sample_rate, dtype=np.int64),
+            },
+        )
+
+        for row, stream in enumerate(streams):
+            stream.state = new_state[:, row].copy()
+            stream.context = inputs[row, -context_size:].copy()
+        return output[:, 0]
+
+    def forward_sequences(
+        self, streams: Sequence[OnnxVADStreamState], chunks: Sequence[np.ndarray]
+    ) -> List[np.ndarray]:
+        """
+        Run a sequence of chunks for each stream, batching across streams.
+
+        Step ``n`` of every stream that has at least ``n + 1`` chunks runs in
+        the same forward pass, so chunks of one stream stay in order.
+
+        Args:
+            streams: Distinct stream states, all at the same sample rate
+            chunks: For each stream, an array of shape (num_chunks, chunk_size)
+
+        Returns:
+            For each stream, an array of per-chunk speech probabilities
+        """
+        results = [np.zeros(len(c), dtype=np.float32) for c in chunks]
+        steps = max((len(c) for c in chunks), default=0)
+        for step in range(steps):
+            active = [i for i, c in enumerate(chunks) if len(c) > step]
+            probs = self.forward(
+                np.stack([chunks[i][step] for i in active]),
+                [streams[i] for i in active],
+            )
+            for row, i in enumerate(active):
+                results[i][step] = probs[row]
+        return results
+
+
+class OnnxVADBatcher(VADBatchWorker):
+    """Merges VAD requests from concurrent calls into batched forward passes.
+
+    Requests are collected for up to ``batch_window_ms`` (or until
+    ``max_batch_size`` is reached) and run on a single worker thread, so the
+    event loop never blocks on inference and batches of the same stream run
+    in submission order.
+
+    Attributes:
+        model: Shared ONNX model
+        max_batch_size: Maximum number of requests merged into one batch
+        batch_window_ms: Time to wait for more requests after the first one
+    """
+
+    thread_name = "vad-onnx"
+
+    def __init__(
+        self,
+        model: SileroOnnxModel,
+        max_batch_size: int = 64,
+        batch_window_ms: float = 2.0,
+    ):
+        super().__init__(max_batch_size, batch_window_ms)
+        self.model = model
+
+    def _forward(
+        self, sample_rate: int, requests: List[VADRequest]
+    ) -> List[np.ndarray]:
+        return self.model.forward_sequences(
+            [r.stream for r in requests], [r.chunks for r in requests]
+        )
+
+
+_models: Dict[str, SileroOnnxModel] = {}
+_batcher: Optional[OnnxVADBatcher] = None
+_lock = threading.Lock()
+
+
+def get_onnx_model(model_path: Optional[str] = None) -> SileroOnnxModel:
+    """Get the process-wide ONNX model for a path, loading it on first use."""
+    path = model_path or default_model_path()
+    with _lock:
+        if path not in _models:
+            _models[path] = SileroOnnxModel(path)
+        return _models[path]
+
+
+def get_onnx_batcher(model_path: Optional[str] = None) -> OnnxVADBatcher:
+    """Get the process-wide batcher, creating it on first use."""
+    global _batcher
+    model = get_onnx_model(model_path)
+    with _lock:
+        if _batcher is None or _batcher.model is not model:
+            _batcher = OnnxVADBatcher(model)
+        return _batcher
+
+
+class SileroOnnxVAD(SileroVAD):
+    """Silero VAD backed by onnxruntime instead of torch.
+
+    Configuration, chunking and speech hysteresis are those of ``SileroVAD``.
+    The model's recurrent state is kept per instance in an
+    ``OnnxVADStreamState``. With ``shared`` set in the config, the model is
+    loaded once per process and async calls are batched across instances.
+
+    Example:
+        >>> vad = SileroOnnxVAD()
+        >>> vad.initialize({'sample_rate': 16000, 'threshold': 0.5})
+        >>> result = vad.process_audio(audio_data)
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._stream: Optional[OnnxVADStreamState] = None
+        self._batcher: Optional[OnnxVADBatcher] = None
+
+    def initialize(self, config: Dict[str, Any]) -> None:
+        """
+        Configure the VAD and load the ONNX model.
+
+        Args:
+            config: Configuration dictionary (see SileroVAD.initialize()), plus:
+                - onnx_model_path: Path to the Silero ONNX model
+                - shared: Use the process-wide model and async batcher
+
+        Raises:
+            RuntimeError: If onnxruntime or the model is not available
+            ValueError: If invalid configuration parameters are provided
+        """
+        self._configure(config)
+        model_path = config.get("onnx_model_path")
+        if config.get("shared", False):
+            self._batcher = get_onnx_batcher(model_path)
+            self.model = self._batcher.model
+        else:
+            self.model = SileroOnnxModel(model_path)
+        self._stream = self.model.create_stream(self.vad_sample_rate)
+
+    def process_audio(self, audio_data: np.ndarray) -> Dict[str, Any]:
+        """Process audio on the calling thread (see SileroVAD.process_audio())."""
+        if self.model is None or self._stream is None:
+            raise RuntimeError(
+                "Silero VAD model not initialized. Call initialize() first."
+            )
+        current_time = time.time()
+        probs = self.model.forward_sequences(
+            [self._stream], [self._prepare_chunks(audio_data)]
+        )[0]
+        return self._update_speech_state(float(probs.max()), current_time)
+
+    async def process_audio_async(self, audio_data: np.ndarray) -> Dict[str, Any]:
+        """Process audio, batched with other calls when the model is shared."""
+        if self._batcher is None:
+            return self.process_audio(audio_data)
+        if self._stream is None:
+            raise RuntimeError(
+                "Silero VAD model not initialized. Call initialize() first."
+            )
+        current_time = time.time()
+        probs = await self._batcher.infer(self._stream, self._prepare_chunks(audio_data))
+        return self._update_speech_state(float(probs.max()), current_time)
+
+    def reset(self) -> None:
+        """Reset speech state and the stream's recurrent state."""
+        super().reset()
+        if self._stream is not None:
+            self._stream.reset()
+
+    def cleanup(self) -> None:
+        """Release the model. A shared model stays loaded for other calls."""
+        self._stream = None
+        self._batcher = None
+        super().cleanup()
@@ -14,9 +14,9 @@ import time
 from typing import Any, Dict, Optional
 
 import numpy as np
-import torch
 
 from .base_vad import BaseVAD
+from opusagent.utils.resampler import StreamingResampler
 from opusagent.config.constants import DEFAULT_VAD_SAMPLE_RATE, DEFAULT_VAD_CHUNK_SIZE_16KHZ
 
 logger = logging.getLogger(__name__)
@@ -93,6 +93,29 @@ class SileroVAD(BaseVAD):
             - 16kHz: chunk_size = 512
             - 24kHz: Will be resampled to 16kHz for VAD processing
         """
+        self._configure(config)
+
+        try:
+            from silero_vad import load_silero_vad
+
+            # Load the Silero VAD model (uses default device)
+            self.model = load_silero_vad()
+        except ImportError:
+            raise RuntimeError(
+                "silero-vad package not installed. Please install with: "
+                "pip install silero-vad"
+            )
+
+    def _configure(self, config: Dict[str, Any]) -> None:
+        """
+        Validate and apply configuration without loading the model.
+
+        Args:
+            config: Configuration dictionary (see initialize())
+
+        Raises:
+            ValueError: If invalid configuration parameters are provided
+        """
         self.sample_rate = config.get("sample_rate", DEFAULT_VAD_SAMPLE_RATE)
         self.threshold = config.get("threshold", 0.5)
         self.silence_threshold = config.get("silence_threshold", 0.6)
@@ -139,16 +162,13 @@ class SileroVAD(BaseVAD):
         elif self.vad_sample_rate == 8000 and self.chunk_size != 256:
             self.chunk_size = 256
 
-        try:
-            from silero_vad import load_silero_vad
-
-            # Load the Silero VAD model (uses default device)
-            self.model = load_silero_vad()
-        except ImportError:
-            raise RuntimeError(
-                "silero-vad package not installed. Please install with: "
-                "pip install silero-vad"
-            )
+        # Stateful resampler so 24kHz streams reach the model without
+        # per-chunk FFT resampling or boundary artifacts
+        self._resampler = (
+            StreamingResampler(self.original_sample_rate, self.vad_sample_rate)
+            if self.needs_resampling
+            else None
+        )
 
     def process_audio(self, audio_data: np.ndarray) -> Dict[str, Any]:
         """
@@ -177,55 +197,67 @@ class SileroVAD(BaseVAD):
                 "Silero VAD model not initialized. Call initialize() first."
             )
 
+        # Imported here so torch-free backends can reuse this class
+        import torch
+
         current_time = time.time()
 
+        chunks = self._prepare_chunks(audio_data)
+        speech_probs = []
+        for chunk in chunks:
+            audio_tensor = torch.from_numpy(chunk).float()
+            speech_prob = self.model(audio_tensor, self.vad_sample_rate).item()
+            speech_probs.append(speech_prob)
+
+        # Use the maximum probability as the overall result
+        max_speech_prob = max(speech_probs) if speech_probs else 0.0
+
+        return self._update_speech_state(max_speech_prob, current_time)
+
+    def _prepare_chunks(self, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Resample and split audio into model-sized chunks.
+
+        Args:
+            audio_data: Input audio as numpy array (float32, -1.0 to 1.0, mono)
+
+        Returns:
+            Array of shape (num_chunks, chunk_size). Audio shorter than one
+            chunk is zero-padded; a trailing partial chunk is dropped.
+        """
         # Validate input audio format
         if audio_data.dtype != np.float32:
             audio_data = audio_data.astype(np.float32)
 
         # Handle resampling if needed (24kHz -> 16kHz)
-        if hasattr(self, 'needs_resampling') and self.needs_resampling:
-            try:
-                from scipy import signal
-                # Resample from original_sample_rate to vad_sample_rate
-                target_length = int(len(audio_data) * self.vad_sample_rate / self.original_sample_rate)
-                resampled_audio = signal.resample(audio_data, target_length)
-                audio_data = np.array(resampled_audio, dtype=np.float32)
-                logger.debug(f"Resampled audio from {self.original_sample_rate}Hz to {self.vad_sample_rate}Hz for VAD")
-            except ImportError:
-                logger.warning("scipy not available for resampling - VAD may not work correctly with 24kHz")
-                # Fall back to using original audio (may not work well)
-                pass
-
-        # Handle variable-length input by splitting into chunks
-        if len(audio_data) != self.chunk_size:
-            # Split audio into chunks of the correct size
-            chunks = []
-            for i in range(0, len(audio_data), self.chunk_size):
-                chunk = audio_data[i : i + self.chunk_size]
-                if len(chunk) == self.chunk_size:
-                    chunks.append(chunk)
-
-            if not chunks:
-                # Audio is too short, pad with zeros
-                padded_audio = np.zeros(self.chunk_size, dtype=np.float32)
-                padded_audio[: len(audio_data)] = audio_data
-                chunks = [padded_audio]
-
-            # Process each chunk and aggregate results
-            speech_probs = []
-            for chunk in chunks:
-                audio_tensor = torch.from_numpy(chunk).float()
-                speech_prob = self.model(audio_tensor, self.vad_sample_rate).item()
-                speech_probs.append(speech_prob)
-
-            # Use the maximum probability as the overall result
-            max_speech_prob = max(speech_probs) if speech_probs else 0.0
-        else:
-            # Audio is already the correct size - process directly
-            audio_tensor = torch.from_numpy(audio_data).float()
-            max_speech_prob = self.model(audio_tensor, self.vad_sample_rate).item()
+        if getattr(self, "_resampler", None) is not None:
+            audio_data = self._resampler.process_samples(audio_data)
+            logger.debug(f"Resampled audio from {self.original_sample_rate}Hz to {self.vad_sample_rate}Hz for VAD")
+
+        num_chunks = len(audio_data) // self.chunk_size
+        if num_chunks == 0:
+            # Audio is too short, pad with zeros
+            padded_audio = np.zeros((1, self.chunk_size), dtype=np.float32)
+            padded_audio[0, : len(audio_data)] = audio_data
+            return padded_audio
+
+        return audio_data[: num_chunks * self.chunk_size].reshape(
+            num_chunks, self.chunk_size
+        )
+
+    def _update_speech_state(
+        self, max_speech_prob: float, current_time: float
+    ) -> Dict[str, Any]:
+        """
+        Apply hysteresis to a speech probability and build the result dict.
+
+        Args:
+            max_speech_prob: Maximum speech probability for the processed audio
+            current_time: Wall-clock time of the processed audio
 
+        Returns:
+            Result dictionary as described in process_audio()
+        """
         # Enhanced speech detection with improved state management
         is_speech = max_speech_prob > self.threshold
         is_silence = max_speech_prob < self.silence_threshold
@@ -292,6 +324,8 @@ class SileroVAD(BaseVAD):
         self._last_speech_time = None
         self._consecutive_speech_count = 0
         self._consecutive_silence_count = 0
+        if getattr(self, "_resampler", None) is not None:
+            self._resampler.reset()
 
     def cleanup(self) -> None:
         """
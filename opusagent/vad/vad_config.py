@@ -23,4 +23,5 @@ def load_vad_config():
         'chunk_size': config.chunk_size,
         'confidence_history_size': config.confidence_history_size,
         'force_stop_timeout_ms': config.force_stop_timeout_ms,
+        'onnx_model_path': config.onnx_model_path,
     } 
\ No newline at end of file
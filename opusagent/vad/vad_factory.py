@@ -14,6 +14,7 @@ class VADFactory:
         
         Args:
             config (dict, optional): Configuration dictionary. If None, uses defaults.
+                Set ``shared`` to use the process-wide inference service.
             
         Returns:
             BaseVAD: Configured VAD instance
@@ -27,7 +28,20 @@ class VADFactory:
             
         backend = config.get('backend', 'silero')
         if backend == 'silero':
-            vad = SileroVAD()
+            # Shared mode loads the model once per process and batches
+            # inference for all calls on a dedicated thread
+            if config.get('shared', False):
+                from .vad_service import SharedSileroVAD
+                vad = SharedSileroVAD()
+            else:
+                vad = SileroVAD()
+            vad.initialize(config)
+            return vad
+        elif backend == 'silero_onnx':
+            # Same model on onnxruntime: no torch import, explicit per-stream
+            # state and batched inference across calls in shared mode
+            from .silero_onnx_vad import SileroOnnxVAD
+            vad = SileroOnnxVAD()
             vad.initialize(config)
             return vad
         else:
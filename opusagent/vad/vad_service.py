@@ -0,0 +1,207 @@
+"""
+Process-wide Silero VAD inference service.
+
+Building a ``SileroVAD`` per call reloads the model for every call, and running
+its forward pass inside the asyncio handler means VAD latency on one call
+stalls audio forwarding for every other call on the same worker.
+
+``VADInferenceService`` loads the model once per process and runs inference on
+a dedicated thread. Requests arriving from many calls within a short batching
+window are stacked into a single batched forward pass (see ``batching``). The
+recurrent state of each call lives in its own ``VADStreamState`` and is
+gathered into / scattered out of the batch around every forward pass, so calls
+never share state.
+
+``SharedSileroVAD`` is the per-call ``BaseVAD`` front end: it keeps the speech
+hysteresis state for one call and delegates model inference to the service.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import torch
+
+from .batching import VADBatchWorker, VADRequest
+from .silero_vad import SileroVAD
+
+logger = logging.getLogger(__name__)
+
+# Recurrent state width of the Silero v5 model
+_STATE_SIZE = 128
+# Samples of left context the model expects in front of every chunk
+_CONTEXT_SIZES = {16000: 64, 8000: 32}
+
+
+class VADStreamState:
+    """Per-stream recurrent state for the shared Silero model.
+
+    Attributes:
+        sample_rate: Sample rate of the stream (8000 or 16000)
+        state: LSTM state tensor of shape (2, 128)
+        context: Trailing samples of the previous chunk
+    """
+
+    def __init__(self, sample_rate: int):
+        if sample_rate not in _CONTEXT_SIZES:
+            raise ValueError(
+                f"Unsupported VAD sample rate: {sample_rate}. Must be 8000 or 16000 Hz"
+            )
+        self.sample_rate = sample_rate
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the recurrent state."""
+        self.state = torch.zeros(2, _STATE_SIZE)
+        self.context = torch.zeros(_CONTEXT_SIZES[self.sample_rate])
+
+
+class VADInferenceService(VADBatchWorker):
+    """Shared, batched Silero VAD inference running off the event loop.
+
+    Attributes:
+        max_batch_size: Maximum number of requests merged into one batch
+        batch_window_ms: Time to wait for more requests after the first one
+    """
+
+    thread_name = "vad-inference"
+
+    def __init__(self, max_batch_size: int = 64, batch_window_ms: float = 2.0):
+        """
+        Initialize the service. The model is loaded lazily by start().
+
+        Args:
+            max_batch_size: Maximum number of requests merged into one batch
+            batch_window_ms: Time to wait for more requests after the first one
+        """
+        super().__init__(max_batch_size, batch_window_ms)
+        self.model: Optional[Any] = None
+
+    def _prepare(self) -> None:
+        """Load the model (once) before the inference thread starts.
+
+        Raises:
+            RuntimeError: If silero-vad package is not installed
+        """
+        if self.model is None:
+            try:
+                from silero_vad import load_silero_vad
+            except ImportError:
+                raise RuntimeError(
+                    "silero-vad package not installed. Please install with: "
+                    "pip install silero-vad"
+                )
+            self.model = load_silero_vad()
+            logger.info("Loaded shared Silero VAD model")
+
+    def create_stream(self, sample_rate: int) -> VADStreamState:
+        """Create recurrent state for a new audio stream."""
+        return VADStreamState(sample_rate)
+
+    def _forward(
+        self, sample_rate: int, requests: List[VADRequest]
+    ) -> List[np.ndarray]:
+        model = self.model._model if sample_rate == 16000 else self.model._model_8k
+        context_size = _CONTEXT_SIZES[sample_rate]
+        results = [np.zeros(len(r.chunks), dtype=np.float32) for r in requests]
+        steps = max(len(r.chunks) for r in requests)
+
+        with torch.no_grad():
+            for step in range(steps):
+                active = [i for i, r in enumerate(requests) if len(r.chunks) > step]
+                streams = [requests[i].stream for i in active]
+
+                audio = torch.from_numpy(
+                    np.stack([requests[i].chunks[step] for i in active])
+                )
+                context = torch.stack([s.context for s in streams])
+                state = torch.stack([s.state for s in streams], dim=1)
+
+                inputs = torch.cat([context, audio], dim=1)
+                output, new_state = model(inputs, state)
+
+                new_context = inputs[:, -context_size:]
+                probs = output[:, 0].tolist()
+                for row, (i, stream) in enumerate(zip(active, streams)):
+                    stream.state = new_state[:, row].clone()
+                    stream.context = new_context[row].clone()
+                    results[i][step] = probs[row]
+
+        return results
+
+
+_service: Optional[VADInferenceService] = None
+_service_lock = threading.Lock()
+
+
+def get_vad_service() -> VADInferenceService:
+    """Get the process-wide VAD inference service, creating it on first use."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = VADInferenceService()
+        return _service
+
+
+class SharedSileroVAD(SileroVAD):
+    """Silero VAD that delegates inference to the shared service.
+
+    Speech hysteresis and the model's recurrent state stay per instance;
+    the model weights and the inference thread are shared process-wide.
+    """
+
+    def __init__(self, service: Optional[VADInferenceService] = None) -> None:
+        super().__init__()
+        self._service = service
+        self._stream: Optional[VADStreamState] = None
+
+    def initialize(self, config: Dict[str, Any]) -> None:
+        """
+        Configure the VAD and attach to the shared inference service.
+
+        Args:
+            config: Configuration dictionary (see SileroVAD.initialize())
+
+        Raises:
+            RuntimeError: If silero-vad package is not installed
+            ValueError: If invalid configuration parameters are provided
+        """
+        self._configure(config)
+        if self._service is None:
+            self._service = get_vad_service()
+        self._service.start()
+        self.model = self._service.model
+        self._stream = self._service.create_stream(self.vad_sample_rate)
+
+    def process_audio(self, audio_data: np.ndarray) -> Dict[str, Any]:
+        """Process audio, blocking until the shared service returns."""
+        if self.model is None or self._stream is None:
+            raise RuntimeError(
+                "Silero VAD model not initialized. Call initialize() first."
+            )
+        current_time = time.time()
+        probs = self._service.infer_sync(self._stream, self._prepare_chunks(audio_data))
+        return self._update_speech_state(float(probs.max()), current_time)
+
+    async def process_audio_async(self, audio_data: np.ndarray) -> Dict[str, Any]:
+        """Process audio without blocking the event loop."""
+        if self.model is None or self._stream is None:
+            raise RuntimeError(
+                "Silero VAD model not initialized. Call initialize() first."
+            )
+        current_time = time.time()
+        probs = await self._service.infer(self._stream, self._prepare_chunks(audio_data))
+        return self._update_speech_state(float(probs.max()), current_time)
+
+    def reset(self) -> None:
+        """Reset speech state and the stream's recurrent state."""
+        super().reset()
+        if self._stream is not None:
+            self._stream.reset()
+
+    def cleanup(self) -> None:
+        """Detach from the shared service. The shared model stays loaded."""
+        self._stream = None
+        super().cleanup()
@@ -1,15 +1,22 @@
 # __init__.py for voiceprint module
-from .recognizer import OpusAgentVoiceRecognizer
+from .recognizer import OpusAgentVoiceRecognizer, get_voice_encoder, get_voice_recognizer
 from .models import Voiceprint, VoiceFingerprintConfig
 from .storage import JSONStorage, RedisStorage, SQLiteStorage
+from .index import VoiceprintIndex, IVFVoiceprintIndex
+from .streaming import StreamingCallerIdentifier
 from .config import VoiceFingerprintConfig as Config
 
 __all__ = [
     'OpusAgentVoiceRecognizer',
+    'get_voice_encoder',
+    'get_voice_recognizer',
     'Voiceprint', 
     'VoiceFingerprintConfig',
     'JSONStorage',
     'RedisStorage', 
     'SQLiteStorage',
+    'VoiceprintIndex',
+    'IVFVoiceprintIndex',
+    'StreamingCallerIdentifier',
     'Config'
 ] 
\ No newline at end of file
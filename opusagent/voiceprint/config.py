@@ -8,4 +8,10 @@ class VoiceFingerprintConfig:
         self.storage_backend = os.getenv('VOICE_STORAGE_BACKEND', 'json')
         self.storage_path = os.getenv('VOICE_STORAGE_PATH', 'voiceprints.json')
         self.min_audio_quality = float(os.getenv('VOICE_MIN_AUDIO_QUALITY', '0.6'))
-        self.max_voiceprints_per_caller = int(os.getenv('VOICE_MAX_VOICEPRINTS_PER_CALLER', '3')) 
\ No newline at end of file
+        self.max_voiceprints_per_caller = int(os.getenv('VOICE_MAX_VOICEPRINTS_PER_CALLER', '3')) 
+        # Identify callers from the first seconds of inbound audio
+        self.streaming_identification = os.getenv('VOICE_STREAMING_IDENTIFICATION', 'false').lower() == 'true'
+        self.streaming_window_seconds = float(os.getenv('VOICE_STREAMING_WINDOW_SECONDS', '1.6'))
+        self.streaming_hop_seconds = float(os.getenv('VOICE_STREAMING_HOP_SECONDS', '0.8'))
+        self.streaming_max_seconds = float(os.getenv('VOICE_STREAMING_MAX_SECONDS', '10.0'))
+        self.streaming_required_agreement = int(os.getenv('VOICE_STREAMING_REQUIRED_AGREEMENT', '2'))
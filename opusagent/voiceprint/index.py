@@ -0,0 +1,449 @@
+"""
+Voiceprint Index Module
+
+This module provides in-memory indexes for matching a voice embedding against
+enrolled voiceprints by cosine similarity.
+
+Matching used to compute one scipy cosine distance per stored voiceprint in a
+Python loop, so identification cost grew linearly with the caller base and was
+dominated by interpreter overhead. The indexes here keep every embedding
+L2-normalized in one contiguous float32 matrix, so scoring all callers is a
+single matrix-vector product and the best matches are picked with a partial
+sort.
+
+The module includes two index implementations:
+
+1. VoiceprintIndex: Exact search
+   - Scores every enrolled voiceprint
+   - Incremental add, replace and remove without rebuilding
+
+2. IVFVoiceprintIndex: Approximate search for very large enrollments
+   - Clusters embeddings around k-means centroids (an inverted file)
+   - Scores only the voiceprints in the clusters closest to the query
+   - Falls back to exact search until enough voiceprints are enrolled
+
+Usage Example:
+    from opusagent.voiceprint.index import VoiceprintIndex
+
+    index = VoiceprintIndex()
+    index.load(*storage.get_embeddings())
+    index.add("user123", embedding, {"name": "John"})
+    matches = index.search(query_embedding, k=3, threshold=0.75)
+    for caller_id, similarity, metadata in matches:
+        print(caller_id, similarity)
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .models import Voiceprint
+
+Match = Tuple[str, float, Dict[str, Any]]
+
+
+def _normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize embeddings row by row as float32.
+
+    Zero rows are left as zeros so that they score 0 against any query,
+    instead of raising like utils.normalize_embedding.
+
+    Args:
+        embeddings: 1-D embedding or 2-D array with one embedding per row
+
+    Returns:
+        np.ndarray: float32 array of the same shape with unit-length rows
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return np.divide(
+        embeddings, norms, out=np.zeros_like(embeddings), where=norms > 0
+    )
+
+
+class VoiceprintIndex:
+    """
+    Exact cosine-similarity index over enrolled voiceprints.
+
+    Embeddings are stored normalized in a float32 matrix that grows by
+    doubling. Removing a voiceprint moves the last row into its place, so
+    add, replace and remove are O(dimension).
+
+    Attributes:
+        dimension (Optional[int]): Embedding size, set by the first voiceprint
+    """
+
+    def __init__(self, dimension: Optional[int] = None, initial_capacity: int = 1024):
+        """
+        Initialize an empty index.
+
+        Args:
+            dimension: Embedding size. Defaults to the size of the first
+                voiceprint added.
+            initial_capacity: Rows allocated up front. Defaults to 1024.
+        """
+        self.dimension = dimension
+        self._fixed_dimension = dimension
+        self._initial_capacity = max(1, initial_capacity)
+        self._matrix = np.empty((0, dimension or 0), dtype=np.float32)
+        self._caller_ids: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._rows: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._caller_ids)
+
+    def __contains__(self, caller_id: object) -> bool:
+        return caller_id in self._rows
+
+    def build(self, voiceprints: Iterable[Voiceprint]) -> None:
+        """
+        Replace the contents of the index with the given voiceprints.
+
+        All embeddings are normalized in one vectorized pass. When a caller
+        appears more than once, the last voiceprint wins.
+
+        Args:
+            voiceprints: Voiceprints to index
+
+        Raises:
+            ValueError: If the embeddings do not all have the same size
+        """
+        latest: Dict[str, Voiceprint] = {}
+        for voiceprint in voiceprints:
+            latest.pop(voiceprint.caller_id, None)
+            latest[voiceprint.caller_id] = voiceprint
+
+        embeddings = [np.ravel(voiceprint.embedding) for voiceprint in latest.values()]
+        sizes = {embedding.shape[0] for embedding in embeddings}
+        if len(sizes) > 1:
+            raise ValueError(f"Voiceprint embeddings have mixed sizes: {sorted(sizes)}")
+        self.load(
+            list(latest),
+            np.stack(embeddings) if embeddings else np.empty((0, 0), dtype=np.float32),
+            [voiceprint.metadata for voiceprint in latest.values()],
+        )
+
+    def load(
+        self,
+        caller_ids: List[str],
+        embeddings: np.ndarray,
+        metadata: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Replace the contents of the index with an embedding matrix.
+
+        This is the bulk path used with storage.get_embeddings(); it skips
+        creating a Voiceprint per caller.
+
+        Args:
+            caller_ids: Unique caller IDs, one per row of embeddings
+            embeddings: Matrix with one embedding per row
+            metadata: Metadata of each caller, in the same order
+
+        Raises:
+            ValueError: If the embedding size differs from the index dimension
+        """
+        self._caller_ids = list(caller_ids)
+        self._metadata = list(metadata)
+        self._rows = {caller_id: row for row, caller_id in enumerate(self._caller_ids)}
+        if not self._caller_ids:
+            self.dimension = self._fixed_dimension
+            self._matrix = np.empty((0, self.dimension or 0), dtype=np.float32)
+            return
+
+        dimension = embeddings.shape[1]
+        if self._fixed_dimension and dimension != self._fixed_dimension:
+            raise ValueError(
+                f"Embedding size {dimension} does not match index "
+                f"dimension {self._fixed_dimension}"
+            )
+        self.dimension = dimension
+        capacity = max(self._initial_capacity, len(self._caller_ids))
+        self._matrix = np.zeros((capacity, dimension), dtype=np.float32)
+        self._matrix[: len(self._caller_ids)] = _normalize_rows(embeddings)
+
+    def add(
+        self,
+        caller_id: str,
+        embedding: np.ndarray,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Add a voiceprint, replacing any previous one for the caller.
+
+        Args:
+            caller_id: Unique identifier for the caller
+            embedding: Voice embedding of the caller
+            metadata: Metadata returned with matches. Defaults to empty.
+
+        Raises:
+            ValueError: If the embedding size differs from the index dimension
+        """
+        vector = np.ravel(embedding)
+        if self.dimension is None:
+            self.dimension = vector.shape[0]
+            self._matrix = np.empty((0, self.dimension), dtype=np.float32)
+        if vector.shape[0] != self.dimension:
+            raise ValueError(
+                f"Embedding size {vector.shape[0]} does not match index "
+                f"dimension {self.dimension}"
+            )
+
+        row = self._rows.get(caller_id)
+        if row is None:
+            row = len(self._caller_ids)
+            self._reserve(row + 1)
+            self._caller_ids.append(caller_id)
+            self._metadata.append(metadata or {})
+            self._rows[caller_id] = row
+        else:
+            self._metadata[row] = metadata or {}
+        self._matrix[row] = _normalize_rows(vector)
+        self._row_updated(row)
+
+    def remove(self, caller_id: str) -> bool:
+        """
+        Remove a caller's voiceprint.
+
+        Args:
+            caller_id: Unique identifier for the caller
+
+        Returns:
+            bool: True if the caller was indexed
+        """
+        row = self._rows.pop(caller_id, None)
+        if row is None:
+            return False
+        last = len(self._caller_ids) - 1
+        if row != last:
+            moved = self._caller_ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._caller_ids[row] = moved
+            self._metadata[row] = self._metadata[last]
+            self._rows[moved] = row
+            self._row_moved(last, row)
+        self._caller_ids.pop()
+        self._metadata.pop()
+        return True
+
+    def clear(self) -> None:
+        """Remove every voiceprint from the index."""
+        self.build([])
+
+    def search(
+        self,
+        embedding: np.ndarray,
+        k: int = 1,
+        threshold: Optional[float] = None,
+    ) -> List[Match]:
+        """
+        Find the enrolled voiceprints most similar to an embedding.
+
+        Args:
+            embedding: Voice embedding to match
+            k: Maximum number of matches to return. Defaults to 1.
+            threshold: Only return matches with a similarity strictly above
+                this value. Defaults to no threshold.
+
+        Returns:
+            List of (caller_id, similarity, metadata) tuples, most similar
+            first.
+        """
+        if not self._caller_ids or k <= 0:
+            return []
+        query = _normalize_rows(np.ravel(embedding))
+        if query.shape[0] != self.dimension or not query.any():
+            return []
+
+        rows, scores = self._score(query)
+        if threshold is not None:
+            above = scores > threshold
+            rows, scores = rows[above], scores[above]
+        if len(scores) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            rows, scores = rows[top], scores[top]
+        order = np.argsort(-scores, kind="stable")
+        return [
+            (self._caller_ids[row], float(score), self._metadata[row])
+            for row, score in zip(rows[order], scores[order])
+        ]
+
+    def _score(self, query: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return candidate rows and their similarities to a normalized query."""
+        size = len(self._caller_ids)
+        return np.arange(size), self._matrix[:size] @ query
+
+    def _reserve(self, size: int) -> None:
+        """Grow the embedding matrix to hold at least ``size`` rows."""
+        capacity = self._matrix.shape[0]
+        if size <= capacity:
+            return
+        capacity = max(self._initial_capacity, capacity)
+        while capacity < size:
+            capacity *= 2
+        matrix = np.zeros((capacity, self.dimension), dtype=np.float32)
+        matrix[: len(self._caller_ids)] = self._matrix[: len(self._caller_ids)]
+        self._matrix = matrix
+
+    def _row_updated(self, row: int) -> None:
+        """Hook called after a row's embedding was written."""
+
+    def _row_moved(self, source: int, target: int) -> None:
+        """Hook called after a row was moved to fill a removed one."""
+
+
+class IVFVoiceprintIndex(VoiceprintIndex):
+    """
+    Approximate cosine-similarity index using an inverted file (IVF).
+
+    Embeddings are assigned to the nearest of ``n_lists`` k-means centroids.
+    A search scores the centroids first and then only the voiceprints in the
+    ``n_probe`` closest clusters, trading a little recall for far fewer dot
+    products. Below ``min_train_size`` voiceprints the index searches
+    exactly. Centroids are trained on first search and retrained once the
+    index has doubled in size since the last training.
+
+    Attributes:
+        n_lists (int): Number of clusters
+        n_probe (int): Clusters scored per search
+        min_train_size (int): Voiceprints needed before clustering
+    """
+
+    def __init__(
+        self,
+        n_lists: int = 256,
+        n_probe: int = 8,
+        min_train_size: int = 10000,
+        train_iterations: int = 10,
+        dimension: Optional[int] = None,
+        initial_capacity: int = 1024,
+        seed: int = 0,
+    ):
+        """
+        Initialize an empty approximate index.
+
+        Args:
+            n_lists: Number of clusters. Defaults to 256.
+            n_probe: Clusters scored per search. Defaults to 8.
+            min_train_size: Voiceprints needed before clustering; smaller
+                indexes are searched exactly. Defaults to 10000.
+            train_iterations: K-means iterations per training. Defaults to 10.
+            dimension: Embedding size. Defaults to the size of the first
+                voiceprint added.
+            initial_capacity: Rows allocated up front. Defaults to 1024.
+            seed: Seed of the centroid initialization. Defaults to 0.
+
+        Raises:
+            ValueError: If n_lists or n_probe is not positive
+        """
+        if n_lists <= 0 or n_probe <= 0:
+            raise ValueError("n_lists and n_probe must be positive")
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.min_train_size = max(min_train_size, n_lists)
+        self.train_iterations = train_iterations
+        self._rng = np.random.default_rng(seed)
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.empty(0, dtype=np.int32)
+        self._trained_size = 0
+        super().__init__(dimension=dimension, initial_capacity=initial_capacity)
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether searches use the clusters instead of exact search."""
+        return self._centroids is not None
+
+    def load(
+        self,
+        caller_ids: List[str],
+        embeddings: np.ndarray,
+        metadata: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Replace the contents of the index and retrain the clusters.
+
+        Args:
+            caller_ids: Unique caller IDs, one per row of embeddings
+            embeddings: Matrix with one embedding per row
+            metadata: Metadata of each caller, in the same order
+
+        Raises:
+            ValueError: If the embedding size differs from the index dimension
+        """
+        super().load(caller_ids, embeddings, metadata)
+        self._centroids = None
+        self._assignments = np.zeros(self._matrix.shape[0], dtype=np.int32)
+        self._trained_size = 0
+        self.train()
+
+    def train(self) -> bool:
+        """
+        Cluster the indexed embeddings with spherical k-means.
+
+        Returns:
+            bool: True if the index was trained, False if it holds fewer than
+                min_train_size voiceprints
+        """
+        size = len(self._caller_ids)
+        if size < self.min_train_size:
+            return False
+        data = self._matrix[:size]
+        sample = data
+        max_sample = self.n_lists * 256
+        if size > max_sample:
+            sample = data[self._rng.choice(size, max_sample, replace=False)]
+        centroids = sample[self._rng.choice(len(sample), self.n_lists, replace=False)]
+        for _ in range(self.train_iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(labels, kind="stable")
+            counts = np.bincount(labels, minlength=self.n_lists)
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            empty = counts == 0
+            sums = np.zeros_like(centroids)
+            sums[~empty] = np.add.reduceat(sample[order], starts[~empty], axis=0)
+            sums[empty] = centroids[empty]
+            centroids = _normalize_rows(sums)
+
+        self._centroids = centroids
+        self._assignments[:size] = self._assign(data)
+        self._trained_size = size
+        return True
+
+    def _assign(self, embeddings: np.ndarray) -> np.ndarray:
+        """Return the nearest centroid of each normalized embedding."""
+        labels = np.empty(len(embeddings), dtype=np.int32)
+        # Chunked so a million-row assignment does not allocate n x n_lists at once
+        for start in range(0, len(embeddings), 65536):
+            chunk = embeddings[start : start + 65536]
+            labels[start : start + len(chunk)] = np.argmax(chunk @ self._centroids.T, axis=1)
+        return labels
+
+    def _score(self, query: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        size = len(self._caller_ids)
+        if self._trained_size and size >= 2 * self._trained_size:
+            self.train()
+        elif self._centroids is None:
+            self.train()
+        if self._centroids is None:
+            return super()._score(query)
+
+        n_probe = min(self.n_probe, self.n_lists)
+        probes = np.argpartition(-(self._centroids @ query), n_probe - 1)[:n_probe]
+        rows = np.flatnonzero(np.isin(self._assignments[:size], probes))
+        return rows, self._matrix[rows] @ query
+
+    def _reserve(self, size: int) -> None:
+        super()._reserve(size)
+        if self._assignments.shape[0] < self._matrix.shape[0]:
+            assignments = np.zeros(self._matrix.shape[0], dtype=np.int32)
+            assignments[: self._assignments.shape[0]] = self._assignments
+            self._assignments = assignments
+
+    def _row_updated(self, row: int) -> None:
+        if self._centroids is not None:
+            self._assignments[row] = self._assign(self._matrix[row : row + 1])[0]
+
+    def _row_moved(self, source: int, target: int) -> None:
+        self._assignments[target] = self._assignments[source]
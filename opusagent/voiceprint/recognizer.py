@@ -11,11 +11,24 @@ The main component is the OpusAgentVoiceRecognizer class which handles:
 - Voice matching against stored voiceprints
 - Similarity scoring and threshold-based identification
 
+Stored voiceprints are matched through a VoiceprintIndex, loaded from the
+storage backend on first use, updated incrementally on enrollment and
+reloaded when the storage reports a change made elsewhere, so
+identifying a caller is one matrix-vector product instead of a Python loop
+over every voiceprint. For identification while a call is still in its
+first seconds, see StreamingCallerIdentifier in .streaming.
+
+resemblyzer (and with it torch) is imported on first use rather than at
+module load, and the encoder model is loaded once per process on the first
+embedding: every bridge builds a recognizer, and most calls never need one.
+Call get_voice_encoder() to load it ahead of the first call.
+
 Key Features:
 - Speaker identification through voice fingerprinting
 - Configurable similarity thresholds
 - Metadata storage for enrolled callers
 - Support for multiple storage backends
+- Exact or approximate (IVF) voiceprint indexes for large enrollments
 
 Example Usage:
     >>> from opusagent.voiceprint.recognizer import OpusAgentVoiceRecognizer
@@ -32,20 +45,76 @@ Example Usage:
 
 Dependencies:
     - resemblyzer: For voice embedding generation
-    - numpy: For numerical operations
-    - scipy: For similarity calculations
+    - numpy: For numerical operations and similarity calculations
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import importlib
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
-from resemblyzer import VoiceEncoder, preprocess_wav
-from scipy.spatial.distance import cosine
 
 from .config import VoiceFingerprintConfig
+from .index import VoiceprintIndex
 from .models import Voiceprint
 from .storage import JSONStorage
 
+# Override points for resemblyzer's VoiceEncoder and preprocess_wav (tests
+# patch these); None means the resemblyzer implementation, imported lazily
+VoiceEncoder: Any = None
+preprocess_wav: Any = None
+
+_encoder: Any = None
+_encoder_lock = threading.Lock()
+
+_recognizer: Optional["OpusAgentVoiceRecognizer"] = None
+_recognizer_lock = threading.Lock()
+
+
+def _resemblyzer() -> Any:
+    return importlib.import_module("resemblyzer")
+
+
+def _preprocess(audio: np.ndarray) -> np.ndarray:
+    return (preprocess_wav or _resemblyzer().preprocess_wav)(audio)
+
+
+def get_voice_encoder() -> Any:
+    """Return the process-wide resemblyzer VoiceEncoder, loading it on first use."""
+    global _encoder
+    with _encoder_lock:
+        if _encoder is None:
+            _encoder = _resemblyzer().VoiceEncoder()
+        return _encoder
+
+
+def reset_voice_encoder() -> None:
+    """Drop the process-wide encoder (for tests)."""
+    global _encoder
+    with _encoder_lock:
+        _encoder = None
+
+
+def get_voice_recognizer() -> "OpusAgentVoiceRecognizer":
+    """
+    Return the process-wide voice recognizer, creating it on first use.
+
+    Every call shares its voiceprint index: it is loaded from storage once,
+    and enrollments update it in place.
+    """
+    global _recognizer
+    with _recognizer_lock:
+        if _recognizer is None:
+            _recognizer = OpusAgentVoiceRecognizer()
+        return _recognizer
+
+
+def reset_voice_recognizer() -> None:
+    """Drop the process-wide recognizer and its index (for tests)."""
+    global _recognizer
+    with _recognizer_lock:
+        _recognizer = None
+
 
 class OpusAgentVoiceRecognizer:
     """
@@ -55,22 +124,80 @@ class OpusAgentVoiceRecognizer:
     and match incoming audio against stored voiceprints to identify known callers.
 
     Attributes:
-        encoder (VoiceEncoder): The voice encoder used to generate embeddings
+        encoder (VoiceEncoder): The voice encoder used to generate embeddings,
+            created on first use
         storage (JSONStorage): Backend storage for voiceprint data
         config (VoiceFingerprintConfig): Configuration settings for voice recognition
+        index (VoiceprintIndex): In-memory index of the stored voiceprints
     """
 
-    def __init__(self, storage_backend: Optional[Any] = None) -> None:
+    def __init__(
+        self,
+        storage_backend: Optional[Any] = None,
+        index: Optional[VoiceprintIndex] = None,
+    ) -> None:
         """
         Initialize the voice recognizer.
 
         Args:
             storage_backend (Any, optional): Storage backend for voiceprints.
                 Defaults to JSONStorage if not provided.
+            index (VoiceprintIndex, optional): Index used for matching, e.g. an
+                IVFVoiceprintIndex for very large enrollments. Defaults to an
+                exact VoiceprintIndex.
         """
-        self.encoder: VoiceEncoder = VoiceEncoder()
+        # A patched VoiceEncoder is captured here so the encoder can be
+        # created lazily; otherwise the shared encoder is used
+        self._encoder_class: Any = VoiceEncoder
+        self._encoder: Any = None
         self.storage: Any = storage_backend or JSONStorage()
         self.config: VoiceFingerprintConfig = VoiceFingerprintConfig()
+        self.index: VoiceprintIndex = index if index is not None else VoiceprintIndex()
+        self._index_loaded: bool = False
+        # Storage version the index reflects, for storages that report one
+        self._index_version: Optional[int] = None
+        # Matches run in worker threads (StreamingCallerIdentifier) while
+        # enrollments update the index from the event loop
+        self._index_lock = threading.RLock()
+
+    @property
+    def encoder(self) -> Any:
+        """The voice encoder, created on first use."""
+        if self._encoder is None:
+            if self._encoder_class is not None:
+                self._encoder = self._encoder_class()
+            else:
+                self._encoder = get_voice_encoder()
+        return self._encoder
+
+    def load_index(self) -> int:
+        """
+        Rebuild the voiceprint index from the storage backend.
+
+        Called automatically on the first match, and again whenever the
+        storage reports that its voiceprints changed (see
+        storage.get_version()). With a storage that does not report changes,
+        call it after voiceprints were saved without going through
+        enroll_caller, e.g. by another process.
+
+        Returns:
+            int: Number of voiceprints indexed
+        """
+        with self._index_lock:
+            version = self._storage_version()
+            get_embeddings = getattr(self.storage, "get_embeddings", None)
+            if get_embeddings is not None:
+                self.index.load(*get_embeddings())
+            else:
+                self.index.build(self.storage.get_all())
+            self._index_loaded = True
+            self._index_version = version
+            return len(self.index)
+
+    def _storage_version(self) -> Optional[int]:
+        """Return the storage's change counter, or None if it has none."""
+        get_version = getattr(self.storage, "get_version", None)
+        return get_version() if get_version is not None else None
 
     def get_embedding(self, audio_buffer: np.ndarray) -> np.ndarray:
         """
@@ -89,7 +216,28 @@ class OpusAgentVoiceRecognizer:
         Raises:
             ValueError: If audio_buffer is empty or invalid
         """
-        wav = preprocess_wav(audio_buffer)
+        wav = _preprocess(audio_buffer)
+        embedding = self.encoder.embed_utterance(wav)
+        return np.array(embedding, dtype=np.float32)
+
+    def get_partial_embedding(self, window: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Generate a voice embedding from a short window of a call's audio.
+
+        Used by StreamingCallerIdentifier, which averages the partial
+        embeddings of consecutive windows. Unlike get_embedding(), a window
+        with no speech left after silence trimming is not an error.
+
+        Args:
+            window (np.ndarray): Float audio at 16kHz in [-1, 1]
+
+        Returns:
+            numpy.ndarray or None: Voice embedding as a float32 array, or None
+            if the window holds no speech
+        """
+        wav = _preprocess(window)
+        if len(wav) == 0:
+            return None
         embedding = self.encoder.embed_utterance(wav)
         return np.array(embedding, dtype=np.float32)
 
@@ -100,7 +248,7 @@ class OpusAgentVoiceRecognizer:
         Match incoming voice to stored voiceprints.
 
         This method compares the voice embedding of the incoming audio against
-        all stored voiceprints to identify if the caller is known. Returns
+        the stored voiceprints to identify if the caller is known. Returns
         the best match if similarity exceeds the configured threshold.
 
         Args:
@@ -117,15 +265,31 @@ class OpusAgentVoiceRecognizer:
             ...     print(f"Caller identified: {caller_id} (similarity: {similarity:.2f})")
         """
         new_embedding = self.get_embedding(audio_buffer)
+        return self.match_embedding(new_embedding)
+
+    def match_embedding(
+        self, embedding: np.ndarray
+    ) -> Optional[Tuple[str, float, Dict[str, Any]]]:
+        """
+        Match a precomputed voice embedding to stored voiceprints.
+
+        Safe to call from worker threads while callers are enrolled.
 
-        matches: List[Tuple[str, float, Dict[str, Any]]] = []
-        for voiceprint in self.storage.get_all():
-            similarity = float(1 - cosine(new_embedding, voiceprint.embedding))
-            if similarity > self.config.similarity_threshold:
-                matches.append((voiceprint.caller_id, similarity, voiceprint.metadata))
+        Args:
+            embedding (np.ndarray): Voice embedding of the caller
+
+        Returns:
+            tuple or None: If match found, returns (caller_id, similarity_score, metadata).
+                Returns None if no match exceeds the similarity threshold.
+        """
+        with self._index_lock:
+            if not self._index_loaded or self._storage_version() != self._index_version:
+                self.load_index()
 
+            matches = self.index.search(
+                embedding, k=1, threshold=self.config.similarity_threshold
+            )
         if matches:
-            matches.sort(key=lambda x: x[1], reverse=True)
             return matches[0]  # (caller_id, similarity, metadata)
         return None
 
@@ -140,6 +304,8 @@ class OpusAgentVoiceRecognizer:
 
         This method creates a voiceprint for a new caller by generating an
         embedding from their audio sample and storing it with associated metadata.
+        The voiceprint is added to the index, replacing any previous one for
+        the caller.
 
         Args:
             caller_id (str): Unique identifier for the caller
@@ -166,4 +332,11 @@ class OpusAgentVoiceRecognizer:
             caller_id=caller_id, embedding=embedding, metadata=metadata or {}
         )
         self.storage.save(voiceprint)
+        with self._index_lock:
+            if self._index_loaded:
+                version = self._storage_version()
+                if version is None or version == (self._index_version or 0) + 1:
+                    self.index.add(caller_id, embedding, voiceprint.metadata)
+                    self._index_version = version
+                # Otherwise the storage also changed elsewhere; the next match reloads
         return voiceprint
@@ -10,21 +10,33 @@ The module includes three storage implementations:
 1. JSONStorage: File-based storage using JSON format
    - Simple and portable
    - Good for development and small datasets
-   - Embeds numpy arrays as lists for JSON serialization
+   - Embeds float32 embeddings as base64 strings
 
 2. RedisStorage: Redis-backed storage for high-performance applications
    - Fast in-memory storage with persistence
    - Suitable for production environments
-   - Stores voiceprints as JSON strings in Redis
+   - Stores raw float32 embeddings and JSON metadata in two hashes, loaded
+     in bulk with HSCAN
 
 3. SQLiteStorage: SQLite database storage for structured data
    - ACID-compliant storage with transaction support
    - Efficient BLOB storage for embeddings
+   - One persistent connection; bulk loads with a single cursor
    - Includes database maintenance and optimization features
 
+Every backend keeps an in-memory copy of the stored voiceprints. get_all()
+reads the backend only on first use and when another process changed it
+(file modification time, Redis version counter or SQLite data_version);
+save() updates the copy in place. The recognizer builds its index from
+get_embeddings(), which returns the cached embeddings as one float32 matrix
+without creating a Voiceprint per caller.
+
 All storage implementations provide a consistent interface:
 - save(voiceprint): Store a voiceprint
+- save_many(voiceprints): Store several voiceprints in one write
 - get_all(): Retrieve all stored voiceprints
+- get_embeddings(): Retrieve caller IDs, an embedding matrix and metadata
+- get_version(): Counter that changes whenever the stored voiceprints change
 
 Usage Example:
     from opusagent.voiceprint.storage import JSONStorage
@@ -36,22 +48,178 @@ Usage Example:
     all_voiceprints = storage.get_all()
 """
 
+import base64
 import json
+import logging
+import os
 import sqlite3
-from typing import Any, Dict, List, Optional
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import numpy as np
 
 from .models import Voiceprint
 
+logger = logging.getLogger(__name__)
+
+# Cached voiceprint: (embedding, metadata, created_at, last_seen)
+_Record = Tuple[np.ndarray, Dict[str, Any], Optional[str], Optional[str]]
+
+
+def _to_float32(embedding: np.ndarray) -> np.ndarray:
+    """Return an embedding as a flat float32 array."""
+    return np.ascontiguousarray(np.ravel(embedding), dtype=np.float32)
+
+
+def _record(voiceprint: Voiceprint) -> _Record:
+    # Cached embeddings are shared with every get_all() caller, so they are
+    # copied and made read-only
+    embedding = np.array(np.ravel(voiceprint.embedding), dtype=np.float32)
+    embedding.setflags(write=False)
+    return (
+        embedding,
+        voiceprint.metadata,
+        voiceprint.created_at,
+        voiceprint.last_seen,
+    )
+
+
+class _CachedStorage:
+    """
+    Base class keeping an in-memory copy of a storage's voiceprints.
+
+    Subclasses implement _load_records() to read every voiceprint in bulk,
+    _has_changed() to detect writes by other processes cheaply, and
+    _write() to persist voiceprints.
+    """
+
+    def __init__(self) -> None:
+        self._records: Optional[Dict[str, _Record]] = None
+        self._version = 0
+        self._embeddings: Optional[Tuple[List[str], np.ndarray, List[Dict[str, Any]]]] = None
+        self._cache_lock = threading.RLock()
+
+    def save(self, voiceprint: Voiceprint) -> None:
+        """
+        Save a voiceprint, replacing any previous one for the caller.
+
+        Args:
+            voiceprint: The Voiceprint object to save.
+        """
+        self.save_many([voiceprint])
+
+    def save_many(self, voiceprints: Iterable[Voiceprint]) -> None:
+        """
+        Save several voiceprints in one write.
+
+        Args:
+            voiceprints: The Voiceprint objects to save.
+        """
+        voiceprints = list(voiceprints)
+        if not voiceprints:
+            return
+        with self._cache_lock:
+            # Pick up writes by other processes before applying ours
+            records = self._current_records()
+            self._write(voiceprints)
+            for voiceprint in voiceprints:
+                records[voiceprint.caller_id] = _record(voiceprint)
+            self._embeddings = None
+            self._version += 1
+
+    def get_all(self) -> List[Voiceprint]:
+        """
+        Retrieve all voiceprints.
+
+        Returns:
+            List of Voiceprint objects, served from the in-memory copy.
+        """
+        with self._cache_lock:
+            records = dict(self._current_records())
+        return [
+            Voiceprint(
+                caller_id=caller_id,
+                embedding=embedding,
+                metadata=metadata,
+                created_at=created_at,
+                last_seen=last_seen,
+            )
+            for caller_id, (embedding, metadata, created_at, last_seen) in records.items()
+        ]
+
+    def get_embeddings(self) -> Tuple[List[str], np.ndarray, List[Dict[str, Any]]]:
+        """
+        Retrieve all embeddings as one matrix, without building Voiceprints.
+
+        Returns:
+            Tuple of caller IDs, a float32 matrix with one embedding per row
+            in the same order, and the metadata of each caller.
+
+        Raises:
+            ValueError: If the stored embeddings do not all have the same size
+        """
+        with self._cache_lock:
+            records = self._current_records()
+            if self._embeddings is None:
+                caller_ids = list(records)
+                if records:
+                    matrix = np.stack([record[0] for record in records.values()])
+                else:
+                    matrix = np.empty((0, 0), dtype=np.float32)
+                metadata = [record[1] for record in records.values()]
+                self._embeddings = (caller_ids, matrix, metadata)
+            return self._embeddings
+
+    def get_version(self) -> int:
+        """
+        Get a counter that changes whenever the stored voiceprints change.
+
+        Checks the backend for writes by other processes first.
+
+        Returns:
+            int: Version of the stored voiceprints
+        """
+        with self._cache_lock:
+            self._current_records()
+            return self._version
+
+    def invalidate_cache(self) -> None:
+        """Drop the in-memory copy so the next read reloads the backend."""
+        with self._cache_lock:
+            self._records = None
+            self._embeddings = None
+
+    def _current_records(self) -> Dict[str, _Record]:
+        """Return the in-memory copy, reloading it if the backend changed."""
+        with self._cache_lock:
+            if self._records is None or self._has_changed():
+                self._records = self._load_records()
+                self._embeddings = None
+                self._version += 1
+            return self._records
 
-class JSONStorage:
+    def _load_records(self) -> Dict[str, _Record]:
+        raise NotImplementedError
+
+    def _has_changed(self) -> bool:
+        raise NotImplementedError
+
+    def _write(self, voiceprints: List[Voiceprint]) -> None:
+        """Persist voiceprints on top of the current in-memory copy."""
+        raise NotImplementedError
+
+
+class JSONStorage(_CachedStorage):
     """
     JSON-based storage implementation for voiceprint data.
 
     This class provides a simple file-based storage solution using JSON format.
-    Voiceprint embeddings are stored as lists and converted to/from numpy arrays
-    for serialization compatibility.
+    Embeddings are stored as base64-encoded float32 bytes; files written with
+    embeddings as lists of numbers are still read. The parsed file is kept in
+    memory and reloaded only when its modification time or size changes, so
+    save() writes the file without reading it first. The file is replaced
+    atomically.
     """
 
     def __init__(self, file_path: str = "voiceprints.json") -> None:
@@ -62,45 +230,66 @@ class JSONStorage:
             file_path: Path to the JSON file where voiceprints will be stored.
                       Defaults to 'voiceprints.json'.
         """
+        super().__init__()
         self.file_path = file_path
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._signature: Optional[Tuple[int, int]] = None
 
-    def save(self, voiceprint: Voiceprint) -> None:
-        """
-        Save a voiceprint to JSON storage.
-
-        Args:
-            voiceprint: The Voiceprint object to save.
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
-        Note:
-            The embedding numpy array is converted to a list for JSON serialization.
-        """
-        voiceprints = self._load_all()
-        # Convert numpy array to list for JSON serialization
-        voiceprint_dict = voiceprint.model_dump()
-        voiceprint_dict["embedding"] = voiceprint_dict["embedding"].tolist()
-        voiceprints[voiceprint.caller_id] = voiceprint_dict
-        self._save_all(voiceprints)
+    def _has_changed(self) -> bool:
+        return self._file_signature() != self._signature
 
-    def get_all(self) -> List[Voiceprint]:
+    def _load_records(self) -> Dict[str, _Record]:
         """
-        Retrieve all voiceprints from JSON storage.
+        Load all voiceprint data from the JSON file.
 
         Returns:
-            List of Voiceprint objects loaded from storage.
+            Dictionary mapping caller_id to cached voiceprint data.
 
         Note:
-            Invalid voiceprint entries are silently skipped.
+            Invalid voiceprint entries are silently skipped. A missing, empty
+            or invalid file holds no voiceprints.
         """
-        voiceprints = self._load_all()
-        result = []
-        for vp in voiceprints.values():
+        self._signature = self._file_signature()
+        self._data = self._load_all()
+        records = {}
+        for caller_id, vp in self._data.items():
             try:
-                # Convert list back to numpy array
-                vp["embedding"] = np.array(vp["embedding"], dtype=np.float32)
-                result.append(Voiceprint(**vp))
-            except (KeyError, ValueError, TypeError):
+                embedding = vp["embedding"]
+                if isinstance(embedding, str):
+                    embedding = np.frombuffer(base64.b64decode(embedding), dtype=np.float32)
+                else:
+                    embedding = np.array(embedding, dtype=np.float32)
+                    embedding.setflags(write=False)
+                records[vp["caller_id"]] = (
+                    embedding,
+                    vp.get("metadata") or {},
+                    vp.get("created_at"),
+                    vp.get("last_seen"),
+                )
+            except (KeyError, ValueError, TypeError, AttributeError):
                 continue
-        return result
+        return records
+
+    def _write(self, voiceprints: List[Voiceprint]) -> None:
+        for voiceprint in voiceprints:
+            self._data[voiceprint.caller_id] = {
+                "caller_id": voiceprint.caller_id,
+                "embedding": base64.b64encode(
+                    _to_float32(voiceprint.embedding).tobytes()
+                ).decode("ascii"),
+                "metadata": voiceprint.metadata,
+                "created_at": voiceprint.created_at,
+                "last_seen": voiceprint.last_seen,
+            }
+        self._save_all(self._data)
+        self._signature = self._file_signature()
 
     def _load_all(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -128,79 +317,204 @@ class JSONStorage:
         Args:
             voiceprints: Dictionary mapping caller_id to voiceprint data.
         """
-        with open(self.file_path, "w") as f:
-            json.dump(voiceprints, f)
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(voiceprints, f)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
 
 
-class RedisStorage:
+class RedisStorage(_CachedStorage):
     """
     Redis-based storage implementation for voiceprint data.
 
     This class provides a Redis-backed storage solution for voiceprints.
-    Voiceprint embeddings are stored as JSON strings and converted to/from
-    numpy arrays for serialization compatibility.
+    Embeddings are stored as raw float32 bytes in the ``{prefix}embeddings``
+    hash and the rest of each voiceprint as JSON in the ``{prefix}info``
+    hash, keyed by caller ID. Every save increments ``{prefix}version`` in
+    the same transaction, so checking for changes by other processes is a
+    single GET; the hashes are read with HSCAN only when it changed.
+
+    Voiceprints stored by earlier versions as ``voiceprint:{caller_id}``
+    JSON strings are copied into the hashes on the first load that finds
+    the hashes empty.
+
+    The client must return bytes (decode_responses=False).
     """
 
-    def __init__(self, redis_client) -> None:
+    def __init__(
+        self, redis_client, key_prefix: str = "voiceprints:", scan_count: int = 1000
+    ) -> None:
         """
         Initialize Redis storage with the provided Redis client.
 
         Args:
             redis_client: Redis client instance for database operations.
-        """
-        self.redis = redis_client
+            key_prefix: Prefix of the storage's keys. Defaults to 'voiceprints:'.
+            scan_count: Hash fields requested per HSCAN call. Defaults to 1000.
 
-    def save(self, voiceprint: Voiceprint) -> None:
+        Raises:
+            ValueError: If the client decodes responses to str, which would
+                corrupt the binary embeddings
         """
-        Save a voiceprint to Redis storage.
+        connection_kwargs = getattr(
+            getattr(redis_client, "connection_pool", None), "connection_kwargs", None
+        )
+        if isinstance(connection_kwargs, dict) and connection_kwargs.get(
+            "decode_responses"
+        ):
+            raise ValueError(
+                "RedisStorage stores embeddings as raw bytes; create the Redis "
+                "client with decode_responses=False"
+            )
+        super().__init__()
+        self.redis = redis_client
+        self.embeddings_key = f"{key_prefix}embeddings"
+        self.info_key = f"{key_prefix}info"
+        self.version_key = f"{key_prefix}version"
+        self.scan_count = scan_count
+        self._redis_version: Optional[int] = None
+        self._legacy_checked = False
 
-        Args:
-            voiceprint: The Voiceprint object to save.
+    def _read_version(self) -> int:
+        return int(self.redis.get(self.version_key) or 0)
 
-        Note:
-            The embedding numpy array is converted to a list for JSON serialization.
-        """
-        key = f"voiceprint:{voiceprint.caller_id}"
-        # Convert numpy array to list for JSON serialization
-        voiceprint_dict = voiceprint.model_dump()
-        voiceprint_dict["embedding"] = voiceprint_dict["embedding"].tolist()
-        self.redis.set(key, json.dumps(voiceprint_dict))
+    def _has_changed(self) -> bool:
+        return self._read_version() != self._redis_version
 
-    def get_all(self) -> List[Voiceprint]:
+    def _load_records(self) -> Dict[str, _Record]:
         """
-        Retrieve all voiceprints from Redis storage.
+        Load all voiceprints from the two hashes with HSCAN.
 
         Returns:
-            List of Voiceprint objects loaded from storage.
+            Dictionary mapping caller_id to cached voiceprint data.
 
         Raises:
             json.JSONDecodeError: If stored data is corrupted and cannot be parsed.
 
         Note:
-            Invalid voiceprint entries are silently skipped, except for JSON decode errors.
+            Voiceprints missing their embedding or info are skipped. If the
+            hashes are empty, legacy keys are migrated into them (once per
+            storage).
         """
-        keys = self.redis.keys("voiceprint:*")
-        voiceprints = []
-        for key in keys:
-            try:
-                data = json.loads(self.redis.get(key))
-                # Convert list back to numpy array
-                data["embedding"] = np.array(data["embedding"], dtype=np.float32)
-                voiceprints.append(Voiceprint(**data))
-            except KeyError:
+        # Read the version first; a write during the scan triggers a reload
+        self._redis_version = self._read_version()
+        embeddings = {
+            _decode_key(field): np.frombuffer(value, dtype=np.float32)
+            for field, value in self.redis.hscan_iter(
+                self.embeddings_key, count=self.scan_count
+            )
+        }
+        records = {}
+        for field, value in self.redis.hscan_iter(self.info_key, count=self.scan_count):
+            caller_id = _decode_key(field)
+            embedding = embeddings.get(caller_id)
+            if embedding is None:
                 continue
-            except json.JSONDecodeError:
-                # Re-raise JSON decode errors to indicate data corruption
-                raise
-        return voiceprints
+            info = json.loads(value)
+            records[caller_id] = (
+                embedding,
+                info.get("metadata") or {},
+                info.get("created_at"),
+                info.get("last_seen"),
+            )
+
+        if not records and not self._legacy_checked:
+            self._legacy_checked = True
+            for voiceprints in self._read_legacy_keys(self.scan_count):
+                self._write(voiceprints)
+                records.update((vp.caller_id, _record(vp)) for vp in voiceprints)
+            if records:
+                logger.info(f"Migrated {len(records)} legacy voiceprints into the Redis hashes")
+        return records
+
+    def _write(self, voiceprints: List[Voiceprint]) -> None:
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(
+            self.embeddings_key,
+            mapping={
+                vp.caller_id: _to_float32(vp.embedding).tobytes() for vp in voiceprints
+            },
+        )
+        pipe.hset(
+            self.info_key,
+            mapping={
+                vp.caller_id: json.dumps(
+                    {
+                        "metadata": vp.metadata,
+                        "created_at": vp.created_at,
+                        "last_seen": vp.last_seen,
+                    }
+                )
+                for vp in voiceprints
+            },
+        )
+        pipe.incr(self.version_key)
+        version = pipe.execute()[-1]
+        if self._redis_version is not None and version == self._redis_version + 1:
+            self._redis_version = version
+        else:
+            # Another process wrote in between; reload on next read
+            self._redis_version = None
+
+    def migrate_legacy_keys(self, batch_size: int = 1000) -> int:
+        """
+        Copy voiceprints stored as ``voiceprint:{caller_id}`` JSON strings
+        into the hashes.
+
+        Earlier versions stored one JSON string per caller, with the
+        embedding as a list of numbers. The legacy keys are left in place.
+        The first load of a storage whose hashes are empty does this
+        automatically; call it to copy legacy keys written since.
+
+        Args:
+            batch_size: Keys read per pipelined round trip. Defaults to 1000.
+
+        Returns:
+            int: Number of voiceprints migrated
+        """
+        migrated = 0
+        for voiceprints in self._read_legacy_keys(batch_size):
+            self.save_many(voiceprints)
+            migrated += len(voiceprints)
+        return migrated
+
+    def _read_legacy_keys(self, batch_size: int) -> Iterator[List[Voiceprint]]:
+        """Yield the voiceprints stored under legacy keys, one batch at a time."""
+        keys = list(self.redis.scan_iter(match="voiceprint:*", count=batch_size))
+        for start in range(0, len(keys), batch_size):
+            voiceprints = []
+            for value in self.redis.mget(keys[start : start + batch_size]):
+                if value is None:
+                    continue
+                try:
+                    voiceprints.append(Voiceprint(**json.loads(value)))
+                except (KeyError, ValueError, TypeError):
+                    continue
+            if voiceprints:
+                yield voiceprints
+
+
+def _decode_key(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
 
 
-class SQLiteStorage:
+class SQLiteStorage(_CachedStorage):
     """
     SQLite-based storage implementation for voiceprint data.
 
     This class provides a SQLite database storage solution for voiceprints.
-    Voiceprint embeddings are stored as BLOB data for efficient storage and retrieval.
+    Voiceprint embeddings are stored as float32 BLOB data for efficient
+    storage and retrieval. One connection is kept open for the life of the
+    storage; PRAGMA data_version tells whether another connection changed
+    the database since it was last read.
     """
 
     def __init__(self, db_path: str = "voiceprints.db") -> None:
@@ -210,22 +524,32 @@ class SQLiteStorage:
         Args:
             db_path: Path to the SQLite database file. Defaults to 'voiceprints.db'.
         """
+        super().__init__()
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[int] = None
         self._init_db()
 
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The persistent connection, reopened after close()."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        return self._conn
+
     def _init_db(self) -> None:
         """
         Initialize the SQLite database with the required table structure.
 
         Creates the voiceprints table if it doesn't exist with the following schema:
         - caller_id: TEXT PRIMARY KEY
-        - embedding: BLOB (numpy array as bytes)
+        - embedding: BLOB (float32 array as bytes)
         - metadata: TEXT (JSON string)
         - created_at: TEXT
         - last_seen: TEXT
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self._cache_lock, self.conn:
+            self.conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS voiceprints (
                     caller_id TEXT PRIMARY KEY,
@@ -237,59 +561,66 @@ class SQLiteStorage:
             """
             )
 
-    def save(self, voiceprint: Voiceprint) -> None:
+    def _read_data_version(self) -> int:
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _has_changed(self) -> bool:
+        return self._read_data_version() != self._data_version
+
+    def _load_records(self) -> Dict[str, _Record]:
         """
-        Save a voiceprint to SQLite storage.
+        Load all voiceprints with a single cursor.
 
-        Args:
-            voiceprint: The Voiceprint object to save.
+        Returns:
+            Dictionary mapping caller_id to cached voiceprint data.
 
         Note:
-            The embedding is stored as BLOB data for efficient storage.
-            Metadata is stored as a JSON string.
+            Invalid voiceprint entries are silently skipped.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO voiceprints 
-                (caller_id, embedding, metadata, created_at, last_seen) VALUES (?, ?, ?, ?, ?)
-            """,
-                (
-                    voiceprint.caller_id,
-                    voiceprint.embedding.tobytes(),
-                    json.dumps(voiceprint.metadata),
-                    voiceprint.created_at,
-                    voiceprint.last_seen,
-                ),
-            )
+        self._data_version = self._read_data_version()
+        cursor = self.conn.execute(
+            "SELECT caller_id, embedding, metadata, created_at, last_seen "
+            "FROM voiceprints ORDER BY rowid"
+        )
+        records = {}
+        for caller_id, embedding, metadata, created_at, last_seen in cursor:
+            try:
+                records[caller_id] = (
+                    np.frombuffer(embedding, dtype=np.float32),
+                    json.loads(metadata) if metadata else {},
+                    created_at,
+                    last_seen,
+                )
+            except (json.JSONDecodeError, ValueError, TypeError):
+                continue
+        return records
 
-    def get_all(self) -> List[Voiceprint]:
+    def _write(self, voiceprints: List[Voiceprint]) -> None:
         """
-        Retrieve all voiceprints from SQLite storage.
-
-        Returns:
-            List of Voiceprint objects loaded from storage.
+        Save voiceprints in one transaction.
 
         Note:
-            Invalid voiceprint entries are silently skipped.
+            The embedding is stored as float32 BLOB data for efficient storage.
+            Metadata is stored as a JSON string. Writes on this connection do
+            not change its data_version.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT * FROM voiceprints")
-            voiceprints = []
-            for row in cursor.fetchall():
-                try:
-                    voiceprints.append(
-                        Voiceprint(
-                            caller_id=row[0],
-                            embedding=np.frombuffer(row[1], dtype=np.float32),
-                            metadata=json.loads(row[2]) if row[2] else {},
-                            created_at=row[3],
-                            last_seen=row[4],
-                        )
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO voiceprints
+                (caller_id, embedding, metadata, created_at, last_seen) VALUES (?, ?, ?, ?, ?)
+            """,
+                [
+                    (
+                        voiceprint.caller_id,
+                        _to_float32(voiceprint.embedding).tobytes(),
+                        json.dumps(voiceprint.metadata),
+                        voiceprint.created_at,
+                        voiceprint.last_seen,
                     )
-                except (json.JSONDecodeError, ValueError):
-                    continue
-            return voiceprints
+                    for voiceprint in voiceprints
+                ],
+            )
 
     def close(self) -> None:
         """
@@ -302,13 +633,16 @@ class SQLiteStorage:
 
         Note:
             This should be called when the storage instance is no longer needed
-            to ensure proper cleanup of database resources.
+            to ensure proper cleanup of database resources. The connection is
+            reopened if the storage is used again.
         """
-        # Force a connection to ensure any pending writes are flushed
-        with sqlite3.connect(self.db_path) as conn:
+        with self._cache_lock:
+            conn = self.conn
             conn.execute("PRAGMA wal_checkpoint(FULL)")
             conn.execute("PRAGMA optimize")
             conn.commit()
-            # Close all connections to this database
             conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
             conn.commit()
+            conn.close()
+            self._conn = None
+            self._data_version = None
@@ -0,0 +1,264 @@
+"""
+Streaming caller identification for OpusAgent.
+
+OpusAgentVoiceRecognizer.match_caller() needs the caller's whole utterance
+and embeds it synchronously, so a caller can only be recognized once enough
+audio has been collected, and the event loop stalls while the encoder runs.
+
+StreamingCallerIdentifier is fed the inbound audio of one call as it
+arrives. Every hop it embeds the most recent window of audio in a worker
+thread, folds that partial embedding into a running average and looks the
+average up in the recognizer's voiceprint index. Once the same caller has
+been the best match above the similarity threshold for a few consecutive
+windows, the on_identified callback fires, typically a second or two into
+the call and well before the first agent response. Identification gives up
+after a maximum amount of audio.
+
+Example Usage:
+    >>> identifier = StreamingCallerIdentifier(
+    ...     recognizer,
+    ...     sample_rate=24000,
+    ...     on_identified=bridge.load_caller_context,
+    ... )
+    >>> identifier.feed(pcm16_chunk)  # from the inbound audio path
+    >>> match = await identifier.wait(timeout=5.0)
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from opusagent.utils.resampler import StreamingResampler
+
+logger = logging.getLogger(__name__)
+
+# Resemblyzer works on 16kHz audio
+EMBEDDING_SAMPLE_RATE = 16000
+
+Match = Tuple[str, float, Dict[str, Any]]
+IdentifiedCallback = Callable[
+    [str, float, Dict[str, Any]], Union[None, Awaitable[None]]
+]
+
+
+class StreamingCallerIdentifier:
+    """
+    Incremental caller identification over the first seconds of a call.
+
+    feed() never blocks: it resamples the chunk to 16kHz and appends it to
+    the call's buffer. Embedding and index lookups run one window at a time
+    in a worker thread; audio that arrives meanwhile is picked up by the
+    next window.
+
+    Attributes:
+        recognizer (OpusAgentVoiceRecognizer): Recognizer providing the
+            encoder, the voiceprint index and the similarity threshold
+        sample_rate (int): Sample rate of the PCM16 audio passed to feed()
+        on_identified (Optional[IdentifiedCallback]): Called once with
+            (caller_id, similarity, metadata) when the caller is identified
+        result (Optional[Match]): The identification, once made
+        windows_processed (int): Windows embedded so far
+    """
+
+    def __init__(
+        self,
+        recognizer: Any,
+        sample_rate: int = 24000,
+        on_identified: Optional[IdentifiedCallback] = None,
+        window_seconds: float = 1.6,
+        hop_seconds: float = 0.8,
+        max_seconds: float = 10.0,
+        required_agreement: int = 2,
+    ) -> None:
+        """
+        Initialize the identifier.
+
+        Args:
+            recognizer (OpusAgentVoiceRecognizer): Recognizer to embed and
+                match with
+            sample_rate (int): Sample rate of the audio passed to feed()
+            on_identified (IdentifiedCallback, optional): Callback, sync or
+                async, for the identified caller
+            window_seconds (float): Audio embedded per partial embedding
+            hop_seconds (float): New audio needed before the next window
+            max_seconds (float): Audio after which identification gives up
+            required_agreement (int): Consecutive windows that must agree on
+                the same caller before it is reported
+        """
+        if hop_seconds <= 0 or window_seconds <= 0:
+            raise ValueError("window_seconds and hop_seconds must be positive")
+
+        self.recognizer = recognizer
+        self.sample_rate = sample_rate
+        self.on_identified = on_identified
+        self.required_agreement = max(1, required_agreement)
+
+        self._window = int(window_seconds * EMBEDDING_SAMPLE_RATE)
+        self._hop = int(hop_seconds * EMBEDDING_SAMPLE_RATE)
+        self._capacity = max(int(max_seconds * EMBEDDING_SAMPLE_RATE), self._window)
+        self._resampler = StreamingResampler(sample_rate, EMBEDDING_SAMPLE_RATE)
+        self._audio = np.zeros(self._capacity, dtype=np.float32)
+        self._task: Optional[asyncio.Task] = None
+        self._done = asyncio.Event()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the current call's audio and result, e.g. for a new stream."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self._resampler.reset()
+        self._length = 0
+        self._next_window_end = self._window
+        self._embedding_sum: Optional[np.ndarray] = None
+        self._candidate: Optional[str] = None
+        self._agreement = 0
+        self._finished = False
+        self._done.clear()
+        self.result: Optional[Match] = None
+        self.windows_processed = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether the caller was identified or identification gave up."""
+        return self._finished
+
+    def feed(self, audio_bytes: bytes) -> None:
+        """
+        Add a chunk of inbound caller audio.
+
+        Args:
+            audio_bytes (bytes): 16-bit little-endian mono PCM at sample_rate
+        """
+        if self._finished or not audio_bytes:
+            return
+
+        samples = np.frombuffer(audio_bytes[: len(audio_bytes) // 2 * 2], dtype="<i2")
+        samples = self._resampler.process_samples(samples.astype(np.float32) / 32768.0)
+        count = min(len(samples), self._capacity - self._length)
+        self._audio[self._length : self._length + count] = samples[:count]
+        self._length += count
+        self._maybe_start_window()
+
+    async def wait(self, timeout: Optional[float] = None) -> Optional[Match]:
+        """
+        Wait until the caller is identified or identification gives up.
+
+        Args:
+            timeout (float, optional): Seconds to wait at most
+
+        Returns:
+            Match or None: (caller_id, similarity, metadata), or None if the
+            caller was not identified (yet)
+        """
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.result
+
+    async def close(self) -> None:
+        """Stop identifying and wait for a window still being embedded."""
+        self._finished = True
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._done.set()
+
+    def _maybe_start_window(self) -> None:
+        """Embed the next window unless one is already in progress."""
+        if self._finished or (self._task is not None and not self._task.done()):
+            return
+        if self._length >= self._next_window_end:
+            end = self._length
+            window = self._audio[end - self._window : end].copy()
+            self._next_window_end = end + self._hop
+            self._task = asyncio.create_task(self._process_window(window))
+        elif self._length >= self._capacity:
+            self._give_up()
+
+    async def _process_window(self, window: np.ndarray) -> None:
+        """Embed and match one window, then act on the result."""
+        try:
+            embedding_sum, match = await asyncio.to_thread(
+                self._embed_and_match, window, self._embedding_sum
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Streaming caller identification failed: {e}")
+            embedding_sum, match = self._embedding_sum, None
+        if self._finished:
+            return
+
+        self._embedding_sum = embedding_sum
+
+        self.windows_processed += 1
+        if match is None:
+            self._candidate, self._agreement = None, 0
+        elif match[0] == self._candidate:
+            self._agreement += 1
+        else:
+            self._candidate, self._agreement = match[0], 1
+
+        if match is not None and self._agreement >= self.required_agreement:
+            await self._identify(match)
+            return
+        self._task = None  # This window is done; audio may be waiting already
+        self._maybe_start_window()
+
+    def _embed_and_match(
+        self, window: np.ndarray, embedding_sum: Optional[np.ndarray]
+    ) -> Tuple[Optional[np.ndarray], Optional[Match]]:
+        """
+        Fold one window into the running embedding and match it.
+
+        Runs in a worker thread, so it only works on its arguments; the
+        caller stores the new running sum back on the event loop.
+
+        Returns:
+            Tuple: (new running sum, match or None)
+        """
+        partial = self.recognizer.get_partial_embedding(window)
+        if partial is None:
+            return embedding_sum, None  # Silence, nothing to learn from it
+        embedding_sum = partial if embedding_sum is None else embedding_sum + partial
+        norm = np.linalg.norm(embedding_sum)
+        if norm == 0:
+            return embedding_sum, None
+        return embedding_sum, self.recognizer.match_embedding(embedding_sum / norm)
+
+    async def _identify(self, match: Match) -> None:
+        """Record the identification and notify the callback."""
+        caller_id, similarity, metadata = match
+        self.result = match
+        self._finished = True
+        self._done.set()
+        logger.info(
+            f"Caller {caller_id} identified after {self._length / EMBEDDING_SAMPLE_RATE:.1f}s "
+            f"of audio (similarity: {similarity:.3f}, windows: {self.windows_processed})"
+        )
+        if self.on_identified is None:
+            return
+        try:
+            outcome = self.on_identified(caller_id, similarity, metadata)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception as e:
+            logger.error(f"Error handling identified caller {caller_id}: {e}")
+
+    def _give_up(self) -> None:
+        """Stop once the maximum audio was processed without a match."""
+        self._finished = True
+        self._done.set()
+        logger.info(
+            f"Caller not identified within {self._capacity / EMBEDDING_SAMPLE_RATE:.1f}s "
+            f"of audio ({self.windows_processed} windows)"
+        )
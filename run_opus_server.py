@@ -6,7 +6,7 @@ for minimal latency in real-time audio streaming between AudioCodes and OpenAI.
 Supports both real OpenAI API and mock mode via environment variables.
 
 Usage:
-    python run_opus_server.py [--port PORT] [--host HOST] [--mock] [--mock-server-url URL]
+    python run_opus_server.py [--port PORT] [--host HOST] [--workers N] [--mock] [--mock-server-url URL]
 
 Environment Variables:
     OPUSAGENT_USE_MOCK=true          - Enable mock mode (default: false)
@@ -15,6 +15,8 @@ Environment Variables:
     PORT=port                        - Server port (default: 8080)
     HOST=host                        - Server host (default: 0.0.0.0)
     LOG_LEVEL=level                  - Logging level (default: INFO)
+    WORKERS=n                        - Worker processes; 0 for one per CPU core (default: 1)
+    SESSION_STORAGE_TYPE=backend     - memory, redis or tiered (default: memory)
 
 Examples:
     # Run with real OpenAI API
@@ -28,11 +30,27 @@ Examples:
 
     # Run with command line flags
     python run_opus_server.py --mock --port 9000
+
+    # One worker process per CPU core, sessions shared through Redis
+    SESSION_STORAGE_TYPE=redis python run_opus_server.py --workers 0
+
+Multiple workers:
+    Each call's audio path (resampling, VAD, quality monitoring, recording)
+    runs in Python on the event loop, so one process is limited to one core.
+    With --workers N > 1, uvicorn's supervisor binds the socket once and
+    starts N worker processes that accept connections from it. Each worker
+    has its own WebSocketManager pool and warm connections (the warm pool
+    size is per worker). Sessions are shared through SESSION_STORAGE_TYPE, and
+    every worker publishes its statistics to a temporary directory so /stats
+    and /health report the whole server. Code reloading is not available
+    with several workers.
 """
 
 import argparse
 import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 import uvicorn
@@ -131,6 +149,15 @@ def parse_args():
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
         help=f"Logging level (default: {config.logging.level.value} from config)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=config.server.workers,
+        help=(
+            "Worker processes; 0 for one per CPU core "
+            f"(default: {config.server.workers} from config)"
+        ),
+    )
     parser.add_argument(
         "--mock",
         action="store_true",
@@ -144,9 +171,19 @@ def parse_args():
     return parser.parse_args()
 
 
+def resolve_workers(requested: int) -> int:
+    """Number of worker processes to start; 0 or less means one per CPU core."""
+    return requested if requested > 0 else (os.cpu_count() or 1)
+
+
 def main():
     """Main entry point for starting the server with optimized settings."""
     args = parse_args()
+    workers = resolve_workers(args.workers)
+    reload = config.server.reload or config.server.environment.value == "development"
+    if workers > 1 and reload:
+        logger.warning("Code reloading is not available with several workers")
+        reload = False
 
     # Handle mock mode configuration
     use_mock = args.mock or config.mock.enabled
@@ -197,6 +234,8 @@ def main():
     logger.info(f"Host: {args.host}")
     logger.info(f"Port: {args.port}")
     logger.info(f"Log level: {args.log_level}")
+    logger.info(f"Workers: {workers}")
+    logger.info(f"Session storage: {config.server.session_storage}")
     logger.info(f"Environment: {config.server.environment.value}")
     logger.info(f"Mode: {'MOCK' if use_mock else 'REAL'} API")
     logger.info(f"OpenAI Model: {config.openai.model}")
@@ -214,6 +253,7 @@ def main():
 
     logger.info("=========================")
 
+    stats_dir = None
     try:
         # Check if port is available
         import socket
@@ -228,9 +268,19 @@ def main():
             print("Please choose a different port or stop the process using that port")
             sys.exit(1)
 
-        # Configure uvicorn with optimized WebSocket settings for low latency
-        uvicorn_config = uvicorn.Config(
-            "opusagent.main:app",
+        if workers > 1:
+            if config.server.session_storage == "memory":
+                logger.warning(
+                    "Sessions are kept in each worker's memory; set "
+                    "SESSION_STORAGE_TYPE=redis to resume calls on any worker"
+                )
+            # Workers inherit the environment, so they all publish here
+            if not config.server.worker_stats_dir:
+                stats_dir = tempfile.mkdtemp(prefix="opusagent-workers-")
+                os.environ["WORKER_STATS_DIR"] = stats_dir
+
+        # Uvicorn settings with optimized WebSocket settings for low latency
+        uvicorn_settings = dict(
             host=args.host,
             port=args.port,
             log_level=args.log_level.lower(),
@@ -239,14 +289,13 @@ def main():
             # Disable access logs for lower overhead, we have our own logging
             access_log=config.server.access_log,
             # Reload on code changes during development
-            reload=config.server.reload
-            or config.server.environment.value == "development",
+            reload=reload,
             # WebSocket settings from centralized config
             ws_ping_interval=config.server.ws_ping_interval,
             ws_ping_timeout=config.server.ws_ping_timeout,
             ws_max_size=config.server.ws_max_size,
             # Performance settings from centralized config
-            workers=config.server.workers,
+            workers=workers,
             loop="asyncio",  # Use asyncio event loop
             timeout_keep_alive=config.server.timeout_keep_alive,
         )
@@ -257,23 +306,35 @@ def main():
             print(f"   Mock server URL: {args.mock_server_url}")
             print(f"   Server URL: http://{args.host}:{args.port}")
             print(f"   Log level: {args.log_level}")
+            print(f"   Workers: {workers}")
             print(f"\n   The server is using the LocalRealtimeClient for testing.")
             print(f"   No OpenAI API calls will be made.")
         else:
             print(f"\n🚀 Starting OpusAgent server in REAL mode")
             print(f"   Server URL: http://{args.host}:{args.port}")
             print(f"   Log level: {args.log_level}")
+            print(f"   Workers: {workers}")
             print(f"\n   The server is using the real OpenAI API.")
             print(f"   Make sure your API key is valid and has sufficient credits.")
 
         logger.info("Starting server with uvicorn...")
-        server = uvicorn.Server(uvicorn_config)
-        server.run()
+        if workers > 1:
+            # Only uvicorn.run() starts the multiprocess supervisor;
+            # Server.run() ignores workers
+            uvicorn.run("opusagent.main:app", **uvicorn_settings)
+        else:
+            server = uvicorn.Server(
+                uvicorn.Config("opusagent.main:app", **uvicorn_settings)
+            )
+            server.run()
 
     except Exception as e:
         logger.error(f"Failed to start server: {str(e)}")
         print(f"\nError: Failed to start server: {str(e)}")
         sys.exit(1)
+    finally:
+        if stats_dir is not None:
+            shutil.rmtree(stats_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Event Codec Benchmark
+
+Measures events per second for the per-message work the handlers do before
+anything is sent, comparing the validated path (json.loads and pydantic
+models) with the fast path in opusagent/utils/event_codec.py:
+
+- response.audio.delta: decode, validate the delta, build playStream.chunk
+  (the validated path also base64-decodes the delta to check it)
+- media (Twilio): decode, read payload and track
+- response.done: decode only; control events keep full validation, so this
+  shows the orjson gain alone
+
+orjson is used when installed; otherwise the fast path falls back to the
+standard library and only the skipped validation is measured.
+
+Usage:
+    python scripts/benchmark_event_codec.py [--events N]
+
+Examples:
+    # Default run: 100000 events per event type and path
+    python scripts/benchmark_event_codec.py
+"""
+
+import argparse
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from opusagent.models.audiocodes_api import PlayStreamChunkMessage, TelephonyEventType
+from opusagent.models.openai_api import ResponseAudioDeltaEvent
+from opusagent.models.twilio_api import MediaMessage
+from opusagent.utils import event_codec
+
+# 20 ms of 24 kHz PCM16 and of 8 kHz mu-law
+AUDIO_DELTA = json.dumps(
+    {
+        "type": "response.audio.delta",
+        "event_id": "event_bench",
+        "response_id": "resp_bench",
+        "item_id": "item_bench",
+        "output_index": 0,
+        "content_index": 0,
+        "delta": base64.b64encode(bytes(960)).decode(),
+    }
+)
+
+TWILIO_MEDIA = json.dumps(
+    {
+        "event": "media",
+        "sequenceNumber": "42",
+        "streamSid": "MZbench",
+        "media": {
+            "track": "inbound",
+            "chunk": "41",
+            "timestamp": "820",
+            "payload": base64.b64encode(bytes(160)).decode(),
+        },
+    }
+)
+
+RESPONSE_DONE = json.dumps(
+    {
+        "type": "response.done",
+        "event_id": "event_bench",
+        "response": {
+            "id": "resp_bench",
+            "status": "completed",
+            "output": [
+                {
+                    "type": "message",
+                    "role": "assistant",
+                    "content": [{"type": "audio", "transcript": "Sure, let me check that. " * 10}],
+                }
+            ],
+            "usage": {"total_tokens": 512, "input_tokens": 300, "output_tokens": 212},
+        },
+    }
+)
+
+
+def audio_delta_validated(message: str) -> Dict[str, Any]:
+    audio_delta = ResponseAudioDeltaEvent(**json.loads(message))
+    base64.b64decode(audio_delta.delta)
+    return PlayStreamChunkMessage(
+        type=TelephonyEventType.PLAY_STREAM_CHUNK,
+        conversationId="conv_bench",
+        streamId="stream_bench",
+        audioChunk=audio_delta.delta,
+        participant="caller",
+    ).model_dump()
+
+
+def audio_delta_fast(message: str) -> Dict[str, Any]:
+    delta = event_codec.read_audio_delta(event_codec.loads(message))
+    return event_codec.play_stream_chunk("conv_bench", "stream_bench", delta)
+
+
+def media_validated(message: str) -> Any:
+    media = MediaMessage(**json.loads(message)).media
+    return media.payload, media.track
+
+
+def media_fast(message: str) -> Any:
+    return event_codec.read_twilio_media(event_codec.loads(message))
+
+
+CASES = [
+    ("response.audio.delta", AUDIO_DELTA, audio_delta_validated, audio_delta_fast),
+    ("media", TWILIO_MEDIA, media_validated, media_fast),
+    ("response.done", RESPONSE_DONE, json.loads, event_codec.loads),
+]
+
+
+def bench(func: Callable[[str], Any], message: str, events: int) -> float:
+    """Events per second through one path."""
+    start = time.perf_counter()
+    for _ in range(events):
+        func(message)
+    return events / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fast-path event decoding")
+    parser.add_argument(
+        "--events", type=int, default=100000, help="Events per event type and path"
+    )
+    args = parser.parse_args()
+
+    print(f"orjson: {'yes' if event_codec.HAS_ORJSON else 'no (stdlib fallback)'}")
+    print(f"{'event type':>22} {'validated/s':>12} {'fast/s':>12} {'speedup':>8}")
+    for name, message, validated, fast in CASES:
+        # Warm up both paths
+        bench(validated, message, 1000)
+        bench(fast, message, 1000)
+        slow_rate = bench(validated, message, args.events)
+        fast_rate = bench(fast, message, args.events)
+        print(
+            f"{name:>22} {slow_rate:>12.0f} {fast_rate:>12.0f} "
+            f"{fast_rate / slow_rate:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Event Router Benchmark
+
+Measures messages per second through EventRouter.handle_platform_event and
+handle_realtime_event with no-op handlers, for the mix a live call produces
+(mostly audio chunks and deltas, some transcript and control events). The
+router's logger is set to WARNING so the numbers reflect dispatch, not
+logging; see benchmark_logging.py for the logging cost.
+
+Usage:
+    python scripts/benchmark_event_router.py [--messages N]
+
+Examples:
+    # Default run: 200000 messages per path
+    python scripts/benchmark_event_router.py
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from opusagent.handlers.event_router import EventRouter
+from opusagent.models.audiocodes_api import TelephonyEventType
+
+PLATFORM_MIX = [
+    {"type": "userStream.chunk", "conversationId": "bench", "audioChunk": "A" * 640}
+] * 18 + [
+    {"type": "userStream.speech.started", "conversationId": "bench"},
+    {"type": "userStream.speech.stopped", "conversationId": "bench"},
+]
+
+REALTIME_MIX = [{"type": "response.audio.delta", "delta": "B" * 640}] * 14 + [
+    {"type": "response.audio_transcript.delta", "delta": "Sure"},
+    {"type": "response.audio_transcript.delta", "delta": " thing"},
+    {"type": "input_audio_buffer.speech_started"},
+    {"type": "rate_limits.updated", "rate_limits": []},
+    {"type": "response.output_item.done", "item": {"id": "item_1"}},
+    {"type": "response.done", "response": {"id": "resp_1", "status": "completed"}},
+]
+
+
+async def noop(data):
+    return None
+
+
+def sync_noop(data):
+    return None
+
+
+def build_router() -> EventRouter:
+    router = EventRouter()
+    for event_type in (
+        TelephonyEventType.USER_STREAM_CHUNK,
+        TelephonyEventType.USER_STREAM_SPEECH_STARTED,
+        TelephonyEventType.USER_STREAM_SPEECH_STOPPED,
+    ):
+        router.register_platform_handler(event_type, noop)
+    for event_type in {m["type"] for m in REALTIME_MIX}:
+        router.register_realtime_handler(event_type, noop)
+    # One sync handler, as some bridges register
+    router.register_realtime_handler("response.output_item.done", sync_noop)
+    return router
+
+
+async def bench(handle, mix, messages: int) -> float:
+    """Messages per second through one router entry point."""
+    count = 0
+    start = time.perf_counter()
+    while count < messages:
+        for message in mix:
+            await handle(message)
+        count += len(mix)
+    return count / (time.perf_counter() - start)
+
+
+async def main_async(args) -> None:
+    router = build_router()
+    platform_rate = await bench(router.handle_platform_event, PLATFORM_MIX, args.messages)
+    realtime_rate = await bench(router.handle_realtime_event, REALTIME_MIX, args.messages)
+
+    print(f"{'path':>10} {'messages/s':>12} {'us/message':>11}")
+    for name, rate in (("platform", platform_rate), ("realtime", realtime_rate)):
+        print(f"{name:>10} {rate:>12.0f} {1e6 / rate:>11.2f}")
+
+    stats = router.get_stats()
+    print(f"\nDispatched {stats['dispatched']} messages, {stats['errors']} errors")
+    print(f"{'event type':>34} {'count':>8} {'avg us':>8} {'p99 us':>8}")
+    for event_type, event_stats in sorted(stats["events"].items()):
+        print(
+            f"{event_type:>34} {event_stats['count']:>8} "
+            f"{event_stats['avg_us']:>8.2f} {event_stats['p99_us']:>8.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EventRouter dispatch")
+    parser.add_argument(
+        "--messages", type=int, default=200000, help="Messages sent per path"
+    )
+    args = parser.parse_args()
+
+    # Keep router logging out of the measurement
+    logging.getLogger("event_router").setLevel(logging.WARNING)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+G.711 Codec Micro-Benchmark
+
+Measures frames/sec of the NumPy lookup-table G.711 codec against audioop
+(when the running Python still ships it) and the previous per-sample
+struct-based fallback, for the 20ms frames Twilio Media Streams use.
+
+Usage:
+    python scripts/benchmark_g711.py [--seconds SECONDS] [--frame-ms MS]
+
+Examples:
+    # Default run: 20ms frames, 30 seconds of 8kHz audio
+    python scripts/benchmark_g711.py
+
+    # 40ms frames (two Twilio frames, as buffered by the bridge)
+    python scripts/benchmark_g711.py --frame-ms 40
+"""
+
+import argparse
+import struct
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from opusagent.utils import g711
+
+SAMPLE_RATE = 8000
+
+
+def struct_ulaw_decode(mulaw_bytes: bytes) -> bytes:
+    """Per-sample decode, as the old AudioUtils fallback did it."""
+    table = np.frombuffer(g711.ulaw_to_pcm16(bytes(range(256))), dtype="<i2").tolist()
+    out = bytearray()
+    for byte in mulaw_bytes:
+        out.extend(struct.pack("<h", table[byte]))
+    return bytes(out)
+
+
+def make_frames(seconds: float, frame_ms: int):
+    """Create PCM16 and μ-law frames of a speech-band test signal."""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    signal = 0.3 * np.sin(2 * np.pi * 220 * t) + 0.1 * np.sin(2 * np.pi * 1800 * t)
+    pcm = (signal * 32767).astype(np.int16)
+    frame_samples = SAMPLE_RATE * frame_ms // 1000
+    pcm_frames = [
+        pcm[i : i + frame_samples].tobytes()
+        for i in range(0, len(pcm) - frame_samples + 1, frame_samples)
+    ]
+    ulaw_frames = [g711.pcm16_to_ulaw(frame) for frame in pcm_frames]
+    return pcm_frames, ulaw_frames
+
+
+def bench(func, frames) -> float:
+    func(frames[0])  # warm up
+    start = time.perf_counter()
+    for frame in frames:
+        func(frame)
+    return len(frames) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark G.711 codec paths")
+    parser.add_argument("--seconds", type=float, default=30.0, help="Audio to convert")
+    parser.add_argument("--frame-ms", type=int, default=20, help="Frame duration")
+    args = parser.parse_args()
+
+    pcm_frames, ulaw_frames = make_frames(args.seconds, args.frame_ms)
+
+    cases = [
+        ("ulaw decode (lut)", g711.ulaw_to_pcm16, ulaw_frames),
+        ("ulaw encode (lut)", g711.pcm16_to_ulaw, pcm_frames),
+        ("alaw decode (lut)", g711.alaw_to_pcm16, ulaw_frames),
+        ("alaw encode (lut)", g711.pcm16_to_alaw, pcm_frames),
+        ("ulaw decode (struct)", struct_ulaw_decode, ulaw_frames),
+    ]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            import audioop
+        except ImportError:
+            audioop = None
+    if audioop is not None:
+        cases += [
+            ("ulaw decode (audioop)", lambda b: audioop.ulaw2lin(b, 2), ulaw_frames),
+            ("ulaw encode (audioop)", lambda b: audioop.lin2ulaw(b, 2), pcm_frames),
+        ]
+    else:
+        print("audioop not available on this Python - skipping audioop baseline")
+
+    frames_per_stream_sec = 1000 / args.frame_ms
+    print(f"{'path':>24} {'frames/s':>12} {'MB/s':>8} {'streams/core':>13}")
+    for name, func, frames in cases:
+        rate = bench(func, frames)
+        megabytes = rate * len(frames[0]) / 1e6
+        print(
+            f"{name:>24} {rate:>12.0f} {megabytes:>8.1f} "
+            f"{rate / frames_per_stream_sec:>13.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Logging Load Benchmark
+
+Drives the EventRouter with simulated calls (an inbound audio chunk and an
+outbound audio delta every 20 ms per call, and a response.done payload every
+two seconds) while a probe task measures how late the event loop wakes up.
+Compares:
+
+- off: logging disabled
+- sync, DEBUG: console and file written on the event loop, every record kept
+  (close to the previous configuration)
+- queued, DEBUG: background writer with hot-path sampling
+- queued, INFO: background writer, sampling, DEBUG payloads never serialized
+
+Console output goes to /dev/null and the log file to a temporary directory,
+so the numbers reflect formatting and I/O rather than terminal speed.
+
+Usage:
+    python scripts/benchmark_logging.py [--calls N] [--seconds S]
+
+Examples:
+    # Default run: 20 calls for 3 seconds per mode
+    python scripts/benchmark_logging.py
+
+    # Heavier load
+    python scripts/benchmark_logging.py --calls 100 --seconds 5
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from opusagent.config import logging_config
+from opusagent.handlers.event_router import EventRouter
+from opusagent.models.audiocodes_api import TelephonyEventType
+
+FRAME_SECONDS = 0.02
+PROBE_INTERVAL = 0.005
+
+RESPONSE_DONE = {
+    "type": "response.done",
+    "response": {
+        "id": "resp_bench",
+        "status": "completed",
+        "output": [
+            {
+                "type": "message",
+                "role": "assistant",
+                "content": [{"type": "audio", "transcript": "Sure, let me check that. " * 10}],
+            }
+        ],
+        "usage": {"total_tokens": 512, "input_tokens": 300, "output_tokens": 212},
+    },
+}
+
+
+def configure(mode: str, log_dir: str) -> None:
+    """Point the event router's logger at the configuration under test."""
+    logging_config.shutdown_logging()
+    queued, level = {
+        "off": (True, logging.CRITICAL + 1),
+        "sync, DEBUG": (False, logging.DEBUG),
+        "queued, DEBUG": (True, logging.DEBUG),
+        "queued, INFO": (True, logging.INFO),
+    }[mode]
+    logging_config.LOG_QUEUED = queued
+    sampled = mode.startswith("queued")
+    logging_config.event_filter.rate_limit = 20.0 if sampled else 0
+    logging_config.event_filter.audio_sample_every = 50 if sampled else 1
+
+    stdout = sys.stdout
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = devnull
+        try:
+            logger = logging_config.configure_logging("event_router", log_dir, "bench.log")
+        finally:
+            sys.stdout = stdout
+    logger.setLevel(level)
+
+
+async def simulate_call(router: EventRouter, stop: asyncio.Event, counter: List[int]) -> None:
+    chunk = {"type": "userStream.chunk", "conversationId": "bench", "audioChunk": "A" * 640}
+    delta = {"type": "response.audio.delta", "delta": "B" * 640}
+    frames = 0
+    while not stop.is_set():
+        await router.handle_platform_event(chunk)
+        await router.handle_realtime_event(delta)
+        frames += 1
+        if frames % 100 == 0:
+            await router.handle_realtime_event(RESPONSE_DONE)
+        counter[0] += 2
+        await asyncio.sleep(FRAME_SECONDS)
+
+
+async def probe(stop: asyncio.Event, lags: List[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - start - PROBE_INTERVAL) * 1000)
+
+
+async def run_mode(mode: str, calls: int, seconds: float, log_dir: str) -> Dict[str, float]:
+    configure(mode, log_dir)
+    router = EventRouter()
+
+    async def noop(data):
+        return None
+
+    router.register_platform_handler(TelephonyEventType.USER_STREAM_CHUNK, noop)
+    router.register_realtime_handler("response.audio.delta", noop)
+
+    stop = asyncio.Event()
+    lags: List[float] = []
+    counter = [0]
+    tasks = [asyncio.create_task(simulate_call(router, stop, counter)) for _ in range(calls)]
+    tasks.append(asyncio.create_task(probe(stop, lags)))
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+
+    lags.sort()
+    return {
+        "events_per_s": counter[0] / seconds,
+        "p50": statistics.median(lags),
+        "p99": lags[int(len(lags) * 0.99) - 1],
+        "max": lags[-1],
+    }
+
+
+async def main_async(args) -> None:
+    modes = ["off", "sync, DEBUG", "queued, DEBUG", "queued, INFO"]
+    print(f"{args.calls} calls, {args.seconds:.0f}s per mode; event loop lag in ms")
+    print(f"{'mode':>14} {'events/s':>10} {'p50':>8} {'p99':>8} {'max':>8}")
+    with tempfile.TemporaryDirectory() as log_dir:
+        for mode in modes:
+            result = await run_mode(mode, args.calls, args.seconds, log_dir)
+            print(
+                f"{mode:>14} {result['events_per_s']:>10.0f} {result['p50']:>8.2f} "
+                f"{result['p99']:>8.2f} {result['max']:>8.2f}"
+            )
+        logging_config.shutdown_logging()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark logging cost on the event loop")
+    parser.add_argument("--calls", type=int, default=20, help="Simulated concurrent calls")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration of each mode")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Memory Session Storage Benchmark
+
+Fills MemorySessionStorage to capacity (100k sessions by default) and
+measures the operations a busy server performs on it:
+
+- store at capacity, which evicts a session each time
+- retrieve and touch of random sessions
+- cleanup when 1% of the sessions have expired
+
+The same workload runs against a copy of the storage that evicts by
+scanning every timestamp with min() and expires sessions with a full scan,
+as MemorySessionStorage did before its activity index. Latencies come from
+the histograms in get_stats().
+
+Usage:
+    python scripts/benchmark_memory_storage.py [--sessions N] [--operations N]
+
+Examples:
+    # Default run: 100k sessions
+    python scripts/benchmark_memory_storage.py
+
+    # Quicker run
+    python scripts/benchmark_memory_storage.py --sessions 20000 --operations 500
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from opusagent.session_storage import MemorySessionStorage
+
+OPERATIONS = [
+    "store_session",
+    "retrieve_session",
+    "update_session_activity",
+    "cleanup_expired_sessions",
+]
+
+
+class ScanningMemoryStorage(MemorySessionStorage):
+    """Evicts and expires by scanning every session timestamp."""
+
+    async def _evict_oldest_session(self) -> None:
+        oldest = min(
+            self._session_timestamps.keys(),
+            key=lambda k: self._session_timestamps[k],
+        )
+        del self._sessions[oldest]
+        del self._session_timestamps[oldest]
+
+    async def cleanup_expired_sessions(self, max_age_seconds: int = 3600) -> int:
+        start = time.perf_counter()
+        async with self._lock:
+            now = time.time()
+            expired = [
+                conv_id
+                for conv_id, timestamp in self._session_timestamps.items()
+                if now - timestamp > max_age_seconds
+            ]
+            for conv_id in expired:
+                del self._sessions[conv_id]
+                del self._session_timestamps[conv_id]
+        self._latency["cleanup_expired_sessions"].record(time.perf_counter() - start)
+        return len(expired)
+
+
+def session(conversation_id: str) -> Dict[str, str]:
+    return {"conversation_id": conversation_id, "status": "active"}
+
+
+async def run(
+    storage: MemorySessionStorage, sessions: int, operations: int
+) -> Dict[str, Dict[str, float]]:
+    """Run the workload; returns latency stats per operation."""
+    ids: List[str] = [f"call-{i}" for i in range(sessions)]
+    for conversation_id in ids:
+        await storage.store_session(conversation_id, session(conversation_id))
+    storage._latency.clear()
+
+    rng = random.Random(0)
+    for i in range(operations):
+        new_id = f"new-{i}"
+        await storage.store_session(new_id, session(new_id))
+        ids.append(new_id)
+        await storage.retrieve_session(rng.choice(ids[-sessions:]))
+        await storage.update_session_activity(rng.choice(ids[-sessions:]))
+
+    # Age 1% of the sessions, then expire them
+    now = time.time()
+    for conversation_id in rng.sample(list(storage._sessions), sessions // 100):
+        storage._session_timestamps[conversation_id] = now - 7200
+    removed = await storage.cleanup_expired_sessions(max_age_seconds=3600)
+    assert removed == sessions // 100, "cleanup missed sessions"
+
+    return storage.get_stats()["latency"]
+
+
+async def main_async(args) -> None:
+    cases = [
+        ("activity index", MemorySessionStorage(max_sessions=args.sessions)),
+        ("full scan", ScanningMemoryStorage(max_sessions=args.sessions)),
+    ]
+    print(f"{args.sessions} sessions, {args.operations} operations each\n")
+    print(f"{'operation':<26} {'storage':<16} {'avg':>11} {'p50':>11} {'p99':>11}")
+    results = []
+    for name, storage in cases:
+        results.append((name, await run(storage, args.sessions, args.operations)))
+    for operation in OPERATIONS:
+        for name, latency in results:
+            stats = latency[operation]
+            print(
+                f"{operation:<26} {name:<16} {stats['avg_us']:>8.1f} us "
+                f"{stats['p50_us']:>8.1f} us {stats['p99_us']:>8.1f} us"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark MemorySessionStorage at capacity"
+    )
+    parser.add_argument(
+        "--sessions", type=int, default=100_000, help="Sessions held in storage"
+    )
+    parser.add_argument(
+        "--operations", type=int, default=1000, help="Stores, retrieves and touches"
+    )
+    args = parser.parse_args()
+
+    # Keep storage debug logging out of the results table
+    logging.disable(logging.INFO)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
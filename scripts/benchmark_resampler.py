@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Resampler Micro-Benchmark
+
+Compares chunks/sec of the stateful polyphase StreamingResampler against the
+stateless AudioUtils.resample_audio (librosa) path for the fixed telephony
+ratios used by the bridges.
+
+Usage:
+    python scripts/benchmark_resampler.py [--seconds SECONDS] [--chunk-ms MS]
+
+Examples:
+    # Default run: 20ms chunks, 10 seconds of audio per ratio
+    python scripts/benchmark_resampler.py
+
+    # 40ms chunks (AudioCodes default)
+    python scripts/benchmark_resampler.py --chunk-ms 40
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from opusagent.utils.audio_utils import AudioUtils
+from opusagent.utils.resampler import StreamingResampler
+
+RATE_PAIRS = [
+    (8000, 24000),  # Twilio inbound
+    (16000, 24000),  # AudioCodes inbound
+    (24000, 8000),  # Twilio outbound
+    (24000, 16000),
+]
+
+
+def make_chunks(sample_rate: int, seconds: float, chunk_ms: int):
+    """Create PCM16 chunks of a speech-band test signal."""
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    signal = 0.3 * np.sin(2 * np.pi * 220 * t) + 0.1 * np.sin(2 * np.pi * 1800 * t)
+    pcm = (signal * 32767).astype(np.int16)
+    chunk_samples = sample_rate * chunk_ms // 1000
+    return [
+        pcm[i : i + chunk_samples].tobytes()
+        for i in range(0, len(pcm) - chunk_samples + 1, chunk_samples)
+    ]
+
+
+def bench_streaming(chunks, from_rate: int, to_rate: int) -> float:
+    resampler = StreamingResampler(from_rate, to_rate)
+    start = time.perf_counter()
+    for chunk in chunks:
+        resampler.process(chunk)
+    return len(chunks) / (time.perf_counter() - start)
+
+
+def bench_librosa(chunks, from_rate: int, to_rate: int) -> float:
+    start = time.perf_counter()
+    for chunk in chunks:
+        AudioUtils.resample_audio(chunk, from_rate, to_rate)
+    return len(chunks) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark audio resampling paths")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Audio per ratio")
+    parser.add_argument("--chunk-ms", type=int, default=20, help="Chunk duration")
+    args = parser.parse_args()
+
+    try:
+        import librosa  # noqa: F401
+
+        have_librosa = True
+    except ImportError:
+        have_librosa = False
+        print("librosa not installed - reporting the struct fallback as baseline")
+
+    chunks_per_stream_sec = 1000 / args.chunk_ms
+    print(f"{'ratio':>14} {'streaming/s':>12} {'librosa/s':>12} {'speedup':>8} {'streams/core':>13}")
+    for from_rate, to_rate in RATE_PAIRS:
+        chunks = make_chunks(from_rate, args.seconds, args.chunk_ms)
+        # Warm up both paths (filter design, librosa imports)
+        bench_streaming(chunks[:5], from_rate, to_rate)
+        bench_librosa(chunks[:5], from_rate, to_rate)
+
+        streaming = bench_streaming(chunks, from_rate, to_rate)
+        baseline = bench_librosa(chunks, from_rate, to_rate)
+        print(
+            f"{from_rate:>6}->{to_rate:<6} {streaming:>12.0f} {baseline:>12.0f} "
+            f"{streaming / baseline:>7.1f}x {streaming / chunks_per_stream_sec:>13.0f}"
+        )
+
+    if not have_librosa:
+        print("(baseline column measured without librosa)")
+
+
+if __name__ == "__main__":
+    main()
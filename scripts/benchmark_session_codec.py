@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Session Codec Benchmark
+
+Measures encode time, decode time and stored size of a whole session for
+each session codec, using realistic 50-turn banking and insurance calls:
+transcript items on both sides, function calls with the results the agents
+return, and scenario metadata.
+
+Codecs whose optional packages (orjson, msgpack, zstandard) are not
+installed are skipped.
+
+Usage:
+    python scripts/benchmark_session_codec.py [--turns N] [--iterations N]
+        [--codecs SPEC ...]
+
+Examples:
+    # Default run: 50-turn sessions, all codecs
+    python scripts/benchmark_session_codec.py
+
+    # Longer calls, selected codecs
+    python scripts/benchmark_session_codec.py --turns 200 --codecs json msgpack+zstd
+"""
+
+import argparse
+import logging
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from opusagent.agents import banking_agent, insurance_agent
+from opusagent.models.session_state import SessionState, SessionStatus
+from opusagent.session_storage import get_session_codec
+
+DEFAULT_CODECS = [
+    "json",
+    "json+zlib",
+    "json+zstd",
+    "orjson",
+    "orjson+zlib",
+    "orjson+zstd",
+    "msgpack",
+    "msgpack+zlib",
+    "msgpack+zstd",
+]
+
+BANKING_DIALOGUE = [
+    ("user", "Hi, I lost my debit card yesterday and I need a replacement."),
+    ("assistant", "I'm sorry to hear that. I can help you replace your card. "
+     "Before we continue, could you confirm the last four digits of your "
+     "account number?"),
+    ("user", "It ends in 4821. Can you also tell me my current balance?"),
+    ("assistant", "Thank you. Your current balance is $1,234.56, including "
+     "pending transactions. Would you like me to block the lost card now?"),
+    ("user", "Yes please, and move two hundred dollars into savings."),
+    ("assistant", "Done. I've transferred $200.00 to your savings account and "
+     "blocked the lost card. Where should we send the replacement?"),
+]
+
+INSURANCE_DIALOGUE = [
+    ("user", "I was in a car accident this morning and need to file a claim."),
+    ("assistant", "I'm sorry to hear that, I hope everyone is okay. Can you "
+     "give me your policy number so I can look up your coverage?"),
+    ("user", "It's POL-123456. The other driver ran a red light."),
+    ("assistant", "Thank you. Your Auto & Home Bundle is active, with "
+     "collision coverage and a $500 deductible. Can you describe the damage?"),
+    ("user", "The front bumper and headlight are smashed, maybe three "
+     "thousand dollars."),
+    ("assistant", "I've filed your collision claim. A claims adjuster will "
+     "contact you within 24 to 48 hours."),
+]
+
+BANKING_CALLS: List[Tuple[str, Callable, Dict[str, Any]]] = [
+    ("get_balance", banking_agent.func_get_balance,
+     {"account_number": "****4821", "include_pending": True}),
+    ("transfer_funds", banking_agent.func_transfer_funds,
+     {"from_account": "checking", "to_account": "savings", "amount": 200}),
+    ("process_replacement", banking_agent.func_process_replacement,
+     {"card_type": "debit", "reason": "lost",
+      "delivery_address": "12 Main Street, Springfield"}),
+]
+
+INSURANCE_CALLS: List[Tuple[str, Callable, Dict[str, Any]]] = [
+    ("get_policy_info", insurance_agent.func_get_policy_info,
+     {"policy_number": "POL-123456", "include_coverage": True}),
+    ("check_coverage", insurance_agent.func_check_coverage,
+     {"policy_number": "POL-123456", "coverage_type": "collision"}),
+    ("file_claim", insurance_agent.func_file_claim,
+     {"policy_number": "POL-123456", "claim_type": "Auto",
+      "incident_date": "2025-01-01", "estimated_damage": 3000,
+      "description": "Hit at an intersection by a driver who ran a red light"}),
+]
+
+
+def build_session(
+    scenario: str,
+    dialogue: List[Tuple[str, str]],
+    calls: List[Tuple[str, Callable, Dict[str, Any]]],
+    turns: int,
+) -> Dict[str, Any]:
+    """A serialized session of ``turns`` transcript items."""
+    start = datetime(2025, 1, 1, 12, 0, 0)
+    session = SessionState(
+        conversation_id=f"{scenario}-call",
+        bot_name=f"{scenario}-agent",
+        caller="+15551234567",
+        status=SessionStatus.ACTIVE,
+        openai_session_id="sess_8f2a61c0b5",
+        metadata={"scenario": scenario, "language": "en-US", "channel": "phone"},
+    )
+    for turn in range(turns):
+        role, text = dialogue[turn % len(dialogue)]
+        timestamp = (start + timedelta(seconds=6 * turn)).isoformat()
+        session.add_conversation_item(
+            {
+                "type": "input" if role == "user" else "output",
+                "role": role,
+                "content": text,
+                "timestamp": timestamp,
+            }
+        )
+        # A function call every few turns, as the agent resolves requests
+        if role == "assistant" and turn % 4 == 1:
+            name, func, arguments = calls[(turn // 4) % len(calls)]
+            session.add_function_call(
+                {
+                    "name": name,
+                    "call_id": f"call_{turn:04d}",
+                    "arguments": arguments,
+                    "result": func(arguments),
+                    "timestamp": timestamp,
+                }
+            )
+    return session.to_dict()
+
+
+def bench(
+    spec: str, session: Dict[str, Any], iterations: int
+) -> Tuple[float, float, int]:
+    """Encode microseconds, decode microseconds and stored bytes."""
+    codec = get_session_codec(spec)
+    data = codec.encode(session)
+    assert codec.decode(data) == session, f"{spec} did not round-trip"
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        codec.encode(session)
+    encode_us = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        codec.decode(data)
+    decode_us = (time.perf_counter() - start) / iterations * 1e6
+    return encode_us, decode_us, len(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark session codecs")
+    parser.add_argument(
+        "--turns", type=int, default=50, help="Transcript items per session"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=500, help="Encodes and decodes timed"
+    )
+    parser.add_argument(
+        "--codecs", nargs="+", default=DEFAULT_CODECS, help="Codec specs to compare"
+    )
+    args = parser.parse_args()
+
+    # Keep the agents' function logging out of the results table
+    logging.disable(logging.INFO)
+
+    sessions = {
+        "banking": build_session(
+            "banking", BANKING_DIALOGUE, BANKING_CALLS, args.turns
+        ),
+        "insurance": build_session(
+            "insurance", INSURANCE_DIALOGUE, INSURANCE_CALLS, args.turns
+        ),
+    }
+
+    for scenario, session in sessions.items():
+        print(f"\n{scenario} session, {args.turns} turns")
+        print(
+            f"{'codec':<14} {'encode':>10} {'decode':>10} {'bytes':>8} {'vs json':>8}"
+        )
+        json_bytes = None
+        for spec in args.codecs:
+            try:
+                encode_us, decode_us, size = bench(spec, session, args.iterations)
+            except RuntimeError as e:
+                print(f"{spec:<14} skipped: {e}")
+                continue
+            json_bytes = json_bytes or (size if spec == "json" else None)
+            ratio = f"{size / json_bytes:>7.0%}" if json_bytes else f"{'-':>7}"
+            print(
+                f"{spec:<14} {encode_us:>7.1f} us {decode_us:>7.1f} us "
+                f"{size:>8} {ratio:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Session Update Benchmark
+
+Measures the cost of one transcript turn (append a conversation item, then
+patch a scalar field) as a call gets longer, for:
+
+- full rewrite: read the whole session, decode it, apply the change and
+  encode and write it back, as update_session did before delta writes.
+  Sessions are held as JSON strings, the way Redis stores them.
+- delta (memory): MemorySessionStorage with in-place patches and appends
+- delta (redis): RedisSessionStorage with hash patches and list appends
+  (only with --redis-url)
+- tiered (redis): TieredSessionStorage caching sessions locally in front
+  of Redis, with write-behind flushes (only with --redis-url)
+
+The full rewrite grows with the history; the delta paths should stay flat.
+
+Usage:
+    python scripts/benchmark_session_updates.py [--turns N] [--samples N]
+        [--redis-url URL]
+
+Examples:
+    # Default run: up to 2000 turns
+    python scripts/benchmark_session_updates.py
+
+    # Include a local Redis server
+    python scripts/benchmark_session_updates.py --redis-url redis://localhost:6379
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from opusagent.models.session_state import SessionStatus
+from opusagent.services.session_manager_service import SessionManagerService
+from opusagent.session_storage import MemorySessionStorage, SessionStorage
+
+
+class JsonSnapshotStorage(SessionStorage):
+    """Whole-session JSON strings; patches fall back to read-modify-write."""
+
+    def __init__(self):
+        self._sessions: Dict[str, str] = {}
+
+    async def store_session(
+        self, conversation_id: str, session_data: Dict[str, Any]
+    ) -> bool:
+        self._sessions[conversation_id] = json.dumps(session_data)
+        return True
+
+    async def retrieve_session(
+        self, conversation_id: str, update_activity: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        data = self._sessions.get(conversation_id)
+        return json.loads(data) if data else None
+
+    async def delete_session(self, conversation_id: str) -> bool:
+        return self._sessions.pop(conversation_id, None) is not None
+
+    async def list_active_sessions(self) -> List[str]:
+        return list(self._sessions)
+
+    async def cleanup_expired_sessions(self, max_age_seconds: int = 3600) -> int:
+        return 0
+
+    async def update_session_activity(self, conversation_id: str) -> bool:
+        return conversation_id in self._sessions
+
+
+def make_item(turn: int) -> Dict[str, Any]:
+    """A transcript item of typical size."""
+    role = "user" if turn % 2 == 0 else "assistant"
+    return {
+        "type": "input" if role == "user" else "output",
+        "role": role,
+        "text": f"Turn {turn}: I would like to check the balance on my account "
+        "and ask about the last two card transactions, please.",
+        "timestamp": "2025-01-01T12:00:00",
+    }
+
+
+async def run_turn(
+    service: SessionManagerService, conversation_id: str, turn: int
+) -> None:
+    await service.append_conversation_item(conversation_id, make_item(turn))
+    await service.update_session(conversation_id, status=SessionStatus.ACTIVE)
+
+
+async def bench(
+    storage: SessionStorage, checkpoints: List[int], samples: int
+) -> List[float]:
+    """Microseconds per turn at each history length."""
+    service = SessionManagerService(storage)
+    conversation_id = "bench-call"
+    await service.delete_session(conversation_id)
+    await service.create_session(conversation_id)
+
+    results = []
+    turn = 0
+    for checkpoint in checkpoints:
+        while turn < checkpoint:
+            await run_turn(service, conversation_id, turn)
+            turn += 1
+        start = time.perf_counter()
+        for _ in range(samples):
+            await run_turn(service, conversation_id, turn)
+            turn += 1
+        results.append((time.perf_counter() - start) / samples * 1e6)
+
+    session = await service.get_session(conversation_id, update_activity=False)
+    assert session.current_turn == turn, "turns were lost"
+    await service.delete_session(conversation_id)
+    return results
+
+
+async def main_async(args) -> None:
+    checkpoints = [n for n in (10, 100, 500, 1000, 2000, 5000) if n <= args.turns]
+
+    cases = [
+        ("full rewrite", JsonSnapshotStorage()),
+        ("delta (memory)", MemorySessionStorage()),
+    ]
+    if args.redis_url:
+        from opusagent.session_storage import (
+            RedisSessionStorage,
+            TieredSessionStorage,
+        )
+
+        redis_storage = RedisSessionStorage(
+            redis_url=args.redis_url, session_prefix="bench:"
+        )
+        cases.append(("delta (redis)", redis_storage))
+        tiered_remote = RedisSessionStorage(
+            redis_url=args.redis_url, session_prefix="bench-tiered:"
+        )
+        cases.append(("tiered (redis)", TieredSessionStorage(tiered_remote)))
+
+    print(f"{'history':>8} " + " ".join(f"{name:>16}" for name, _ in cases))
+    columns = []
+    for name, storage in cases:
+        columns.append(await bench(storage, checkpoints, args.samples))
+        if hasattr(storage, "close"):
+            await storage.close()
+
+    for i, checkpoint in enumerate(checkpoints):
+        row = " ".join(f"{column[i]:>13.1f} us" for column in columns)
+        print(f"{checkpoint:>8} {row}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark session update cost")
+    parser.add_argument(
+        "--turns", type=int, default=2000, help="Longest history to measure"
+    )
+    parser.add_argument(
+        "--samples", type=int, default=50, help="Turns timed per point"
+    )
+    parser.add_argument("--redis-url", help="Also benchmark Redis at this URL")
+    args = parser.parse_args()
+
+    # Keep storage debug logging out of the results table
+    logging.disable(logging.INFO)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Server Startup Benchmark
+
+Measures the cold import of the server entry point with ``python -X
+importtime`` in fresh interpreters, and checks it against a regression
+budget:
+
+- the median cumulative import time of the module must stay under
+  --budget-ms
+- none of the optional heavy packages (torch, resemblyzer, scipy, ...) may
+  be imported; they load on first use or through PRELOAD
+
+Prints the median and the slowest imports of the last run, and exits with
+status 1 when the budget is exceeded, so it can run in CI.
+
+Usage:
+    python scripts/benchmark_startup.py [--module M] [--runs N] [--budget-ms MS] [--top K]
+
+Examples:
+    # Default run: 5 cold imports of opusagent.main, 1500 ms budget
+    python scripts/benchmark_startup.py
+
+    # Compare a single subsystem
+    python scripts/benchmark_startup.py --module opusagent.bridges.twilio_bridge --runs 3
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Optional packages that must not load with the server
+HEAVY_MODULES = (
+    "torch",
+    "resemblyzer",
+    "silero_vad",
+    "onnxruntime",
+    "whisper",
+    "pocketsphinx",
+    "scipy",
+    "sounddevice",
+    "pyaudio",
+    "twilio",
+)
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_import(module: str) -> Tuple[float, Dict[str, int], List[Tuple[int, int, str]]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        Tuple of the module's cumulative import time in ms, the top-level
+        package of every imported module mapped to its cumulative time in us,
+        and the (self us, cumulative us, name) rows
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr[-2000:])
+        raise SystemExit(f"Importing {module} failed")
+
+    rows: List[Tuple[int, int, str]] = []
+    packages: Dict[str, int] = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, _, name = match.groups()
+        rows.append((int(self_us), int(cumulative_us), name))
+        package = name.split(".")[0]
+        packages[package] = max(packages.get(package, 0), int(cumulative_us))
+        if name == module:
+            total_us = int(cumulative_us)
+    return total_us / 1000, packages, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark server cold-start imports")
+    parser.add_argument("--module", default="opusagent.main", help="Module to import")
+    parser.add_argument("--runs", type=int, default=5, help="Cold imports to time")
+    parser.add_argument(
+        "--budget-ms", type=float, default=1500.0, help="Budget for the median import time"
+    )
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    args = parser.parse_args()
+
+    # The first run warms the bytecode and OS file caches
+    run_import(args.module)
+    timings = []
+    for _ in range(args.runs):
+        total_ms, packages, rows = run_import(args.module)
+        timings.append(total_ms)
+
+    median_ms = statistics.median(timings)
+    print(f"{args.module}: median {median_ms:.0f} ms over {args.runs} runs "
+          f"(min {min(timings):.0f}, max {max(timings):.0f}); budget {args.budget_ms:.0f} ms")
+
+    print("\nSlowest top-level packages (cumulative ms):")
+    for package, cumulative_us in sorted(packages.items(), key=lambda p: -p[1])[: args.top]:
+        print(f"{package:>28} {cumulative_us / 1000:>8.1f}")
+
+    print("\nSlowest modules (self ms):")
+    for self_us, _, name in sorted(rows, reverse=True)[: args.top]:
+        print(f"{name.strip():>48} {self_us / 1000:>8.1f}")
+
+    heavy = [name for name in HEAVY_MODULES if name in packages]
+    failed = False
+    if heavy:
+        print(f"\nFAIL: optional packages imported at startup: {', '.join(heavy)}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"\nFAIL: median import time {median_ms:.0f} ms exceeds {args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print("\nOK: within budget, no optional packages imported")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
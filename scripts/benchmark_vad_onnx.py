@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Silero VAD Backend Benchmark
+
+Compares the torch ``SileroVAD`` backend with the onnxruntime ``silero_onnx``
+backend on:
+
+- start-up cost: time to import the backend and load the model, and the
+  resulting peak RSS, each measured in a fresh interpreter
+- per-call latency: one 32ms chunk at a time, as a single call sees it
+- batched throughput: one forward pass over many concurrent streams
+  (ONNX backend only; the torch backend runs streams one by one)
+
+Usage:
+    python scripts/benchmark_vad_onnx.py [--streams N] [--iterations N]
+
+Examples:
+    # Default run: 64 concurrent streams
+    python scripts/benchmark_vad_onnx.py
+
+    # Larger fan-out
+    python scripts/benchmark_vad_onnx.py --streams 256 --iterations 50
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+SAMPLE_RATE = 16000
+CHUNK_SIZE = 512
+
+STARTUP_PROBE = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+from opusagent.vad.vad_factory import VADFactory
+vad = VADFactory.create_vad({{"backend": {backend!r}, "sample_rate": 16000}})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "startup_s": elapsed,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "torch_loaded": "torch" in sys.modules,
+}}))
+"""
+
+
+def measure_startup(backend: str) -> dict:
+    """Import the backend and load its model in a fresh interpreter."""
+    code = STARTUP_PROBE.format(root=str(project_root), backend=backend)
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def make_chunks(count: int) -> np.ndarray:
+    """Noisy speech-band test chunks."""
+    rng = np.random.default_rng(0)
+    t = np.arange(count * CHUNK_SIZE) / SAMPLE_RATE
+    audio = 0.3 * np.sin(2 * np.pi * 220 * t) + 0.02 * rng.standard_normal(len(t))
+    return audio.astype(np.float32).reshape(count, CHUNK_SIZE)
+
+
+def bench_single(vad, chunks: np.ndarray) -> float:
+    """Mean milliseconds per process_audio() call on one chunk."""
+    vad.process_audio(chunks[0])  # warm up
+    start = time.perf_counter()
+    for chunk in chunks:
+        vad.process_audio(chunk)
+    return (time.perf_counter() - start) / len(chunks) * 1000
+
+
+def bench_batched(model, streams: int, iterations: int) -> float:
+    """Mean milliseconds per batched pass over ``streams`` streams."""
+    states = [model.create_stream(SAMPLE_RATE) for _ in range(streams)]
+    audio = make_chunks(streams)
+    model.forward(audio, states)  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        model.forward(audio, states)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Silero VAD backends")
+    parser.add_argument("--streams", type=int, default=64, help="Concurrent streams")
+    parser.add_argument(
+        "--iterations", type=int, default=100, help="Chunks/batches to time"
+    )
+    args = parser.parse_args()
+
+    from opusagent.vad.vad_factory import VADFactory
+
+    chunk_ms = CHUNK_SIZE / SAMPLE_RATE * 1000
+    chunks = make_chunks(args.iterations)
+
+    print("Start-up (fresh interpreter: import + model load)")
+    print(f"{'backend':>12} {'startup s':>10} {'peak RSS MB':>12} {'torch':>6}")
+    for backend in ("silero", "silero_onnx"):
+        try:
+            stats = measure_startup(backend)
+        except subprocess.CalledProcessError as e:
+            print(f"{backend:>12} unavailable: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        print(
+            f"{backend:>12} {stats['startup_s']:>10.2f} "
+            f"{stats['peak_rss_mb']:>12.0f} {str(stats['torch_loaded']):>6}"
+        )
+
+    print(f"\nPer-call latency ({chunk_ms:.0f}ms chunk, batch of 1)")
+    print(f"{'backend':>12} {'ms/chunk':>10} {'x realtime':>11}")
+    vads = {}
+    for backend in ("silero", "silero_onnx"):
+        try:
+            vads[backend] = VADFactory.create_vad(
+                {"backend": backend, "sample_rate": SAMPLE_RATE}
+            )
+        except RuntimeError as e:
+            print(f"{backend:>12} unavailable: {e}")
+            continue
+        latency = bench_single(vads[backend], chunks)
+        print(f"{backend:>12} {latency:>10.3f} {chunk_ms / latency:>11.0f}")
+
+    if "silero_onnx" in vads:
+        model = vads["silero_onnx"].model
+        print(f"\nBatched ONNX pass ({args.streams} streams, one chunk each)")
+        batch_ms = bench_batched(model, args.streams, args.iterations)
+        per_stream = batch_ms / args.streams
+        print(f"{'ms/batch':>10} {'ms/stream':>10} {'streams/core':>13}")
+        print(f"{batch_ms:>10.3f} {per_stream:>10.4f} {chunk_ms / per_stream:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Voiceprint Index Benchmark
+
+Measures caller identification latency against 1k, 100k and 1M enrolled
+callers (random 256-dimensional embeddings) for:
+
+- loop: one scipy cosine distance per voiceprint, as match_caller did before
+  the index (only up to --max-loop-size callers)
+- exact: VoiceprintIndex, one matrix-vector product
+- ivf: IVFVoiceprintIndex, scoring only the closest clusters; recall@1 is
+  measured against the exact index
+
+Queries are noisy copies of enrolled embeddings, like a returning caller.
+
+Usage:
+    python scripts/benchmark_voiceprint_index.py [--sizes N ...] [--queries N]
+
+Examples:
+    # Default run: 1k, 100k and 1M callers
+    python scripts/benchmark_voiceprint_index.py
+
+    # Quicker run
+    python scripts/benchmark_voiceprint_index.py --sizes 1000 100000 --queries 50
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from opusagent.voiceprint.index import IVFVoiceprintIndex, VoiceprintIndex
+from opusagent.voiceprint.models import Voiceprint
+
+DIMENSION = 256
+
+
+def make_voiceprints(rng, size: int):
+    embeddings = rng.standard_normal((size, DIMENSION), dtype=np.float32)
+    return [
+        Voiceprint(caller_id=f"caller_{i}", embedding=embedding)
+        for i, embedding in enumerate(embeddings)
+    ]
+
+
+def make_queries(rng, voiceprints, count: int):
+    picks = rng.choice(len(voiceprints), count)
+    return [
+        voiceprints[i].embedding
+        + 0.5 * rng.standard_normal(DIMENSION, dtype=np.float32)
+        for i in picks
+    ]
+
+
+def bench_loop(voiceprints, queries, threshold: float) -> float:
+    from scipy.spatial.distance import cosine
+
+    start = time.perf_counter()
+    for query in queries:
+        best = None
+        for voiceprint in voiceprints:
+            similarity = float(1 - cosine(query, voiceprint.embedding))
+            if similarity > threshold and (best is None or similarity > best[1]):
+                best = (voiceprint.caller_id, similarity)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def bench_index(index, queries, threshold: float):
+    index.search(queries[0], threshold=threshold)  # Warm up (and train IVF)
+    start = time.perf_counter()
+    results = [index.search(query, threshold=threshold) for query in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark voiceprint matching")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 100000, 1000000],
+        help="Enrolled callers per run",
+    )
+    parser.add_argument("--queries", type=int, default=100, help="Queries per run")
+    parser.add_argument(
+        "--max-loop-size", type=int, default=100000,
+        help="Largest enrollment to time the per-voiceprint loop on",
+    )
+    parser.add_argument("--threshold", type=float, default=0.75)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(
+        f"{'callers':>9} {'build ms':>9} {'loop ms':>9} {'exact ms':>9} "
+        f"{'ivf ms':>9} {'ivf recall':>11}"
+    )
+    for size in args.sizes:
+        voiceprints = make_voiceprints(rng, size)
+        queries = make_queries(rng, voiceprints, args.queries)
+
+        start = time.perf_counter()
+        exact = VoiceprintIndex()
+        exact.build(voiceprints)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        ivf = IVFVoiceprintIndex(n_lists=max(16, int(np.sqrt(size))), n_probe=16)
+        ivf.build(voiceprints)
+
+        loop = "-"
+        if size <= args.max_loop_size:
+            loop = f"{bench_loop(voiceprints, queries[:10], args.threshold) * 1000:.2f}"
+        exact_s, exact_results = bench_index(exact, queries, args.threshold)
+        ivf_s, ivf_results = bench_index(ivf, queries, args.threshold)
+
+        found = [
+            [m[0] for m in ivf_result] == [m[0] for m in exact_result]
+            for exact_result, ivf_result in zip(exact_results, ivf_results)
+        ]
+        recall = sum(found) / len(found)
+        print(
+            f"{size:>9} {build_ms:>9.1f} {loop:>9} {exact_s * 1000:>9.3f} "
+            f"{ivf_s * 1000:>9.3f} {recall:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
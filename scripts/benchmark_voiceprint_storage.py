@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Voiceprint Storage Benchmark
+
+Measures what a recognizer pays at startup and per match for each storage
+backend, with 100k enrolled callers (random 256-dimensional embeddings) by
+default:
+
+- load: a fresh storage reading every voiceprint and building the index from
+  get_embeddings(), as OpusAgentVoiceRecognizer.load_index() does
+- reread: get_embeddings() again with nothing changed (the cache check only)
+- save: one more enrollment
+
+Redis runs only with --redis-url.
+
+Usage:
+    python scripts/benchmark_voiceprint_storage.py [--callers N] [--redis-url URL]
+
+Examples:
+    # Default run: 100k callers, JSON and SQLite
+    python scripts/benchmark_voiceprint_storage.py
+
+    # Include Redis
+    python scripts/benchmark_voiceprint_storage.py --redis-url redis://localhost:6379
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from opusagent.voiceprint.index import VoiceprintIndex
+from opusagent.voiceprint.models import Voiceprint
+from opusagent.voiceprint.storage import JSONStorage, RedisStorage, SQLiteStorage
+
+DIMENSION = 256
+
+
+def make_voiceprints(count: int):
+    embeddings = np.random.default_rng(0).standard_normal(
+        (count, DIMENSION), dtype=np.float32
+    )
+    return [
+        Voiceprint(caller_id=f"caller_{i}", embedding=embedding, metadata={"i": i})
+        for i, embedding in enumerate(embeddings)
+    ]
+
+
+def bench(name: str, make_storage, voiceprints) -> None:
+    make_storage().save_many(voiceprints)
+
+    storage = make_storage()
+    start = time.perf_counter()
+    VoiceprintIndex().load(*storage.get_embeddings())
+    load_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(100):
+        storage.get_embeddings()
+    reread_ms = (time.perf_counter() - start) * 10
+
+    extra = Voiceprint(caller_id="extra", embedding=voiceprints[0].embedding)
+    start = time.perf_counter()
+    storage.save(extra)
+    save_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{name:>8} {load_ms:>10.1f} {reread_ms:>10.3f} {save_ms:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark voiceprint storage loading")
+    parser.add_argument("--callers", type=int, default=100000, help="Enrolled callers")
+    parser.add_argument("--redis-url", help="Also benchmark RedisStorage")
+    args = parser.parse_args()
+
+    voiceprints = make_voiceprints(args.callers)
+    print(f"{'storage':>8} {'load ms':>10} {'reread ms':>10} {'save ms':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "voiceprints.json")
+        bench("json", lambda: JSONStorage(json_path), voiceprints)
+
+        db_path = os.path.join(directory, "voiceprints.db")
+        bench("sqlite", lambda: SQLiteStorage(db_path), voiceprints)
+
+    if args.redis_url:
+        import redis
+
+        client = redis.Redis.from_url(args.redis_url)
+        prefix = "bench-voiceprints:"
+        bench("redis", lambda: RedisStorage(client, key_prefix=prefix), voiceprints)
+        client.delete(f"{prefix}embeddings", f"{prefix}info", f"{prefix}version")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Multi-Worker Load Test
+
+Starts run_opus_server.py with the local realtime mock (no OpenAI calls) at
+each requested worker count and finds how many concurrent calls it sustains
+in real time. Each simulated call is an AudioCodes session on
+/ws/telephony: session.initiate, then 20 ms userStream.chunk frames of
+16 kHz PCM16 paced at real time for --seconds, then userStream.stop.
+
+The server handles a connection's messages in order, so the delay between
+sending userStream.stop and receiving userStream.stopped is how far the
+server has fallen behind that call's audio. The concurrency is raised by
+--step until the p95 of that delay exceeds --max-lag-ms or calls fail; the
+last passing level is the capacity. With enough cores, capacity should grow
+roughly with the number of workers.
+
+During each level /stats is sampled halfway through, to check that the
+aggregated active_calls covers all workers.
+
+The load generator is a single Python process. When its own sends run late
+(reported as "client lag") the result is limited by the client, not the
+server; run it on another machine or lower --max-calls.
+
+Usage:
+    python scripts/load_test_workers.py [--workers 1,2,4] [--seconds S]
+        [--step N] [--max-calls N] [--max-lag-ms MS] [--port PORT]
+
+Examples:
+    # Default run: 1, 2 and 4 workers (capped at the CPU count)
+    python scripts/load_test_workers.py
+
+    # Finer steps and longer calls
+    python scripts/load_test_workers.py --workers 1,8 --step 5 --seconds 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+import uuid
+from base64 import b64encode
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import websockets
+
+# Add the project root to the path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+FRAME_SECONDS = 0.02
+SAMPLE_RATE = 16000
+ACK_TIMEOUT = 30.0
+
+
+def make_audio_chunk() -> str:
+    """20 ms of 16 kHz PCM16 noise, base64 encoded."""
+    frame_bytes = int(SAMPLE_RATE * FRAME_SECONDS) * 2
+    return b64encode(random.Random(0).randbytes(frame_bytes)).decode("ascii")
+
+
+AUDIO_CHUNK = make_audio_chunk()
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    """Start run_opus_server.py in mock mode in its own process group."""
+    env = dict(
+        os.environ,
+        OPUSAGENT_USE_MOCK="true",
+        USE_LOCAL_REALTIME="true",
+        LOG_LEVEL="WARNING",
+        ENV="production",
+    )
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "run_opus_server.py",
+            "--mock",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "WARNING",
+        ],
+        cwd=project_root,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    """Stop the server and its workers."""
+    try:
+        os.killpg(process.pid, signal.SIGINT)
+        process.wait(timeout=15)
+    except (ProcessLookupError, subprocess.TimeoutExpired):
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+
+def get_stats(port: int) -> Dict[str, Any]:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/stats", timeout=5) as response:
+        return json.loads(response.read())
+
+
+def wait_until_ready(port: int, workers: int, timeout: float = 60.0) -> None:
+    """Wait until /stats answers and, with several workers, all have published."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            stats = get_stats(port)
+            if workers == 1 or stats.get("workers", 0) >= workers:
+                return
+        except OSError:
+            pass
+        time.sleep(0.5)
+    raise SystemExit(f"Server with {workers} workers did not start within {timeout:.0f}s")
+
+
+async def run_call(url: str, seconds: float) -> Dict[str, float]:
+    """
+    Run one simulated call.
+
+    Returns:
+        The stop acknowledgement delay and the worst client send lag, in ms
+    """
+    conversation_id = str(uuid.uuid4())
+    loop = asyncio.get_running_loop()
+    accepted = loop.create_future()
+    stopped = loop.create_future()
+
+    def message(event_type: str, **fields: Any) -> str:
+        return json.dumps({"type": event_type, "conversationId": conversation_id, **fields})
+
+    chunk = message("userStream.chunk", participant="caller", audioChunk=AUDIO_CHUNK)
+
+    async with websockets.connect(url, max_size=None) as websocket:
+
+        async def read() -> None:
+            async for raw in websocket:
+                event_type = json.loads(raw).get("type")
+                if event_type == "session.accepted" and not accepted.done():
+                    accepted.set_result(None)
+                elif event_type == "userStream.stopped" and not stopped.done():
+                    stopped.set_result(time.perf_counter())
+
+        reader = asyncio.create_task(read())
+        try:
+            await websocket.send(
+                message(
+                    "session.initiate",
+                    botName="load_test",
+                    caller="+15550000000",
+                    expectAudioMessages=True,
+                    supportedMediaFormats=["raw/lpcm16"],
+                )
+            )
+            await asyncio.wait_for(accepted, ACK_TIMEOUT)
+            await websocket.send(message("userStream.start", participant="caller"))
+
+            client_lag = 0.0
+            start = time.perf_counter()
+            for frame in range(int(seconds / FRAME_SECONDS)):
+                due = start + frame * FRAME_SECONDS
+                client_lag = max(client_lag, time.perf_counter() - due)
+                await websocket.send(chunk)
+                await asyncio.sleep(max(0.0, due + FRAME_SECONDS - time.perf_counter()))
+
+            stop_sent = time.perf_counter()
+            await websocket.send(message("userStream.stop", participant="caller"))
+            stopped_at = await asyncio.wait_for(stopped, ACK_TIMEOUT)
+            await websocket.send(
+                message("session.end", reasonCode="normal", reason="Load test finished")
+            )
+        finally:
+            reader.cancel()
+
+    return {"ack_lag_ms": (stopped_at - stop_sent) * 1000, "client_lag_ms": client_lag * 1000}
+
+
+async def run_level(port: int, calls: int, seconds: float) -> Dict[str, Any]:
+    """Run `calls` simultaneous calls and summarize them."""
+    url = f"ws://127.0.0.1:{port}/ws/telephony"
+    tasks = [asyncio.create_task(run_call(url, seconds)) for _ in range(calls)]
+
+    # Sample the aggregated statistics while every call is streaming
+    await asyncio.sleep(seconds / 2)
+    try:
+        stats = await asyncio.to_thread(get_stats, port)
+    except OSError:
+        stats = {}
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    completed = [r for r in results if isinstance(r, dict)]
+    ack_lags = sorted(r["ack_lag_ms"] for r in completed)
+    return {
+        "calls": calls,
+        "failed": calls - len(completed),
+        "p50_ms": statistics.median(ack_lags) if ack_lags else 0.0,
+        "p95_ms": ack_lags[int(0.95 * (len(ack_lags) - 1))] if ack_lags else 0.0,
+        "client_lag_ms": max((r["client_lag_ms"] for r in completed), default=0.0),
+        "active_calls": stats.get("active_calls"),
+        "workers": stats.get("workers", 1),
+    }
+
+
+async def find_capacity(
+    port: int, args: argparse.Namespace
+) -> Optional[Dict[str, Any]]:
+    """Raise the concurrency until the server falls behind; return the last passing level."""
+    capacity = None
+    for calls in range(args.step, args.max_calls + 1, args.step):
+        level = await run_level(port, calls, args.seconds)
+        print(
+            f"  {calls:>5} calls: p50 {level['p50_ms']:>7.1f} ms, p95 {level['p95_ms']:>7.1f} ms, "
+            f"failed {level['failed']}, client lag {level['client_lag_ms']:.0f} ms, "
+            f"/stats active_calls {level['active_calls']} over {level['workers']} workers"
+        )
+        if level["failed"] or level["p95_ms"] > args.max_lag_ms:
+            break
+        capacity = level
+    return capacity
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the server at several worker counts")
+    parser.add_argument(
+        "--workers", default="1,2,4", help="Comma-separated worker counts (capped at the CPU count)"
+    )
+    parser.add_argument("--seconds", type=float, default=10.0, help="Audio streamed per call")
+    parser.add_argument("--step", type=int, default=10, help="Concurrent calls added per level")
+    parser.add_argument("--max-calls", type=int, default=500, help="Highest concurrency tried")
+    parser.add_argument(
+        "--max-lag-ms", type=float, default=200.0, help="p95 stop acknowledgement delay allowed"
+    )
+    parser.add_argument("--port", type=int, default=8765, help="Port for the test server")
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({min(int(n), cpus) for n in args.workers.split(",")})
+
+    capacities: Dict[int, int] = {}
+    for workers in worker_counts:
+        print(f"\n{workers} worker(s):")
+        process = start_server(workers, args.port)
+        try:
+            wait_until_ready(args.port, workers)
+            level = asyncio.run(find_capacity(args.port, args))
+        finally:
+            stop_server(process)
+        capacities[workers] = level["calls"] if level else 0
+
+    baseline = capacities[worker_counts[0]] or 1
+    print(f"\nConcurrent-call capacity (p95 lag <= {args.max_lag_ms:.0f} ms, {cpus} CPUs):")
+    print(f"{'workers':>8} {'calls':>8} {'scaling':>8}")
+    for workers in worker_counts:
+        print(f"{workers:>8} {capacities[workers]:>8} {capacities[workers] / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
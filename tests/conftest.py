@@ -32,6 +32,29 @@ def reset_logging():
 # Removed custom event_loop fixture to avoid conflicts with pytest-asyncio
 # pytest-asyncio will provide its own event_loop fixture
 
+@pytest.fixture(autouse=True)
+def reset_transcription_models():
+    """Give every test its own transcription model registry and scheduler"""
+    yield
+    from opusagent.local.transcription.model_registry import reset_model_registry
+    from opusagent.local.transcription.scheduler import reset_whisper_scheduler
+    reset_model_registry()
+    reset_whisper_scheduler()
+
+@pytest.fixture(autouse=True)
+def reset_shared_session_storage():
+    """Give every test its own process-wide session storage"""
+    yield
+    from opusagent.session_storage.factory import reset_session_storage
+    reset_session_storage()
+
+@pytest.fixture(autouse=True)
+def reset_shared_voice_recognizer():
+    """Give every test its own process-wide voice recognizer"""
+    yield
+    from opusagent.voiceprint.recognizer import reset_voice_recognizer
+    reset_voice_recognizer()
+
 @pytest.fixture(autouse=True)
 def skip_integration_when_no_api_key(request):
     if request.node.get_closest_marker("integration") and not os.environ.get("OPENAI_API_KEY"):
@@ -407,4 +407,16 @@ async def test_close_with_websocket_error_handling(bridge, mock_websocket, mock_
     assert bridge._closed is True
     
     # Verify realtime handler close was called
-    bridge.realtime_handler.close.assert_called_once() 
\ No newline at end of file
+    bridge.realtime_handler.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_load_caller_context_informs_model(bridge, mock_realtime_websocket):
+    """Test that an identified caller's metadata is sent to the Realtime session."""
+    await bridge.load_caller_context("caller_1", 0.9, {"name": "Ada"})
+
+    sent = json.loads(mock_realtime_websocket.send.call_args[0][0])
+    assert sent["type"] == "conversation.item.create"
+    assert sent["item"]["role"] == "system"
+    assert "Ada" in sent["item"]["content"][0]["text"]
+    assert bridge.identified_caller["caller_id"] == "caller_1"
@@ -665,6 +665,90 @@ class TestTwilioBridgeEnhanced:
             assert stats["features"]["bridge_type"] == "twilio"
 
 
+class TestTwilioEgress:
+    """Test paced outbound audio to Twilio."""
+
+    @pytest.mark.asyncio
+    async def test_send_audio_to_twilio_queues_without_blocking(self, twilio_bridge):
+        """A long delta is queued and the call returns immediately."""
+        twilio_bridge.stream_sid = "MZ" + "0" * 32
+        pcm16 = b"\x00\x01" * 24000  # 1s at 24kHz
+
+        start = asyncio.get_event_loop().time()
+        await twilio_bridge.send_audio_to_twilio(pcm16)
+        elapsed = asyncio.get_event_loop().time() - start
+
+        assert elapsed < 0.2
+        assert twilio_bridge._egress.queue_depth >= 45
+        await twilio_bridge._egress.close()
+
+    @pytest.mark.asyncio
+    async def test_frames_sent_as_media_messages(self, twilio_bridge):
+        """Queued frames go out as 160-byte Twilio media messages."""
+        twilio_bridge.stream_sid = "MZ" + "0" * 32
+        await twilio_bridge.send_audio_to_twilio(b"\x00\x00" * 480)  # 20ms
+
+        assert await twilio_bridge._egress.drain(timeout=1.0)
+        message = twilio_bridge.platform_websocket.send_json.call_args[0][0]
+        assert message["event"] == TwilioEventType.MEDIA
+        assert len(base64.b64decode(message["media"]["payload"])) == 160
+        await twilio_bridge._egress.close()
+
+    @pytest.mark.asyncio
+    async def test_clear_outbound_audio(self, twilio_bridge):
+        """Clearing drops queued frames and sends a Twilio clear message."""
+        twilio_bridge.stream_sid = "MZ" + "0" * 32
+        await twilio_bridge.send_audio_to_twilio(b"\x00\x01" * 24000)
+
+        dropped = await twilio_bridge.clear_outbound_audio()
+
+        assert dropped > 0
+        assert twilio_bridge._egress.queue_depth == 0
+        twilio_bridge.platform_websocket.send_json.assert_any_call(
+            {"event": TwilioEventType.CLEAR, "streamSid": twilio_bridge.stream_sid}
+        )
+        await twilio_bridge._egress.close()
+
+    @pytest.mark.asyncio
+    async def test_hang_up_plays_out_queued_audio(self, twilio_bridge):
+        """A graceful hang-up sends the queued goodbye before closing."""
+        twilio_bridge.stream_sid = "MZ" + "0" * 32
+        await twilio_bridge.send_audio_to_twilio(b"\x00\x01" * 2400)  # 100ms
+
+        await twilio_bridge.hang_up("Call completed")
+
+        assert twilio_bridge._egress.frames_sent == 5
+        assert twilio_bridge._egress.frames_cleared == 0
+        assert twilio_bridge._closed
+
+    @pytest.mark.asyncio
+    async def test_close_drops_queued_audio(self, twilio_bridge):
+        """Closing on a caller stop or error does not wait for queued audio."""
+        twilio_bridge.stream_sid = "MZ" + "0" * 32
+        await twilio_bridge.send_audio_to_twilio(b"\x00\x01" * 24000)
+
+        await twilio_bridge.close()
+
+        assert twilio_bridge._egress.frames_cleared > 0
+
+    @pytest.mark.asyncio
+    async def test_speech_started_clears_outbound_audio(self, twilio_bridge):
+        """Barge-in drops the rest of the bot response."""
+        twilio_bridge.vad_enabled = True
+        with patch.object(
+            twilio_bridge, "clear_outbound_audio", new_callable=AsyncMock
+        ) as mock_clear:
+            await twilio_bridge.handle_speech_started({})
+            mock_clear.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_statistics_include_egress(self, twilio_bridge):
+        """Back-pressure metrics are reported with the bridge statistics."""
+        stats = await twilio_bridge.get_bridge_statistics()
+        assert stats["egress"]["queue_depth"] == 0
+        assert "frames_overflowed" in stats["egress"]
+
+
 class TestTwilioBridge:
     """Test original Twilio bridge functionality."""
     
@@ -0,0 +1,77 @@
+"""
+Unit tests for pooled audio buffers and egress framing.
+
+Tests cover:
+- Prebuilt input_audio_buffer.append framing matching the pydantic model
+- Buffer reuse and silence padding in AudioBufferPool
+"""
+
+import base64
+import json
+
+from opusagent.models.openai_api import InputAudioBufferAppendEvent
+from opusagent.utils.audio_buffer import AudioBufferPool, encode_input_audio_append
+
+
+class TestEncodeInputAudioAppend:
+    """Test the prebuilt egress JSON template."""
+
+    def test_matches_pydantic_serialization(self):
+        """The template produces byte-identical JSON to the model."""
+        audio = bytes(range(256)) * 4
+        expected = InputAudioBufferAppendEvent(
+            type="input_audio_buffer.append",
+            audio=base64.b64encode(audio).decode("utf-8"),
+        ).model_dump_json()
+
+        assert encode_input_audio_append(audio) == expected
+
+    def test_accepts_buffer_views(self):
+        """bytearray and memoryview inputs encode like bytes."""
+        audio = b"\x01\x02" * 160
+
+        for buffer in (bytearray(audio), memoryview(audio)):
+            message = json.loads(encode_input_audio_append(buffer))
+            assert message["type"] == "input_audio_buffer.append"
+            assert base64.b64decode(message["audio"]) == audio
+
+
+class TestAudioBufferPool:
+    """Test AudioBufferPool behaviour."""
+
+    def test_released_buffer_reused(self):
+        """A released buffer is handed out again for the same size."""
+        pool = AudioBufferPool()
+        first = pool.acquire(640)
+        pool.release(first)
+
+        assert pool.acquire(640) is first
+        assert pool.get_stats()["reuses"] == 1
+
+    def test_sizes_kept_separate(self):
+        """Buffers are only reused for their own size."""
+        pool = AudioBufferPool()
+        pool.release(pool.acquire(640))
+
+        assert len(pool.acquire(320)) == 320
+        assert pool.get_stats()["allocations"] == 2
+
+    def test_pad_fills_with_silence(self):
+        """Padding copies the audio and zeroes the remainder, even on reuse."""
+        pool = AudioBufferPool()
+        dirty = pool.acquire(8)
+        dirty[:] = b"\xff" * 8
+        pool.release(dirty)
+
+        padded = pool.pad(b"\x01\x02\x03", 8)
+
+        assert padded is dirty
+        assert bytes(padded) == b"\x01\x02\x03" + bytes(5)
+
+    def test_free_list_bounded(self):
+        """At most max_buffers_per_size free buffers are kept."""
+        pool = AudioBufferPool(max_buffers_per_size=2)
+        for buffer in [pool.acquire(16) for _ in range(4)]:
+            pool.release(buffer)
+
+        assert pool.get_stats()["pooled_buffers"] == 2
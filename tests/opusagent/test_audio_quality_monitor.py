@@ -0,0 +1,159 @@
+"""
+Unit tests for the audio quality monitor.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from opusagent.utils.audio_quality_monitor import (
+    AudioQualityMonitor,
+    QualityAnalysisService,
+    QualityLevel,
+    spectral_metrics,
+)
+
+SAMPLE_RATE = 16000
+
+
+def _tone(samples, freq=500.0, amplitude=0.5, third=0.0):
+    t = np.arange(samples) / SAMPLE_RATE
+    signal = amplitude * np.sin(2 * np.pi * freq * t)
+    signal += third * np.sin(2 * np.pi * 3 * freq * t)
+    return signal.astype(np.float32)
+
+
+def _pcm(signal: np.ndarray) -> bytes:
+    return (np.clip(signal, -1.0, 0.99997) * 32768).astype(np.int16).tobytes()
+
+
+class TestSpectralMetrics:
+    """Test cases for the shared FFT analysis."""
+
+    def test_clean_tone(self):
+        """A pure tone has a high SNR and negligible distortion."""
+        snr_db, thd_percent = spectral_metrics(_tone(1024), SAMPLE_RATE)
+        assert snr_db[0] > 30
+        assert thd_percent[0] < 1.0
+
+    def test_harmonic_raises_thd(self):
+        """A 3rd harmonic shows up as distortion."""
+        _, clean = spectral_metrics(_tone(1024), SAMPLE_RATE)
+        _, distorted = spectral_metrics(_tone(1024, third=0.1), SAMPLE_RATE)
+        assert distorted[0] > clean[0] + 5
+
+    def test_batch_matches_single_windows(self):
+        """Batched rows give the same results as one window at a time."""
+        rng = np.random.default_rng(0)
+        windows = np.stack(
+            [
+                _tone(512, freq=f, third=0.05) + 0.05 * rng.standard_normal(512)
+                for f in (200, 700, 1900, 3100)
+            ]
+        ).astype(np.float32)
+
+        snr_db, thd_percent = spectral_metrics(windows, SAMPLE_RATE)
+
+        for i, window in enumerate(windows):
+            single_snr, single_thd = spectral_metrics(window, SAMPLE_RATE)
+            assert snr_db[i] == pytest.approx(single_snr[0])
+            assert thd_percent[i] == pytest.approx(single_thd[0])
+
+    def test_tiny_window(self):
+        """Windows too short to analyse return zeros."""
+        window = np.ones(3, dtype=np.float32)
+        snr_db, thd_percent = spectral_metrics(window, SAMPLE_RATE)
+        assert snr_db[0] == 0.0 and thd_percent[0] == 0.0
+
+
+class TestAudioQualityMonitor:
+    """Test cases for AudioQualityMonitor."""
+
+    def test_analyze_quiet_chunk(self):
+        """Quiet audio is reported as unacceptable and not recorded."""
+        monitor = AudioQualityMonitor(sample_rate=SAMPLE_RATE)
+        metrics = monitor.analyze_audio_chunk(_pcm(_tone(320, amplitude=0.001)))
+        assert metrics.quality_level == QualityLevel.UNACCEPTABLE
+        assert monitor.total_chunks_analyzed == 0
+
+    def test_analyze_tone(self):
+        """A clean tone scores well and is recorded."""
+        monitor = AudioQualityMonitor(sample_rate=SAMPLE_RATE)
+        metrics = monitor.analyze_audio_chunk(_pcm(_tone(1024)))
+        assert metrics.snr_db > 30
+        assert metrics.clipping_percent == 0.0
+        assert metrics.rms_level == pytest.approx(0.5 / np.sqrt(2), rel=0.01)
+        assert monitor.total_chunks_analyzed == 1
+
+    def test_decimated_cadence(self):
+        """Spectral analysis runs every analysis_interval chunks."""
+        monitor = AudioQualityMonitor(sample_rate=SAMPLE_RATE, analysis_interval=4)
+        chunk = _pcm(_tone(320))
+
+        results = [monitor.process_audio_chunk(chunk) for _ in range(9)]
+
+        analysed = [i for i, metrics in enumerate(results) if metrics is not None]
+        assert analysed == [0, 4, 8]
+        assert monitor.get_quality_summary()["chunks_processed"] == 9
+        assert monitor.get_quality_summary()["total_chunks"] == 3
+
+    def test_levels_cover_skipped_chunks(self):
+        """Clipping in a chunk between analyses is still reported."""
+        monitor = AudioQualityMonitor(sample_rate=SAMPLE_RATE, analysis_interval=2)
+        monitor.process_audio_chunk(_pcm(_tone(320)))
+
+        clipped = _tone(320)
+        clipped[:32] = 1.0
+        monitor.process_audio_chunk(_pcm(clipped))
+        metrics = monitor.process_audio_chunk(_pcm(_tone(320)))
+
+        assert metrics.clipping_percent == pytest.approx(32 / 640 * 100)
+        assert metrics.peak_level == pytest.approx(1.0, abs=1e-3)
+
+    def test_sliding_window_spans_chunks(self):
+        """The ring buffer gives the same spectrum as the ordered window."""
+        pcm = _pcm(_tone(320 * 8, freq=440, third=0.05))
+        monitor = AudioQualityMonitor(
+            sample_rate=SAMPLE_RATE, analysis_interval=7, window_size=1024
+        )
+        for i in range(8):
+            metrics = monitor.process_audio_chunk(pcm[i * 640 : (i + 1) * 640])
+
+        # The 8th chunk triggers an analysis of the last 1024 samples
+        ordered = np.frombuffer(pcm, dtype=np.int16)[-1024:].astype(np.float32)
+        snr_db, thd_percent = spectral_metrics(ordered / 32768.0, SAMPLE_RATE)
+        assert metrics.snr_db == pytest.approx(snr_db[0], rel=1e-4)
+        assert metrics.thd_percent == pytest.approx(thd_percent[0], rel=1e-4)
+
+    def test_batched_analysis(self):
+        """Batched results are recorded on a later chunk."""
+        service = QualityAnalysisService(batch_window_ms=1.0)
+        monitors = [
+            AudioQualityMonitor(sample_rate=SAMPLE_RATE, batch_service=service)
+            for _ in range(4)
+        ]
+        chunk = _pcm(_tone(320))
+
+        assert all(m.process_audio_chunk(chunk) is None for m in monitors)
+        deadline = time.monotonic() + 2.0
+        while service.windows_analyzed < 4 and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+        for monitor in monitors:
+            metrics = monitor.process_audio_chunk(chunk)
+            assert metrics is not None and metrics.snr_db > 20
+        assert service.get_stats()["windows_analyzed"] >= 4
+        service.shutdown()
+
+    def test_reset_clears_stream_state(self):
+        """reset() restarts the cadence and empties the window."""
+        monitor = AudioQualityMonitor(
+            sample_rate=SAMPLE_RATE, analysis_interval=3, window_size=512
+        )
+        monitor.process_audio_chunk(_pcm(_tone(320)))
+        monitor.process_audio_chunk(_pcm(_tone(320)))
+        monitor.reset()
+
+        assert monitor.process_audio_chunk(_pcm(_tone(320))) is not None
+        assert monitor.chunks_processed == 1
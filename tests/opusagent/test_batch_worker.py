@@ -0,0 +1,106 @@
+"""
+Tests for the shared batching thread behind the VAD, Whisper and quality
+analysis services.
+"""
+
+import concurrent.futures
+import threading
+from dataclasses import dataclass, field
+
+import pytest
+
+from opusagent.utils.batch_worker import BatchWorker
+
+
+@dataclass
+class EchoRequest:
+    value: int
+    future: concurrent.futures.Future = field(default_factory=concurrent.futures.Future)
+
+
+class EchoWorker(BatchWorker[EchoRequest]):
+    """Answers every request with its value, recording the batches it saw."""
+
+    thread_name = "echo-worker"
+
+    def __init__(self, batch_window_ms: float = 20.0):
+        super().__init__(max_batch_size=16, batch_window_ms=batch_window_ms)
+        self.batches = []
+        self.gate = None
+
+    def submit(self, value: int) -> concurrent.futures.Future:
+        return self._submit(EchoRequest(value))
+
+    def _process_batch(self, batch):
+        if self.gate is not None:
+            started, release = self.gate
+            started.set()
+            release.wait(5)
+        values = [request.value for request in batch]
+        self.batches.append(values)
+        if any(value < 0 for value in values):
+            raise ValueError("negative value")
+        for request in batch:
+            request.future.set_result(request.value)
+
+
+@pytest.fixture
+def worker():
+    worker = EchoWorker()
+    yield worker
+    worker.shutdown()
+
+
+def test_requests_within_window_share_a_batch(worker):
+    futures = [worker.submit(i) for i in range(3)]
+    assert [f.result(timeout=5) for f in futures] == [0, 1, 2]
+    assert worker.batches == [[0, 1, 2]]
+    assert worker.running
+
+
+def test_max_batch_size_is_at_least_one():
+    assert BatchWorker(max_batch_size=0, batch_window_ms=1.0).max_batch_size == 1
+
+
+def test_request_cancelled_while_queued_is_skipped():
+    worker = EchoWorker(batch_window_ms=100.0)
+    try:
+        cancelled = worker.submit(1)
+        kept = worker.submit(2)
+        assert cancelled.cancel()
+        assert kept.result(timeout=5) == 2
+        assert worker.batches == [[2]]
+    finally:
+        worker.shutdown()
+
+
+def test_cancel_during_batch_does_not_stop_thread(worker):
+    started, release = threading.Event(), threading.Event()
+    worker.gate = (started, release)
+    future = worker.submit(1)
+    assert started.wait(5)
+
+    # Claimed requests can no longer be cancelled, so their results can be set
+    assert not future.cancel()
+    release.set()
+    assert future.result(timeout=5) == 1
+
+    worker.gate = None
+    assert worker.submit(2).result(timeout=5) == 2
+    assert worker.running
+
+
+def test_failed_batch_fails_its_requests_only(worker):
+    failed = worker.submit(-1)
+    with pytest.raises(ValueError):
+        failed.result(timeout=5)
+
+    assert worker.submit(3).result(timeout=5) == 3
+    assert worker.running
+
+
+def test_shutdown_serves_queued_requests(worker):
+    future = worker.submit(5)
+    worker.shutdown()
+    assert future.result(timeout=5) == 5
+    assert not worker.running
@@ -375,7 +375,63 @@ class TestCallRecorder:
             mock_resample.assert_called_once_with(
                 audio_data.tobytes(), 8000, 24000
             )
-    
+
+    @pytest.mark.asyncio
+    async def test_record_caller_audio_bytes_copies_buffer(self, recorder):
+        """Test that a reusable caller buffer is copied before being kept."""
+        recorder.recording_active = True
+        recorder.caller_wav = Mock()
+        recorder.stereo_wav = Mock()
+
+        buffer = bytearray(np.array([100, -200, 300, -400], dtype=np.int16).tobytes())
+
+        with patch.object(recorder, '_write_stereo_chunk', new_callable=AsyncMock):
+            result = await recorder.record_caller_audio_bytes(buffer)
+            buffer[:] = bytes(len(buffer))
+
+            assert result is True
+            assert recorder.caller_audio_buffer[0] == np.array(
+                [100, -200, 300, -400], dtype=np.int16
+            ).tobytes()
+
+    @pytest.mark.asyncio
+    async def test_record_caller_audio_g711(self, recorder):
+        """Test μ-law caller audio is decoded and resampled to the caller rate."""
+        recorder.recording_active = True
+        recorder.caller_wav = Mock()
+        recorder.stereo_wav = Mock()
+
+        with patch.object(recorder, '_write_stereo_chunk', new_callable=AsyncMock):
+            result = await recorder.record_caller_audio_g711(b"\xff" * 160)
+
+            assert result is True
+            # 20ms at 8kHz becomes 20ms at the 24kHz caller rate
+            assert recorder.metadata.caller_audio_bytes == 960
+            assert recorder.caller_audio_buffer[0] == bytes(960)
+
+    @pytest.mark.asyncio
+    async def test_record_caller_audio_g711_invalid_law(self, recorder):
+        """Test unknown G.711 variants are rejected."""
+        recorder.recording_active = True
+
+        assert await recorder.record_caller_audio_g711(b"\xff", law="xlaw") is False
+
+    @pytest.mark.asyncio
+    async def test_record_bot_audio_bytes_success(self, recorder):
+        """Test bot audio recording from decoded bytes."""
+        recorder.recording_active = True
+        recorder.bot_wav = Mock()
+        recorder.stereo_wav = Mock()
+
+        audio_bytes = np.array([100, -200, 300, -400], dtype=np.int16).tobytes()
+
+        with patch.object(recorder, '_write_stereo_chunk', new_callable=AsyncMock):
+            result = await recorder.record_bot_audio_bytes(memoryview(audio_bytes))
+
+            assert result is True
+            assert recorder.metadata.bot_audio_chunks == 1
+            recorder.bot_wav.writeframes.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_record_bot_audio_success(self, recorder):
         """Test successful bot audio recording."""
@@ -1067,5 +1123,103 @@ class TestCallRecorder:
         assert recorder.metadata.end_time is not None
 
 
+class TestCallRecorderStreaming:
+    """Test CallRecorder with the background streaming writer."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for testing."""
+        temp_dir = tempfile.mkdtemp()
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.fixture
+    def recorder(self, temp_dir):
+        """Create a streaming CallRecorder instance for testing."""
+        return CallRecorder(
+            conversation_id="test_conv_stream",
+            base_output_dir=temp_dir,
+            streaming=True,
+            writer_queue_size=50,
+        )
+
+    @pytest.mark.asyncio
+    async def test_streaming_recording_writes_files(self, recorder):
+        """Audio is written by the writer thread, not buffered in memory."""
+        assert await recorder.start_recording()
+        assert recorder.caller_wav is None
+        assert recorder.get_recording_status()["streaming_writer"]
+
+        audio = np.full(1600, 1000, dtype=np.int16).tobytes()
+        assert await recorder.record_caller_audio_bytes(audio)
+        assert await recorder.record_bot_audio_bytes(audio)
+        assert recorder.caller_audio_buffer == []
+        assert recorder.bot_audio_buffer == []
+
+        with patch.object(
+            recorder, "_create_final_stereo_recording", new_callable=AsyncMock
+        ) as mock_create_stereo:
+            assert await recorder.stop_recording()
+            mock_create_stereo.assert_not_called()
+
+        with wave.open(str(recorder.stereo_audio_file), "rb") as wav:
+            assert wav.getnchannels() == 2
+            assert wav.getnframes() >= 1600
+        with wave.open(str(recorder.caller_audio_file), "rb") as wav:
+            assert wav.getnframes() == 1600
+
+        writer_stats = recorder.get_recording_summary()["writer"]
+        assert writer_stats["chunks_written"] == 2
+        assert writer_stats["chunks_dropped"] == 0
+        assert not writer_stats["running"]
+
+    @pytest.mark.asyncio
+    async def test_streaming_emergency_cleanup_stops_writer(self, recorder):
+        """Emergency cleanup stops the writer thread."""
+        assert await recorder.start_recording()
+        await recorder.emergency_cleanup()
+        assert not recorder._writer.running
+        assert not recorder.recording_active
+
+    @pytest.mark.asyncio
+    async def test_compressed_recording_single_stereo_file(self, temp_dir):
+        """FLAC recordings write one stereo file and extract channels on demand."""
+        recorder = CallRecorder(
+            conversation_id="test_conv_flac",
+            base_output_dir=temp_dir,
+            recording_format="flac",
+        )
+        assert recorder.streaming
+        assert recorder.stereo_audio_file.suffix == ".flac"
+
+        assert await recorder.start_recording()
+        audio = np.full(1600, 1000, dtype=np.int16).tobytes()
+        assert await recorder.record_caller_audio_bytes(audio)
+        assert await recorder.stop_recording()
+
+        assert recorder.stereo_audio_file.exists()
+        assert not recorder.caller_audio_file.exists()
+
+        encoder_stats = recorder.get_recording_summary()["encoder"]
+        assert encoder_stats["format"] == "flac"
+        assert encoder_stats["compression_ratio"] > 1.0
+        assert "encode_cpu_ms" in encoder_stats
+
+        caller_file = await recorder.extract_channel(AudioChannel.CALLER)
+        assert caller_file == recorder.caller_audio_file
+        with wave.open(str(caller_file), "rb") as wav:
+            assert wav.getnchannels() == 1
+            assert wav.getnframes() >= 1600
+
+    def test_invalid_recording_format(self, temp_dir):
+        """Unknown recording formats are rejected."""
+        with pytest.raises(ValueError):
+            CallRecorder(
+                conversation_id="test_conv_bad",
+                base_output_dir=temp_dir,
+                recording_format="mp3",
+            )
+
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
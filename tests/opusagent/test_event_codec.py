@@ -0,0 +1,105 @@
+"""
+Unit tests for the fast-path event codec.
+
+Tests cover:
+- JSON decoding with and without orjson
+- Audio delta and Twilio media field readers
+- playStream.chunk messages identical to the pydantic model's output
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from opusagent.models.audiocodes_api import PlayStreamChunkMessage, TelephonyEventType
+from opusagent.models.twilio_api import MediaMessage
+from opusagent.utils import event_codec
+
+AUDIO_DELTA = {
+    "type": "response.audio.delta",
+    "event_id": "event_1",
+    "response_id": "resp_1",
+    "item_id": "item_1",
+    "output_index": 0,
+    "content_index": 0,
+    "delta": "dGVzdCBhdWRpbyBkYXRh",
+}
+
+TWILIO_MEDIA = {
+    "event": "media",
+    "sequenceNumber": "3",
+    "streamSid": "MZ123",
+    "media": {"track": "inbound", "chunk": "1", "timestamp": "20", "payload": "//79/Q=="},
+}
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def codec_backend(request):
+    if request.param and not event_codec.HAS_ORJSON:
+        pytest.skip("orjson is not installed")
+    if request.param:
+        yield
+    else:
+        with patch.object(event_codec, "orjson", None):
+            yield
+
+
+def test_loads_text_and_bytes(codec_backend):
+    message = json.dumps(AUDIO_DELTA)
+    assert event_codec.loads(message) == AUDIO_DELTA
+    assert event_codec.loads(message.encode()) == AUDIO_DELTA
+
+
+def test_loads_invalid_json_raises_json_error(codec_backend):
+    with pytest.raises(json.JSONDecodeError):
+        event_codec.loads("{not json")
+
+
+def test_read_audio_delta():
+    assert event_codec.read_audio_delta(AUDIO_DELTA) == AUDIO_DELTA["delta"]
+
+
+@pytest.mark.parametrize("field", event_codec.AUDIO_DELTA_FIELDS)
+def test_read_audio_delta_missing_field(field):
+    event = {k: v for k, v in AUDIO_DELTA.items() if k != field}
+    assert event_codec.read_audio_delta(event) is None
+
+
+@pytest.mark.parametrize("delta", ["", "   "])
+def test_read_audio_delta_empty_is_returned(delta):
+    # Callers skip empty deltas where their slow paths do
+    assert event_codec.read_audio_delta({**AUDIO_DELTA, "delta": delta}) == delta
+
+
+def test_read_audio_delta_not_a_string():
+    assert event_codec.read_audio_delta({**AUDIO_DELTA, "delta": None}) is None
+
+
+def test_read_twilio_media_matches_model():
+    model = MediaMessage(**TWILIO_MEDIA)
+    assert event_codec.read_twilio_media(TWILIO_MEDIA) == (
+        model.media.payload,
+        model.media.track,
+    )
+
+
+def test_read_twilio_media_without_payload():
+    with pytest.raises(ValueError):
+        event_codec.read_twilio_media({"event": "media", "media": {}})
+    with pytest.raises(ValueError):
+        event_codec.read_twilio_media({"event": "media"})
+
+
+def test_play_stream_chunk_matches_model():
+    fast = event_codec.play_stream_chunk("conv_1", "stream_1", AUDIO_DELTA["delta"])
+    model = PlayStreamChunkMessage(
+        type=TelephonyEventType.PLAY_STREAM_CHUNK,
+        conversationId="conv_1",
+        streamId="stream_1",
+        audioChunk=AUDIO_DELTA["delta"],
+        participant="caller",
+    ).model_dump()
+    assert fast == model
+    assert list(fast) == list(model)
+    assert json.dumps(fast) == json.dumps(model)
@@ -0,0 +1,155 @@
+"""
+Unit tests for the G.711 lookup-table codec.
+
+Tests cover:
+- Bit-exact agreement with the ITU-T G.191 reference over every input
+- Agreement with audioop where the two references coincide
+- Round trips, silence code words and odd-length input
+"""
+
+import numpy as np
+import pytest
+
+from opusagent.utils import g711
+
+ALL_SAMPLES = np.arange(-32768, 32768, dtype=np.int16)
+ALL_CODES = bytes(range(256))
+
+
+# Scalar transcriptions of the ITU-T G.191 STL g711.c reference routines
+
+
+def _ref_ulaw_compress(sample: int) -> int:
+    absno = ((~sample) >> 2) + 33 if sample < 0 else (sample >> 2) + 33
+    if absno > 0x1FFF:
+        absno = 0x1FFF
+    i = absno >> 6
+    segno = 1
+    while i != 0:
+        segno += 1
+        i >>= 1
+    high_nibble = 0x0008 - segno
+    low_nibble = 0x000F - ((absno >> segno) & 0x000F)
+    code = (high_nibble << 4) | low_nibble
+    if sample >= 0:
+        code |= 0x0080
+    return code
+
+
+def _ref_ulaw_expand(code: int) -> int:
+    sign = -1 if code < 0x0080 else 1
+    mantissa = ~code
+    exponent = (mantissa >> 4) & 0x0007
+    segment = exponent + 1
+    mantissa &= 0x000F
+    step = 4 << segment
+    return sign * ((0x0080 << exponent) + step * mantissa + step // 2 - 4 * 33)
+
+
+def _ref_alaw_compress(sample: int) -> int:
+    ix = (~sample) >> 4 if sample < 0 else sample >> 4
+    if ix > 15:
+        iexp = 1
+        while ix > 16 + 15:
+            ix >>= 1
+            iexp += 1
+        ix -= 16
+        ix += iexp << 4
+    if sample >= 0:
+        ix |= 0x0080
+    return ix ^ 0x0055
+
+
+def _ref_alaw_expand(code: int) -> int:
+    ix = (code ^ 0x0055) & 0x007F
+    iexp = ix >> 4
+    mant = ix & 0x000F
+    if iexp > 0:
+        mant += 16
+    mant = (mant << 4) + 0x0008
+    if iexp > 1:
+        mant <<= iexp - 1
+    return mant if code > 127 else -mant
+
+
+class TestITUReference:
+    """Bit-exact comparison against the G.191 reference."""
+
+    def test_ulaw_encode_all_samples(self):
+        expected = bytes(_ref_ulaw_compress(int(s)) for s in ALL_SAMPLES)
+        assert g711.pcm16_to_ulaw(ALL_SAMPLES.tobytes()) == expected
+
+    def test_alaw_encode_all_samples(self):
+        expected = bytes(_ref_alaw_compress(int(s)) for s in ALL_SAMPLES)
+        assert g711.pcm16_to_alaw(ALL_SAMPLES.tobytes()) == expected
+
+    def test_ulaw_decode_all_codes(self):
+        expected = np.array([_ref_ulaw_expand(c) for c in ALL_CODES], dtype="<i2")
+        assert g711.ulaw_to_pcm16(ALL_CODES) == expected.tobytes()
+
+    def test_alaw_decode_all_codes(self):
+        expected = np.array([_ref_alaw_expand(c) for c in ALL_CODES], dtype="<i2")
+        assert g711.alaw_to_pcm16(ALL_CODES) == expected.tobytes()
+
+
+class TestAudioopCompatibility:
+    """Compatibility with the audioop module being replaced."""
+
+    @pytest.fixture
+    def audioop(self):
+        return pytest.importorskip("audioop")
+
+    def test_decoders_match(self, audioop):
+        assert g711.ulaw_to_pcm16(ALL_CODES) == audioop.ulaw2lin(ALL_CODES, 2)
+        assert g711.alaw_to_pcm16(ALL_CODES) == audioop.alaw2lin(ALL_CODES, 2)
+
+    def test_alaw_encoder_matches(self, audioop):
+        pcm = ALL_SAMPLES.tobytes()
+        assert g711.pcm16_to_alaw(pcm) == audioop.lin2alaw(pcm, 2)
+
+    def test_ulaw_encoder_differs_by_at_most_one_step(self, audioop):
+        """audioop negates with two's complement; only boundary codes move."""
+        pcm = ALL_SAMPLES.tobytes()
+        ours = np.frombuffer(g711.pcm16_to_ulaw(pcm), dtype=np.uint8).astype(int)
+        theirs = np.frombuffer(audioop.lin2ulaw(pcm, 2), dtype=np.uint8).astype(int)
+
+        differs = ours != theirs
+        assert np.all(ALL_SAMPLES[differs] < 0)
+        assert np.abs(ours - theirs).max() <= 1
+
+
+class TestCodecBehaviour:
+    """General codec behaviour."""
+
+    @pytest.mark.parametrize(
+        "encode,decode",
+        [
+            (g711.pcm16_to_ulaw, g711.ulaw_to_pcm16),
+            (g711.pcm16_to_alaw, g711.alaw_to_pcm16),
+        ],
+    )
+    def test_code_words_round_trip(self, encode, decode):
+        """Decoding then encoding every code word is lossless."""
+        codes = bytes(c for c in ALL_CODES if c not in (0x7F,))
+        assert encode(decode(codes)) == codes
+
+    def test_silence_code_words(self):
+        """The silence constants decode to (near) zero."""
+        assert g711.ulaw_to_pcm16(bytes([g711.ULAW_SILENCE])) == b"\x00\x00"
+        assert abs(np.frombuffer(g711.alaw_to_pcm16(bytes([g711.ALAW_SILENCE])), "<i2")[0]) <= 8
+
+    def test_odd_trailing_byte_dropped(self):
+        """A partial trailing sample is ignored when encoding."""
+        pcm = np.array([1000, -1000], dtype=np.int16).tobytes()
+        assert g711.pcm16_to_ulaw(pcm + b"\x01") == g711.pcm16_to_ulaw(pcm)
+
+    def test_accepts_buffer_views(self):
+        """bytearray and memoryview inputs are accepted."""
+        pcm = np.array([1000, -1000], dtype=np.int16).tobytes()
+        assert g711.pcm16_to_ulaw(memoryview(pcm)) == g711.pcm16_to_ulaw(pcm)
+        assert g711.ulaw_to_pcm16(bytearray(b"\x00\xff")) == g711.ulaw_to_pcm16(b"\x00\xff")
+
+    def test_tables_read_only(self):
+        assert not g711.ULAW_ENCODE_TABLE.flags.writeable
+        assert g711.ULAW_ENCODE_TABLE.shape == (65536,)
+        assert g711.ALAW_DECODE_TABLE.shape == (256,)
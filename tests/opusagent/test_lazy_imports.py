@@ -0,0 +1,93 @@
+"""
+Tests for lazy loading of optional subsystems and the startup preload hook.
+
+Import checks run in a fresh interpreter, since the test session itself
+has already imported most packages.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from opusagent.services import preload
+from opusagent.services.preload import preload_subsystems
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Optional packages that must not load with the server
+HEAVY_MODULES = ["torch", "resemblyzer", "silero_vad", "scipy", "sounddevice", "pyaudio", "twilio"]
+
+# Prefixes the result line, since the subsystems imported may log to stdout
+RESULT_MARKER = "HEAVY_MODULES_IMPORTED="
+
+
+def imported_heavy_modules(code: str):
+    """Run code in a fresh interpreter and return the heavy modules it imported."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{code}\n"
+            f"print({RESULT_MARKER!r} + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+        ],
+        cwd=PROJECT_ROOT,
+        # Write logs synchronously so none arrive after the result
+        env=dict(os.environ, LOG_QUEUED="false"),
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    lines = [
+        line for line in result.stdout.splitlines() if line.startswith(RESULT_MARKER)
+    ]
+    assert lines, result.stdout
+    return [m for m in lines[-1][len(RESULT_MARKER) :].split(",") if m]
+
+
+def test_server_import_skips_optional_packages():
+    assert imported_heavy_modules("import opusagent.main") == []
+
+
+def test_voice_recognizer_loads_encoder_on_first_use():
+    code = (
+        "from opusagent.voiceprint import OpusAgentVoiceRecognizer\n"
+        "OpusAgentVoiceRecognizer()"
+    )
+    assert imported_heavy_modules(code) == []
+
+
+def test_local_realtime_skips_local_clients():
+    assert imported_heavy_modules("import opusagent.local.realtime") == []
+
+
+def test_local_clients_resolved_on_access():
+    import opusagent.local as local
+
+    client = local.MockTwilioClient
+    assert local.TWILIO_AVAILABLE is (client is not None)
+    with pytest.raises(AttributeError):
+        local.NotAClient
+
+
+@pytest.mark.asyncio
+async def test_preload_runs_requested_subsystems():
+    calls = []
+    preloaders = {"vad": lambda: calls.append("vad"), "mock": lambda: calls.append("mock")}
+    with patch.dict(preload.PRELOADERS, preloaders, clear=True):
+        timings = await preload_subsystems(["vad", " MOCK "])
+    assert calls == ["vad", "mock"]
+    assert set(timings) == {"vad", "mock"}
+
+
+@pytest.mark.asyncio
+async def test_preload_skips_unknown_and_failing_subsystems():
+    def fail():
+        raise RuntimeError("silero-vad package not installed")
+
+    with patch.dict(preload.PRELOADERS, {"vad": fail}, clear=True):
+        timings = await preload_subsystems(["vad", "unknown"])
+    assert timings == {}
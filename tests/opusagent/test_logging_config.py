@@ -1,27 +1,106 @@
 import unittest
 import logging
-from opusagent.config.logging_config import configure_logging
+from logging.handlers import QueueHandler
+from unittest.mock import patch
+
+from opusagent.config import logging_config
+from opusagent.config.logging_config import (
+    EventSamplingFilter,
+    LazyJson,
+    configure_logging,
+    get_listener,
+)
 
 class TestLoggingConfig(unittest.TestCase):
     def test_configure_logging(self):
         # Test that the function returns a logger
         logger = configure_logging()
         self.assertIsInstance(logger, logging.Logger)
-        
+
         # Test that the logger has the correct name
         self.assertEqual(logger.name, "opusagent")
-        
+
         # Test that the logger has the correct level
         self.assertEqual(logger.level, logging.DEBUG)
-        
-        # Test that the logger has the correct handlers and format
-        self.assertGreaterEqual(len(logger.handlers), 1)  # At least one handler (console)
-        handler = logger.handlers[0]  # Check first handler (should be console handler)
+
+        # Records go through a queue to the background writer
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertIsInstance(logger.handlers[0], QueueHandler)
+        listener = get_listener()
+        assert listener is not None
+
+        # Test that the writer has the correct handlers and format
+        handler = listener.handlers[0]  # Console handler
         self.assertIsInstance(handler, logging.StreamHandler)
         formatter = handler.formatter
         self.assertIsNotNone(formatter, "Handler should have a formatter")
         assert formatter is not None  # Type assertion for linter
         self.assertEqual(formatter._fmt, "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
+    def test_loggers_share_one_writer(self):
+        first = configure_logging("test_first")
+        second = configure_logging("test_second")
+        self.assertIs(first.handlers[0], second.handlers[0])
+        self.assertIn(logging_config.event_filter, first.filters)
+
+    def test_synchronous_mode(self):
+        with patch.object(logging_config, "LOG_QUEUED", False):
+            logger = configure_logging("test_sync")
+        self.assertIsInstance(logger.handlers[0], logging.StreamHandler)
+        self.assertNotIsInstance(logger.handlers[0], QueueHandler)
+
+    def test_writer_restarted_after_fork(self):
+        configure_logging()
+        listener = get_listener()
+        assert listener is not None
+        # A forked child holds the listener but not its thread
+        listener.stop()
+        logging_config._restart_listeners_after_fork()
+        self.assertTrue(listener._thread.is_alive())
+
+
+def make_record(event_type=None, level=logging.INFO, msg="event"):
+    record = logging.LogRecord("test", level, __file__, 1, msg, None, None)
+    if event_type is not None:
+        record.event_type = event_type
+    return record
+
+
+class TestEventSamplingFilter(unittest.TestCase):
+    def test_untagged_records_pass(self):
+        event_filter = EventSamplingFilter(rate_limit=1)
+        self.assertTrue(all(event_filter.filter(make_record()) for _ in range(10)))
+
+    def test_rate_limit_per_event_type(self):
+        event_filter = EventSamplingFilter(rate_limit=3)
+        passed = [event_filter.filter(make_record("session.created")) for _ in range(5)]
+        self.assertEqual(passed, [True, True, True, False, False])
+        # Other event types have their own budget
+        self.assertTrue(event_filter.filter(make_record("response.done")))
+        self.assertEqual(event_filter.get_stats(), {"session.created": 2})
+
+    def test_audio_events_sampled(self):
+        event_filter = EventSamplingFilter(rate_limit=0, audio_sample_every=4)
+        records = [make_record("userStream.chunk") for _ in range(9)]
+        passed = [event_filter.filter(record) for record in records]
+        self.assertEqual(passed, [True, False, False, False, True, False, False, False, True])
+        self.assertEqual(records[4].msg, "event (3 similar suppressed)")
+
+    def test_warnings_never_dropped(self):
+        event_filter = EventSamplingFilter(rate_limit=1)
+        event_filter.filter(make_record("error"))
+        self.assertTrue(event_filter.filter(make_record("error", level=logging.WARNING)))
+
+
+class TestLazyJson(unittest.TestCase):
+    def test_serializes_only_when_formatted(self):
+        payload = {"type": "response.done"}
+        logger = logging.getLogger("test_lazy_json")
+        logger.setLevel(logging.INFO)
+        with patch("opusagent.config.logging_config.json.dumps") as dumps:
+            logger.debug("payload: %s", LazyJson(payload))
+            dumps.assert_not_called()
+        self.assertEqual(str(LazyJson(payload)), '{"type": "response.done"}')
+
 if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+    unittest.main()
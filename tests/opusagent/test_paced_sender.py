@@ -0,0 +1,143 @@
+"""
+Unit tests for the paced egress sender.
+
+Tests cover:
+- Enqueue returning immediately while frames go out at playback rate
+- Partial-frame carry-over and silence padding
+- Catch-up after an event-loop stall
+- Clear, overflow and close behaviour
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from opusagent.utils.paced_sender import PacedAudioSender
+
+
+class FrameSink:
+    def __init__(self):
+        self.frames = []
+        self.times = []
+
+    async def __call__(self, frame: bytes) -> None:
+        self.frames.append(frame)
+        self.times.append(time.monotonic())
+
+
+@pytest.fixture
+def sink():
+    return FrameSink()
+
+
+class TestPacedAudioSender:
+    """Test PacedAudioSender behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_does_not_block(self, sink):
+        """Queuing a second of audio returns immediately."""
+        sender = PacedAudioSender(sink, frame_size=160, frame_duration=0.02)
+        start = time.monotonic()
+        sender.enqueue(b"\x01" * 160 * 50)
+        assert time.monotonic() - start < 0.01
+        assert sender.queue_depth == 50
+        await sender.close()
+
+    @pytest.mark.asyncio
+    async def test_frames_paced_at_playback_rate(self, sink):
+        """Frames beyond the lead are released one frame time apart."""
+        sender = PacedAudioSender(sink, frame_size=4, frame_duration=0.01, lead_frames=1)
+        sender.enqueue(b"\x01" * 4 * 10)
+
+        assert await sender.drain(timeout=1.0)
+        elapsed = sink.times[-1] - sink.times[0]
+        assert len(sink.frames) == 10
+        # 10 frames with a one-frame lead take at least ~8 frame times
+        assert elapsed >= 0.07
+        await sender.close()
+
+    @pytest.mark.asyncio
+    async def test_partial_frame_carried_then_padded(self, sink):
+        """Split frames are joined; a trailing partial is padded with silence."""
+        sender = PacedAudioSender(
+            sink, frame_size=4, frame_duration=0.01, silence_byte=0xFF
+        )
+        sender.enqueue(b"\x01\x02\x03")
+        sender.enqueue(b"\x04\x05")
+
+        assert await sender.drain(timeout=1.0)
+        assert sink.frames == [b"\x01\x02\x03\x04", b"\x05\xff\xff\xff"]
+        await sender.close()
+
+    @pytest.mark.asyncio
+    async def test_catches_up_after_stall(self, sink):
+        """Frames that became due during a stall are sent in one batch."""
+        sender = PacedAudioSender(sink, frame_size=4, frame_duration=0.01, lead_frames=0)
+        sender.enqueue(b"\x01" * 4 * 20)
+        await asyncio.sleep(0.015)
+
+        time.sleep(0.1)  # Block the event loop
+        sent_before = len(sink.frames)
+        await asyncio.sleep(0.002)
+
+        assert len(sink.frames) - sent_before >= 8
+        assert sender.get_stats()["catch_up_batches"] >= 1
+        assert sender.get_stats()["max_lag_ms"] >= 80
+        await sender.close()
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_queued_audio(self, sink):
+        """Clear discards everything queued, including a partial frame."""
+        sender = PacedAudioSender(sink, frame_size=4, frame_duration=0.05)
+        sender.enqueue(b"\x01" * 4 * 20 + b"\x02")
+        await asyncio.sleep(0)
+
+        dropped = sender.clear()
+        await asyncio.sleep(0.06)
+
+        assert dropped > 0
+        assert sender.queue_depth == 0
+        assert len(sink.frames) <= 4
+        assert sender.get_stats()["frames_cleared"] == dropped
+        await sender.close()
+
+    @pytest.mark.asyncio
+    async def test_overflow_drops_oldest(self, sink):
+        """Frames beyond the queue bound drop the oldest audio."""
+        sender = PacedAudioSender(sink, frame_size=1, max_queue_frames=5)
+        sender.enqueue(bytes(range(8)))
+
+        assert sender.queue_depth == 5
+        assert sender.get_stats()["frames_overflowed"] == 3
+        assert sender._frames[0] == b"\x03"
+        await sender.close()
+
+    @pytest.mark.asyncio
+    async def test_send_errors_counted(self):
+        """A failing send is counted and does not stop the sender."""
+        calls = []
+
+        async def flaky(frame):
+            calls.append(frame)
+            if len(calls) == 1:
+                raise RuntimeError("socket gone")
+
+        sender = PacedAudioSender(flaky, frame_size=1, frame_duration=0.001)
+        sender.enqueue(b"\x01\x02\x03")
+
+        assert await sender.drain(timeout=1.0)
+        assert sender.get_stats()["send_errors"] == 1
+        assert sender.get_stats()["frames_sent"] == 2
+        await sender.close()
+
+    @pytest.mark.asyncio
+    async def test_close_stops_sender(self, sink):
+        """After close, the task is gone and new audio is ignored."""
+        sender = PacedAudioSender(sink, frame_size=4)
+        sender.enqueue(b"\x01" * 40)
+        await sender.close()
+
+        sender.enqueue(b"\x01" * 40)
+        assert sender._task is None
+        assert sender.queue_depth == 0
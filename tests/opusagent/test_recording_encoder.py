@@ -0,0 +1,104 @@
+"""
+Unit tests for the recording encoders.
+"""
+
+import shutil
+import tempfile
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from opusagent.utils.recording_encoder import (
+    RECORDING_FORMATS,
+    FlacEncoder,
+    OpusEncoder,
+    WavEncoder,
+    create_recording_encoder,
+    extract_channel,
+    get_encoder_class,
+)
+
+SAMPLE_RATE = 16000
+
+
+def _stereo_tone(seconds: float = 1.0) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    left = 8000 * np.sin(2 * np.pi * 220 * t)
+    right = 4000 * np.sin(2 * np.pi * 330 * t)
+    return np.stack([left, right], axis=1).astype(np.int16)
+
+
+def _read_mono(path: Path) -> np.ndarray:
+    with wave.open(str(path), "rb") as wav:
+        assert wav.getnchannels() == 1
+        return np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+
+class TestRecordingEncoders:
+    """Test cases for the format encoders."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        temp_dir = Path(tempfile.mkdtemp())
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    def test_format_lookup(self):
+        """Format names map to encoder classes."""
+        assert RECORDING_FORMATS == ("wav", "flac", "opus")
+        assert get_encoder_class("FLAC") is FlacEncoder
+        with pytest.raises(ValueError, match="Unsupported recording format"):
+            get_encoder_class("mp3")
+
+    def test_opus_rejects_unsupported_rate(self, temp_dir):
+        """Opus only accepts its native sample rates."""
+        with pytest.raises(ValueError, match="Opus does not support"):
+            OpusEncoder(temp_dir / "out.opus", 44100)
+
+    def test_wav_round_trip(self, temp_dir):
+        """WAV output is uncompressed and lossless."""
+        frames = _stereo_tone()
+        encoder = WavEncoder(temp_dir / "out.wav", SAMPLE_RATE)
+        encoder.open()
+        for start in range(0, len(frames), 320):
+            encoder.write(frames[start : start + 320])
+        encoder.close()
+
+        stats = encoder.get_stats()
+        assert stats["audio_seconds"] == pytest.approx(1.0)
+        assert stats["input_bytes"] == frames.nbytes
+        assert stats["compression_ratio"] == pytest.approx(1.0, abs=0.01)
+
+        caller = extract_channel(temp_dir / "out.wav", 0, temp_dir / "caller.wav")
+        np.testing.assert_array_equal(_read_mono(caller), frames[:, 0])
+
+    @pytest.mark.parametrize("recording_format", ["flac", "opus"])
+    def test_compressed_output(self, temp_dir, recording_format):
+        """Compressed formats shrink the stream and report their CPU cost."""
+        frames = _stereo_tone()
+        encoder = create_recording_encoder(
+            recording_format, temp_dir / f"out.{recording_format}", SAMPLE_RATE
+        )
+        encoder.open()
+        for start in range(0, len(frames), 320):
+            encoder.write(frames[start : start + 320])
+        encoder.close()
+
+        stats = encoder.get_stats()
+        assert stats["format"] == recording_format
+        assert stats["compression_ratio"] > 2.0
+        assert stats["encode_cpu_ms"] > 0
+
+        bot = extract_channel(encoder.path, 1, temp_dir / "bot.wav")
+        decoded = _read_mono(bot)
+        assert len(decoded) == len(frames)
+        if recording_format == "flac":
+            np.testing.assert_array_equal(decoded, frames[:, 1])
+
+    def test_write_before_open_is_ignored(self, temp_dir):
+        """Frames written before open() are not counted."""
+        encoder = WavEncoder(temp_dir / "out.wav", SAMPLE_RATE)
+        encoder.write(_stereo_tone(0.1))
+        assert encoder.frames_written == 0
@@ -0,0 +1,171 @@
+"""
+Unit tests for the streaming recording writer.
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from opusagent.utils.recording_writer import (
+    BOT_CHANNEL,
+    CALLER_CHANNEL,
+    StreamingRecordingWriter,
+)
+
+SAMPLE_RATE = 1000
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pcm(value: int, count: int) -> bytes:
+    return np.full(count, value, dtype=np.int16).tobytes()
+
+
+def _read(path: Path) -> np.ndarray:
+    with wave.open(str(path), "rb") as wav:
+        data = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+        return data.reshape(-1, wav.getnchannels())
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert predicate()
+
+
+class TestStreamingRecordingWriter:
+    """Test cases for StreamingRecordingWriter."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        temp_dir = Path(tempfile.mkdtemp())
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def writer(self, temp_dir, clock):
+        writer = StreamingRecordingWriter(
+            temp_dir / "caller.wav",
+            temp_dir / "bot.wav",
+            temp_dir / "stereo.wav",
+            sample_rate=SAMPLE_RATE,
+            max_skew_seconds=0.5,
+            clock=clock,
+        )
+        yield writer
+        writer.close(timeout=2.0)
+
+    def test_write_before_start(self, writer):
+        """Chunks are refused until the writer is started."""
+        assert writer.write(CALLER_CHANNEL, _pcm(1, 10)) is False
+
+    def test_channels_share_timeline(self, writer, clock, temp_dir):
+        """Chunks land at their arrival time on a common stereo timeline."""
+        writer.start()
+        clock.now += 0.1
+        writer.write(CALLER_CHANNEL, _pcm(1, 100))  # samples 0-99
+        clock.now += 0.2
+        writer.write(BOT_CHANNEL, _pcm(2, 100))  # samples 200-299
+        writer.close(timeout=2.0)
+
+        stereo = _read(temp_dir / "stereo.wav")
+        assert len(stereo) == 300
+        assert (stereo[:100, CALLER_CHANNEL] == 1).all()
+        assert (stereo[100:, CALLER_CHANNEL] == 0).all()
+        assert (stereo[:200, BOT_CHANNEL] == 0).all()
+        assert (stereo[200:, BOT_CHANNEL] == 2).all()
+        assert writer.get_stats()["silence_samples_inserted"] == 200
+
+        # Mono files hold only the audio that was written
+        assert len(_read(temp_dir / "caller.wav")) == 100
+        assert len(_read(temp_dir / "bot.wav")) == 100
+
+    def test_burst_is_laid_out_back_to_back(self, writer, clock, temp_dir):
+        """Chunks arriving faster than real time follow each other."""
+        writer.start()
+        clock.now += 0.05
+        for value in (1, 2, 3):
+            writer.write(BOT_CHANNEL, _pcm(value, 50))
+        writer.close(timeout=2.0)
+
+        bot = _read(temp_dir / "stereo.wav")[:, BOT_CHANNEL]
+        np.testing.assert_array_equal(bot, np.repeat([1, 2, 3], 50))
+
+    def test_quiet_channel_does_not_hold_back_stereo(self, writer, clock):
+        """Stereo frames are written while one channel stays silent."""
+        writer.start()
+        clock.now += 1.0
+        writer.write(CALLER_CHANNEL, _pcm(1, 1000))
+        _wait_for(lambda: writer.get_stats()["chunks_written"] == 1)
+        # The bot is only assumed silent up to the clock less the skew
+        _wait_for(lambda: writer.stereo_frames_written == 500)
+
+        # Once the clock is past the skew allowance, the bot counts as silent
+        clock.now += 0.6
+        _wait_for(lambda: writer.stereo_frames_written >= 1000)
+
+    def test_full_queue_drops_chunks(self, temp_dir, clock):
+        """A full queue drops chunks instead of blocking the caller."""
+        writer = StreamingRecordingWriter(
+            temp_dir / "caller.wav",
+            temp_dir / "bot.wav",
+            temp_dir / "stereo.wav",
+            sample_rate=SAMPLE_RATE,
+            max_queue_chunks=2,
+            clock=clock,
+        )
+        # Stall the writer thread on its first chunk
+        release = threading.Event()
+        write_chunk = writer._write_chunk
+
+        def stalled_write_chunk(*args):
+            release.wait(2.0)
+            write_chunk(*args)
+
+        writer._write_chunk = stalled_write_chunk
+        writer.start()
+
+        assert writer.write(CALLER_CHANNEL, _pcm(1, 10))
+        _wait_for(lambda: writer._queue.qsize() == 0)
+        assert writer.write(CALLER_CHANNEL, _pcm(1, 10))
+        assert writer.write(CALLER_CHANNEL, _pcm(1, 10))
+        assert writer.write(CALLER_CHANNEL, _pcm(1, 10)) is False
+
+        release.set()
+        writer.close(timeout=2.0)
+        stats = writer.get_stats()
+        assert stats["chunks_dropped"] == 1
+        assert stats["chunks_written"] == 3
+
+    def test_close_flushes_and_stops(self, writer, clock, temp_dir):
+        """close() writes queued audio and closes the files."""
+        writer.start()
+        clock.now += 0.01
+        writer.write(CALLER_CHANNEL, _pcm(5, 10))
+        writer.close(timeout=2.0)
+
+        stats = writer.get_stats()
+        assert not stats["running"]
+        assert stats["chunks_written"] == 1
+        assert stats["stereo_frames_written"] == 10
+        assert writer.write(CALLER_CHANNEL, _pcm(5, 10)) is False
+        assert (_read(temp_dir / "stereo.wav")[:, CALLER_CHANNEL] == 5).all()
@@ -0,0 +1,126 @@
+"""
+Unit tests for the streaming resampler.
+
+Tests cover:
+- Output lengths for the fixed telephony ratios
+- Chunked processing matching one-shot processing (no boundary artifacts)
+- Passband preservation and stopband rejection
+- Shared filter banks and state reset
+"""
+
+import numpy as np
+import pytest
+
+from opusagent.utils.resampler import (
+    DEFAULT_HALF_WIDTH,
+    StreamingResampler,
+    get_filter_bank,
+)
+
+RATE_PAIRS = [
+    (8000, 16000),
+    (8000, 24000),
+    (16000, 24000),
+    (16000, 8000),
+    (24000, 8000),
+    (24000, 16000),
+]
+
+
+def _tone(frequency: float, sample_rate: int, seconds: float = 1.0) -> np.ndarray:
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    return (np.sin(2 * np.pi * frequency * t) * 10000).astype(np.int16)
+
+
+class TestStreamingResampler:
+    """Test StreamingResampler behaviour."""
+
+    @pytest.mark.parametrize("from_rate,to_rate", RATE_PAIRS)
+    def test_output_length_matches_ratio(self, from_rate, to_rate):
+        """Each 20ms chunk yields exactly 20ms of output."""
+        resampler = StreamingResampler(from_rate, to_rate)
+        chunk = _tone(440, from_rate, 0.02).tobytes()
+
+        for _ in range(10):
+            output = resampler.process(chunk)
+            assert len(output) == int(to_rate * 0.02) * 2
+
+    @pytest.mark.parametrize("from_rate,to_rate", RATE_PAIRS)
+    def test_chunked_matches_one_shot(self, from_rate, to_rate):
+        """Chunked processing is identical to processing the whole stream."""
+        audio = _tone(440, from_rate)
+
+        one_shot = StreamingResampler(from_rate, to_rate).process(audio.tobytes())
+
+        resampler = StreamingResampler(from_rate, to_rate)
+        chunk_samples = from_rate // 50
+        chunked = b"".join(
+            resampler.process(audio[i : i + chunk_samples].tobytes())
+            for i in range(0, len(audio), chunk_samples)
+        )
+
+        assert chunked == one_shot
+
+    def test_odd_byte_carried_to_next_chunk(self):
+        """A split sample is carried over instead of being dropped."""
+        audio = _tone(440, 16000, 0.04).tobytes()
+
+        expected = StreamingResampler(16000, 24000).process(audio)
+
+        resampler = StreamingResampler(16000, 24000)
+        output = resampler.process(audio[:641]) + resampler.process(audio[641:])
+
+        assert output == expected
+
+    def test_passband_preserved(self):
+        """A 1kHz tone keeps its level through 24kHz -> 8kHz."""
+        audio = _tone(1000, 24000)
+        output = np.frombuffer(
+            StreamingResampler(24000, 8000).process(audio.tobytes()), dtype=np.int16
+        )
+
+        ratio = output[200:].astype(float).std() / audio.astype(float).std()
+        assert ratio == pytest.approx(1.0, abs=0.02)
+
+    def test_aliasing_rejected(self):
+        """A 6kHz tone is removed when downsampling to 8kHz."""
+        audio = _tone(6000, 24000)
+        output = np.frombuffer(
+            StreamingResampler(24000, 8000).process(audio.tobytes()), dtype=np.int16
+        )
+
+        assert np.abs(output[200:]).max() < 50
+
+    def test_same_rate_passthrough(self):
+        """Equal rates return the input unchanged."""
+        audio = _tone(440, 16000, 0.02).tobytes()
+        assert StreamingResampler(16000, 16000).process(audio) is audio
+
+    def test_empty_input(self):
+        """Empty chunks produce empty output."""
+        assert StreamingResampler(16000, 24000).process(b"") == b""
+
+    def test_reset_clears_history(self):
+        """After reset the resampler behaves like a new instance."""
+        audio = _tone(440, 16000, 0.02).tobytes()
+        resampler = StreamingResampler(16000, 24000)
+        first = resampler.process(audio)
+        resampler.process(audio)
+
+        resampler.reset()
+
+        assert resampler.process(audio) == first
+
+    def test_filter_bank_shared_between_streams(self):
+        """Streams with the same rate pair share one filter bank."""
+        first = StreamingResampler(8000, 24000)
+        second = StreamingResampler(8000, 24000)
+
+        assert first._bank is second._bank
+        assert get_filter_bank(8000, 24000, DEFAULT_HALF_WIDTH)[0] is first._bank
+        assert not first._bank.flags.writeable
+
+    def test_invalid_rate(self):
+        """Non-positive rates are rejected."""
+        with pytest.raises(ValueError):
+            StreamingResampler(0, 16000)
@@ -3,17 +3,20 @@ Tests for WebSocket manager module.
 """
 
 import asyncio
+import json
 import time
 import uuid
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
+from opusagent.config.models import ApplicationConfig, OpenAIConfig
 from opusagent.handlers.websocket_manager import (
     RealtimeConnection,
     WebSocketManager,
     get_websocket_manager,
 )
+from opusagent.models.openai_api import SessionConfig
 
 
 class TestRealtimeConnection:
@@ -241,10 +244,38 @@ class TestWebSocketManager:
             conn.session_count = conn.max_sessions  # Mark as full
             connections.append(conn)
 
-        # Request another connection - should replace oldest
-        new_connection = await manager.get_connection()
+        # Request another connection - should wait rather than evict, then time out
+        manager.pool_wait_timeout = 0.05
+        with pytest.raises(asyncio.TimeoutError):
+            await manager.get_connection()
 
-        assert isinstance(new_connection, RealtimeConnection)
+        assert len(manager._connections) == manager.max_connections
+        assert all(not conn.websocket.close.called for conn in connections)
+        stats = manager.get_stats()["pool"]
+        assert stats["waits"] == 1
+        assert stats["wait_timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_connection_waits_for_free_slot(
+        self, manager, mock_websockets_connect
+    ):
+        """Test that a saturated pool hands the next free slot to a waiter."""
+        connections = []
+        for _ in range(manager.max_connections):
+            conn = await manager.get_connection()
+            conn.session_count = conn.max_sessions
+            connections.append(conn)
+
+        manager.pool_wait_timeout = 2.0
+        waiter = asyncio.create_task(manager.get_connection())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        assert manager.get_stats()["pool"]["waiting"] == 1
+
+        await manager._remove_connection(connections[0].connection_id)
+        new_connection = await asyncio.wait_for(waiter, 1.0)
+
+        assert new_connection is not connections[0]
         assert len(manager._connections) == manager.max_connections
 
     @pytest.mark.asyncio
@@ -368,6 +399,7 @@ class TestWebSocketManager:
             "active_sessions",
             "total_sessions_handled",
             "max_connections",
+            "pool",
         ]
 
         for key in expected_keys:
@@ -392,3 +424,142 @@ class TestWebSocketManager:
 
         # Connection should be removed
         assert len(manager._connections) == 0
+
+
+class TestWarmPool:
+    """Test cases for the WebSocketManager warm pool."""
+
+    @pytest.fixture(autouse=True)
+    def mock_env_vars(self):
+        """Mock environment variables required by WebSocketConfig."""
+        with patch.dict(
+            "os.environ",
+            {"OPENAI_API_KEY": "test_api_key", "OPENAI_ORG_ID": "test_org_id"},
+        ):
+            yield
+
+    @pytest.fixture
+    def mock_websockets_connect(self):
+        """Mock websockets.connect returning a fresh socket per call."""
+
+        async def connect(*args, **kwargs):
+            websocket = AsyncMock()
+            websocket.closed = False
+            websocket.close_code = None
+            return websocket
+
+        with patch(
+            "opusagent.handlers.websocket_manager.websockets.connect",
+            side_effect=connect,
+        ) as mock_connect:
+            yield mock_connect
+
+    @pytest.fixture(autouse=True)
+    def app_config(self):
+        """Default configuration, whatever mock-mode config other tests left behind."""
+        config = ApplicationConfig(openai=OpenAIConfig(api_key="sk-test"))
+        with patch("opusagent.config.get_config", return_value=config):
+            yield config
+
+    @pytest.fixture
+    def session_config(self):
+        """Default session configuration for warm connections."""
+        return SessionConfig(model="gpt-4o-realtime-preview", voice="verse")
+
+    @pytest.fixture
+    async def manager(self):
+        """Create a WebSocketManager with a warm pool of two."""
+        manager = WebSocketManager()
+        manager.warm_pool_size = 2
+        yield manager
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, mock_websockets_connect, session_config):
+        """Test that no connections are opened when warm_pool_size is 0."""
+        manager = WebSocketManager()
+        assert manager.warm_pool_size == 0
+
+        await manager.start_warm_pool(session_config, wait=True)
+
+        assert len(manager._connections) == 0
+        mock_websockets_connect.assert_not_called()
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_start_fills_pool_with_configured_sessions(
+        self, manager, mock_websockets_connect, session_config
+    ):
+        """Test that warm connections are opened and sent session.update."""
+        await manager.start_warm_pool(session_config, wait=True)
+
+        assert len(manager._warm_connections) == 2
+        for conn in manager._warm_connections:
+            sent = json.loads(conn.websocket.send.call_args[0][0])
+            assert sent["type"] == "session.update"
+            assert sent["session"]["voice"] == "verse"
+            assert conn.websocket.preconfigured_session == session_config
+        assert manager.get_pool_stats()["warm_connections_created"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get_connection_hits_warm_pool_and_refills(
+        self, manager, mock_websockets_connect, session_config
+    ):
+        """Test that calls take warm connections and the pool is refilled."""
+        await manager.start_warm_pool(session_config, wait=True)
+        warm = list(manager._warm_connections)
+
+        connection = await manager.get_connection()
+        assert connection is warm[0]
+        assert connection.session_count == 1
+
+        await manager._refill_task
+        assert len(manager._warm_connections) == 2
+        assert connection not in manager._warm_connections
+
+        stats = manager.get_stats()["pool"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 0
+        assert stats["hit_rate"] == 1.0
+        assert stats["acquire_latency_ms"]["max"] >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_miss_when_pool_empty(
+        self, manager, mock_websockets_connect, session_config
+    ):
+        """Test that an empty warm pool falls back to a fresh connection."""
+        manager.warm_pool_size = 0
+        manager._warm_session_config = session_config
+
+        connection = await manager.get_connection()
+
+        assert connection.preconfigured_session is None
+        assert manager.get_pool_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_warm_failure_is_counted(
+        self, manager, mock_websockets_connect, session_config
+    ):
+        """Test that a failed warm-up is recorded without raising."""
+        mock_websockets_connect.side_effect = Exception("Connection failed")
+
+        await manager.start_warm_pool(session_config, wait=True)
+
+        assert len(manager._warm_connections) == 0
+        assert manager.get_pool_stats()["warm_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reused_connection_clears_preconfigured_session(
+        self, manager, mock_websockets_connect, session_config
+    ):
+        """Test that reusing a connection for another call drops the marker."""
+        manager.warm_pool_size = 1
+        await manager.start_warm_pool(session_config, wait=True)
+        first = await manager.get_connection()
+        await manager._refill_task
+        manager._warm_connections.clear()
+
+        second = await manager.get_connection()
+
+        assert second is first
+        assert second.websocket.preconfigured_session is None
@@ -0,0 +1,109 @@
+"""
+Tests for multi-worker support: statistics shared between worker processes
+and the process-wide session storage.
+"""
+
+import json
+import time
+
+import pytest
+
+from opusagent.services.worker_stats import (
+    WorkerStatsPublisher,
+    aggregate_worker_stats,
+    read_worker_stats,
+)
+from opusagent.session_storage.factory import (
+    create_session_storage,
+    get_session_storage,
+    reset_session_storage,
+)
+from opusagent.session_storage.memory_storage import MemorySessionStorage
+
+
+def worker_snapshot(pid, hits=0, misses=0, p95=0.0, **fields):
+    stats = {
+        "pid": pid,
+        "updated_at": time.time(),
+        "total_connections": 2,
+        "healthy_connections": 2,
+        "active_sessions": 1,
+        "total_sessions_handled": 5,
+        "max_connections": 10,
+        "active_calls": 3,
+        "use_mock": False,
+        "pool": {
+            "warm_pool_size": 2,
+            "warm_connections": 1,
+            "hits": hits,
+            "misses": misses,
+            "acquire_latency_ms": {"avg": 1.0, "p50": 1.0, "p95": p95, "max": p95},
+        },
+    }
+    stats.update(fields)
+    return stats
+
+
+def test_aggregate_sums_counters_across_workers():
+    stats = aggregate_worker_stats(
+        [worker_snapshot(1, hits=3, misses=1, p95=4.0), worker_snapshot(2, hits=4, p95=9.0)]
+    )
+    assert stats["workers"] == 2
+    assert stats["active_calls"] == 6
+    assert stats["healthy_connections"] == 4
+    assert stats["max_connections"] == 20
+    assert stats["pool"]["warm_pool_size"] == 4
+    assert stats["pool"]["hit_rate"] == pytest.approx(7 / 8)
+    assert stats["pool"]["acquire_latency_ms"]["p95"] == 9.0
+    assert [worker["pid"] for worker in stats["per_worker"]] == [1, 2]
+
+
+def test_aggregate_without_workers():
+    stats = aggregate_worker_stats([])
+    assert stats["workers"] == 0
+    assert stats["healthy_connections"] == 0
+    assert stats["pool"]["hit_rate"] == 0.0
+
+
+def test_read_skips_stale_and_invalid_snapshots(tmp_path):
+    (tmp_path / "worker-1.json").write_text(json.dumps(worker_snapshot(1)))
+    stale = worker_snapshot(2, updated_at=time.time() - 60)
+    (tmp_path / "worker-2.json").write_text(json.dumps(stale))
+    (tmp_path / "worker-3.json").write_text("{not json")
+
+    assert [stats["pid"] for stats in read_worker_stats(tmp_path, max_age=10)] == [1]
+
+
+@pytest.mark.asyncio
+async def test_publisher_includes_other_workers(tmp_path):
+    (tmp_path / "worker-1.json").write_text(json.dumps(worker_snapshot(1)))
+    snapshot = {"healthy_connections": 1, "active_calls": 2}
+    publisher = WorkerStatsPublisher(tmp_path, lambda: snapshot, interval=60)
+
+    await publisher.start()
+    assert publisher.path.exists()
+    stats = publisher.cluster_stats()
+    assert stats["workers"] == 2
+    assert stats["active_calls"] == 5
+
+    await publisher.stop()
+    assert not publisher.path.exists()
+
+
+def test_publisher_rejects_non_positive_interval(tmp_path):
+    with pytest.raises(ValueError):
+        WorkerStatsPublisher(tmp_path, dict, interval=0)
+
+
+def test_session_storage_shared_within_process():
+    storage = get_session_storage()
+    assert isinstance(storage, MemorySessionStorage)
+    assert get_session_storage() is storage
+
+    reset_session_storage()
+    assert get_session_storage() is not storage
+
+
+def test_unknown_session_storage_backend():
+    with pytest.raises(ValueError):
+        create_session_storage("sqlite")
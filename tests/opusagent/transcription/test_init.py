@@ -35,7 +35,11 @@ def test_all_exports_defined():
         "TranscriptionConfig", 
         "TranscriptionFactory",
         "load_transcription_config",
-        "BaseTranscriber"
+        "BaseTranscriber",
+        "ModelRegistry",
+        "get_model_registry",
+        "WhisperBatchScheduler",
+        "get_whisper_scheduler",
     }
     
     actual_exports = set(transcription_module.__all__)
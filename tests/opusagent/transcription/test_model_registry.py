@@ -0,0 +1,147 @@
+"""
+Unit tests for the transcription model registry.
+"""
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from opusagent.local.transcription.backends.whisper import WhisperTranscriber
+from opusagent.local.transcription.model_registry import ModelRegistry
+from opusagent.local.transcription.models import TranscriptionConfig
+
+KEY = ("whisper", "base", "cpu")
+
+
+class TestModelRegistry:
+    """Test ModelRegistry."""
+
+    def test_shared_model_loaded_once(self):
+        """Test that holders of a shared model share one load."""
+        registry = ModelRegistry()
+        loader = MagicMock(side_effect=lambda: object())
+
+        first = registry.acquire(KEY, loader)
+        second = registry.acquire(KEY, loader)
+
+        assert first.model is second.model
+        assert loader.call_count == 1
+        assert registry.get_stats()["leases"] == 2
+
+    def test_concurrent_acquire_waits_for_one_load(self):
+        """Test that concurrent first acquisitions load the model once."""
+        registry = ModelRegistry()
+        loads = []
+
+        def loader():
+            loads.append(1)
+            time.sleep(0.05)
+            return object()
+
+        leases = []
+        threads = [
+            threading.Thread(target=lambda: leases.append(registry.acquire(KEY, loader)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(loads) == 1
+        assert len({id(lease.model) for lease in leases}) == 1
+
+    def test_exclusive_models_are_pooled(self):
+        """Test that exclusive models go to one holder and are reused after release."""
+        registry = ModelRegistry()
+        loader = MagicMock(side_effect=lambda: object())
+        key = ("pocketsphinx", "config", "cpu")
+
+        first = registry.acquire(key, loader, exclusive=True)
+        second = registry.acquire(key, loader, exclusive=True)
+        assert first.model is not second.model
+
+        model = first.model
+        first.release()
+        third = registry.acquire(key, loader, exclusive=True)
+
+        assert third.model is model
+        assert loader.call_count == 2
+
+    def test_idle_models_evicted(self):
+        """Test that unused models are evicted after the idle timeout."""
+        registry = ModelRegistry(idle_timeout=0.01)
+        lease = registry.acquire(KEY, object)
+        assert registry.evict_idle() == 0  # Still in use
+
+        lease.release()
+        lease.release()  # Second release is ignored
+        time.sleep(0.02)
+
+        assert registry.evict_idle() == 1
+        assert registry.get_stats()["models_loaded"] == 0
+
+    def test_idle_models_evicted_without_further_calls(self):
+        """Test that the background sweep evicts idle models on its own."""
+        registry = ModelRegistry(idle_timeout=0.01)
+        registry.acquire(KEY, object).release()
+
+        deadline = time.monotonic() + 5
+        while registry.get_stats()["models_loaded"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert registry.get_stats()["models_loaded"] == 0
+        assert registry.evictions == 1
+
+    def test_memory_budget_evicts_least_recently_used(self):
+        """Test that idle models are evicted oldest first to fit the budget."""
+        registry = ModelRegistry(idle_timeout=None, memory_budget_bytes=250)
+        sizer = lambda model: 100
+
+        for name in ("a", "b"):
+            registry.acquire(("whisper", name, "cpu"), object, sizer=sizer).release()
+        in_use = registry.acquire(("whisper", "c", "cpu"), object, sizer=sizer)
+        assert registry.get_stats()["memory_bytes"] == 200
+        assert registry.evictions == 1
+
+        registry.acquire(("whisper", "d", "cpu"), object, sizer=sizer)
+        stats = registry.get_stats()
+        assert stats["models_loaded"] == 2  # "c" and "d", both in use
+        assert not in_use.released
+
+    def test_loader_error_propagates(self):
+        """Test that a failed load leaves nothing registered."""
+        registry = ModelRegistry()
+
+        with pytest.raises(RuntimeError):
+            registry.acquire(KEY, MagicMock(side_effect=RuntimeError("boom")))
+
+        assert registry.get_stats()["models_loaded"] == 0
+
+
+class TestWhisperSharedModel:
+    """Test that Whisper transcribers share their model."""
+
+    @pytest.mark.asyncio
+    async def test_transcribers_share_model(self):
+        """Test that two transcribers load the weights once and keep separate state."""
+        config = TranscriptionConfig(backend="whisper", model_size="base", device="cpu")
+        mock_whisper = MagicMock()
+        mock_whisper.load_model.return_value = MagicMock()
+
+        with patch.dict('sys.modules', {'whisper': mock_whisper, 'openai_whisper': None}):
+            first = WhisperTranscriber(config)
+            second = WhisperTranscriber(config)
+            assert await first.initialize()
+            assert await second.initialize()
+
+        assert first._model is second._model
+        mock_whisper.load_model.assert_called_once_with("base", device="cpu")
+
+        first._accumulated_text = "hello"
+        assert second._accumulated_text == ""
+
+        await first.cleanup()
+        await second.cleanup()
+        assert first._lease is None and second._lease is None
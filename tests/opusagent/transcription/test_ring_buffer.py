@@ -0,0 +1,62 @@
+"""
+Unit tests for the audio ring buffer.
+"""
+import numpy as np
+
+from opusagent.local.transcription.ring_buffer import AudioRingBuffer
+
+
+class TestAudioRingBuffer:
+    """Test AudioRingBuffer."""
+
+    def test_extend_peek_consume(self):
+        """Test that samples come out in order and consume drops the oldest."""
+        buffer = AudioRingBuffer(capacity=8)
+        buffer.extend(np.arange(6))
+
+        assert len(buffer) == 6
+        np.testing.assert_array_equal(buffer.peek(4), [0, 1, 2, 3])
+        buffer.consume(3)
+        np.testing.assert_array_equal(buffer.to_array(), [3, 4, 5])
+
+    def test_wraps_around(self):
+        """Test that appends wrap around the end of the array."""
+        buffer = AudioRingBuffer(capacity=8)
+        buffer.extend(np.arange(6))
+        buffer.consume(5)
+        buffer.extend(np.arange(6, 12))
+
+        assert buffer.capacity == 8
+        np.testing.assert_array_equal(buffer.peek(7), np.arange(5, 12))
+
+    def test_grows_without_dropping_audio(self):
+        """Test that overflowing appends grow the buffer."""
+        buffer = AudioRingBuffer(capacity=4)
+        buffer.extend(np.arange(3))
+        buffer.consume(2)
+        buffer.extend(np.arange(3, 12))
+
+        assert buffer.capacity >= 10
+        np.testing.assert_array_equal(buffer.to_array(), np.arange(2, 12))
+
+    def test_peek_returns_copy(self):
+        """Test that peeked windows are unaffected by later appends."""
+        buffer = AudioRingBuffer(capacity=4)
+        buffer.extend([1.0, 2.0])
+        window = buffer.peek(2)
+        buffer.consume(2)
+        buffer.extend([9.0, 9.0, 9.0, 9.0])
+
+        np.testing.assert_array_equal(window, [1.0, 2.0])
+        assert window.dtype == np.float32
+
+    def test_clear_and_bool(self):
+        """Test clearing and truthiness."""
+        buffer = AudioRingBuffer()
+        assert not buffer
+        buffer.extend([0.5])
+        assert buffer
+        buffer.clear()
+        assert len(buffer) == 0
+        buffer.consume(10)  # Consuming more than buffered is a no-op
+        assert len(buffer) == 0
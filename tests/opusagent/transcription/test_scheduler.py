@@ -0,0 +1,177 @@
+"""
+Unit tests for the Whisper batch scheduler.
+"""
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from opusagent.local.transcription.backends.whisper import WhisperTranscriber
+from opusagent.local.transcription.models import TranscriptionConfig
+from opusagent.local.transcription.scheduler import WhisperBatchScheduler
+
+
+def make_whisper():
+    """Whisper module stand-in that decodes each window to its index."""
+    whisper = MagicMock()
+    whisper.log_mel_spectrogram.side_effect = lambda audio, n_mels, device=None: float(audio[0])
+    batches = []
+
+    def decode(model, mels, options):
+        batches.append(list(mels))
+        return [
+            SimpleNamespace(text=f" window {int(mel)} ", avg_logprob=-0.2, no_speech_prob=0.01)
+            for mel in mels
+        ]
+
+    whisper.decode.side_effect = decode
+    return whisper, batches
+
+
+@pytest.fixture
+def fake_torch():
+    torch = MagicMock()
+    torch.stack.side_effect = lambda tensors: list(tensors)
+    with patch.dict("sys.modules", {"torch": torch}):
+        yield torch
+
+
+class TestWhisperBatchScheduler:
+    """Test WhisperBatchScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_windows_from_sessions_share_a_batch(self, fake_torch):
+        """Test that concurrent windows are decoded in one batch."""
+        whisper, batches = make_whisper()
+        scheduler = WhisperBatchScheduler(max_batch_size=8, batch_window_ms=50)
+        model = MagicMock()
+        audio = [np.full(16000, i, dtype=np.float32) for i in range(4)]
+
+        results = await asyncio.gather(
+            *[scheduler.transcribe(whisper, model, a) for a in audio]
+        )
+        scheduler.shutdown()
+
+        assert [r.text for r in results] == [f"window {i}" for i in range(4)]
+        assert len(batches) == 1
+        stats = scheduler.get_stats()
+        assert stats["batches_run"] == 1
+        assert stats["windows_decoded"] == 4
+        assert stats["audio_seconds"] == pytest.approx(4.0)
+        assert stats["real_time_factor"] > 0
+        assert stats["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_batches_split_by_options_and_size(self, fake_torch):
+        """Test that windows with different options or over the size limit are split."""
+        whisper, batches = make_whisper()
+        scheduler = WhisperBatchScheduler(max_batch_size=2, batch_window_ms=50)
+        model = MagicMock()
+        audio = np.zeros(1600, dtype=np.float32)
+
+        await asyncio.gather(
+            scheduler.transcribe(whisper, model, audio, language="fr"),
+            scheduler.transcribe(whisper, model, audio, language="de"),
+            scheduler.transcribe(whisper, model, audio, language="fr"),
+        )
+        scheduler.shutdown()
+
+        # "de" never shares a decode with "fr"
+        assert len(batches) >= 2
+        assert scheduler.get_stats()["max_batch_seen"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_decode_error_fails_every_window(self, fake_torch):
+        """Test that a failed batch raises in every waiting transcriber."""
+        whisper, _ = make_whisper()
+        whisper.decode.side_effect = RuntimeError("out of memory")
+        scheduler = WhisperBatchScheduler(batch_window_ms=50)
+        audio = np.zeros(1600, dtype=np.float32)
+
+        results = await asyncio.gather(
+            scheduler.transcribe(whisper, MagicMock(), audio),
+            scheduler.transcribe(whisper, MagicMock(), audio),
+            return_exceptions=True,
+        )
+        scheduler.shutdown()
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert not scheduler.running
+
+    @pytest.mark.asyncio
+    async def test_cancelled_window_does_not_stop_scheduler(self, fake_torch):
+        """Test that a session cancelled mid-decode leaves the batch and thread intact."""
+        whisper, _ = make_whisper()
+        decode = whisper.decode.side_effect
+        decoding = threading.Event()
+        release = threading.Event()
+
+        def blocking_decode(model, mels, options):
+            decoding.set()
+            release.wait(5)
+            return decode(model, mels, options)
+
+        whisper.decode.side_effect = blocking_decode
+        scheduler = WhisperBatchScheduler(batch_window_ms=50)
+        model = MagicMock()
+        audio = [np.full(1600, i, dtype=np.float32) for i in range(2)]
+
+        cancelled = asyncio.create_task(scheduler.transcribe(whisper, model, audio[0]))
+        kept = asyncio.create_task(scheduler.transcribe(whisper, model, audio[1]))
+        await asyncio.to_thread(decoding.wait, 5)
+        cancelled.cancel()
+        release.set()
+
+        assert (await kept).text == "window 1"
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert scheduler.running
+        assert (await scheduler.transcribe(whisper, model, audio[0])).text == "window 0"
+        scheduler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_window_cancelled_while_queued_is_skipped(self, fake_torch):
+        """Test that a window cancelled before its batch runs is not decoded."""
+        whisper, batches = make_whisper()
+        scheduler = WhisperBatchScheduler(batch_window_ms=100)
+        model = MagicMock()
+        audio = [np.full(1600, i, dtype=np.float32) for i in range(2)]
+
+        cancelled = asyncio.create_task(scheduler.transcribe(whisper, model, audio[0]))
+        kept = asyncio.create_task(scheduler.transcribe(whisper, model, audio[1]))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert (await kept).text == "window 1"
+        scheduler.shutdown()
+        assert batches == [[1.0]]
+
+
+class TestWhisperTranscriberBatching:
+    """Test WhisperTranscriber with the batch scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_transcribe_chunk_uses_scheduler(self, fake_torch):
+        """Test that windows go through the scheduler and the overlap is kept."""
+        config = TranscriptionConfig(
+            backend="whisper", chunk_duration=1.0, sample_rate=16000, device="cpu"
+        )
+        transcriber = WhisperTranscriber(config)
+        whisper, batches = make_whisper()
+        transcriber._model = MagicMock()
+        transcriber._whisper = whisper
+        transcriber._scheduler = WhisperBatchScheduler(batch_window_ms=1)
+        transcriber._initialized = True
+
+        audio = (np.ones(32000) * 1000).astype(np.int16).tobytes()
+        result = await transcriber.transcribe_chunk(audio)
+        transcriber._scheduler.shutdown()
+
+        assert result.error is None
+        assert result.text == "window 0"
+        assert result.confidence == pytest.approx(0.4)
+        assert len(transcriber._audio_buffer) == 3200  # 10% overlap kept
+        transcriber._model.transcribe.assert_not_called()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the onnxruntime Silero VAD backend.
+"""
+
+import asyncio
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from opusagent.vad.batching import VADRequest, group_requests
+from opusagent.vad.silero_onnx_vad import (
+    OnnxVADBatcher,
+    OnnxVADStreamState,
+    SileroOnnxModel,
+    SileroOnnxVAD,
+    default_model_path,
+)
+from opusagent.vad.vad_factory import VADFactory
+
+
+class FakeSession:
+    """Stand-in for the ONNX session: output depends on carried state."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def run(self, output_names, feeds):
+        self.batch_sizes.append(feeds["input"].shape[0])
+        # Probability = running count of chunks seen by the stream / 10
+        new_state = feeds["state"] + 1.0
+        return new_state[0, :, :1] / 10.0, new_state
+
+
+@pytest.fixture
+def fake_model():
+    model = SileroOnnxModel.__new__(SileroOnnxModel)
+    model.model_path = "fake.onnx"
+    model.session = FakeSession()
+    return model
+
+
+def _model_available():
+    try:
+        import onnxruntime  # noqa: F401
+
+        default_model_path()
+        return True
+    except (ImportError, RuntimeError):
+        return False
+
+
+requires_onnx_model = pytest.mark.skipif(
+    not _model_available(), reason="onnxruntime or silero-vad not installed"
+)
+
+
+class TestSileroOnnxModel:
+    """Test cases for the stateless batched model."""
+
+    def test_stream_state_shapes(self):
+        """Stream state matches the model's expected layout."""
+        stream = OnnxVADStreamState(16000)
+        assert stream.state.shape == (2, 128)
+        assert stream.context.shape == (64,)
+        assert OnnxVADStreamState(8000).context.shape == (32,)
+
+    def test_stream_state_invalid_rate(self):
+        """Unsupported rates are rejected."""
+        with pytest.raises(ValueError):
+            OnnxVADStreamState(24000)
+
+    def test_forward_keeps_state_per_stream(self, fake_model):
+        """Each row's state is scattered back to its own stream."""
+        a, b = OnnxVADStreamState(16000), OnnxVADStreamState(16000)
+        audio = np.ones((2, 512), dtype=np.float32)
+        audio[1] *= 0.5
+
+        fake_model.forward(audio, [a, b])
+        probs = fake_model.forward(audio[:1], [a])
+
+        assert probs[0] == pytest.approx(0.2)
+        assert b.state[0, 0] == 1.0
+        np.testing.assert_array_equal(b.context, np.full(64, 0.5, dtype=np.float32))
+
+    def test_forward_validates_batch(self, fake_model):
+        """Mismatched rows, rates and chunk sizes are rejected."""
+        audio = np.zeros((2, 512), dtype=np.float32)
+        with pytest.raises(ValueError):
+            fake_model.forward(audio, [OnnxVADStreamState(16000)])
+        with pytest.raises(ValueError):
+            fake_model.forward(
+                audio, [OnnxVADStreamState(16000), OnnxVADStreamState(8000)]
+            )
+        with pytest.raises(ValueError):
+            fake_model.forward(audio[:, :256], [OnnxVADStreamState(16000)] * 2)
+
+    def test_forward_sequences_ragged(self, fake_model):
+        """Streams with different chunk counts share passes while they overlap."""
+        a, b = OnnxVADStreamState(8000), OnnxVADStreamState(8000)
+        chunks_a = np.zeros((3, 256), dtype=np.float32)
+        chunks_b = np.zeros((1, 256), dtype=np.float32)
+
+        probs_a, probs_b = fake_model.forward_sequences([a, b], [chunks_a, chunks_b])
+
+        np.testing.assert_allclose(probs_a, [0.1, 0.2, 0.3], rtol=1e-6)
+        np.testing.assert_allclose(probs_b, [0.1], rtol=1e-6)
+        assert fake_model.session.batch_sizes == [2, 1, 1]
+
+    def test_default_model_path_missing_package(self):
+        """A missing silero-vad package is reported clearly."""
+        with patch("importlib.util.find_spec", return_value=None):
+            with pytest.raises(RuntimeError, match="silero-vad"):
+                default_model_path()
+
+
+class TestOnnxVADBatcher:
+    """Test cases for the asyncio batcher."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_a_batch(self, fake_model):
+        """Requests from many streams within the window run as one pass."""
+        batcher = OnnxVADBatcher(fake_model, batch_window_ms=20.0)
+        streams = [OnnxVADStreamState(16000) for _ in range(8)]
+        chunks = np.zeros((1, 512), dtype=np.float32)
+
+        results = await asyncio.gather(*(batcher.infer(s, chunks) for s in streams))
+
+        assert all(r[0] == pytest.approx(0.1) for r in results)
+        assert fake_model.session.batch_sizes == [8]
+        assert batcher.get_stats()["max_batch_size"] == 8
+        batcher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_same_stream_requests_stay_ordered(self, fake_model):
+        """Two requests of one stream in a batch run in submission order."""
+        batcher = OnnxVADBatcher(fake_model, batch_window_ms=20.0)
+        stream = OnnxVADStreamState(16000)
+        chunks = np.zeros((2, 512), dtype=np.float32)
+
+        first, second = await asyncio.gather(
+            batcher.infer(stream, chunks), batcher.infer(stream, chunks)
+        )
+
+        np.testing.assert_allclose(first, [0.1, 0.2], rtol=1e-6)
+        np.testing.assert_allclose(second, [0.3, 0.4], rtol=1e-6)
+        assert batcher.get_stats()["batches_run"] == 1
+        batcher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_early(self, fake_model):
+        """Reaching max_batch_size runs the batch without waiting the window."""
+        batcher = OnnxVADBatcher(fake_model, max_batch_size=2, batch_window_ms=10000)
+        chunks = np.zeros((1, 512), dtype=np.float32)
+
+        await asyncio.wait_for(
+            asyncio.gather(
+                batcher.infer(OnnxVADStreamState(16000), chunks),
+                batcher.infer(OnnxVADStreamState(16000), chunks),
+            ),
+            timeout=1.0,
+        )
+        batcher.shutdown()
+
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_is_skipped(self, fake_model):
+        """A call that hangs up mid-batch does not fail the other requests."""
+        batcher = OnnxVADBatcher(fake_model, batch_window_ms=50.0)
+        chunks = np.zeros((1, 512), dtype=np.float32)
+
+        cancelled = asyncio.ensure_future(
+            batcher.infer(OnnxVADStreamState(16000), chunks)
+        )
+        kept = asyncio.ensure_future(batcher.infer(OnnxVADStreamState(16000), chunks))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert (await kept)[0] == pytest.approx(0.1)
+        assert fake_model.session.batch_sizes == [1]
+        assert batcher.running
+        batcher.shutdown()
+
+    def test_same_stream_requests_go_to_later_rounds(self):
+        """A stream appears once per round; rounds split by sample rate."""
+        a, b = OnnxVADStreamState(16000), OnnxVADStreamState(8000)
+        chunks = np.zeros((1, 512), dtype=np.float32)
+        batch = [VADRequest(a, chunks), VADRequest(b, chunks), VADRequest(a, chunks)]
+
+        rounds = group_requests(batch)
+
+        assert [[len(group) for group in groups] for groups in rounds] == [[1, 1], [1]]
+        assert rounds[1][0][0] is batch[2]
+
+
+class TestSileroOnnxVAD:
+    """Test cases for the BaseVAD front end."""
+
+    def test_process_before_initialize(self):
+        """Processing without a model raises."""
+        with pytest.raises(RuntimeError):
+            SileroOnnxVAD().process_audio(np.zeros(512, dtype=np.float32))
+
+    def test_reset_clears_stream_state(self, fake_model):
+        """reset() clears the model's recurrent state for the stream."""
+        vad = SileroOnnxVAD()
+        vad._configure({"sample_rate": 16000})
+        vad.model = fake_model
+        vad._stream = fake_model.create_stream(16000)
+
+        vad.process_audio(np.zeros(1024, dtype=np.float32))
+        assert vad._stream.state[0, 0] == 2.0
+        vad.reset()
+        assert vad._stream.state[0, 0] == 0.0
+
+    @requires_onnx_model
+    def test_factory_creates_onnx_backend(self):
+        """The factory builds the ONNX backend and it detects a tone as speech."""
+        vad = VADFactory.create_vad({"backend": "silero_onnx", "sample_rate": 16000})
+        assert isinstance(vad, SileroOnnxVAD)
+
+        silence = vad.process_audio(np.zeros(16000, dtype=np.float32))
+        assert silence["speech_prob"] < 0.1
+        vad.cleanup()
+
+    @requires_onnx_model
+    def test_shared_instances_reuse_model(self):
+        """Shared instances load the model once but keep separate state."""
+        config = {"backend": "silero_onnx", "sample_rate": 16000, "shared": True}
+        first = VADFactory.create_vad(config)
+        second = VADFactory.create_vad(config)
+
+        assert first.model is second.model
+        assert first._stream is not second._stream
+
+    @requires_onnx_model
+    @pytest.mark.asyncio
+    async def test_async_shared_processing(self):
+        """Async processing through the batcher returns a full result."""
+        config = {"backend": "silero_onnx", "sample_rate": 24000, "shared": True}
+        vad = VADFactory.create_vad(config)
+
+        result = await vad.process_audio_async(np.zeros(4800, dtype=np.float32))
+
+        assert set(result) >= {"speech_prob", "is_speech", "speech_state"}
+
+    def test_module_does_not_import_torch(self):
+        """The backend module does not pull in torch by itself."""
+        import subprocess
+
+        code = (
+            "import sys; import opusagent.vad.silero_onnx_vad; "
+            "sys.exit(1 if 'torch' in sys.modules else 0)"
+        )
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
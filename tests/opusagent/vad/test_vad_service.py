@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared VAD inference service.
+"""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+import torch
+
+from opusagent.vad.vad_factory import VADFactory
+from opusagent.vad.vad_service import (
+    SharedSileroVAD,
+    VADInferenceService,
+    VADStreamState,
+)
+
+
+class FakeRecurrentModel:
+    """Stand-in for the Silero sub-model: output depends on carried state."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def __call__(self, inputs, state):
+        self.batch_sizes.append(inputs.shape[0])
+        # Probability = running count of chunks seen by the stream / 10
+        new_state = state + 1.0
+        output = new_state[0, :, :1] / 10.0
+        return output, new_state
+
+
+class FakeSileroWrapper:
+    def __init__(self):
+        self._model = FakeRecurrentModel()
+        self._model_8k = FakeRecurrentModel()
+
+
+@pytest.fixture
+def fake_service():
+    service = VADInferenceService(max_batch_size=16, batch_window_ms=20.0)
+    service.model = FakeSileroWrapper()
+    service.start()
+    yield service
+    service.shutdown()
+
+
+class TestVADInferenceService:
+    """Test cases for VADInferenceService."""
+
+    def test_stream_state_shapes(self):
+        """Stream state matches the model's expected layout."""
+        stream = VADStreamState(16000)
+        assert stream.state.shape == (2, 128)
+        assert stream.context.shape == (64,)
+        assert VADStreamState(8000).context.shape == (32,)
+
+    def test_stream_state_invalid_rate(self):
+        """Unsupported rates are rejected."""
+        with pytest.raises(ValueError):
+            VADStreamState(24000)
+
+    def test_per_stream_state_kept_separate(self, fake_service):
+        """Each stream carries its own recurrent state."""
+        first = fake_service.create_stream(16000)
+        second = fake_service.create_stream(16000)
+        chunks = np.zeros((2, 512), dtype=np.float32)
+
+        probs_first = fake_service.infer_sync(first, chunks)
+        probs_second = fake_service.infer_sync(second, chunks[:1])
+        probs_first_again = fake_service.infer_sync(first, chunks[:1])
+
+        np.testing.assert_allclose(probs_first, [0.1, 0.2])
+        np.testing.assert_allclose(probs_second, [0.1])
+        np.testing.assert_allclose(probs_first_again, [0.3])
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_batched(self, fake_service):
+        """Requests from many streams share one forward pass."""
+        streams = [fake_service.create_stream(16000) for _ in range(8)]
+        chunks = np.zeros((1, 512), dtype=np.float32)
+
+        results = await asyncio.gather(
+            *(fake_service.infer(stream, chunks) for stream in streams)
+        )
+
+        assert all(result[0] == pytest.approx(0.1) for result in results)
+        assert max(fake_service.model._model.batch_sizes) > 1
+        assert fake_service.get_stats()["requests_served"] == 8
+
+    def test_same_stream_requests_run_in_order(self, fake_service):
+        """Two queued requests for one stream are not merged into one pass."""
+        stream = fake_service.create_stream(16000)
+        chunks = np.zeros((1, 512), dtype=np.float32)
+
+        first = fake_service.submit(stream, chunks)
+        second = fake_service.submit(stream, chunks)
+
+        assert first.result()[0] == pytest.approx(0.1)
+        assert second.result()[0] == pytest.approx(0.2)
+
+    def test_sample_rates_use_matching_model(self, fake_service):
+        """8kHz streams run on the 8kHz sub-model."""
+        stream = fake_service.create_stream(8000)
+        fake_service.infer_sync(stream, np.zeros((1, 256), dtype=np.float32))
+
+        assert fake_service.model._model_8k.batch_sizes == [1]
+        assert fake_service.model._model.batch_sizes == []
+
+    def test_context_carries_previous_chunk(self, fake_service):
+        """The stream context holds the tail of the last chunk."""
+        stream = fake_service.create_stream(16000)
+        chunks = np.arange(512, dtype=np.float32).reshape(1, 512)
+
+        fake_service.infer_sync(stream, chunks)
+
+        torch.testing.assert_close(stream.context, torch.arange(448, 512).float())
+
+    def test_model_error_propagates(self, fake_service):
+        """Inference errors are raised to the caller."""
+
+        def broken(inputs, state):
+            raise RuntimeError("boom")
+
+        fake_service.model._model = broken
+        stream = fake_service.create_stream(16000)
+        with pytest.raises(RuntimeError, match="boom"):
+            fake_service.infer_sync(stream, np.zeros((1, 512), dtype=np.float32))
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_does_not_stop_service(self, fake_service):
+        """A call hanging up during inference leaves its batch and the thread intact."""
+        forward = fake_service.model._model
+        inferring = threading.Event()
+        release = threading.Event()
+
+        def blocking(inputs, state):
+            inferring.set()
+            release.wait(5)
+            return forward(inputs, state)
+
+        fake_service.model._model = blocking
+        streams = [fake_service.create_stream(16000) for _ in range(2)]
+        chunks = np.zeros((1, 512), dtype=np.float32)
+
+        cancelled = asyncio.create_task(fake_service.infer(streams[0], chunks))
+        kept = asyncio.create_task(fake_service.infer(streams[1], chunks))
+        await asyncio.to_thread(inferring.wait, 5)
+        cancelled.cancel()
+        release.set()
+
+        assert (await asyncio.wait_for(kept, 5))[0] == pytest.approx(0.1)
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        assert fake_service.running
+        assert fake_service.infer_sync(streams[1], chunks)[0] == pytest.approx(0.2)
+
+
+class TestSharedSileroVAD:
+    """Test cases for SharedSileroVAD."""
+
+    def test_factory_creates_shared_vad(self):
+        """The factory returns the shared variant when requested."""
+        vad = VADFactory.create_vad({"backend": "silero", "shared": True})
+        assert isinstance(vad, SharedSileroVAD)
+        vad.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_process_audio_async_uses_service(self, fake_service):
+        """Async processing goes through the service and applies hysteresis."""
+        vad = SharedSileroVAD(service=fake_service)
+        vad.initialize({"sample_rate": 16000, "threshold": 0.15})
+
+        first = await vad.process_audio_async(np.zeros(512, dtype=np.float32))
+        second = await vad.process_audio_async(np.zeros(512, dtype=np.float32))
+
+        assert first["speech_prob"] == pytest.approx(0.1)
+        assert first["is_speech"] is False
+        assert second["speech_prob"] == pytest.approx(0.2)
+        assert second["is_speech"] is True
+
+    def test_24khz_input_resampled(self, fake_service):
+        """24kHz audio is resampled to 16kHz model chunks."""
+        vad = SharedSileroVAD(service=fake_service)
+        vad.initialize({"sample_rate": 24000})
+
+        vad.process_audio(np.zeros(768 * 2, dtype=np.float32))
+
+        assert vad.chunk_size == 512
+        assert fake_service.chunks_processed == 2
+
+    def test_reset_clears_stream_state(self, fake_service):
+        """Reset restarts the recurrent state."""
+        vad = SharedSileroVAD(service=fake_service)
+        vad.initialize({"sample_rate": 16000})
+        vad.process_audio(np.zeros(512, dtype=np.float32))
+
+        vad.reset()
+        result = vad.process_audio(np.zeros(512, dtype=np.float32))
+
+        assert result["speech_prob"] == pytest.approx(0.1)
+
+    def test_matches_silero_stateful_inference(self):
+        """Batched shared inference matches the model's own stateful calls."""
+        silero_vad = pytest.importorskip("silero_vad")
+        model = silero_vad.load_silero_vad()
+        service = VADInferenceService(batch_window_ms=5.0)
+        service.model = model
+        try:
+            rng = np.random.default_rng(0)
+            audio = (rng.standard_normal((4, 512)) * 0.1).astype(np.float32)
+
+            stream = service.create_stream(16000)
+            shared = service.infer_sync(stream, audio)
+
+            model.reset_states()
+            expected = [model(torch.from_numpy(chunk), 16000).item() for chunk in audio]
+
+            np.testing.assert_allclose(shared, expected, atol=1e-5)
+        finally:
+            service.shutdown()
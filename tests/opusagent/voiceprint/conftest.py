@@ -114,8 +114,21 @@ def multiple_voiceprints(sample_embedding):
 
 @pytest.fixture
 def mock_redis_client():
-    """Mock Redis client for testing."""
+    """Mock Redis client holding two voiceprints in the storage hashes."""
     mock_redis = Mock()
-    mock_redis.keys.return_value = [b"voiceprint:caller_1", b"voiceprint:caller_2"]
-    mock_redis.get.return_value = '{"caller_id": "test", "embedding": [0.1, 0.2]}'
-    return mock_redis 
\ No newline at end of file
+    mock_redis.get.return_value = b"2"
+    hashes = {
+        "voiceprints:embeddings": [
+            (b"caller_1", np.array([0.1, 0.2], dtype=np.float32).tobytes()),
+            (b"caller_2", np.array([0.3, 0.4], dtype=np.float32).tobytes()),
+        ],
+        "voiceprints:info": [
+            (b"caller_1", b'{"metadata": {"name": "one"}}'),
+            (b"caller_2", b'{"metadata": {}}'),
+        ],
+    }
+    mock_redis.hashes = hashes
+    mock_redis.hscan_iter.side_effect = lambda key, count=None: iter(hashes[key])
+    mock_redis.pipeline.return_value.execute.return_value = [1, 1, 3]
+    mock_redis.scan_iter.return_value = []  # No legacy voiceprint:{id} keys
+    return mock_redis
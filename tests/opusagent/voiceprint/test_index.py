@@ -0,0 +1,138 @@
+import pytest
+import numpy as np
+from unittest.mock import patch
+from scipy.spatial.distance import cosine
+from opusagent.voiceprint.index import IVFVoiceprintIndex, VoiceprintIndex
+from opusagent.voiceprint.models import Voiceprint
+from opusagent.voiceprint.recognizer import OpusAgentVoiceRecognizer
+
+
+def make_voiceprints(count, dimension=64, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        Voiceprint(
+            caller_id=f"caller_{i}",
+            embedding=rng.standard_normal(dimension).astype(np.float32),
+            metadata={"index": i},
+        )
+        for i in range(count)
+    ]
+
+
+class TestVoiceprintIndex:
+    """Test the exact voiceprint index."""
+
+    def test_search_matches_cosine_loop(self):
+        """Test that search ranks like one cosine call per voiceprint."""
+        voiceprints = make_voiceprints(50)
+        index = VoiceprintIndex()
+        index.build(voiceprints)
+        query = voiceprints[7].embedding + 0.1
+
+        expected = sorted(
+            ((vp.caller_id, 1 - cosine(query, vp.embedding)) for vp in voiceprints),
+            key=lambda match: match[1],
+            reverse=True,
+        )[:5]
+        matches = index.search(query, k=5)
+
+        assert [m[0] for m in matches] == [e[0] for e in expected]
+        for match, (_, similarity) in zip(matches, expected):
+            assert abs(match[1] - similarity) < 1e-5
+        assert matches[0][2] == {"index": 7}
+
+    def test_search_threshold(self):
+        """Test that only matches strictly above the threshold are returned."""
+        index = VoiceprintIndex()
+        index.add("same", np.array([1.0, 0.0], dtype=np.float32))
+        index.add("orthogonal", np.array([0.0, 1.0], dtype=np.float32))
+
+        matches = index.search(np.array([2.0, 0.0]), k=5, threshold=0.5)
+
+        assert [m[0] for m in matches] == ["same"]
+        assert index.search(np.array([0.0, 0.0]), k=5) == []
+
+    def test_add_replaces_and_remove(self):
+        """Test incremental add, replace and remove."""
+        voiceprints = make_voiceprints(5, dimension=8)
+        index = VoiceprintIndex(initial_capacity=2)
+        for vp in voiceprints:
+            index.add(vp.caller_id, vp.embedding, vp.metadata)
+        assert len(index) == 5
+
+        index.add("caller_0", voiceprints[4].embedding, {"replaced": True})
+        assert len(index) == 5
+        assert index.remove("caller_1")
+        assert not index.remove("caller_1")
+        assert "caller_1" not in index
+
+        # The last row moved into the removed one and is still found
+        matches = index.search(voiceprints[4].embedding, k=2)
+        assert {m[0] for m in matches} == {"caller_0", "caller_4"}
+        assert index.search(voiceprints[3].embedding)[0][0] == "caller_3"
+
+    def test_dimension_mismatch(self):
+        """Test that embeddings of another size are rejected."""
+        index = VoiceprintIndex()
+        index.add("caller", np.ones(4, dtype=np.float32))
+
+        with pytest.raises(ValueError):
+            index.add("other", np.ones(8, dtype=np.float32))
+        assert index.search(np.ones(8, dtype=np.float32)) == []
+
+
+class TestIVFVoiceprintIndex:
+    """Test the approximate voiceprint index."""
+
+    def test_exact_below_train_size(self):
+        """Test that small indexes are searched exactly."""
+        voiceprints = make_voiceprints(20)
+        index = IVFVoiceprintIndex(n_lists=4, min_train_size=100)
+        index.build(voiceprints)
+
+        assert not index.is_trained
+        assert index.search(voiceprints[3].embedding)[0][0] == "caller_3"
+
+    def test_trained_search_and_updates(self):
+        """Test that a trained index finds enrolled and newly added callers."""
+        voiceprints = make_voiceprints(500)
+        index = IVFVoiceprintIndex(n_lists=8, n_probe=2, min_train_size=100)
+        index.build(voiceprints)
+        assert index.is_trained
+
+        for vp in voiceprints[:50]:
+            assert index.search(vp.embedding)[0][0] == vp.caller_id
+
+        new = np.random.default_rng(1).standard_normal(64).astype(np.float32)
+        index.add("new_caller", new)
+        assert index.search(new)[0][0] == "new_caller"
+        index.remove("caller_0")
+        assert "caller_0" not in [m[0] for m in index.search(voiceprints[0].embedding, k=5)]
+        assert index.search(voiceprints[499].embedding)[0][0] == "caller_499"
+
+
+class TestRecognizerIndex:
+    """Test how the recognizer keeps its index in sync with storage."""
+
+    def test_index_loaded_once_and_updated_on_enroll(self, sample_audio_buffer, temp_json_storage, mock_voice_encoder):
+        """Test that the index is loaded once and enrollment updates it in place."""
+        with patch('opusagent.voiceprint.recognizer.VoiceEncoder') as mock_encoder_class:
+            mock_encoder_class.return_value = mock_voice_encoder
+            recognizer = OpusAgentVoiceRecognizer(storage_backend=temp_json_storage)
+
+            first = np.random.rand(256).astype(np.float32)
+            mock_voice_encoder.embed_utterance.return_value = first
+            recognizer.enroll_caller("first", sample_audio_buffer)
+
+            with patch.object(recognizer.index, 'load', wraps=recognizer.index.load) as load, \
+                    patch.object(temp_json_storage, '_load_all', wraps=temp_json_storage._load_all) as load_all:
+                assert recognizer.match_caller(sample_audio_buffer)[0] == "first"
+
+                second = -first
+                mock_voice_encoder.embed_utterance.return_value = second
+                recognizer.enroll_caller("second", sample_audio_buffer)
+                assert recognizer.match_caller(sample_audio_buffer)[0] == "second"
+
+                assert load.call_count == 1
+                assert load_all.call_count == 0
+            assert len(recognizer.index) == 2
@@ -293,6 +293,66 @@ class TestOpusAgentVoiceRecognizer:
             except FileNotFoundError:
                 pass
 
+    @patch('opusagent.voiceprint.recognizer.preprocess_wav', side_effect=lambda audio: audio)
+    def test_enroll_waits_for_match_in_another_thread(self, mock_preprocess, sample_audio_buffer, temp_json_storage, mock_voice_encoder):
+        """Test that enrolling does not change the index during a threaded match."""
+        import threading
+
+        with patch('opusagent.voiceprint.recognizer.VoiceEncoder') as mock_encoder_class:
+            mock_encoder_class.return_value = mock_voice_encoder
+            recognizer = OpusAgentVoiceRecognizer(storage_backend=temp_json_storage)
+            recognizer.load_index()
+
+            searching, release = threading.Event(), threading.Event()
+            search = recognizer.index.search
+            events = []
+
+            def blocking_search(*args, **kwargs):
+                searching.set()
+                release.wait(5)
+                events.append("search done")
+                return search(*args, **kwargs)
+
+            add = recognizer.index.add
+
+            def recording_add(*args, **kwargs):
+                events.append("add")
+                return add(*args, **kwargs)
+
+            recognizer.index.search = blocking_search
+            recognizer.index.add = recording_add
+
+            matcher = threading.Thread(
+                target=recognizer.match_embedding,
+                args=(np.random.rand(256).astype(np.float32),),
+            )
+            matcher.start()
+            assert searching.wait(5)
+
+            enroller = threading.Thread(
+                target=recognizer.enroll_caller, args=("new_caller", sample_audio_buffer)
+            )
+            enroller.start()
+            enroller.join(0.1)
+            assert enroller.is_alive()  # Waiting for the match to finish
+
+            release.set()
+            matcher.join(5)
+            enroller.join(5)
+            assert events == ["search done", "add"]
+            assert len(recognizer.index) == 1
+
+
+def test_voice_recognizer_shared_within_process():
+    """Test that calls share one recognizer, and with it one voiceprint index."""
+    from opusagent.voiceprint.recognizer import get_voice_recognizer, reset_voice_recognizer
+
+    recognizer = get_voice_recognizer()
+    assert get_voice_recognizer() is recognizer
+
+    reset_voice_recognizer()
+    assert get_voice_recognizer() is not recognizer
+
 
 class TestRecognizerPerformance:
     """Performance tests for the recognizer."""
@@ -97,6 +97,43 @@ class TestJSONStorage:
         assert "caller_id" in data[sample_voiceprint.caller_id]
         assert "embedding" in data[sample_voiceprint.caller_id]
         assert "metadata" in data[sample_voiceprint.caller_id]
+    
+    def test_json_storage_cache(self, temp_json_storage, sample_voiceprint, multiple_voiceprints):
+        """Test that the file is only parsed again after another writer changed it."""
+        temp_json_storage.save(sample_voiceprint)
+        
+        with patch.object(temp_json_storage, '_load_all', wraps=temp_json_storage._load_all) as load_all:
+            temp_json_storage.get_all()
+            temp_json_storage.save(multiple_voiceprints[0])
+            assert len(temp_json_storage.get_all()) == 2
+            assert load_all.call_count == 0
+            
+            other = JSONStorage(temp_json_storage.file_path)
+            other.save(multiple_voiceprints[1])
+            assert len(temp_json_storage.get_all()) == 3
+            assert load_all.call_count == 1
+    
+    def test_json_storage_legacy_list_embeddings(self, temp_json_storage):
+        """Test reading files written with embeddings as lists of numbers."""
+        with open(temp_json_storage.file_path, 'w') as f:
+            json.dump({"legacy": {"caller_id": "legacy", "embedding": [0.5, 0.25], "metadata": {}}}, f)
+        
+        voiceprints = temp_json_storage.get_all()
+        
+        assert voiceprints[0].caller_id == "legacy"
+        assert voiceprints[0].embedding.dtype == np.float32
+        assert np.array_equal(voiceprints[0].embedding, [0.5, 0.25])
+    
+    def test_json_storage_get_embeddings(self, temp_json_storage, multiple_voiceprints):
+        """Test the bulk embedding matrix."""
+        temp_json_storage.save_many(multiple_voiceprints)
+        
+        caller_ids, embeddings, metadata = temp_json_storage.get_embeddings()
+        
+        assert caller_ids == [vp.caller_id for vp in multiple_voiceprints]
+        assert embeddings.shape == (3, 256)
+        assert embeddings.dtype == np.float32
+        assert metadata[2] == {"test_id": 2}
 
 
 class TestRedisStorage:
@@ -108,43 +145,106 @@ class TestRedisStorage:
         assert storage.redis == mock_redis_client
     
     def test_redis_storage_save(self, mock_redis_client, sample_voiceprint):
-        """Test saving voiceprint to Redis."""
+        """Test saving voiceprint to Redis in one transaction."""
         storage = RedisStorage(mock_redis_client)
         storage.save(sample_voiceprint)
         
-        # Verify that Redis set was called
-        mock_redis_client.set.assert_called_once()
-        call_args = mock_redis_client.set.call_args
-        assert call_args[0][0] == f"voiceprint:{sample_voiceprint.caller_id}"
+        mock_redis_client.pipeline.assert_called_once_with(transaction=True)
+        pipe = mock_redis_client.pipeline.return_value
+        embeddings_call, info_call = pipe.hset.call_args_list
+        assert embeddings_call[0][0] == "voiceprints:embeddings"
+        blob = embeddings_call[1]["mapping"][sample_voiceprint.caller_id]
+        assert np.array_equal(np.frombuffer(blob, dtype=np.float32), sample_voiceprint.embedding)
+        assert info_call[0][0] == "voiceprints:info"
+        pipe.incr.assert_called_once_with("voiceprints:version")
+        pipe.execute.assert_called_once()
     
     def test_redis_storage_get_all(self, mock_redis_client):
-        """Test loading all voiceprints from Redis."""
+        """Test loading all voiceprints from Redis with HSCAN."""
         storage = RedisStorage(mock_redis_client)
         voiceprints = storage.get_all()
         
-        # Verify that Redis keys and get were called
-        mock_redis_client.keys.assert_called_once_with("voiceprint:*")
-        assert mock_redis_client.get.call_count == 2  # Two keys returned
+        scanned = [c[0][0] for c in mock_redis_client.hscan_iter.call_args_list]
+        assert scanned == ["voiceprints:embeddings", "voiceprints:info"]
+        mock_redis_client.keys.assert_not_called()
+        assert [vp.caller_id for vp in voiceprints] == ["caller_1", "caller_2"]
+        assert voiceprints[0].embedding.dtype == np.float32
+        assert np.allclose(voiceprints[0].embedding, [0.1, 0.2])
+        assert voiceprints[0].metadata == {"name": "one"}
+    
+    def test_redis_storage_cache(self, mock_redis_client, sample_voiceprint):
+        """Test that Redis is only scanned again after another process wrote."""
+        storage = RedisStorage(mock_redis_client)
+        storage.get_all()
+        mock_redis_client.pipeline.return_value.execute.return_value = [1, 1, 3]
+        storage.save(sample_voiceprint)
+        mock_redis_client.get.return_value = b"3"
+        
+        assert len(storage.get_all()) == 3
+        assert mock_redis_client.hscan_iter.call_count == 2
+        
+        # Another process incremented the version
+        mock_redis_client.get.return_value = b"4"
+        assert len(storage.get_all()) == 2
+        assert mock_redis_client.hscan_iter.call_count == 4
     
     def test_redis_storage_empty(self, mock_redis_client):
         """Test loading from empty Redis."""
-        mock_redis_client.keys.return_value = []
+        mock_redis_client.hashes["voiceprints:embeddings"] = []
+        mock_redis_client.hashes["voiceprints:info"] = []
         storage = RedisStorage(mock_redis_client)
         voiceprints = storage.get_all()
         
         assert len(voiceprints) == 0
-        mock_redis_client.keys.assert_called_once_with("voiceprint:*")
-        mock_redis_client.get.assert_not_called()
+        mock_redis_client.keys.assert_not_called()
     
     def test_redis_storage_invalid_json(self, mock_redis_client):
         """Test handling of invalid JSON in Redis."""
-        mock_redis_client.keys.return_value = [b"voiceprint:test"]
-        mock_redis_client.get.return_value = "invalid json"
+        mock_redis_client.hashes["voiceprints:info"] = [(b"caller_1", b"invalid json")]
         
         storage = RedisStorage(mock_redis_client)
         
         with pytest.raises(Exception):  # Should raise JSON decode error
             storage.get_all()
+    
+    def test_redis_storage_migrate_legacy_keys(self, mock_redis_client):
+        """Test copying legacy voiceprint:{id} strings into the hashes."""
+        mock_redis_client.scan_iter.return_value = [b"voiceprint:test"]
+        mock_redis_client.mget.return_value = ['{"caller_id": "test", "embedding": [0.1, 0.2]}']
+        mock_redis_client.pipeline.return_value.execute.return_value = [1, 1, 3]
+        storage = RedisStorage(mock_redis_client)
+        
+        assert storage.migrate_legacy_keys() == 1
+        mapping = mock_redis_client.pipeline.return_value.hset.call_args_list[0][1]["mapping"]
+        assert list(mapping) == ["test"]
+
+    def test_redis_storage_migrates_legacy_keys_when_hashes_empty(self, mock_redis_client):
+        """Test that voiceprints under legacy keys are not lost after upgrading."""
+        mock_redis_client.hashes["voiceprints:embeddings"] = []
+        mock_redis_client.hashes["voiceprints:info"] = []
+        mock_redis_client.get.return_value = None
+        mock_redis_client.scan_iter.return_value = [b"voiceprint:test"]
+        mock_redis_client.mget.return_value = [b'{"caller_id": "test", "embedding": [0.1, 0.2]}']
+        mock_redis_client.pipeline.return_value.execute.return_value = [1, 1, 1]
+        storage = RedisStorage(mock_redis_client)
+
+        voiceprints = storage.get_all()
+
+        assert [vp.caller_id for vp in voiceprints] == ["test"]
+        assert np.allclose(voiceprints[0].embedding, [0.1, 0.2])
+        mapping = mock_redis_client.pipeline.return_value.hset.call_args_list[0][1]["mapping"]
+        assert list(mapping) == ["test"]
+
+        # Checked once per storage
+        storage.invalidate_cache()
+        storage.get_all()
+        assert mock_redis_client.scan_iter.call_count == 1
+
+    def test_redis_storage_rejects_decoding_client(self, mock_redis_client):
+        """Test that a client returning str instead of bytes is refused up front."""
+        mock_redis_client.connection_pool.connection_kwargs = {"decode_responses": True}
+        with pytest.raises(ValueError, match="decode_responses=False"):
+            RedisStorage(mock_redis_client)
 
 
 class TestSQLiteStorage:
@@ -294,6 +394,19 @@ class TestSQLiteStorage:
         assert len(voiceprints) == 1
         assert np.array_equal(voiceprints[0].embedding, test_embedding)
         assert voiceprints[0].embedding.dtype == np.float32
+    
+    def test_sqlite_storage_detects_other_connections(self, temp_sqlite_storage, multiple_voiceprints):
+        """Test that the cache is reloaded only after another connection wrote."""
+        temp_sqlite_storage.save(multiple_voiceprints[0])
+        version = temp_sqlite_storage.get_version()
+        assert temp_sqlite_storage.get_version() == version
+        
+        other = SQLiteStorage(temp_sqlite_storage.db_path)
+        other.save_many(multiple_voiceprints[1:])
+        other.close()
+        
+        assert temp_sqlite_storage.get_version() != version
+        assert len(temp_sqlite_storage.get_all()) == 3
 
 
 class TestStorageIntegration:
@@ -0,0 +1,146 @@
+import asyncio
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from opusagent.voiceprint.streaming import StreamingCallerIdentifier
+
+
+def make_chunk(seconds, sample_rate=16000, amplitude=8000):
+    """PCM16 noise at the given sample rate."""
+    samples = np.random.default_rng(0).uniform(-amplitude, amplitude, int(seconds * sample_rate))
+    return samples.astype("<i2").tobytes()
+
+
+def make_recognizer(matches):
+    """Recognizer whose matches are returned in order, one per window."""
+    recognizer = Mock()
+    recognizer.get_partial_embedding.return_value = np.ones(4, dtype=np.float32)
+    recognizer.match_embedding.side_effect = list(matches)
+    return recognizer
+
+
+async def feed_and_settle(identifier, chunks):
+    for chunk in chunks:
+        identifier.feed(chunk)
+        # Let the worker thread and window task finish before the next chunk
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            if identifier._task is None or identifier._task.done():
+                break
+
+
+class TestStreamingCallerIdentifier:
+    """Test incremental caller identification."""
+
+    async def test_identifies_after_agreeing_windows(self):
+        """Test that the caller is reported once consecutive windows agree."""
+        match = ("caller_1", 0.9, {"name": "Ann"})
+        recognizer = make_recognizer([("caller_2", 0.8, {}), match, match, match])
+        on_identified = Mock()
+        identifier = StreamingCallerIdentifier(
+            recognizer,
+            sample_rate=16000,
+            on_identified=on_identified,
+            window_seconds=1.0,
+            hop_seconds=0.5,
+        )
+
+        await feed_and_settle(identifier, [make_chunk(1.0)] + [make_chunk(0.5)] * 4)
+
+        assert identifier.done
+        assert identifier.result == match
+        assert await identifier.wait(timeout=0.1) == match
+        on_identified.assert_called_once_with("caller_1", 0.9, {"name": "Ann"})
+        assert identifier.windows_processed == 3
+
+    async def test_waits_for_a_full_window(self):
+        """Test that nothing is embedded before a window of audio arrived."""
+        recognizer = make_recognizer([])
+        identifier = StreamingCallerIdentifier(recognizer, sample_rate=16000, window_seconds=1.0)
+
+        await feed_and_settle(identifier, [make_chunk(0.5)])
+
+        recognizer.get_partial_embedding.assert_not_called()
+        assert not identifier.done
+
+    async def test_resamples_to_16khz(self):
+        """Test that windows are embedded at 16kHz whatever the input rate."""
+        recognizer = make_recognizer([None])
+        identifier = StreamingCallerIdentifier(
+            recognizer, sample_rate=24000, window_seconds=1.0
+        )
+
+        await feed_and_settle(identifier, [make_chunk(1.1, sample_rate=24000)])
+
+        window = recognizer.get_partial_embedding.call_args[0][0]
+        assert len(window) == 16000
+        assert window.dtype == np.float32
+        assert np.abs(window).max() <= 1.0
+
+    async def test_gives_up_after_max_audio(self):
+        """Test that identification stops after max_seconds without a match."""
+        recognizer = make_recognizer([None] * 10)
+        on_identified = Mock()
+        identifier = StreamingCallerIdentifier(
+            recognizer,
+            sample_rate=16000,
+            on_identified=on_identified,
+            window_seconds=1.0,
+            hop_seconds=0.5,
+            max_seconds=2.0,
+        )
+
+        await feed_and_settle(identifier, [make_chunk(0.5)] * 6)
+
+        assert identifier.done
+        assert identifier.result is None
+        on_identified.assert_not_called()
+        assert recognizer.get_partial_embedding.call_count <= 3
+
+    async def test_silent_windows_do_not_count(self):
+        """Test that windows without speech reset agreement and are not matched."""
+        match = ("caller_1", 0.9, {})
+        recognizer = make_recognizer([match, match])
+        recognizer.get_partial_embedding.side_effect = [
+            np.ones(4, dtype=np.float32),
+            None,
+            np.ones(4, dtype=np.float32),
+        ]
+        identifier = StreamingCallerIdentifier(
+            recognizer, sample_rate=16000, window_seconds=1.0, hop_seconds=0.5
+        )
+
+        await feed_and_settle(identifier, [make_chunk(1.0)] + [make_chunk(0.5)] * 2)
+
+        assert recognizer.match_embedding.call_count == 2
+        assert not identifier.done
+
+    async def test_reset_and_async_callback(self):
+        """Test that reset starts over and async callbacks are awaited."""
+        match = ("caller_1", 0.9, {})
+        recognizer = make_recognizer([match, match])
+        identified = []
+
+        async def on_identified(caller_id, similarity, metadata):
+            identified.append(caller_id)
+
+        identifier = StreamingCallerIdentifier(
+            recognizer,
+            sample_rate=16000,
+            on_identified=on_identified,
+            window_seconds=1.0,
+            required_agreement=1,
+        )
+        await feed_and_settle(identifier, [make_chunk(1.0)])
+        assert identified == ["caller_1"]
+
+        identifier.reset()
+        assert not identifier.done and identifier.result is None
+        await feed_and_settle(identifier, [make_chunk(1.0)])
+        assert identified == ["caller_1", "caller_1"]
+
+        await identifier.close()
+        identifier.feed(make_chunk(1.0))
+        assert recognizer.get_partial_embedding.call_count == 2
@@ -64,6 +64,8 @@ def mock_call_recorder():
     recorder = AsyncMock()
     recorder.record_caller_audio = AsyncMock()
     recorder.record_bot_audio = AsyncMock()
+    recorder.record_caller_audio_bytes = AsyncMock()
+    recorder.record_bot_audio_bytes = AsyncMock()
     return recorder
 
 
@@ -117,9 +119,11 @@ async def test_handle_incoming_audio_success(audio_handler):
     )  # Verify size after decoding (24kHz for OpenAI)
 
     # Verify the audio was recorded - should be the resampled and padded version
-    audio_handler.call_recorder.record_caller_audio.assert_called_once()
-    recorded_audio = audio_handler.call_recorder.record_caller_audio.call_args[0][0]
-    assert len(base64.b64decode(recorded_audio)) == 4800  # Verify size after decoding (24kHz internal)
+    # The recorder receives the decoded buffer directly, without a base64 round trip
+    audio_handler.call_recorder.record_caller_audio_bytes.assert_called_once()
+    audio_handler.call_recorder.record_caller_audio.assert_not_called()
+    recorded_audio = audio_handler.call_recorder.record_caller_audio_bytes.call_args[0][0]
+    assert len(recorded_audio) == 4800  # 100ms at 24kHz internal
 
 
 @pytest.mark.asyncio
@@ -189,8 +193,8 @@ async def test_handle_outgoing_audio_success(audio_handler):
     assert chunk_message["audioChunk"] == TEST_AUDIO_DELTA
 
     # Verify the audio was recorded
-    audio_handler.call_recorder.record_bot_audio.assert_called_once_with(
-        TEST_AUDIO_DELTA
+    audio_handler.call_recorder.record_bot_audio_bytes.assert_called_once_with(
+        base64.b64decode(TEST_AUDIO_DELTA)
     )
 
 
@@ -349,3 +353,56 @@ async def test_websocket_closed_detection(audio_handler):
     audio_handler.platform_websocket = AsyncMock()
     audio_handler.platform_websocket.client_state = WebSocketState.CONNECTED
     assert not audio_handler._is_websocket_closed()
+
+
+@pytest.mark.asyncio
+async def test_initialize_stream_creates_vad_off_event_loop(audio_handler):
+    """Test the VAD (torch and the model) is created in a worker thread."""
+    import threading
+
+    created_on = []
+
+    def create_vad(config):
+        created_on.append(threading.current_thread())
+        return MagicMock(chunk_size=512)
+
+    with patch(
+        "opusagent.handlers.audio_stream_handler.VADFactory.create_vad",
+        side_effect=create_vad,
+    ):
+        await audio_handler.initialize_stream(TEST_CONVERSATION_ID, TEST_MEDIA_FORMAT)
+
+    assert created_on and created_on[0] is not threading.main_thread()
+    assert audio_handler.vad is not None
+
+
+@pytest.mark.asyncio
+async def test_initialize_stream_continues_without_vad_on_failure(audio_handler):
+    """Test a VAD that cannot be created disables VAD instead of failing the call."""
+    with patch(
+        "opusagent.handlers.audio_stream_handler.VADFactory.create_vad",
+        side_effect=RuntimeError("silero-vad package not installed"),
+    ):
+        await audio_handler.initialize_stream(TEST_CONVERSATION_ID, TEST_MEDIA_FORMAT)
+
+    assert not audio_handler.vad_enabled
+    assert audio_handler.vad is None
+
+
+@pytest.mark.asyncio
+async def test_vad_failure_without_initialize_stream_still_forwards_audio(
+    audio_handler, mock_realtime_websocket
+):
+    """Test a VAD that fails to load on the first chunk is not retried per chunk."""
+    with patch(
+        "opusagent.handlers.audio_stream_handler.VADFactory.create_vad",
+        side_effect=RuntimeError("silero-vad package not installed"),
+    ) as create_vad:
+        for _ in range(2):
+            await audio_handler.handle_incoming_audio(
+                {"audioChunk": TEST_AUDIO_CHUNK_B64}
+            )
+
+    create_vad.assert_called_once()
+    assert not audio_handler.vad_enabled
+    assert mock_realtime_websocket.send.call_count == 2
@@ -246,4 +246,48 @@ class TestEventRouter:
         mock_telephony_handler.side_effect = Exception("Test error")
         data = {"type": "session.initiate"}
         await event_router.handle_platform_event(data)
-        # Should not raise any exceptions, error should be logged 
\ No newline at end of file
+        # Should not raise any exceptions, error should be logged 
+    @pytest.mark.asyncio
+    async def test_sync_handler_called(self, event_router):
+        """Test that sync handlers are wrapped once and called with the event."""
+        calls = []
+        event_router.register_realtime_handler("session.updated", calls.append)
+        data = {"type": "session.updated"}
+        await event_router.handle_realtime_event(data)
+        assert calls == [data]
+
+    @pytest.mark.asyncio
+    async def test_log_events_route_to_log_handler(self, event_router, mock_realtime_handler):
+        """Test that log events go to handle_log_event even with a handler registered."""
+        event_router.register_realtime_handler("rate_limits.updated", mock_realtime_handler)
+        await event_router.handle_realtime_event({"type": "rate_limits.updated"})
+        mock_realtime_handler.assert_not_called()
+        assert event_router.get_stats()["events"]["rate_limits.updated"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_dispatch_stats(self, event_router, mock_telephony_handler, mock_realtime_handler):
+        """Test per-event-type dispatch counters, errors and latency."""
+        event_router.register_platform_handler(
+            TelephonyEventType.USER_STREAM_CHUNK, mock_telephony_handler
+        )
+        event_router.register_realtime_handler(
+            ServerEventType.SESSION_CREATED, mock_realtime_handler
+        )
+        mock_realtime_handler.side_effect = Exception("Test error")
+
+        for _ in range(3):
+            await event_router.handle_platform_event({"type": "userStream.chunk", "audioChunk": "AA=="})
+        await event_router.handle_realtime_event({"type": ServerEventType.SESSION_CREATED})
+        await event_router.handle_realtime_event({"type": "invalid.event"})
+
+        stats = event_router.get_stats()
+        assert stats["dispatched"] == 4
+        assert stats["errors"] == 1
+        chunk_stats = stats["events"]["userStream.chunk"]
+        assert chunk_stats["count"] == 3
+        assert sum(chunk_stats["buckets_us"].values()) == 3
+        assert stats["events"]["session.created"]["errors"] == 1
+        assert "invalid.event" not in stats["events"]
+
+        event_router.reset_stats()
+        assert event_router.get_stats()["dispatched"] == 0
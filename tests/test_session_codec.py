@@ -0,0 +1,101 @@
+"""
+Unit tests for the session serialization codecs.
+"""
+
+import json
+
+import pytest
+
+from opusagent.session_storage.codec import (
+    HEADER_SIZE,
+    MAGIC,
+    SessionCodec,
+    get_session_codec,
+)
+
+
+def _session(turns: int = 50) -> dict:
+    return {
+        "conversation_id": "call-1",
+        "status": "active",
+        "current_turn": turns,
+        "conversation_history": [
+            {
+                "role": "user" if i % 2 == 0 else "assistant",
+                "text": f"Turn {i}: I need to check the balance on my account.",
+            }
+            for i in range(turns)
+        ],
+        "metadata": {"scenario": "banking", "amount": 125.5, "verified": True},
+        "last_error": None,
+    }
+
+
+class TestSessionCodec:
+    """Test cases for SessionCodec."""
+
+    def test_default_is_plain_json(self):
+        """The default codec writes headerless JSON, as before codecs."""
+        codec = get_session_codec()
+        data = codec.encode(_session())
+        assert not data.startswith(MAGIC)
+        assert json.loads(data) == _session()
+        assert not codec.binary
+
+    @pytest.mark.parametrize(
+        "spec", ["json+zlib", "orjson", "orjson+zlib", "msgpack", "msgpack+zlib"]
+    )
+    def test_round_trip(self, spec):
+        """Every codec decodes what it encodes, with a header."""
+        serializer = spec.split("+")[0]
+        if serializer != "json":
+            pytest.importorskip(serializer)
+        codec = get_session_codec(spec, compression_threshold=0)
+        data = codec.encode(_session())
+        assert data.startswith(MAGIC)
+        assert codec.decode(data) == _session()
+        assert codec.name == spec
+
+    def test_zstd_round_trip(self):
+        """zstd compression is used when zstandard is installed."""
+        pytest.importorskip("zstandard")
+        codec = get_session_codec("json+zstd", compression_threshold=0)
+        data = codec.encode(_session())
+        assert data[HEADER_SIZE - 1] == 2
+        assert codec.decode(data) == _session()
+
+    def test_compression_threshold(self):
+        """Values below the threshold are stored uncompressed."""
+        codec = SessionCodec(compression="zlib", compression_threshold=1024)
+        small = codec.encode({"text": "Hi"})
+        large = codec.encode(_session())
+
+        assert json.loads(small) == {"text": "Hi"}
+        assert large.startswith(MAGIC)
+        assert len(large) < len(json.dumps(_session())) / 3
+        stats = codec.get_stats()
+        assert stats["values_encoded"] == 2
+        assert stats["values_compressed"] == 1
+        assert stats["compression_ratio"] > 1
+
+    def test_decodes_any_codec_and_legacy_json(self):
+        """A reader decodes values whatever codec it is configured with."""
+        pytest.importorskip("msgpack")
+        writer = get_session_codec("msgpack+zlib", compression_threshold=0)
+        reader = get_session_codec("json")
+        assert reader.decode(writer.encode(_session())) == _session()
+        assert writer.decode(json.dumps(_session())) == _session()
+        assert writer.decode(json.dumps(_session()).encode()) == _session()
+
+    def test_rejects_newer_version(self):
+        """Values from a newer format version are not misread."""
+        codec = get_session_codec()
+        with pytest.raises(ValueError, match="Unsupported session codec version"):
+            codec.decode(MAGIC + bytes((99, 0, 0)) + b"{}")
+
+    def test_unknown_spec(self):
+        """Unknown serializers and compressions are rejected."""
+        with pytest.raises(ValueError, match="Unknown session serializer"):
+            get_session_codec("pickle")
+        with pytest.raises(ValueError, match="Unknown session compression"):
+            get_session_codec("json+lzma")
@@ -136,6 +136,18 @@ async def test_send_initial_conversation_item(session_manager, mock_websocket):
     assert second_call["response"]["max_output_tokens"] == 4096
     assert second_call["response"]["voice"] == TEST_VOICE
 
+@pytest.mark.asyncio
+async def test_send_caller_context(session_manager, mock_websocket):
+    """Test sending an identified caller's metadata as a system item."""
+    await session_manager.send_caller_context("caller_1", {"name": "Ada"})
+
+    sent = json.loads(mock_websocket.send.call_args[0][0])
+    assert sent["type"] == "conversation.item.create"
+    assert sent["item"]["role"] == "system"
+    text = sent["item"]["content"][0]["text"]
+    assert "caller_1" in text
+    assert "Ada" in text
+
 @pytest.mark.asyncio
 async def test_create_response(session_manager, mock_websocket):
     """Test creating a new response."""
@@ -154,6 +166,31 @@ async def test_create_response(session_manager, mock_websocket):
     assert sent_data["response"]["max_output_tokens"] == 4096
     assert sent_data["response"]["voice"] == TEST_VOICE
 
+@pytest.mark.asyncio
+async def test_initialize_session_skips_preconfigured_connection(
+    session_manager, mock_websocket, test_session_config
+):
+    """Test that a warm connection with the same config is not updated again."""
+    mock_websocket.preconfigured_session = test_session_config.model_copy()
+
+    await session_manager.initialize_session()
+
+    assert session_manager.session_initialized is True
+    mock_websocket.send.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_initialize_session_sends_when_config_differs(
+    session_manager, mock_websocket, test_session_config
+):
+    """Test that a warm connection with another config still gets the update."""
+    mock_websocket.preconfigured_session = test_session_config.model_copy(
+        update={"voice": "alloy"}
+    )
+
+    await session_manager.initialize_session()
+
+    mock_websocket.send.assert_called_once()
+
 @pytest.mark.asyncio
 async def test_initialize_session_error_handling(session_manager, mock_websocket):
     """Test error handling during session initialization."""
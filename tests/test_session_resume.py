@@ -10,6 +10,7 @@ This module tests the complete session resume system including:
 """
 
 import asyncio
+import fnmatch
 import json
 import pytest
 from datetime import datetime, timedelta
@@ -23,6 +24,158 @@ from opusagent.handlers.transcript_manager import TranscriptManager
 from opusagent.handlers.function_handler import FunctionHandler
 
 
+class FakeRedis:
+    """Minimal in-process stand-in for the redis.asyncio client."""
+    
+    def __init__(self):
+        self.data = {}
+        self.commands = []
+        self.subscribers = []
+    
+    async def ping(self):
+        return True
+    
+    async def close(self):
+        pass
+    
+    async def get(self, key):
+        self.commands.append("get")
+        return self.data.get(key)
+    
+    async def set(self, key, value, ex=None):
+        self.commands.append("set")
+        self.data[key] = value
+        return True
+    
+    async def exists(self, key):
+        self.commands.append("exists")
+        return int(key in self.data)
+    
+    async def delete(self, *keys):
+        self.commands.append("delete")
+        return sum(self.data.pop(key, None) is not None for key in keys)
+    
+    async def expire(self, key, ttl):
+        self.commands.append("expire")
+        return key in self.data
+    
+    async def scan(self, cursor, match, count):
+        self.commands.append("scan")
+        return 0, [key for key in self.data if fnmatch.fnmatchcase(key, match)]
+    
+    async def mget(self, keys):
+        self.commands.append("mget")
+        return [self.data.get(key) for key in keys]
+    
+    async def zadd(self, key, mapping, xx=False, nx=False):
+        self.commands.append("zadd")
+        scores = self.data.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if (xx and member not in scores) or (nx and member in scores):
+                continue
+            added += member not in scores
+            scores[member] = score
+        if not scores:
+            del self.data[key]
+        return added
+    
+    async def zrangebyscore(self, key, min, max, start=None, num=None):
+        self.commands.append("zrangebyscore")
+        low, high = float(min), float(max)
+        members = sorted(
+            (score, member) for member, score in self.data.get(key, {}).items()
+            if low <= score <= high
+        )
+        members = [member for _, member in members]
+        return members[start:start + num] if num is not None else members
+    
+    async def zrem(self, key, *members):
+        scores = self.data.get(key, {})
+        for member in members:
+            scores.pop(member, None)
+        if key in self.data and not scores:
+            del self.data[key]
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    def pubsub(self):
+        pubsub = FakePubSub(self)
+        self.subscribers.append(pubsub)
+        return pubsub
+    
+    # Commands below are only used through pipelines
+    async def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+    
+    async def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+    
+    async def hincrby(self, key, field, amount):
+        fields = self.data.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+        return int(fields[field])
+    
+    async def hdel(self, key, *fields):
+        for field in fields:
+            self.data.get(key, {}).pop(field, None)
+    
+    async def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(values)
+    
+    async def lrange(self, key, start, end):
+        return list(self.data.get(key, []))
+    
+    async def publish(self, channel, message):
+        receivers = [sub for sub in self.subscribers if channel in sub.channels]
+        for sub in receivers:
+            sub.messages.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(receivers)
+
+
+class FakePubSub:
+    """Delivers FakeRedis.publish() messages to a subscriber."""
+    
+    def __init__(self, client):
+        self.client = client
+        self.channels = set()
+        self.messages = asyncio.Queue()
+    
+    async def subscribe(self, channel):
+        self.channels.add(channel)
+    
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+    
+    async def close(self):
+        self.client.subscribers.remove(self)
+
+
+class FakePipeline:
+    """Queues FakeRedis commands and runs them on execute()."""
+    
+    def __init__(self, client):
+        self.client = client
+        self.queued = []
+    
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.queued.append((name, args, kwargs))
+            return self
+        return queue
+    
+    async def execute(self):
+        self.client.commands.append("execute")
+        results = []
+        for name, args, kwargs in self.queued:
+            results.append(await getattr(self.client, name)(*args, **kwargs))
+        return results
+
+
 class TestSessionState:
     """Test session state model functionality."""
     
@@ -226,6 +379,94 @@ class TestMemorySessionStorage:
         # Verify activity was updated
         updated_activity = storage._sessions[conversation_id]["last_activity"]
         assert updated_activity > original_activity
+    
+    @pytest.mark.asyncio
+    async def test_patch_session(self, storage):
+        """Test patching individual fields of a stored session."""
+        await storage.store_session("test-123", {"conversation_id": "test-123", "status": "active"})
+        
+        assert await storage.patch_session("test-123", {"status": "paused"})
+        assert not await storage.patch_session("missing", {"status": "paused"})
+        
+        retrieved = await storage.retrieve_session("test-123")
+        assert retrieved["status"] == "paused"
+    
+    @pytest.mark.asyncio
+    async def test_append_session_items(self, storage):
+        """Test appending conversation items without replacing the session."""
+        session_data = SessionState(conversation_id="test-123").to_dict()
+        await storage.store_session("test-123", session_data)
+        before = await storage.retrieve_session("test-123")
+        
+        assert await storage.append_session_items(
+            "test-123", "conversation_history", [{"type": "input", "text": "Hi"}]
+        )
+        assert await storage.append_session_items(
+            "test-123", "function_calls", [{"call_id": "func-1"}], fields={"status": "active"}
+        )
+        
+        retrieved = await storage.retrieve_session("test-123")
+        assert retrieved["conversation_history"] == [{"type": "input", "text": "Hi"}]
+        assert retrieved["current_turn"] == 1
+        assert retrieved["function_calls"] == [{"call_id": "func-1"}]
+        assert retrieved["status"] == "active"
+        # Earlier copies are not changed by later appends
+        assert before["conversation_history"] == []
+        assert session_data["conversation_history"] == []
+    
+    @pytest.mark.asyncio
+    async def test_append_rejects_unknown_field(self, storage):
+        """Test that only list fields of the session can be appended to."""
+        await storage.store_session("test-123", {"conversation_id": "test-123"})
+        with pytest.raises(ValueError, match="Cannot append"):
+            await storage.append_session_items("test-123", "metadata", [{}])
+    
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test that a full storage evicts the session used longest ago."""
+        storage = MemorySessionStorage(max_sessions=3)
+        for conversation_id in ("a", "b", "c"):
+            await storage.store_session(conversation_id, {"conversation_id": conversation_id})
+        await storage.retrieve_session("a")
+        await storage.update_session_activity("b")
+        
+        # Replacing a stored session never evicts
+        await storage.store_session("b", {"conversation_id": "b"})
+        assert sorted(await storage.list_active_sessions()) == ["a", "b", "c"]
+        
+        await storage.store_session("d", {"conversation_id": "d"})
+        assert sorted(await storage.list_active_sessions()) == ["a", "b", "d"]
+        assert storage.get_stats()["evictions"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_cleanup_expires_by_activity_time(self, storage):
+        """Test that expiry uses activity times, whatever the order of use."""
+        now = time.time()
+        ages = {"a": 10, "b": 4000, "c": 3599, "d": 3601, "e": 90000}
+        for conversation_id, age in ages.items():
+            await storage.store_session(conversation_id, {"conversation_id": conversation_id})
+            storage._session_timestamps[conversation_id] = now - age
+        # A later touch moves a session out of its expired slot
+        await storage.update_session_activity("e")
+        
+        assert await storage.cleanup_expired_sessions(max_age_seconds=3600) == 2
+        assert sorted(await storage.list_active_sessions()) == ["a", "c", "e"]
+        assert await storage.cleanup_expired_sessions(max_age_seconds=3600) == 0
+        assert storage.get_stats()["expirations"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_latency_histograms(self, storage):
+        """Test that each operation reports a latency histogram."""
+        await storage.store_session("test-123", {"conversation_id": "test-123"})
+        for _ in range(3):
+            await storage.retrieve_session("test-123")
+        
+        latency = storage.get_stats()["latency"]
+        assert latency["store_session"]["calls"] == 1
+        retrieve = latency["retrieve_session"]
+        assert retrieve["calls"] == 3
+        assert sum(retrieve["buckets_us"].values()) == 3
+        assert 0 < retrieve["p50_us"] <= retrieve["p99_us"] <= retrieve["max_us"]
 
 
 class TestSessionManagerService:
@@ -412,6 +653,32 @@ class TestSessionManagerService:
         active_sessions = await service.list_active_sessions()
         assert "old" not in active_sessions
         assert "recent" in active_sessions
+    
+    @pytest.mark.asyncio
+    async def test_update_missing_session(self, service):
+        """Test updating a session that doesn't exist."""
+        assert not await service.update_session("nonexistent", status=SessionStatus.PAUSED)
+    
+    @pytest.mark.asyncio
+    async def test_append_conversation_item_and_function_call(self, service):
+        """Test appending turns and function calls as deltas."""
+        conversation_id = "test-123"
+        session = await service.create_session(conversation_id)
+        
+        await service.append_conversation_item(conversation_id, {"type": "input", "text": "Hello"})
+        await service.append_conversation_item(conversation_id, {"type": "output", "text": "Hi"})
+        await service.append_function_call(conversation_id, {"call_id": "func-1"})
+        await service.update_session(conversation_id, status=SessionStatus.PAUSED)
+        
+        restored = await service.get_session(conversation_id)
+        assert [item["text"] for item in restored.conversation_history] == ["Hello", "Hi"]
+        assert restored.current_turn == 2
+        assert restored.function_calls == [{"call_id": "func-1"}]
+        assert restored.status == SessionStatus.PAUSED
+        # The state returned by create_session is not touched
+        assert session.conversation_history == []
+        
+        assert not await service.append_conversation_item("nonexistent", {"text": "Hello"})
 
 
 class TestTranscriptManagerRestoration:
@@ -608,6 +875,10 @@ class TestRedisSessionStorage:
         mock_client.get.return_value = None
         mock_client.delete.return_value = 1
         mock_client.keys.return_value = []
+        mock_client.exists.return_value = 1
+        mock_pipeline = MagicMock()
+        mock_pipeline.execute = AsyncMock(return_value=[])
+        mock_client.pipeline = MagicMock(return_value=mock_pipeline)
         return mock_client
     
     @pytest.fixture
@@ -662,8 +933,10 @@ class TestRedisSessionStorage:
         success = await storage.store_session(conversation_id, session_data)
         assert success
         
-        # Mock successful retrieval
-        mock_redis_client.get.return_value = json.dumps(session_data)
+        # Mock successful retrieval (snapshot, no patched fields or appended items)
+        mock_redis_client.pipeline.return_value.execute.return_value = [
+            json.dumps(session_data), {}, [], []
+        ]
         
         # Retrieve session
         retrieved = await storage.retrieve_session(conversation_id)
@@ -687,6 +960,285 @@ class TestRedisSessionStorage:
         
         retrieved = await storage.retrieve_session("test-123")
         assert retrieved is None
+    
+    @pytest.mark.asyncio
+    @patch('opusagent.session_storage.redis_storage.redis')
+    async def test_redis_delta_writes(self, mock_redis):
+        """Test that patches and appends are stored as deltas and reassembled."""
+        from opusagent.session_storage.redis_storage import RedisSessionStorage
+        
+        client = FakeRedis()
+        mock_redis.ConnectionPool.from_url.return_value = MagicMock()
+        mock_redis.Redis.return_value = client
+        storage = RedisSessionStorage(session_prefix="test:")
+        service = SessionManagerService(storage)
+        
+        await service.create_session("call-1")
+        snapshot = client.data["test:call-1"]
+        for text in ("Hello", "Hi", "Balance?"):
+            await service.append_conversation_item("call-1", {"text": text})
+        await service.append_function_call("call-1", {"call_id": "func-1"})
+        await service.update_session("call-1", status=SessionStatus.PAUSED)
+        
+        # The snapshot is never rewritten by delta updates
+        assert client.data["test:call-1"] == snapshot
+        assert await storage.list_active_sessions() == ["call-1"]
+        
+        restored = await service.get_session("call-1", update_activity=False)
+        assert [item["text"] for item in restored.conversation_history] == ["Hello", "Hi", "Balance?"]
+        assert restored.current_turn == 3
+        assert restored.function_calls == [{"call_id": "func-1"}]
+        assert restored.status == SessionStatus.PAUSED
+        
+        # Resuming compacts the deltas into a new snapshot
+        resumed = await service.resume_session("call-1")
+        assert resumed.current_turn == 3
+        assert "test:call-1:conversation_history" not in client.data
+        assert json.loads(client.data["test:call-1"])["current_turn"] == 3
+        
+        assert not await storage.patch_session("missing", {"status": "ended"})
+        assert await storage.delete_session("call-1")
+        assert client.data == {}
+    
+    @pytest.mark.asyncio
+    @patch('opusagent.session_storage.redis_storage.redis')
+    async def test_redis_loads_legacy_snapshot(self, mock_redis):
+        """Test that sessions stored before deltas and the index still load."""
+        from opusagent.session_storage.redis_storage import RedisSessionStorage
+        
+        client = FakeRedis()
+        mock_redis.ConnectionPool.from_url.return_value = MagicMock()
+        mock_redis.Redis.return_value = client
+        storage = RedisSessionStorage(session_prefix="test:")
+        
+        legacy = {"conversation_id": "call-1", "conversation_history": [{"text": "Hello"}]}
+        client.data["test:call-1"] = json.dumps(legacy)
+        client.data["test:call-1:meta"] = json.dumps(
+            {"conversation_id": "call-1", "last_activity": time.time()}
+        )
+        
+        assert await storage.retrieve_session("call-1", update_activity=False) == legacy
+        # The index is rebuilt from the metadata on first connection
+        assert await storage.list_active_sessions() == ["call-1"]
+        assert "keys" not in client.commands
+        
+        operations = storage.get_stats()["operations"]
+        assert operations["retrieve_session"]["round_trips_per_call"] == 1
+        assert operations["rebuild_activity_index"]["calls"] == 1
+    
+    @pytest.mark.asyncio
+    @patch('opusagent.session_storage.redis_storage.redis')
+    async def test_redis_binary_codec(self, mock_redis):
+        """Test sessions and deltas stored with a compressed msgpack codec."""
+        from opusagent.session_storage.codec import MAGIC
+        from opusagent.session_storage.redis_storage import RedisSessionStorage
+        
+        pytest.importorskip("msgpack")
+        client = FakeRedis()
+        mock_redis.ConnectionPool.from_url.return_value = MagicMock()
+        mock_redis.Redis.return_value = client
+        storage = RedisSessionStorage(session_prefix="test:", codec="msgpack+zlib")
+        service = SessionManagerService(storage)
+        
+        await service.create_session("call-1", bot_name="bank-bot")
+        for i in range(20):
+            await service.append_conversation_item("call-1", {"text": f"Turn {i}"})
+        await service.update_session("call-1", status=SessionStatus.ACTIVE)
+        
+        assert client.data["test:call-1"].startswith(MAGIC)
+        assert client.data["test:call-1:conversation_history"][0].startswith(MAGIC)
+        restored = await service.get_session("call-1", update_activity=False)
+        assert restored.current_turn == 20
+        assert restored.conversation_history[-1] == {"text": "Turn 19"}
+        assert restored.status == SessionStatus.ACTIVE
+        
+        # JSON written before the codec was configured still loads
+        client.data["test:legacy"] = json.dumps({"conversation_id": "legacy"})
+        assert await storage.retrieve_session("legacy", update_activity=False) == {
+            "conversation_id": "legacy"
+        }
+        assert storage.get_stats()["codec"]["codec"] == "msgpack+zlib"
+        
+        with pytest.raises(ValueError, match="decode_responses"):
+            RedisSessionStorage(codec="msgpack", decode_responses=True)
+    
+    @pytest.mark.asyncio
+    @patch('opusagent.session_storage.redis_storage.redis')
+    async def test_redis_single_round_trip_operations(self, mock_redis):
+        """Test that each storage operation is one pipelined round trip."""
+        from opusagent.session_storage.redis_storage import RedisSessionStorage
+        
+        client = FakeRedis()
+        mock_redis.ConnectionPool.from_url.return_value = MagicMock()
+        mock_redis.Redis.return_value = client
+        storage = RedisSessionStorage(session_prefix="test:")
+        
+        await storage.store_session("call-1", {"conversation_id": "call-1"})
+        await storage.append_session_items("call-1", "conversation_history", [{"text": "Hi"}])
+        await storage.patch_session("call-1", {"status": "active"})
+        await storage.update_session_activity("call-1")
+        await storage.retrieve_session("call-1")
+        await storage.delete_session("call-1")
+        
+        operations = storage.get_stats()["operations"]
+        for operation in (
+            "store_session", "append_session_items", "patch_session",
+            "update_session_activity", "retrieve_session", "delete_session",
+        ):
+            assert operations[operation]["round_trips_per_call"] == 1
+        assert not await storage.update_session_activity("call-1")
+        assert client.data == {}
+    
+    @pytest.mark.asyncio
+    @patch('opusagent.session_storage.redis_storage.redis')
+    async def test_redis_cleanup_uses_activity_index(self, mock_redis):
+        """Test that cleanup removes expired sessions in batches from the index."""
+        from opusagent.session_storage.redis_storage import RedisSessionStorage
+        
+        client = FakeRedis()
+        mock_redis.ConnectionPool.from_url.return_value = MagicMock()
+        mock_redis.Redis.return_value = client
+        storage = RedisSessionStorage(session_prefix="test:", cleanup_batch_size=2)
+        
+        for i in range(5):
+            await storage.store_session(f"old-{i}", {"conversation_id": f"old-{i}"})
+        await storage.store_session("recent", {"conversation_id": "recent"})
+        scores = client.data[storage.activity_index_key]
+        for i in range(5):
+            scores[f"old-{i}"] -= 7200
+        
+        cleaned = await storage.cleanup_expired_sessions(max_age_seconds=3600)
+        
+        assert cleaned == 5
+        assert await storage.list_active_sessions() == ["recent"]
+        assert sorted(key for key in client.data if key.startswith("test:old")) == []
+        assert "get" not in client.commands
+        
+        cleanup = storage.get_stats()["cleanup"]
+        assert cleanup["runs"] == 1
+        assert cleanup["last_removed"] == 5
+        assert cleanup["last_duration_ms"] >= 0
+        # Three batches of range query + delete pipeline
+        assert storage.get_stats()["operations"]["cleanup_expired_sessions"]["round_trips"] == 6
+
+
+class TestTieredSessionStorage:
+    """Test the local cache in front of Redis."""
+    
+    @pytest.fixture
+    def client(self):
+        return FakeRedis()
+    
+    @pytest.fixture
+    def make_storage(self, client):
+        """Build tiered storages sharing one fake Redis, as workers would."""
+        from opusagent.session_storage.redis_storage import RedisSessionStorage
+        from opusagent.session_storage.tiered_storage import TieredSessionStorage
+        
+        with patch('opusagent.session_storage.redis_storage.redis') as mock_redis:
+            mock_redis.ConnectionPool.from_url.return_value = AsyncMock()
+            mock_redis.Redis.return_value = client
+            
+            def make(**kwargs):
+                remote = RedisSessionStorage(session_prefix="test:")
+                return TieredSessionStorage(remote, **kwargs)
+            yield make
+    
+    @pytest.mark.asyncio
+    async def test_cached_reads_skip_redis(self, client, make_storage):
+        """Test that reads of cached sessions make no Redis round trips."""
+        storage = make_storage()
+        service = SessionManagerService(storage)
+        await service.create_session("call-1")
+        executed = client.commands.count("execute")
+        
+        for _ in range(5):
+            assert (await service.get_session("call-1")).conversation_id == "call-1"
+        assert client.commands.count("execute") == executed
+        
+        # The activity updates are folded into one write
+        await storage.flush()
+        assert client.commands.count("execute") == executed + 1
+        stats = storage.get_stats()
+        assert stats["hits"] == 5 and stats["misses"] == 0
+        await storage.close()
+    
+    @pytest.mark.asyncio
+    async def test_write_behind_coalesces(self, client, make_storage):
+        """Test that queued writes reach Redis in one call per session."""
+        storage = make_storage(flush_interval=60)
+        service = SessionManagerService(storage)
+        await service.create_session("call-1")
+        
+        for i in range(10):
+            await service.append_conversation_item("call-1", {"text": f"Turn {i}"})
+            await service.update_session("call-1", status=SessionStatus.ACTIVE)
+        assert "test:call-1:conversation_history" not in client.data
+        assert (await service.get_session("call-1")).current_turn == 10
+        
+        assert await storage.flush() == 1
+        assert len(client.data["test:call-1:conversation_history"]) == 10
+        restored = await storage.remote.retrieve_session("call-1", update_activity=False)
+        assert restored["current_turn"] == 10
+        assert restored["status"] == "active"
+        stats = storage.get_stats()
+        assert stats["operations_queued"] == 21
+        assert stats["remote_writes"] == 2  # The create and one append
+        await storage.close()
+    
+    @pytest.mark.asyncio
+    async def test_miss_reads_own_queued_writes(self, make_storage):
+        """Test that a session evicted from the cache is read with its writes."""
+        storage = make_storage(local_max_sessions=1, flush_interval=60)
+        service = SessionManagerService(storage)
+        await service.create_session("call-1")
+        await service.append_conversation_item("call-1", {"text": "Hello"})
+        await service.create_session("call-2")
+        
+        restored = await service.get_session("call-1")
+        assert restored.conversation_history == [{"text": "Hello"}]
+        assert storage.get_stats()["misses"] == 1
+        await storage.close()
+    
+    @pytest.mark.asyncio
+    async def test_resume_on_another_worker_invalidates(self, make_storage):
+        """Test that a session resumed elsewhere is dropped from the cache."""
+        worker_1 = make_storage(flush_interval=60)
+        worker_2 = make_storage(flush_interval=60)
+        service_1 = SessionManagerService(worker_1)
+        service_2 = SessionManagerService(worker_2)
+        await service_1.create_session("call-1")
+        await service_1.append_conversation_item("call-1", {"text": "Hello"})
+        await worker_1.flush()
+        await service_1.append_conversation_item("call-1", {"text": "Stale"})
+        
+        resumed = await service_2.resume_session("call-1")
+        assert resumed.conversation_history == [{"text": "Hello"}]
+        for _ in range(100):
+            if worker_1.get_stats()["invalidations"]:
+                break
+            await asyncio.sleep(0.01)
+        
+        stats = worker_1.get_stats()
+        assert stats["invalidations"] == 1
+        assert stats["dropped_operations"] == 1
+        restored = await service_1.get_session("call-1")
+        assert restored.status == SessionStatus.ACTIVE
+        assert restored.resumed_count == 1
+        await worker_1.close()
+        await worker_2.close()
+    
+    @pytest.mark.asyncio
+    async def test_write_through(self, client, make_storage):
+        """Test that write-through sends each write before returning."""
+        storage = make_storage(write_behind=False)
+        service = SessionManagerService(storage)
+        await service.create_session("call-1")
+        await service.append_conversation_item("call-1", {"text": "Hello"})
+        
+        assert len(client.data["test:call-1:conversation_history"]) == 1
+        assert storage.get_stats()["pending_sessions"] == 0
+        await storage.close()
 
 
 class TestBridgeSessionManagerIntegration: